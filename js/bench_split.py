@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the duty-shifts split, for comparing commits.
+
+For the source optimize_split.py splits (the shipped bundles, combined) and
+synthetic copies of it scaled 1x, 10x and 100x the four stages are timed:
+
+  tokenize    one pass of the streaming tokenizer
+  index       building the declaration index from scratch (no cache)
+  categorise  call graph and bundle assignment
+  emit        writing the data/logic/ui bundles
+
+Each input runs in its own worker process so its peak RAM (ru_maxrss, in KB
+on every platform) is measured on its own. The results also hold the raw and
+gzip size of every bundle, the local script payload of duty-shifts.html and
+the number of declarations per seed category ('unknown' included) and per
+final bundle.
+
+    python js/bench_split.py                  # on the base commit
+    python js/bench_split.py --compare js/.split-cache/bench-results.json
+
+--compare exits with status 1 when a timing, peak RAM or size got worse
+than the thresholds allow.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import re
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from call_graph import BUNDLES, assign_categories, build_call_graph
+from html_pages import local_script_paths
+from js_tokenizer import iter_declarations, tokenize
+from declaration_index import DEFAULT_CACHE
+from minify import gzip_size
+from optimize_split import BUNDLE_FILES, categorize_function, emit_files, find_source, open_index
+
+# 2: the source is the combined bundles, recorded as 'source'
+BENCH_VERSION = 2
+STAGES = ('tokenize', 'index', 'categorise', 'emit')
+DEFAULT_SCALES = (1, 10, 100)
+# Timing differences below this many seconds are noise, whatever the ratio
+MIN_TIME_DELTA = 0.005
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(DEFAULT_CACHE), 'bench-results.json')
+# Suffix write_synthetic gives the names of each extra copy
+_COPY_SUFFIX = re.compile(r'_x\d+$')
+
+
+def write_synthetic(source, scale, path):
+    """Write `scale` copies of source to path, renaming the top-level names
+    of every copy after the first so the declarations stay distinct"""
+    with open(source, 'rb') as f:
+        data = f.read()
+    declared = set()
+    for decl in iter_declarations(tokenize(io.BytesIO(data))):
+        declared.update(name.encode() for name in decl.names)
+    renamed = []  # (start, end, name) of references to top-level names
+    prev = None
+    for token in tokenize(io.BytesIO(data)):
+        if (token.kind == 'name' and token.value in declared
+                and not (prev is not None and prev.value in (b'.', b'?.'))):
+            renamed.append((token.start, token.end, token.value))
+        prev = token
+    with open(path, 'wb') as out:
+        out.write(data)
+        for copy in range(1, scale):
+            suffix = f'_x{copy}'.encode()
+            pos = 0
+            out.write(b'\n')
+            for start, end, name in renamed:
+                out.write(data[pos:start])
+                out.write(name + suffix)
+                pos = end
+            out.write(data[pos:])
+    return path
+
+
+def peak_rss_kb():
+    """Peak resident set size of this process in KB (ru_maxrss is in bytes
+    on macOS and in KB elsewhere)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def _timed(function, repeat):
+    """(best wall time over `repeat` runs, result of the last run)"""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def _count_tokens(path):
+    with open(path, 'rb') as f:
+        return sum(1 for _ in tokenize(f))
+
+
+def _categorise(path, index):
+    """categorize_all, with copies in synthetic files seeded like the original"""
+    graph = build_call_graph([path], index)
+    seeds = {name: categorize_function(_COPY_SUFFIX.sub('', name)) for name in graph.nodes}
+    return graph, seeds, assign_categories(graph, seeds)
+
+
+def _fresh_segments(path):
+    index = open_index(None)
+    index.segments(path)
+    return index
+
+
+def run_stages(path, out_dir, repeat=1):
+    """Time the split stages on one file; return the result record"""
+    times = {}
+    times['tokenize'], tokens = _timed(lambda: _count_tokens(path), repeat)
+    times['index'], index = _timed(lambda: _fresh_segments(path), repeat)
+    times['categorise'], (graph, seeds, labels) = _timed(lambda: _categorise(path, index), repeat)
+    jobs = [(os.path.join(out_dir, filename), category, header)
+            for filename, category, header in BUNDLE_FILES]
+    with contextlib.redirect_stdout(io.StringIO()):
+        times['emit'], _ = _timed(lambda: emit_files(path, jobs, index, labels), repeat)
+
+    categories = {category: 0 for category in BUNDLES + ('unknown',)}
+    for category in seeds.values():
+        categories[category] = categories.get(category, 0) + 1
+    bundles = {category: 0 for category in BUNDLES}
+    for category in labels.values():
+        bundles[category] = bundles.get(category, 0) + 1
+    sizes = {}
+    for output_file, _, _ in jobs:
+        with open(output_file, 'rb') as f:
+            data = f.read()
+        sizes[os.path.basename(output_file)] = {'raw': len(data), 'gzip': gzip_size(data)}
+    return {
+        'bytes': os.path.getsize(path),
+        'tokens': tokens,
+        'declarations': len(index.declarations(path)),
+        'seconds': times,
+        'categories': categories,
+        'bundles': bundles,
+        'sizes': sizes,
+        'peak_rss_kb': peak_rss_kb(),
+    }
+
+
+def run_worker(path, repeat):
+    """Run the stages in a child process, so peak RAM covers this input only"""
+    with tempfile.TemporaryDirectory() as out_dir:
+        command = [sys.executable, os.path.abspath(__file__), '--worker', path,
+                   '--out-dir', out_dir, '--repeat', str(repeat)]
+        output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def page_payload(html_path):
+    """Raw and gzip bytes of the local scripts a page loads"""
+    raw = compressed = 0
+    for path in local_script_paths(html_path):
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                data = f.read()
+            raw += len(data)
+            compressed += gzip_size(data)
+    return {'raw': raw, 'gzip': compressed}
+
+
+def _git_commit(directory):
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=directory, check=True,
+                              capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _metrics(results):
+    """Flatten results into {metric name: (value, kind)}"""
+    metrics = {}
+    for name, record in results['inputs'].items():
+        for stage, seconds in record['seconds'].items():
+            metrics[f'{name} {stage}'] = (seconds, 'time')
+        metrics[f'{name} peak RAM KB'] = (record['peak_rss_kb'], 'memory')
+        for output_file, size in record['sizes'].items():
+            for kind, value in size.items():
+                metrics[f'{name} {output_file} {kind}'] = (value, 'size')
+        for category, count in record['categories'].items():
+            metrics[f'{name} {category} declarations'] = (count, 'count')
+    for kind, value in results['payload'].items():
+        metrics[f'page payload {kind}'] = (value, 'size')
+    return metrics
+
+
+def _format(value, kind):
+    return f"{value * 1000:.1f} ms" if kind == 'time' else str(value)
+
+
+def compare(baseline, current, threshold, size_threshold):
+    """Print the metrics that changed; return the names of regressions"""
+    old = _metrics(baseline)
+    new = _metrics(current)
+    regressions = []
+    for name, (value, kind) in new.items():
+        if name not in old:
+            continue
+        before = old[name][0]
+        if value == before:
+            continue
+        change = (value - before) / before if before else float('inf')
+        limit = size_threshold if kind == 'size' else threshold
+        failed = kind != 'count' and change > limit
+        if kind == 'time' and value - before < MIN_TIME_DELTA:
+            failed = False
+        if failed:
+            regressions.append(name)
+        if failed or kind in ('size', 'count') or abs(change) > threshold:
+            flag = 'REGRESSION' if failed else ''
+            print(f"  {name}: {_format(before, kind)} -> {_format(value, kind)} "
+                  f"({change:+.1%}) {flag}".rstrip())
+    return regressions
+
+
+def print_results(results):
+    for name, record in results['inputs'].items():
+        seconds = ', '.join(f"{stage} {record['seconds'][stage] * 1000:.0f} ms" for stage in STAGES)
+        print(f"{name}: {record['bytes']} bytes, {record['declarations']} declarations; "
+              f"{seconds}; peak RAM {record['peak_rss_kb'] / 1024:.0f} MB")
+        categories = ', '.join(f"{category} {count}" for category, count in record['categories'].items())
+        bundles = ', '.join(f"{category} {count}" for category, count in record['bundles'].items())
+        print(f"  seeds: {categories}; bundles: {bundles}")
+    for output_file, size in results['inputs']['source']['sizes'].items():
+        print(f"{output_file}: {size['raw']} bytes, {size['gzip']} gzip")
+    payload = results['payload']
+    print(f"duty-shifts.html local scripts: {payload['raw']} bytes, {payload['gzip']} gzip")
+
+
+def main():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    root = os.path.dirname(script_dir)
+    parser = argparse.ArgumentParser(description='Benchmark the duty-shifts split')
+    parser.add_argument('--source',
+                        help='single-file source (default: the shipped bundles, combined)')
+    parser.add_argument('--html', default=os.path.join(root, 'duty-shifts.html'),
+                        help='page whose local script payload is measured')
+    parser.add_argument('--scales', default=','.join(map(str, DEFAULT_SCALES)),
+                        help='synthetic input sizes as multiples of the source (default: 1,10,100)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='runs per stage; the fastest counts (default: 3)')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT,
+                        help='JSON results file (default: js/.split-cache/bench-results.json)')
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help='earlier results file; exit 1 on regressions')
+    parser.add_argument('--threshold', type=float, default=0.20,
+                        help='allowed relative slowdown or RAM growth (default: 0.20)')
+    parser.add_argument('--size-threshold', type=float, default=0.01,
+                        help='allowed relative bundle size growth (default: 0.01)')
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    parser.add_argument('--out-dir', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        json.dump(run_stages(args.worker, args.out_dir, args.repeat), sys.stdout)
+        return 0
+
+    if args.source is None:
+        try:
+            args.source = find_source(script_dir)
+        except (OSError, ValueError) as error:
+            print(f"Error: {error}")
+            return 1
+
+    baseline = None
+    if args.compare:
+        # Read first: the baseline may be the file this run overwrites
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('version') != BENCH_VERSION:
+            print(f"Warning: {args.compare} is from benchmark version {baseline.get('version')}, "
+                  f"not {BENCH_VERSION}; only metrics both runs have are compared")
+
+    results = {
+        'version': BENCH_VERSION,
+        'commit': _git_commit(root),
+        'python': platform.python_version(),
+        'inputs': {},
+    }
+    print(f"Benchmarking {args.source}...")
+    results['inputs']['source'] = run_worker(args.source, args.repeat)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for scale in (int(scale) for scale in args.scales.split(',') if scale):
+            path = write_synthetic(args.source, scale, os.path.join(tmp_dir, f'synthetic-{scale}x.js'))
+            # The large inputs take long enough to time in one run
+            repeat = args.repeat if scale < 100 else 1
+            results['inputs'][f'synthetic-{scale}x'] = run_worker(path, repeat)
+            os.remove(path)
+    results['payload'] = page_payload(args.html)
+    print_results(results)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    tmp_path = args.output + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+        f.write('\n')
+    os.replace(tmp_path, args.output)
+    print(f"Wrote {args.output}")
+
+    if baseline is not None:
+        print(f"Compared with {args.compare} ({baseline.get('commit') or 'unknown commit'}):")
+        regressions = compare(baseline, results, args.threshold, args.size_threshold)
+        if regressions:
+            print(f"{len(regressions)} regressions")
+            return 1
+        print("No regressions")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
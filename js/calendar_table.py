@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+"""
+Precomputed holiday and day-type table for the duty-shifts calendar.
+
+calculateOrthodoxEaster, calculateOrthodoxHolidays, isOrthodoxOrCyprusHoliday,
+isSpecialHoliday and getDayType run for every calendar cell and in every
+rotation loop, and each call rebuilds the Easter-based holidays of the year.
+This script writes js/duty-shifts-calendar.js, loaded right after
+duty-shifts-data.js. It holds, for a range of years:
+
+- the Orthodox Easter date of every year
+- one byte per date: the automatic (Orthodox/Cyprus) holiday id in the low
+  five bits, and above it the day type the date has with the default
+  recurring special holidays and no user-defined holidays
+- the default recurring special holiday config the day types assume
+
+and replaces those functions with table lookups. Anything the table cannot
+answer falls back to the original function: dates outside the range, user
+holidays on the date or the next day, and a recurring config that differs
+from the default. isHoliday needs no wrapper: it only adds the user's
+holidays to isOrthodoxOrCyprusHoliday.
+
+--check runs the originals from duty-shifts-data.js and the table side by
+side in node and compares every date of the range, in several time zones.
+"""
+
+import argparse
+import base64
+import datetime
+import io
+import json
+import os
+import subprocess
+import sys
+
+from js_tokenizer import iter_declarations, tokenize
+
+DEFAULT_YEARS = (2000, 2099)
+OUTPUT_FILE = 'duty-shifts-calendar.js'
+CHECK_TIME_ZONES = ('Asia/Nicosia', 'America/Sao_Paulo', 'UTC')
+
+# Indexes into the packed day type bits
+DAY_TYPES = ('normal-day', 'semi-normal-day', 'weekend-holiday', 'special-holiday')
+
+# isOrthodoxOrCyprusHoliday, in the order getOrthodoxHolidayNameAuto checks
+# them; the position + 1 is the holiday id stored in the table
+FIXED_HOLIDAYS = ((1, 1), (1, 6), (3, 25), (4, 1), (5, 1), (8, 15), (10, 1), (10, 28),
+                  (12, 25), (12, 26), (12, 31))
+EASTER_HOLIDAYS = (('cleanMonday', -48), ('palmSunday', -7), ('goodFriday', -2),
+                   ('greatSaturday', -1), ('easterSunday', 0), ('easterMonday', 1),
+                   ('whitMonday', 50))
+# calculateOrthodoxHolidays keys, in the order the original builds them
+ORTHODOX_HOLIDAYS = (('cleanMonday', -48), ('palmSunday', -7), ('goodFriday', -2),
+                     ('greatSaturday', -1), ('easterSunday', 0), ('easterMonday', 1),
+                     ('ascensionDay', 39), ('pentecost', 49), ('whitMonday', 50))
+
+# Default value of recurringSpecialHolidays in duty-shifts-data.js (--check
+# fails if they drift apart)
+RECURRING_SPECIAL_HOLIDAYS = [
+    {'month': 12, 'day': 24, 'name': 'Παραμονή Χριστουγέννων', 'type': 'fixed'},
+    {'month': 12, 'day': 25, 'name': 'Χριστούγεννα', 'type': 'fixed'},
+    {'month': 12, 'day': 31, 'name': 'Παραμονή Πρωτοχρονιάς', 'type': 'fixed'},
+    {'month': 1, 'day': 1, 'name': 'Πρωτοχρονιά', 'type': 'fixed'},
+    {'name': 'Μεγάλο Σάββατο', 'type': 'easter-relative', 'offset': -1},
+    {'name': 'Πάσχα', 'type': 'easter-relative', 'offset': 0},
+]
+
+# Functions replaced by the table, and what --check loads to compare them
+WRAPPED = ('calculateOrthodoxEaster', 'calculateOrthodoxHolidays', 'isOrthodoxOrCyprusHoliday',
+           'isSpecialHoliday', 'getDayType')
+CHECK_FUNCTIONS = WRAPPED + ('isHoliday', 'isWeekend', 'formatDateKey')
+CHECK_VARIABLES = ('holidays', 'specialHolidays', 'recurringSpecialHolidays')
+
+TEMPLATE = """// ============================================================================
+// DUTY-SHIFTS-CALENDAR.JS - generated by js/calendar_table.py, do not edit
+// ============================================================================
+// Holidays and day types of {first}-{last} as a lookup table. Load after
+// duty-shifts-data.js: the functions below replace the originals, which
+// still answer everything the table does not cover.
+(function () {{
+    var FIRST_YEAR = {first};
+    var LAST_YEAR = {last};
+    // Days from March 21 to Orthodox Easter, per year
+    var EASTER = {easter};
+    // Per date: automatic holiday id (bits 0-4), default day type (bits 5-6)
+    var DAYS = '{days}';
+    var DAY_TYPES = {day_types};
+    var ORTHODOX_HOLIDAYS = {orthodox};
+    var DEFAULT_RECURRING = {recurring};
+    var DAY_MS = 86400000;
+
+    var codes = new Uint8Array(atob(DAYS).split('').map(function (c) {{ return c.charCodeAt(0); }}));
+    var firstDay = Date.UTC(FIRST_YEAR, 0, 1) / DAY_MS;
+    var original = {{
+        calculateOrthodoxEaster: calculateOrthodoxEaster,
+        calculateOrthodoxHolidays: calculateOrthodoxHolidays,
+        isOrthodoxOrCyprusHoliday: isOrthodoxOrCyprusHoliday,
+        isSpecialHoliday: isSpecialHoliday,
+        getDayType: getDayType
+    }};
+
+    function inRange(year) {{
+        return typeof year === 'number' && year % 1 === 0 && year >= FIRST_YEAR && year <= LAST_YEAR;
+    }}
+
+    // Table position of a date's local calendar day, or -1
+    function dayIndex(date) {{
+        var year = date.getFullYear();
+        if (!inRange(year)) {{
+            return -1;
+        }}
+        return Date.UTC(year, date.getMonth(), date.getDate()) / DAY_MS - firstDay;
+    }}
+
+    function easterIndex(year) {{
+        return Date.UTC(year, 2, 21 + EASTER[year - FIRST_YEAR]) / DAY_MS - firstDay;
+    }}
+
+    function hasDate(list, key) {{
+        return list.some(function (h) {{ return h.date === key; }});
+    }}
+
+    function isDefaultRecurring() {{
+        if (recurringSpecialHolidays.length !== DEFAULT_RECURRING.length) {{
+            return false;
+        }}
+        for (var i = 0; i < DEFAULT_RECURRING.length; i++) {{
+            var def = recurringSpecialHolidays[i];
+            var expected = DEFAULT_RECURRING[i];
+            if (!def || def.type !== expected.type || def.month !== expected.month ||
+                    def.day !== expected.day || def.offset !== expected.offset) {{
+                return false;
+            }}
+        }}
+        return true;
+    }}
+
+    window.calculateOrthodoxEaster = function (year) {{
+        if (!inRange(year)) {{
+            return original.calculateOrthodoxEaster(year);
+        }}
+        return new Date(year, 2, 21 + EASTER[year - FIRST_YEAR]);
+    }};
+
+    window.calculateOrthodoxHolidays = function (year) {{
+        if (!inRange(year)) {{
+            return original.calculateOrthodoxHolidays(year);
+        }}
+        var easter = 21 + EASTER[year - FIRST_YEAR];
+        var holidays = {{}};
+        for (var i = 0; i < ORTHODOX_HOLIDAYS.length; i++) {{
+            holidays[ORTHODOX_HOLIDAYS[i][0]] = new Date(year, 2, easter + ORTHODOX_HOLIDAYS[i][1]);
+        }}
+        return holidays;
+    }};
+
+    window.isOrthodoxOrCyprusHoliday = function (date) {{
+        var index = dayIndex(date);
+        if (index < 0) {{
+            return original.isOrthodoxOrCyprusHoliday(date);
+        }}
+        return (codes[index] & 31) !== 0;
+    }};
+
+    window.isSpecialHoliday = function (date) {{
+        var index = dayIndex(date);
+        if (index < 0) {{
+            return original.isSpecialHoliday(date);
+        }}
+        var key = formatDateKey(date);
+        if (hasDate(specialHolidays, key)) {{
+            return true;
+        }}
+        var month = date.getMonth() + 1;
+        var day = date.getDate();
+        var easter = -1;
+        for (var i = 0; i < recurringSpecialHolidays.length; i++) {{
+            var def = recurringSpecialHolidays[i];
+            if (def.type === 'fixed') {{
+                if (def.month === month && def.day === day) {{
+                    return true;
+                }}
+            }} else if (def.type === 'easter-relative') {{
+                var offset = def.offset || 0;
+                if (typeof offset !== 'number' || offset % 1 !== 0) {{
+                    // Unusual offsets: let the original work out the dates
+                    return original.isSpecialHoliday(date);
+                }}
+                if (easter < 0) {{
+                    easter = easterIndex(date.getFullYear());
+                }}
+                if (index === easter + offset) {{
+                    return true;
+                }}
+            }}
+        }}
+        return false;
+    }};
+
+    window.getDayType = function (date) {{
+        var index = dayIndex(date);
+        if (index < 0 || index + 1 >= codes.length || !isDefaultRecurring()) {{
+            return original.getDayType(date);
+        }}
+        var next = new Date(date);
+        next.setDate(next.getDate() + 1);
+        var key = formatDateKey(date);
+        var nextKey = formatDateKey(next);
+        if (hasDate(holidays, key) || hasDate(holidays, nextKey) ||
+                hasDate(specialHolidays, key) || hasDate(specialHolidays, nextKey)) {{
+            return original.getDayType(date);
+        }}
+        return DAY_TYPES[codes[index] >> 5];
+    }};
+}})();
+"""
+
+CHECK_SCRIPT = r"""
+const fs = require('fs'), vm = require('vm');
+const [first, last, originals, tablePath] = JSON.parse(fs.readFileSync(0, 'utf8'));
+function load(withTable) {
+    const ctx = { console, atob: s => Buffer.from(s, 'base64').toString('latin1') };
+    ctx.window = ctx;
+    vm.createContext(ctx);
+    vm.runInContext(originals, ctx);
+    if (withTable) {
+        vm.runInContext(fs.readFileSync(tablePath, 'utf8'), ctx, { filename: tablePath });
+    }
+    return ctx;
+}
+const plain = load(false), table = load(true);
+const show = value => JSON.stringify(value);
+const scenarios = [
+    ['defaults', ''],
+    ['user holidays', `holidays = [{ date: '${first + 1}-03-02' }, { date: '${last}-06-15' }];
+                       specialHolidays = [{ date: '${first + 2}-08-06' }, { date: '${first}-12-23' }];`],
+    ['custom recurring', `recurringSpecialHolidays = recurringSpecialHolidays.concat([
+                          { type: 'fixed', month: 7, day: 20 }, { type: 'easter-relative', offset: 50 },
+                          { type: 'easter-relative', offset: -48 }, { type: 'easter-relative', offset: '3' },
+                          { type: 'easter-relative' }]);`],
+    ['no recurring', 'recurringSpecialHolidays = [];'],
+];
+const report = { defaultRecurring: show(vm.runInContext('recurringSpecialHolidays', plain)),
+                 mismatches: [], checked: 0 };
+for (const [name, setup] of scenarios) {
+    vm.runInContext(setup, plain);
+    vm.runInContext(setup, table);
+    for (let year = first - 2; year <= last + 2; year++) {
+        for (const c of [[plain, 'calculateOrthodoxEaster'], [plain, 'calculateOrthodoxHolidays']]) {
+            const expected = show(plain[c[1]](year)), actual = show(table[c[1]](year));
+            report.checked++;
+            if (expected !== actual) report.mismatches.push([name, c[1], year, expected, actual]);
+        }
+        for (let date = new Date(year, 0, 1); date.getFullYear() === year; date.setDate(date.getDate() + 1)) {
+            for (const fn of ['isOrthodoxOrCyprusHoliday', 'isHoliday', 'isSpecialHoliday', 'getDayType']) {
+                const expected = plain[fn](new Date(date)), actual = table[fn](new Date(date));
+                report.checked++;
+                if (expected !== actual) report.mismatches.push([name, fn, plain.formatDateKey(date), expected, actual]);
+            }
+        }
+    }
+}
+for (const [label, ctx] of [['original', plain], ['table', table]]) {
+    vm.runInContext('holidays = []; specialHolidays = []; recurringSpecialHolidays = ' +
+                    report.defaultRecurring + ';', ctx);
+    const started = process.hrtime.bigint();
+    for (let date = new Date(first, 0, 1); date.getFullYear() <= last; date.setDate(date.getDate() + 1)) {
+        ctx.getDayType(date);
+    }
+    report[label + 'Ms'] = Number(process.hrtime.bigint() - started) / 1e6;
+}
+report.mismatches = report.mismatches.slice(0, 20).concat(report.mismatches.length > 20 ? [['...']] : []);
+console.log(JSON.stringify(report));
+"""
+
+
+def orthodox_easter(year):
+    """Gregorian date of Orthodox Easter, computed as calculateOrthodoxEaster does"""
+    a, b, c = year % 19, year % 7, year % 4
+    d = (19 * a + 15) % 30
+    e = (2 * c + 4 * b - d + 34) % 7
+    f = d + e + 114
+    return datetime.date(year, f // 31, f % 31 + 1) + datetime.timedelta(days=13)
+
+
+def holiday_id(day):
+    """Id of the automatic holiday on a date (0 for none)"""
+    if (day.month, day.day) in FIXED_HOLIDAYS:
+        return FIXED_HOLIDAYS.index((day.month, day.day)) + 1
+    offset = (day - orthodox_easter(day.year)).days
+    for position, (_, holiday_offset) in enumerate(EASTER_HOLIDAYS):
+        if offset == holiday_offset:
+            return len(FIXED_HOLIDAYS) + position + 1
+    return 0
+
+
+def is_default_special(day):
+    """isSpecialHoliday with the default recurring config and no user entries"""
+    for definition in RECURRING_SPECIAL_HOLIDAYS:
+        if definition['type'] == 'fixed':
+            if (definition['month'], definition['day']) == (day.month, day.day):
+                return True
+        elif day == orthodox_easter(day.year) + datetime.timedelta(days=definition.get('offset') or 0):
+            return True
+    return False
+
+
+def default_day_type(day):
+    """getDayType with the default recurring config and no user entries"""
+    if is_default_special(day):
+        return 'special-holiday'
+    if holiday_id(day) or day.weekday() >= 5:
+        return 'weekend-holiday'
+    if day.month == 12 and day.day == 30:
+        return 'semi-normal-day' if day.weekday() == 4 else 'normal-day'
+    following = day + datetime.timedelta(days=1)
+    if following.weekday() >= 5 or holiday_id(following) or is_default_special(following):
+        return 'semi-normal-day'
+    if day.weekday() == 4:
+        return 'semi-normal-day'
+    return 'normal-day'
+
+
+def build_table(first, last):
+    """(Easter offsets per year, packed bytes per date) for first..last"""
+    easter = [(orthodox_easter(year) - datetime.date(year, 3, 21)).days
+              for year in range(first, last + 1)]
+    codes = bytearray()
+    day = datetime.date(first, 1, 1)
+    end = datetime.date(last, 12, 31)
+    while day <= end:
+        codes.append(holiday_id(day) | DAY_TYPES.index(default_day_type(day)) << 5)
+        day += datetime.timedelta(days=1)
+    return easter, bytes(codes)
+
+
+def render(first, last):
+    """Source of the generated script"""
+    easter, codes = build_table(first, last)
+    compact = {'separators': (',', ':'), 'ensure_ascii': False}
+    return TEMPLATE.format(
+        first=first, last=last, easter=json.dumps(easter, **compact),
+        days=base64.b64encode(codes).decode('ascii'), day_types=json.dumps(DAY_TYPES, **compact),
+        orthodox=json.dumps(ORTHODOX_HOLIDAYS, **compact),
+        recurring=json.dumps([{key: value for key, value in definition.items() if key != 'name'}
+                              for definition in RECURRING_SPECIAL_HOLIDAYS], **compact))
+
+
+def original_sources(path):
+    """Source of the functions and variables --check compares, from a bundle"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    wanted = set(CHECK_FUNCTIONS) | set(CHECK_VARIABLES)
+    pieces = {}
+    for decl in iter_declarations(tokenize(io.BytesIO(data))):
+        if decl.name in wanted:
+            pieces[decl.name] = data[decl.start:decl.end].decode('utf-8')
+    missing = wanted - set(pieces)
+    if missing:
+        raise ValueError(f"{path} does not declare {', '.join(sorted(missing))}")
+    return '\n'.join(pieces[name] for name in CHECK_VARIABLES + CHECK_FUNCTIONS)
+
+
+def check(first, last, table_path, data_path, time_zones=CHECK_TIME_ZONES):
+    """Compare the table against the original functions in node; return True
+    if every result matches"""
+    payload = json.dumps([first, last, original_sources(data_path), table_path])
+    ok = True
+    for zone in time_zones:
+        result = subprocess.run(['node', '-e', CHECK_SCRIPT], input=payload, capture_output=True,
+                                text=True, env=dict(os.environ, TZ=zone))
+        if result.returncode != 0:
+            print(f"{zone}: node failed:\n{result.stderr}")
+            return False
+        report = json.loads(result.stdout)
+        if json.loads(report['defaultRecurring']) != RECURRING_SPECIAL_HOLIDAYS:
+            print(f"RECURRING_SPECIAL_HOLIDAYS differs from the default in {data_path}")
+            ok = False
+        status = 'OK' if not report['mismatches'] else f"{len(report['mismatches'])} mismatches"
+        print(f"{zone}: {report['checked']} results compared, {status}; getDayType over the range "
+              f"{report['originalMs']:.0f} ms -> {report['tableMs']:.0f} ms")
+        for mismatch in report['mismatches']:
+            print('  ' + ' | '.join(str(part) for part in mismatch))
+        ok = ok and not report['mismatches']
+    return ok
+
+
+def main():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description='Write the precomputed holiday/day-type table')
+    parser.add_argument('--years', default=f'{DEFAULT_YEARS[0]}-{DEFAULT_YEARS[1]}',
+                        help=f'year range FIRST-LAST (default: {DEFAULT_YEARS[0]}-{DEFAULT_YEARS[1]})')
+    parser.add_argument('--output', default=os.path.join(script_dir, OUTPUT_FILE),
+                        help=f'generated script (default: js/{OUTPUT_FILE})')
+    parser.add_argument('--data', default=os.path.join(script_dir, 'duty-shifts-data.js'),
+                        help='bundle with the original functions, for --check')
+    parser.add_argument('--check', action='store_true',
+                        help='compare the table with the original functions in node')
+    args = parser.parse_args()
+
+    try:
+        first, last = (int(year) for year in args.years.split('-'))
+    except ValueError:
+        parser.error('--years must look like 2000-2099')
+    if not 1970 <= first <= last:
+        parser.error('--years must be an increasing range from 1970 on')
+
+    source = render(first, last).encode('utf-8')
+    tmp_path = args.output + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(source)
+    os.replace(tmp_path, args.output)
+    print(f"Wrote {args.output}: {first}-{last}, {len(source)} bytes")
+    if args.check and not check(first, last, args.output, args.data):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Cross-file call graph for the duty-shifts sources and automatic bundle
+assignment.
+
+Every top-level declaration is a node; an edge u -> v means the body of u
+references the global v (directly, or as `v(` inside a string such as an
+inline onclick handler). Functions listed in DATA_FUNCTIONS, LOGIC_FUNCTIONS
+and UI_FUNCTIONS keep their bundle; every other function is placed in the
+bundle that minimises the number of calls crossing between bundles.
+
+Global variables always stay in data.js. Top-level statements follow the
+last-loaded bundle whose functions they reference, so code such as
+`window.renderCalendar = renderCalendar` never runs before its function
+has been defined.
+"""
+
+import os
+import sys
+from collections import namedtuple
+
+from js_tokenizer import FUNCTION_KINDS
+
+BUNDLES = ('data', 'logic', 'ui')
+
+# nodes: name -> Declaration, files: name -> path of the (last) definition,
+# edges: name -> set of referenced global names,
+# top_level: path -> set of globals referenced by top-level statements,
+# initializers: globals referenced while variable initializers run
+CallGraph = namedtuple('CallGraph', 'nodes files edges top_level initializers')
+
+
+def build_call_graph(paths, index):
+    """Build the graph for a set of files sharing one global scope"""
+    nodes = {}
+    files = {}
+    raw_edges = {}
+    top_level = {}
+    initializers = set()
+    for path in paths:
+        top_level[path] = set()
+        for decl, refs in index.references(path):
+            if decl is None:
+                top_level[path].update(refs)
+                continue
+            for name in decl.names:
+                nodes[name] = decl
+                files[name] = path
+                raw_edges.setdefault(name, set()).update(refs)
+            if decl.kind == 'variable':
+                # Initializers run at load time, just like top-level code
+                top_level[path].update(refs)
+                initializers.update(refs)
+
+    edges = {name: {ref for ref in refs if ref in nodes and ref != name}
+             for name, refs in raw_edges.items()}
+    top_level = {path: {ref for ref in refs if ref in nodes}
+                 for path, refs in top_level.items()}
+    return CallGraph(nodes, files, edges, top_level, initializers & set(nodes))
+
+
+def closure(graph, names):
+    """names plus everything the functions among them reference, transitively"""
+    seen = set()
+    pending = list(names)
+    while pending:
+        name = pending.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        pending.extend(graph.edges.get(name, ()))
+    return seen
+
+
+def is_function(decl):
+    """Whether a declaration is a function that can move between bundles"""
+    return decl.kind in FUNCTION_KINDS or decl.kind == 'class'
+
+
+def _neighbour_weights(graph):
+    """Undirected call weights between functions"""
+    functions = {name for name, decl in graph.nodes.items() if is_function(decl)}
+    weights = {name: {} for name in functions}
+    for name, refs in graph.edges.items():
+        if name not in functions:
+            continue
+        for ref in refs:
+            if ref in functions:
+                weights[name][ref] = weights[name].get(ref, 0) + 1
+                weights[ref][name] = weights[ref].get(name, 0) + 1
+    return weights
+
+
+def assign_categories(graph, seeds, default='data', max_rounds=50):
+    """Return name -> bundle for every declaration in the graph.
+
+    `seeds` maps names to their fixed bundle. Variables always live in
+    data.js, and so do unseeded functions that variable initializers call
+    while data.js loads. Every other function repeatedly moves to the bundle
+    it shares most calls with (ties keep the current bundle, then follow
+    BUNDLES order) until no function moves.
+    """
+    labels = {}
+    fixed = set()
+    for name, decl in graph.nodes.items():
+        if not is_function(decl):
+            labels[name] = 'data'
+            fixed.add(name)
+        elif seeds.get(name) in BUNDLES:
+            labels[name] = seeds[name]
+            fixed.add(name)
+        elif name in graph.initializers:
+            labels[name] = 'data'
+            fixed.add(name)
+
+    weights = _neighbour_weights(graph)
+    free = sorted(name for name in graph.nodes if name not in fixed)
+    for _ in range(max_rounds):
+        moved = False
+        for name in free:
+            scores = dict.fromkeys(BUNDLES, 0)
+            for neighbour, weight in weights[name].items():
+                bundle = labels.get(neighbour)
+                if bundle is not None:
+                    scores[bundle] += weight
+            current = labels.get(name)
+            best = max(BUNDLES, key=lambda b: (scores[b], b == current, -BUNDLES.index(b)))
+            if scores[best] == 0:
+                best = current or default
+            if best != current:
+                labels[name] = best
+                moved = True
+        if not moved:
+            break
+    return labels
+
+
+def statement_bundle(refs, labels, default='data'):
+    """Bundle for a top-level statement: the last-loaded bundle among the
+    functions it references, so they are all defined when it runs"""
+    position = BUNDLES.index(default)
+    for ref in refs:
+        bundle = labels.get(ref)
+        if bundle in BUNDLES:
+            position = max(position, BUNDLES.index(bundle))
+    return BUNDLES[position]
+
+
+def cut_size(graph, labels):
+    """Number of calls between functions placed in different bundles, plus
+    the crossing count for each (caller bundle, callee bundle) pair"""
+    total = 0
+    pairs = {}
+    for name, refs in graph.edges.items():
+        if not is_function(graph.nodes[name]):
+            continue
+        for ref in refs:
+            if not is_function(graph.nodes[ref]):
+                continue
+            a, b = labels.get(name), labels.get(ref)
+            if a != b:
+                total += 1
+                pairs[(a, b)] = pairs.get((a, b), 0) + 1
+    return total, pairs
+
+
+def call_count(graph):
+    """Total number of function-to-function references in the graph"""
+    return sum(1 for name, refs in graph.edges.items() if is_function(graph.nodes[name])
+               for ref in refs if is_function(graph.nodes[ref]))
+
+
+def print_report(graph, seeds, labels):
+    """Print how declarations were assigned and the resulting cut size"""
+    functions = [name for name, decl in graph.nodes.items() if is_function(decl)]
+    unseeded = [name for name in functions if seeds.get(name) not in BUNDLES]
+    print(f"{len(graph.nodes)} declarations, {len(functions)} functions, "
+          f"{call_count(graph)} calls between functions")
+    print(f"{len(functions) - len(unseeded)} functions seeded from the category sets, "
+          f"{len(unseeded)} assigned from the call graph")
+    for bundle in BUNDLES:
+        placed = sum(1 for name in functions if labels.get(name) == bundle)
+        auto = sum(1 for name in unseeded if labels.get(name) == bundle)
+        print(f"  {bundle}: {placed} functions ({auto} assigned automatically)")
+    total, pairs = cut_size(graph, labels)
+    print(f"Cut size: {total} cross-bundle calls")
+    for (a, b), count in sorted(pairs.items(), key=lambda item: -item[1]):
+        print(f"  {a} -> {b}: {count}")
+
+
+def main():
+    from optimize_split import categorize_function, find_source, open_index
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    try:
+        # The same source optimize_split.py splits, so the report matches
+        # the assignment it emits
+        paths = sys.argv[1:] or [find_source(script_dir)]
+    except (OSError, ValueError) as error:
+        print(f"Error: {error}")
+        return 1
+    index = open_index()
+    graph = build_call_graph(paths, index)
+    index.save()
+    seeds = {name: categorize_function(name) for name in graph.nodes}
+    labels = assign_categories(graph, seeds)
+    print_report(graph, seeds, labels)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Persistent index of the top-level declarations in the duty-shifts sources.
+
+Besides its span, every segment records the names it references, which is
+what call_graph.py builds on.
+
+The index lives in js/.split-cache/declarations.json and is keyed by the
+content hash of each file, so an unchanged file is answered straight from
+the cache. When a file has changed, the segments (declarations and the code
+between them) recorded for its previous version are matched against the new
+content from both ends; only the region in between is tokenized again.
+"""
+
+import hashlib
+import io
+import json
+import os
+import sys
+
+from js_tokenizer import (Declaration, depth_change, iter_declarations, iter_segments,
+                          referenced_names, tokenize)
+
+INDEX_VERSION = 4
+DEFAULT_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '.split-cache', 'declarations.json')
+
+
+def content_hash(data):
+    """Hash identifying the full content of a file"""
+    return hashlib.sha1(data).hexdigest()
+
+
+def segment_hash(data):
+    """Short hash of one segment's bytes"""
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _closed(token):
+    """Whether a string, template or comment token is terminated"""
+    value = token.value
+    if token.kind == 'string':
+        return len(value) > 1 and value[-1:] == value[:1] and value[-2:-1] != b'\\'
+    if token.kind == 'template':
+        return value.endswith(b'`') and len(value) > 1 or value.endswith(b'${')
+    if token.kind == 'comment' and value.startswith(b'/*'):
+        return len(value) > 3 and value.endswith(b'*/')
+    return True
+
+
+def _scan_region(data, start, end):
+    """Return (declarations, references, balanced) for data[start:end].
+
+    references is a list of (offset, name) for every name the region may
+    reference. A region that is not balanced does not end at top level, so
+    it is not safe to splice between segments recorded for an older version.
+    """
+    state = {'depth': 0, 'closed': True}
+    references = []
+
+    def watched():
+        prev = before_prev = None
+        for token in tokenize(io.BytesIO(data[start:end]), comments=True, base=start):
+            state['depth'] += depth_change(token)
+            state['closed'] = _closed(token)
+            if token.kind != 'comment':
+                for name in referenced_names(token, prev, before_prev):
+                    references.append((token.start, name))
+                prev, before_prev = token, prev
+                yield token
+
+    declarations = list(iter_declarations(watched(), base=start))
+    return declarations, references, state['depth'] == 0 and state['closed']
+
+
+def _make_segments(data, start, end, declarations, references, categorize):
+    """Serializable segment records for bytes [start, end)"""
+    segments = []
+    ref_pos = 0
+    for seg_start, seg_end, decl in iter_segments(end, declarations, start):
+        names = set()
+        while ref_pos < len(references) and references[ref_pos][0] < seg_end:
+            names.add(references[ref_pos][1])
+            ref_pos += 1
+        record = {'start': seg_start, 'end': seg_end,
+                  'hash': segment_hash(data[seg_start:seg_end])}
+        if decl is not None:
+            names.difference_update(decl.names)
+            record.update(name=decl.name, kind=decl.kind, decl_start=decl.start,
+                          names=list(decl.names), category=categorize(decl))
+        record['refs'] = sorted(names)
+        segments.append(record)
+    return segments
+
+
+def _shift(record, delta):
+    """Copy of a segment record moved by delta bytes"""
+    moved = dict(record, start=record['start'] + delta, end=record['end'] + delta)
+    if 'decl_start' in record:
+        moved['decl_start'] = record['decl_start'] + delta
+    return moved
+
+
+class DeclarationIndex:
+    """On-disk cache of top-level declarations keyed by content hash"""
+
+    def __init__(self, cache_path=DEFAULT_CACHE, categorize=None, category_version=''):
+        # cache_path=None keeps the index in memory only
+        self.cache_path = cache_path
+        self.categorize = categorize or (lambda decl: 'unknown')
+        self.category_version = category_version
+        self.files = {}   # content hash -> {'size', 'segments'}
+        self.paths = {}   # absolute path -> content hash of the last version seen
+        self.stats = {'hits': 0, 'incremental': 0, 'full': 0, 'rescanned_bytes': 0}
+        self.dirty = False
+        self._memo = {}   # absolute path -> (mtime, size, content hash) seen this run
+        self._load()
+
+    def _load(self):
+        if self.cache_path is None:
+            return
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return
+        if cached.get('version') != INDEX_VERSION:
+            return
+        self.files = cached.get('files', {})
+        self.paths = cached.get('paths', {})
+        if cached.get('category_version') != self.category_version:
+            # Category sets changed: categories are cheap to recompute
+            for entry in self.files.values():
+                for record in entry['segments']:
+                    if 'name' in record:
+                        record['category'] = self.categorize(_to_declaration(record))
+            self.dirty = True
+
+    def save(self):
+        """Write the index back to disk if anything changed"""
+        if not self.dirty or self.cache_path is None:
+            return
+        live = set(self.paths.values())
+        payload = {
+            'version': INDEX_VERSION,
+            'category_version': self.category_version,
+            'paths': self.paths,
+            'files': {h: entry for h, entry in self.files.items() if h in live},
+        }
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        tmp_path = self.cache_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, separators=(',', ':'))
+        os.replace(tmp_path, self.cache_path)
+        self.dirty = False
+
+    def segments(self, path):
+        """Segment records covering the whole file, declarations included"""
+        key = os.path.abspath(path)
+        stat = os.stat(key)
+        memo = self._memo.get(key)
+        if memo and memo[:2] == (stat.st_mtime_ns, stat.st_size) and memo[2] in self.files:
+            self.stats['hits'] += 1
+            return self.files[memo[2]]['segments']
+        with open(path, 'rb') as f:
+            data = f.read()
+        digest = content_hash(data)
+        self._memo[key] = (stat.st_mtime_ns, stat.st_size, digest)
+        previous_digest = self.paths.get(key)
+        if previous_digest != digest:
+            self.paths[key] = digest
+            self.dirty = True
+
+        entry = self.files.get(digest)
+        if entry is not None:
+            self.stats['hits'] += 1
+            return entry['segments']
+
+        previous = self.files.get(previous_digest)
+        segments = None
+        if previous is not None:
+            segments = self._update(data, previous)
+        if segments is None:
+            self.stats['full'] += 1
+            self.stats['rescanned_bytes'] += len(data)
+            declarations, references, _ = _scan_region(data, 0, len(data))
+            segments = _make_segments(data, 0, len(data), declarations, references,
+                                      self.categorize)
+        else:
+            self.stats['incremental'] += 1
+
+        self.files[digest] = {'size': len(data), 'segments': segments}
+        self.dirty = True
+        return segments
+
+    def _update(self, data, previous):
+        """Re-scan only the region between unchanged leading and trailing segments"""
+        old = previous['segments']
+        delta = len(data) - previous['size']
+
+        head = 0
+        while head < len(old):
+            record = old[head]
+            if record['end'] > len(data) or segment_hash(data[record['start']:record['end']]) != record['hash']:
+                break
+            head += 1
+        tail = len(old)
+        while tail > head:
+            record = old[tail - 1]
+            start = record['start'] + delta
+            if start < 0 or segment_hash(data[start:record['end'] + delta]) != record['hash']:
+                break
+            tail -= 1
+
+        # Re-scan one unchanged segment on each side as well: whether a
+        # statement ends at a line break, and where the comments leading a
+        # declaration begin, both depend on the neighbouring code
+        head = max(head - 1, 0)
+        tail = min(tail + 1, len(old))
+        region_start = old[head - 1]['end'] if head else 0
+        while tail < len(old) and old[tail]['start'] + delta < region_start:
+            tail += 1
+        region_end = old[tail]['start'] + delta if tail < len(old) else len(data)
+
+        declarations, references, balanced = _scan_region(data, region_start, region_end)
+        if not balanced:
+            return None
+        self.stats['rescanned_bytes'] += region_end - region_start
+        middle = _make_segments(data, region_start, region_end, declarations, references,
+                                self.categorize)
+        return old[:head] + middle + [_shift(record, delta) for record in old[tail:]]
+
+    def declarations(self, path):
+        """Declarations of a file, served from the cache when possible"""
+        return [_to_declaration(record) for record in self.segments(path) if 'name' in record]
+
+    def references(self, path):
+        """List of (declaration or None, referenced names) for every segment"""
+        return [(_to_declaration(record) if 'name' in record else None, record['refs'])
+                for record in self.segments(path)]
+
+    def categories(self, path):
+        """Map of declaration name -> category for a file"""
+        return {record['name']: record['category'] for record in self.segments(path)
+                if 'name' in record}
+
+
+def _to_declaration(record):
+    """Rebuild a Declaration from a segment record"""
+    return Declaration(record['name'], record['kind'], record['decl_start'], record['end'],
+                       record['start'], tuple(record['names']))
+
+
+def main():
+    import time
+    index = DeclarationIndex()
+    for path in sys.argv[1:]:
+        started = time.perf_counter()
+        declarations = index.declarations(path)
+        elapsed = time.perf_counter() - started
+        print(f"{path}: {len(declarations)} declarations in {elapsed * 1000:.1f} ms")
+    index.save()
+    print(f"cache hits: {index.stats['hits']}, incremental: {index.stats['incremental']}, "
+          f"full scans: {index.stats['full']}, re-scanned bytes: {index.stats['rescanned_bytes']}")
+
+
+if __name__ == '__main__':
+    main()
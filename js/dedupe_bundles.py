@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Remove declarations that several duty-shifts bundles repeat.
+
+The bundles share the page's global scope and load in the order of their
+<script> tags in duty-shifts.html, so for a name declared in more than one
+of them only one definition is live:
+
+- function declarations: the last one loaded wins (a later script
+  overwrites the global binding before any of its code runs). Copies whose
+  code is identical (comments and whitespace aside) are equivalent, so the
+  first one is kept and serves code running before the later scripts load.
+  An earlier, different definition stays when load-time code of a script
+  loaded before the winner references the name: top-level statements and
+  variable initializers, and the bodies of the functions they call right
+  away. A function that is only captured (`addEventListener('load',
+  init)`, `window.init = init`) needs its own binding at load time, but its
+  body runs later, once every bundle has loaded and the live copies are
+  in place, so what it references does not count.
+- let/const/class: the first one wins. Redeclaring it throws a SyntaxError
+  that stops the whole later script, so dropping the later copy lets that
+  script run.
+- var: identical copies not used by top-level code in between are merged
+  into the first; anything else is reported and left alone.
+
+Each declaration the pass drops is never observable by the page, so the
+bundles it writes behave like the originals.
+"""
+
+import argparse
+import os
+import re
+import sys
+
+from call_graph import build_call_graph, closure
+from defer_scripts import load_time_code
+from html_pages import local_script_paths
+from extract_inline import normalized
+from js_tokenizer import HOISTED_FUNCTION_KINDS, cut_spans
+from optimize_split import open_index
+
+BUNDLE_NAMES = ('duty-shifts-data.js', 'duty-shifts-debug.js', 'duty-shifts-night-changes.js',
+                'duty-shifts-logic.js', 'duty-shifts-ui.js')
+
+_LEXICAL = re.compile(rb'\s*(?:let|const|class)\b')
+
+
+def bundle_paths(html_path):
+    """The bundles in the order duty-shifts.html loads them"""
+    return [path for path in local_script_paths(html_path)
+            if os.path.basename(path) in BUNDLE_NAMES and os.path.exists(path)]
+
+
+def find_duplicates(paths, index):
+    """name -> [(path, Declaration, normalized code)] in load order, for
+    every name declared more than once"""
+    found = {}
+    for path in paths:
+        with open(path, 'rb') as f:
+            data = f.read()
+        for decl in index.declarations(path):
+            code = normalized(data[decl.start:decl.end])
+            for name in decl.names:
+                found.setdefault(name, []).append((path, decl, code))
+    return {name: copies for name, copies in found.items() if len(copies) > 1}
+
+
+def _load_time_refs(paths, index):
+    """path -> names top-level statements and variable initializers read,
+    plus everything the functions they call right away reference"""
+    graph = build_call_graph(paths, index)
+    refs = {}
+    for path in paths:
+        with open(path, 'rb') as f:
+            reads, calls, _ = load_time_code(f.read())
+        refs[path] = reads | closure(graph, calls & set(graph.nodes))
+    return refs
+
+
+def _observed_between(name, first, last, paths, load_refs):
+    """True if top-level code from script `first` up to (not including)
+    script `last` references name, directly or through functions it calls"""
+    order = [os.path.abspath(path) for path in paths]
+    start, end = order.index(os.path.abspath(first)), order.index(os.path.abspath(last))
+    return any(name in load_refs[paths[i]] for i in range(start, end))
+
+
+def plan(paths, index):
+    """Decide which copy of every duplicated name stays.
+
+    Returns (drops, kept, notes): drops maps path -> set of (start, end)
+    declaration spans to remove, kept maps name -> path of the live copy,
+    notes lists (name, reason) for duplicates left in place.
+    """
+    duplicates = find_duplicates(paths, index)
+    load_refs = _load_time_refs(paths, index)
+    drops = {path: set() for path in paths}
+    kept = {}
+    notes = []
+    sources = {}
+    for path in paths:
+        with open(path, 'rb') as f:
+            sources[path] = f.read()
+
+    for name, copies in duplicates.items():
+        if any(len(decl.names) > 1 for _, decl, _ in copies):
+            notes.append((name, 'declared together with other names'))
+            continue
+        kinds = {decl.kind for _, decl, _ in copies}
+        identical = len({code for _, _, code in copies}) == 1
+        if kinds <= set(HOISTED_FUNCTION_KINDS):
+            if identical:
+                live = copies[0]
+            else:
+                live = copies[-1]
+                earlier = [copy for copy in copies[:-1]
+                           if _observed_between(name, copy[0], live[0], paths, load_refs)]
+                if earlier:
+                    notes.append((name, f'the copy in {os.path.basename(earlier[0][0])} '
+                                  'may run at load time, before it is redefined'))
+                    continue
+        elif kinds == {'variable'}:
+            lexical = [copy for copy in copies
+                       if _LEXICAL.match(sources[copy[0]], copy[1].start)]
+            if lexical:
+                live = copies[0]
+            elif identical and not _observed_between(name, copies[0][0], copies[-1][0],
+                                                     paths, load_refs):
+                live = copies[0]
+            else:
+                notes.append((name, 'var assigned differently, or used in between'))
+                continue
+        else:
+            notes.append((name, 'declared as both a function and a variable'))
+            continue
+        kept[name] = live[0]
+        for path, decl, _ in copies:
+            if decl is not live[1]:
+                drops[path].add((decl.lead, decl.end))
+    return drops, kept, notes
+
+
+def write_bundles(paths, drops, out_dir):
+    """Write every bundle without its dropped spans; return
+    [(output path, bytes before, bytes after)]"""
+    results = []
+    for path in paths:
+        with open(path, 'rb') as f:
+            data = f.read()
+        deduped = cut_spans(data, drops[path])
+        output_file = os.path.join(out_dir, os.path.basename(path))
+        tmp_path = f"{output_file}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(deduped)
+        os.replace(tmp_path, output_file)
+        results.append((output_file, len(data), len(deduped)))
+    return results
+
+
+def print_report(duplicates, kept, notes):
+    """Print where the live copy of each duplicated name is"""
+    print(f"{len(duplicates)} names declared in more than one bundle")
+    for name in sorted(kept):
+        where = ', '.join(os.path.basename(path) for path, _, _ in duplicates[name])
+        print(f"  {name}: keeping {os.path.basename(kept[name])} (declared in {where})")
+    for name, reason in notes:
+        print(f"  {name}: left in place ({reason})")
+
+
+def main():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description='Remove declarations repeated across the duty-shifts bundles')
+    parser.add_argument('--html', default=os.path.join(os.path.dirname(script_dir), 'duty-shifts.html'),
+                        help='page whose script order decides which copy is live')
+    parser.add_argument('--out-dir', default=script_dir,
+                        help='directory the deduplicated bundles are written to (default: in place)')
+    parser.add_argument('--dry-run', action='store_true', help='only report the duplicates')
+    args = parser.parse_args()
+
+    paths = bundle_paths(args.html)
+    index = open_index(None)
+    duplicates = find_duplicates(paths, index)
+    drops, kept, notes = plan(paths, index)
+    print_report(duplicates, kept, notes)
+    if args.dry_run:
+        removed = sum(end - start for spans in drops.values() for start, end in spans)
+        print(f"Would remove about {removed} bytes")
+        return
+    os.makedirs(args.out_dir, exist_ok=True)
+    removed = 0
+    for output_file, before, after in write_bundles(paths, drops, args.out_dir):
+        print(f"{output_file}: {before} -> {after} bytes")
+        removed += before - after
+    print(f"Removed {removed} bytes")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
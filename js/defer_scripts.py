@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""
+Load the duty-shifts page's scripts with `defer` and the Excel libraries on
+demand.
+
+Deferred scripts download while the page is parsed and then run in document
+order, before DOMContentLoaded. That keeps the order between the bundles,
+but changes three things that the static analysis checks first:
+
+- a deferred script runs after every classic script, so a classic inline
+  script after it must not use its globals at load time
+- top-level code sees the complete document and document.readyState
+  'interactive', so `if (document.readyState === 'loading')` branches call
+  their handler immediately instead of at DOMContentLoaded: the handler
+  runs while its script is still loading, before the let/const/class
+  declarations further down that script
+- the Excel libraries (xlsx, exceljs, jszip) are no longer there at load
+  time; the functions using them are wrapped to load them first
+
+Load-time code is every top-level statement and variable initializer,
+minus function bodies, class bodies and arrow functions, which only run
+when called. A function called at load time counts with everything its
+body references, transitively; every call counts, whichever branch of a
+readyState check it is in. A name read at load time must be declared by
+the same script or by one that runs before it, and a let/const/class of
+the same script must be declared above the code that reaches it (until
+then it is in its temporal dead zone and throws a ReferenceError);
+`typeof name` is always safe.
+
+The rewrite adds `defer` to the page's external scripts, preload hints for
+the local ones in <head>, and replaces the Excel library tags with
+js/duty-shifts-libraries.js, which loads them on first use.
+"""
+
+import argparse
+import io
+import json
+import os
+import re
+import sys
+
+from call_graph import build_call_graph, closure
+from html_pages import (inline_scripts, is_classic_script, is_local, local_script_paths,
+                        parse_script_tags, read_page, script_preloads, tag_line_span)
+from js_tokenizer import CLOSERS, OPENERS, referenced_names, tokenize
+from lazy_chunks import sync_value_uses
+from optimize_split import open_index
+
+# Global -> URL pattern of the libraries only export code needs
+ON_DEMAND_LIBRARIES = {
+    'XLSX': re.compile(r'/xlsx(\.full)?(\.min)?\.js$'),
+    'ExcelJS': re.compile(r'/exceljs(\.min)?\.js$'),
+    'JSZip': re.compile(r'/jszip(\.min)?\.js$'),
+}
+LOADER_FILE = 'duty-shifts-libraries.js'
+
+_LEXICAL = re.compile(rb'\s*(?:let|const|class)\b')
+
+_CONTROL_KEYWORDS = frozenset([b'if', b'for', b'while', b'switch', b'catch', b'with', b'function'])
+
+LOADER_TEMPLATE = """// ============================================================================
+// DUTY-SHIFTS-LIBRARIES.JS - generated by js/defer_scripts.py, do not edit
+// ============================================================================
+// Libraries only export code needs, loaded (in order) the first time one of
+// the functions using them is called.
+(function () {{
+    var LIBRARIES = {libraries};
+    var pending = null;
+    function loadScript(src) {{
+        return new Promise(function (resolve, reject) {{
+            var script = document.createElement('script');
+            script.src = src;
+            script.onload = resolve;
+            script.onerror = function () {{
+                reject(new Error('Failed to load ' + src));
+            }};
+            document.head.appendChild(script);
+        }});
+    }}
+    window.loadOnDemandLibraries = function () {{
+        if (!pending) {{
+            pending = LIBRARIES.reduce(function (chain, src) {{
+                return chain.then(function () {{ return loadScript(src); }});
+            }}, Promise.resolve());
+            pending.catch(function () {{ pending = null; }});
+        }}
+        return pending;
+    }};
+    {functions}.forEach(function (name) {{
+        var fn = window[name];
+        if (typeof fn !== 'function') {{
+            return;
+        }}
+        window[name] = function () {{
+            var self = this, args = arguments;
+            return window.loadOnDemandLibraries().then(function () {{
+                return fn.apply(self, args);
+            }});
+        }};
+    }});
+}})();
+"""
+
+
+def _matching(tokens):
+    """index of an opening bracket -> index of its closing bracket"""
+    match = {}
+    stack = []
+    for i, token in enumerate(tokens):
+        if token.kind == 'punct' and token.value in OPENERS:
+            stack.append(i)
+        elif token.kind == 'punct' and token.value in CLOSERS:
+            if stack:
+                match[stack.pop()] = i
+        elif token.kind == 'template':
+            if token.value.startswith(b'}') and stack:
+                stack.pop()
+            if token.value.endswith(b'${'):
+                stack.append(i)
+    return match
+
+
+def load_time_uses(code):
+    """Names top-level code uses while a script loads, in source order.
+
+    Returns (uses, dom): uses lists (offset, name, called, direct) for every
+    name read outside function bodies (typeof checks excluded); called is
+    whether it is called right away, direct whether it is a plain identifier
+    rather than `window.name`. dom is whether the code touches `document`.
+    """
+    tokens = list(tokenize(io.BytesIO(code)))
+    match = _matching(tokens)
+    opened = {close: open_ for open_, close in match.items()}
+    reads = []   # (token index, name)
+    calls = set()  # token indices of names called right away
+    indirect = set()  # token indices of names read as window.name
+    dom = False
+
+    def end_of(i):
+        return match.get(i, len(tokens) - 1)
+
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        value = token.value
+        following = tokens[i + 1] if i + 1 < len(tokens) else None
+        if token.kind == 'name' and value == b'function':
+            # Declaration or expression: name and parameters aside, the
+            # body only runs when called
+            j = i + 1
+            while j < len(tokens) and tokens[j].value != b'(':
+                j += 1
+            j = end_of(j) + 1
+            if j >= len(tokens) or tokens[j].value != b'{':
+                i = j
+                continue
+            after = end_of(j) + 1
+            start = i - 1 if i > 0 and tokens[i - 1].value == b'async' else i
+            # A declaration statement is never called in place: a '(' after
+            # it starts the next statement
+            declaration = start == 0 or tokens[start - 1].value in (b';', b'{', b'}')
+            invoked = not declaration and after < len(tokens) and (
+                tokens[after].value == b'(' or (tokens[after].value == b')' and after + 1 < len(tokens)
+                                                and tokens[after + 1].value == b'('))
+            # An IIFE body runs right away
+            i = j + 1 if invoked else after
+            continue
+        if token.kind == 'name' and value == b'class':
+            j = i + 1
+            while j < len(tokens) and tokens[j].value != b'{':
+                if tokens[j - 1].value == b'extends' and tokens[j].kind == 'name':
+                    # The base class is evaluated right away
+                    reads.append((j, tokens[j].value.decode()))
+                j += 1
+            i = end_of(j) + 1
+            continue
+        if token.kind == 'punct' and value == b'=>':
+            # Parameters are bindings, not reads
+            previous = tokens[i - 1]
+            first = opened.get(i - 1, i - 1) if previous.value == b')' else i - 1
+            reads = [(k, name) for k, name in reads if k < first]
+            if following is not None and following.value == b'{':
+                i = end_of(i + 1) + 1
+                continue
+            j = i + 1
+            while j < len(tokens):
+                if tokens[j].kind == 'punct' and tokens[j].value in OPENERS:
+                    j = end_of(j) + 1
+                    continue
+                if tokens[j].value in (b')', b']', b'}', b',', b';'):
+                    break
+                j += 1
+            i = j
+            continue
+        if (token.kind == 'punct' and value == b')' and following is not None
+                and following.value == b'{'):
+            opening = opened.get(i, 0)
+            before = tokens[opening - 1] if opening > 0 else None
+            if before is not None and before.kind == 'name' and before.value not in _CONTROL_KEYWORDS:
+                # Method shorthand `name(...) { ... }`
+                i = end_of(i + 1) + 1
+                continue
+        if i > 0 and tokens[i - 1].value == b'typeof' and token.kind == 'name':
+            i += 1
+            continue
+        prev = tokens[i - 1] if i > 0 else None
+        before_prev = tokens[i - 2] if i > 1 else None
+        if token.kind == 'name':
+            for name in referenced_names(token, prev, before_prev):
+                if following is not None and following.value == b':' and prev is not None \
+                        and prev.value in (b'{', b','):
+                    continue  # object key
+                if (following is not None and following.value == b'(' and prev is not None
+                        and prev.value in (b'{', b',', b'async', b'get', b'set')
+                        and end_of(i + 1) + 1 < len(tokens)
+                        and tokens[end_of(i + 1) + 1].value == b'{'):
+                    continue  # method name `name(...) { ... }`
+                reads.append((i, name))
+                if following is not None and following.value == b'(':
+                    calls.add(i)
+                if prev is not None and prev.value in (b'.', b'?.'):
+                    indirect.add(i)
+                if name == 'document':
+                    dom = True
+        i += 1
+    return [(tokens[k].start, name, k in calls, k not in indirect)
+            for k, name in reads], dom
+
+
+def load_time_code(code):
+    """What top-level code does while a script loads.
+
+    Returns (reads, calls, dom): names read outside function bodies (typeof
+    checks excluded), the subset called right away, and whether it touches
+    `document`.
+    """
+    uses, dom = load_time_uses(code)
+    return {name for _, name, _, _ in uses}, {name for _, name, called, _ in uses if called}, dom
+
+
+def declared_names(path, index):
+    """Names a script declares at top level"""
+    return {name for decl in index.declarations(path) for name in decl.names}
+
+
+def lexical_declarations(path, code, index):
+    """name -> offset of every top-level let/const/class a script declares"""
+    return {name: decl.start for decl in index.declarations(path)
+            if _LEXICAL.match(code, decl.start) for name in decl.names}
+
+
+def analyze(html_path, index):
+    """Per local script, in load order: what its load-time code needs.
+
+    Returns (scripts, problems): scripts is a list of dicts with 'path',
+    'reads', 'calls', 'dom' and 'library_users' (functions referencing an
+    on-demand library); problems lists messages for reads that would run
+    before the defining script, or before a let/const/class further down
+    the same script.
+    """
+    paths = [path for path in local_script_paths(html_path) if os.path.exists(path)]
+    graph = build_call_graph(paths, index)
+    declared = {path: declared_names(path, index) for path in paths}
+    defined_by = {}
+    for path in paths:
+        for name in declared[path]:
+            defined_by.setdefault(name, path)
+    scripts = []
+    problems = []
+    for position, path in enumerate(paths):
+        with open(path, 'rb') as f:
+            code = f.read()
+        uses, dom = load_time_uses(code)
+        reads = {name for _, name, _, _ in uses}
+        calls = {name for _, name, called, _ in uses if called}
+        available = set().union(*(declared[p] for p in paths[:position + 1]))
+        needed = reads | closure(graph, calls & set(graph.nodes))
+        for name in sorted(needed):
+            if name in ON_DEMAND_LIBRARIES and name in reads:
+                problems.append(f"{os.path.basename(path)} uses {name} while loading")
+            elif name in defined_by and name not in available:
+                problems.append(f"{os.path.basename(path)} needs {name} from "
+                                f"{os.path.basename(defined_by[name])} before it has run")
+        lexical = lexical_declarations(path, code, index)
+        too_early = set()
+        for offset, name, called, direct in uses:
+            if called and name in graph.nodes:
+                reached = closure(graph, {name})
+            else:
+                # let/const/class never become window properties
+                reached = {name} if direct else set()
+            too_early |= {later for later in reached if lexical.get(later, -1) > offset}
+        for name in sorted(too_early):
+            problems.append(f"{os.path.basename(path)} uses {name} while loading, "
+                            f"before its declaration")
+        users = sorted(decl.name for decl, refs in index.references(path)
+                       if decl is not None and set(refs) & set(ON_DEMAND_LIBRARIES))
+        scripts.append({'path': path, 'reads': reads, 'calls': calls, 'dom': dom,
+                        'library_users': users})
+    return scripts, problems
+
+
+def library_wrappers(scripts, index, html):
+    """Functions to wrap so the libraries load on demand, or problems that
+    keep the libraries eager"""
+    users = []
+    problems = []
+    segments = []
+    for script in scripts:
+        segments += [(script['path'], record['start'], record['end'])
+                     for record in index.segments(script['path'])]
+    kinds = {decl.name: decl.kind for script in scripts for decl in index.declarations(script['path'])}
+    handler_code = ' '.join(inline_scripts(html))
+    for script in scripts:
+        for name in script['library_users']:
+            if any(name in other['reads'] and name not in other['calls'] for other in scripts):
+                problems.append(f"{name} is captured at load time, before it can be wrapped")
+            if kinds.get(name) != 'async function':
+                uses = sum(sync_value_uses(path, [(start, end)], name) for path, start, end in segments)
+                if uses:
+                    problems.append(f"{name} is not async and {uses} callers use its result")
+            if re.search(r'\b' + re.escape(name) + r'\b', handler_code):
+                problems.append(f"{name} is used by an inline script")
+            users.append(name)
+    return users, problems
+
+
+def rewrite_page(html, libraries, loader_src):
+    """Page with deferred external scripts, preload hints and (if loader_src
+    is given) the library tags replaced by the on-demand loader.
+
+    Hints are kept in step with the page: one per local script it loads,
+    and none for scripts it no longer loads (such as lazy chunks).
+    """
+    edits = []
+    scripts = []
+    removed_libraries = False
+    for tag in parse_script_tags(html):
+        src = tag.attrs.get('src')
+        if not src or not is_classic_script(tag):
+            continue
+        if loader_src is not None and src in libraries:
+            edits.append(tag_line_span(html, tag.start, tag.end) + ('',))
+            removed_libraries = True
+            continue
+        opening = html[tag.start:html.index('>', tag.start) + 1]
+        if 'defer' not in tag.attrs and 'async' not in tag.attrs:
+            edits.append((tag.start, tag.start + len(opening), opening[:-1].rstrip() + ' defer>'))
+        scripts.append(src)
+    if removed_libraries and loader_src not in scripts:
+        # The loader wraps functions of the bundles, so it runs after them
+        last = [tag for tag in parse_script_tags(html) if tag.attrs.get('src') and is_local(tag.attrs['src'])][-1]
+        line_start = html.rfind('\n', 0, last.start) + 1
+        indent = html[line_start:last.start] if not html[line_start:last.start].strip() else ''
+        edits.append((last.end, last.end, f'\n{indent}<script src="{loader_src}" charset="UTF-8" defer></script>'))
+        scripts.append(loader_src)
+    preloaded = set()
+    for tag in script_preloads(html):
+        if tag.attrs['href'] in scripts:
+            preloaded.add(tag.attrs['href'])
+        else:
+            edits.append(tag_line_span(html, tag.start, tag.end) + ('',))
+    hints = ''.join(f'    <link rel="preload" href="{src}" as="script">\n'
+                    for src in scripts if is_local(src) and src not in preloaded)
+    head_end = html.lower().find('</head>')
+    if hints and head_end >= 0:
+        edits.append((head_end, head_end, hints))
+    for start, end, text in sorted(edits, key=lambda edit: edit[0], reverse=True):
+        html = html[:start] + text + html[end:]
+    return html
+
+
+def print_report(scripts, problems, library_problems, users):
+    for script in scripts:
+        notes = []
+        if script['dom']:
+            notes.append('touches the DOM')
+        if script['calls']:
+            notes.append(f"calls {len(script['calls'])} functions")
+        if script['library_users']:
+            notes.append(f"uses the Excel libraries in {', '.join(script['library_users'])}")
+        print(f"{os.path.basename(script['path'])}: load-time code reads {len(script['reads'])} "
+              f"names{'; ' + '; '.join(notes) if notes else ''}")
+    for problem in problems + library_problems:
+        print(f"  problem: {problem}")
+    if users and not problems and not library_problems:
+        print(f"Excel libraries load on first call of {', '.join(users)}")
+
+
+def main():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description='Defer the page scripts and load the Excel libraries on demand')
+    parser.add_argument('--html', default=os.path.join(os.path.dirname(script_dir), 'duty-shifts.html'),
+                        help='page to rewrite')
+    parser.add_argument('--dry-run', action='store_true', help='only report the analysis')
+    args = parser.parse_args()
+
+    html = read_page(args.html)
+    index = open_index(None)
+    scripts, problems = analyze(args.html, index)
+    libraries = [tag.attrs['src'] for tag in parse_script_tags(html) if tag.attrs.get('src')
+                 and any(pattern.search(tag.attrs['src']) for pattern in ON_DEMAND_LIBRARIES.values())]
+    users, library_problems = library_wrappers(scripts, index, html)
+
+    # Classic inline scripts run before deferred ones
+    deferred = set().union(*(declared_names(script['path'], index) for script in scripts))
+    for code in inline_scripts(html):
+        reads, _, _ = load_time_code(code.encode('utf-8'))
+        problems += [f"an inline script uses {name} while loading" for name in sorted(reads & deferred)]
+    print_report(scripts, problems, library_problems, users)
+    if problems:
+        print("Not rewriting the page")
+        return 1
+    if args.dry_run:
+        return 0
+
+    loader_src = None
+    if libraries and not library_problems:
+        base = os.path.dirname(os.path.abspath(args.html))
+        loader_path = os.path.join(script_dir, LOADER_FILE)
+        loader_src = os.path.relpath(loader_path, base).replace(os.sep, '/')
+        source = LOADER_TEMPLATE.format(libraries=json.dumps(libraries, indent=8).replace('\n]', '\n    ]'),
+                                        functions=json.dumps(users))
+        tmp_path = loader_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(source)
+        os.replace(tmp_path, loader_path)
+        print(f"Wrote {loader_path}")
+    updated = rewrite_page(html, libraries, loader_src)
+    if updated != html:
+        tmp_path = args.html + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(updated)
+        os.replace(tmp_path, args.html)
+        print(f"Updated {args.html}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
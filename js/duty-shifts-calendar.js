@@ -0,0 +1,142 @@
+// ============================================================================
+// DUTY-SHIFTS-CALENDAR.JS - generated by js/calendar_table.py, do not edit
+// ============================================================================
+// Holidays and day types of 2000-2099 as a lookup table. Load after
+// duty-shifts-data.js: the functions below replace the originals, which
+// still answer everything the table does not cover.
+(function () {
+    var FIRST_YEAR = 2000;
+    var LAST_YEAR = 2099;
+    // Days from March 21 to Orthodox Easter, per year
+    var EASTER = [40,25,45,37,21,41,33,18,37,29,14,34,25,45,30,22,41,26,18,38,29,42,34,26,45,30,22,42,26,18,38,23,42,34,19,39,30,15,35,27,46,31,23,43,34,19,39,31,15,35,27,47,31,23,43,28,19,39,24,44,35,20,40,32,23,36,28,20,39,24,44,29,20,40,32,17,36,28,48,33,24,44,29,21,40,25,17,37,28,41,33,18,37,29,21,34,25,45,37,22];
+    // Per date: automatic holiday id (bits 0-4), default day type (bits 5-6)
+    var DAYS = 'YUAAACBCIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAAAAgQ0AAAAAAIERAAAAAACBAQAAAAAAgQEAAAAAAIEBNAAAAIE5vcEUAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQCBGAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEcAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEhAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQGBpSgAAIEBrYQAAACBCQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBMAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBDAAAAACBARAAAAAAgQE0AAAAgTm9wUQAAACBAQAAAAAAgQEAgRQAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQFIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAIEYAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBARwAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBASAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAYGlKACBAQGthAAAgQEIAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQEMAAAAgQEBEAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBNACBFIE5vcFEAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAgRiBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQCBHAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBIAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQCBgaUogQEAAa2EAIEBAQgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAAAAgQEAgQwAAIEBAIEQAACBAQAAAAAAgQEAAAAAAIEBNAAAAIE5vcFEAIEUgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAACBGQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAIEcAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAIEgAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAIGBpSkBAAABrYSBAQCBCAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBMAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAgQyBAQAAAIEQgQE0AAAAgTm9wUQAAACBAQAAAAAAgQEAAAAAAIEVAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQFIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBGAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAIEdAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAIEggQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAIGBpSgAAAABrYUAAACBCIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAACBDQEAAAAAgREBAAAAAACBAQAAAAAAgQEAAAAAAIEBNAAAAIE5vZVEAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEYAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgR0AAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAgSEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgYGlKAAAAIGthAAAAIEJAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAAAAgQEAAAAAAIENAAAAAACBEQAAAAAAgQEAAAAAAIEBNAAAAIE5vcFEAAAAgQEBFAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAgRgAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBHAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBIQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBgaUoAACBAa2EAAAAgQkAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBMAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQwAAAAAgQEQAAAAgTm9wUQAAACBAQAAAAAAgQEAAAAAAIEBAIEUAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQFIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAACBGACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEcAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEgAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQGBpSgAgQEBrYQAAIEBCAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAAAAgQEAgQwAAIEBAIEQAACBAQAAAAAAgQEAAAAAAIEBNAAAAIE5vcFEAIEUgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAACBGQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAIEcAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAIEgAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAIGBpSkBAAABrYSBAQCBCAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAAAAgQEAAAAAAIEBAACBDACBAQAAgRAAgQEAAAAAAIEBNAAAAIE5vcFEAAAAgQEAAAAAgRUBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEZAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAgRyBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAgSAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAgYGlKQAAAAGthQEAAIEIAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBMAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAIEMgQE0AACBETm9wUQAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBFQAAAAAAgQEAAAAAAIEBAAAAAACBAQFIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBARgAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAACBHQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAACBIIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAACBgaUoAAAAAa2FAAAAgQiBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAAAAgQEAAAAAgQ0BAAAAAIERAQAAAAAAgQEAAAAAAIEBNAAAAIE5vcFEAAAAgQEUAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBGAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEdAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAIEhAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIGBpSgAAACBrYQAAACBCQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQwAAAAAgQEQAAAAAIEBNAAAAIE5vcFEAAAAgQEAAAAAAIEBAIEUAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAACBGACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEcAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEgAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQGBpSgAgQEBrYQAAIEBCAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEwAAAAgQEBDAAAAIEBARAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBATQAgRSBOb3BRAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAUgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAIEYgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAgRwAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBASAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAgYGlKIEBAAGthACBAQEIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAAAAgQEAAAAAAIEBAIEMAACBAQCBEAAAgQEAAAAAAIEBNAAAAIE5vcFEAAAAgQEAAACBFIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAgRkBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAACBHACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQCBIAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAACBgaUpAQAAAa2EgQEAgQgAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAgQwAgQEAAIEQAIEBNAAAAIE5vcFEAAAAgQEAAAAAAIEBAAAAAIEVAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBGQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAIEcgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAIEgAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAIGBpSkAAAABrYUBAACBCACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEwAAAAgQEAAAAAgQ0BAAAAAIERAQAAAAAAgQEAAAAAAIEBAAAAAACBATQAAACBOb2VRAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAUgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBGAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEdAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAIEhAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIGBpSgAAACBrYQAAACBCQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBDQAAAAAAgREAAAAAAIEBNAAAAIE5vcFEAAAAgQEAAAAAAIEBARQAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAIEYAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBARwAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgSEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAYGlKAAAgQGthAAAAIEJAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEMAAAAAIEBEAAAAIE5vcFEAAAAgQEAAAAAAIEBAAAAAACBAQCBFAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAgRgAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBHAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBIAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBgaUoAIEBAa2EAACBAQgAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEwAAAAgQEAAAAAAIEBAQwAAACBAQEQAAAAgQEAAAAAAIEBAAAAAACBATQAAACBOb3BRIEUAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAUgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAACBGIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAIEcAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEgAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAIGBpSiBAQABrYQAgQEBCAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEwAAAAgQEAAAAAAIEBAAAAAACBAQAAgQwAgQEAAIEQAIEBAAAAAACBATQAAACBOb3BRAAAAIEBAAAAAIEVAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAUgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBGQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAIEcgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAIEgAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAIGBpSkAAAABrYUBAACBCACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEwAAAAgQEAAACBDIEBAAAAgRCBAQAAAAAAgQEAAAAAAIEBAAAAAACBATQAAACBOZXBRAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAUgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEYAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAgR0BAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAgSCBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAgYGlKAAAAAGthQAAAIEIgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEwAAAAgQEAAAAAAIEBAAAAAIENAQAAAACBEQEAAAAAAIEBAAAAAACBATQAAACBOb3BRAAAAIEBFAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAUgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBARgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBHQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAACBIQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBgaUoAAAAga2EAAAAgQkBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEwAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQ0AAAAAAIERAAAAAACBATQAAACBOb3BRAAAAIEBAAAAAACBAQEUAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAUgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQCBGAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEcAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEhAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQGBpSgAAIEBrYQAAACBCQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBMAAAAIEBAQwAAACBAQEQAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQE0AIEUgTm9wUQAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQFIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAACBGIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAIEcAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEgAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAIGBpSiBAQABrYQAgQEBCAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEwAAAAgQEAAAAAAIEBAAAAAACBAQCBDAAAgQEAgRAAAIEBAAAAAACBATQAAACBOb3BRAAAAIEBAAAAgRSBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAUgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAIEZAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAgRwAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAgSAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAgYGlKQEAAAGthIEBAIEIAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEwAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAIEMAIEBAACBEACBATQAAACBOb3BRAAAAIEBAAAAAACBAQAAAACBFQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAUgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgRkAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAACBHIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAACBIACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAACBgaUpAAAAAa2FAQAAgQgAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBMAAAAIEBAAAAgQyBAQAAAIEQgQEAAAAAAIEBAAAAAACBAQAAAAAAgQE0AAAAgTmVwUQAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQFIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBGAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAIEdAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAIEggQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAIGBpSgAAAABrYUAAACBCIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEwAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQ0AAAAAAIERAAAAAACBATQAAACBOb3BRAAAAIEBAAAAAACBAQEUAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAUgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQCBGAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEcAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEhAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQGBpSgAAIEBrYQAAACBCQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEwAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBDAAAAACBARAAAACBOb3BRAAAAIEBAAAAAACBAQAAAAAAgQEAgRQAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAUgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAIEYAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBARwAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBASAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAYGlKACBAQGthAAAgQEIAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBMAAAAIEBAAAAAACBAQEMAAAAgQEBEAAAAIEBAAAAAACBAQAAAAAAgQE0AAAAgTm9wUSBFACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQFIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAgRiBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQCBHAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBIAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQCBgaUogQEAAa2EAIEBAQgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEwAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAgQwAAIEBAIEQAACBATQAAACBOb3BRAAAAIEBAAAAAACBAQAAAIEUgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAUgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAACBGQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAIEcAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAIEgAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAIGBpSkBAAABrYSBAQCBCAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBMAAAAIEBAAAAgQyBAQAAAIEQgQEAAAAAAIEBAAAAAACBAQAAAAAAgQE0AAAAgTmVwUQAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQFIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBGAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAIEdAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAIEggQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAIGBpSgAAAABrYUAAACBCIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBMAAAAIEBAAAAAACBAQAAAACBDQEAAAAAgREBAAAAAACBAQAAAAAAgQE0AAAAgTm9wUQAAACBARQAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQFIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEYAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgR0AAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAgSEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgYGlKAAAAIGthAAAAIEJAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEwAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIENAAAAAACBETQAAACBOb3BRAAAAIEBAAAAAACBAQAAAAAAgQEBFAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAUgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAgRgAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBHAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBIQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBgaUoAACBAa2EAAAAgQkAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBMAAAAIEBAAAAAACBAQwAAAAAgQEQAAAAAIEBAAAAAACBAQAAAAAAgQE0AAAAgTm9wUUUAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQFIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAACBGACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEcAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEgAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQGBpSgAgQEBrYQAAIEBCAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBMAAAAIEBAAAAAACBAQAAAAAAgQEAgQwAAIEBAIEQAACBAQAAAAAAgQE0AAAAgTm9wUQAAACBAQAAAIEUgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQFIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAACBGQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAIEcAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAIEgAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAIGBpSkBAAABrYSBAQCBCAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEwAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAACBDACBATQAgRCBOb3BRAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAgRUBAAAAAACBAQAAAAAAgQEAAAAAAIEBAUgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEZAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAgRyBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAgSAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAgYGlKQAAAAGthQEAAIEIAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBMAAAAIEBAAAAAACBAQAAAIEMgQEAAACBEIEBAAAAAACBAQAAAAAAgQE0AAAAgTm9wUQAAACBFQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQFIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBARgAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAACBHQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAACBIIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAACBgaUoAAAAAa2FAAAAgQiBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBMAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAgQ0BAAAAAIERAQAAAAAAgQE0AAAAgTm9wUQAAACBAQAAAAAAgQEUAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQFIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBGAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEdAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAIEhAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIGBpSgAAACBrYQAAACBCQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQwAAAAAgQEQAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBNIEUAIE5vcFEAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAACBGACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEcAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEgAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQGBpSgAgQEBrYQAAIEBCAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBMAAAAIEBAAAAAACBAQAAAAAAgQEBDAAAAIEBARAAAACBAQAAAAAAgQE0AAAAgTm9wUQAAACBAQAAgRQAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQFIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAIEYgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAgRwAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBASAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAgYGlKIEBAAGthACBAQEIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBMAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAIEMAACBAQCBEAAAgQE0AAAAgTm9wUQAAACBAQAAAAAAgQEAAACBFIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQFIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAgRkBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAACBHACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQCBIAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAACBgaUpAQAAAa2EgQEAgQgAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAgQwAgQEAAIEQAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBNAAAAIEVvcFEAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBGQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAIEcgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAIEgAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAIGBpSkAAAABrYUBAACBCACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAAAAgQEAAAAAgQ0BAAAAAIERAQAAAAAAgQEAAAAAAIEBNAAAAIE5vcFEAAAAgQEUAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBGAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEdAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAIEhAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIGBpSgAAACBrYQAAACBCQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBMAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBDQAAAAAAgRE0AAAAgTm9wUQAAACBAQAAAAAAgQEAAAAAAIEBARQAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQFIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAIEYAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBARwAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgSEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAYGlKAAAgQGthAAAAIEJAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAAAAgQEMAAAAAIEBEAAAAACBAQAAAAAAgQEAAAAAAIEBNAAAAIE5vcFFFAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAgRgAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBHAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBIAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBgaUoAIEBAa2EAACBAQgAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAAAAgQEAAAAAAIEBAQwAAACBAQEQAAAAgQEAAAAAAIEBNAAAAIE5vcFEAAAAgQEAAIEUAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAACBGIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAIEcAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEgAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAIGBpSiBAQABrYQAgQEBCAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBMAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAgQwAgQE0AIEQgTm9wUQAAACBAQAAAAAAgQEAAAAAAIEBAAAAAIEVAQAAAAAAgQEAAAAAAIEBAAAAAACBAQFIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBGQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAIEcgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAIEgAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAIGBpSkAAAABrYUBAACBCACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAAAAgQEAAACBDIEBAAAAgRCBAQAAAAAAgQEAAAAAAIEBNAAAAIE5vcFEAAAAgRUAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEYAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAgR0BAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAgSCBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAgYGlKAAAAAGthQAAAIEIgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAIENAQAAAACBEQEAAAAAAIEBNAAAAIE5vcFEAAAAgQEAAAAAAIEBFAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBARgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBHQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAACBIQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBgaUoAAAAga2EAAAAgQkBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEwAAAAgQ0AAAAAAIERAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBATUUAACBOb3BRAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAUgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQCBGAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEcAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEhAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQGBpSgAAIEBrYQAAACBCQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAAAAgQEAAAAAAIEBAQwAAACBAQEQAAAAgQEAAAAAAIEBNAAAAIE5vcFEAAAAgQEAAIEUAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAACBGIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAIEcAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEgAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAIGBpSiBAQABrYQAgQEBCAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQCBDAAAgQEAgRAAAIEBNAAAAIE5vcFEAAAAgQEAAAAAAIEBAAAAgRSBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAIEZAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAgRwAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAgSAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAgYGlKQEAAAGthIEBAIEIAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEwAAAAgQEAAIEMAIEBAACBEACBAQAAAAAAgQEAAAAAAIEBAAAAAACBATQAAACBFb3BRAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAUgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgRkAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAACBHIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAACBIACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAACBgaUpAAAAAa2FAQAAgQgAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAAAAgQEAAAAAAIEBAAAAgQyBAQAAAIEQgQEAAAAAAIEBNAAAAIE5vcFEAAAAgQEAAAAAAIEVAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBGAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAIEdAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAIEggQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAIGBpSgAAAABrYUAAACBCIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQ0AAAAAAIERNAAAAIE5vcFEAAAAgQEAAAAAAIEBAAAAAACBAQEUAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQCBGAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEcAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEhAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQGBpSgAAIEBrYQAAACBCQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEwAAAAgQEAAAAAAIEBDAAAAACBARAAAAAAgQEAAAAAAIEBAAAAAACBATQAAACBOb3BRRQAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAUgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAIEYAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBARwAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBASAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAYGlKACBAQGthAAAgQEIAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEMAAAAgQEBEAAAAIEBNAAAAIE5vcFEAAAAgQEAAAAAAIEBAACBFACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAgRiBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQCBHAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBIAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQCBgaUogQEAAa2EAIEBAQgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEwAAAAgQEAgQwAAIEBAIEQAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBATQAAIEVOb3BRAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAUgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAACBGQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAIEcAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAIEgAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAIGBpSkBAAABrYSBAQCBCAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEwAAAAgQEAAAAAAIEBAAAAgQyBAQAAAIEQgQEAAAAAAIEBAAAAAACBATQAAACBOb3BRAAAAIEVAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAUgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBGAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAIEdAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAIEggQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAIGBpSgAAAABrYUAAACBCIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAACBDQEAAAAAgREBNAAAAIE5vcFEAAAAgQEAAAAAAIEBAAAAAACBARQAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEYAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgR0AAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAgSEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgYGlKAAAAIGthAAAAIEJAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEwAAAAgQEAAAAAAIENAAAAAACBEQAAAAAAgQEAAAAAAIEBAAAAAACBATQAAACBOb3BFAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAUgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAgRgAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBHAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBIQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBgaUoAACBAa2EAAAAgQkAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEwAAAAgQEAAAAAAIEBAAAAAACBAQwAAAAAgQEQAAAAAIEBAAAAAACBATQAAACBOb3BRAAAAIEBAIEUAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAUgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAACBGACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEcAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEgAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQGBpSgAgQEBrYQAAIEBCAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEwAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAgQwAAIEBAIEQAACBATQAAACBOb3BRAAAAIEBAAAAAACBAQAAAIEUgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAUgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAACBGQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAIEcAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAIEgAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAIGBpSkBAAABrYSBAQCBCAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEwAAAAgQEAAAAAAIEBAACBDACBAQAAgRAAgQEAAAAAAIEBAAAAAACBATQAAACBOb3BRAAAgRUBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAUgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEZAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAgRyBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAgSAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAgYGlKQAAAAGthQEAAIEIAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEwAAAAgQEAAAAAAIEBAAAAAACBAQAAAIEMgQEAAACBEIEBAAAAAACBATQAAACBOb3BRAAAAIEBAAAAAACBFQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAUgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBARgAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAACBHQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAACBIIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAACBgaUoAAAAAa2FAAAAgQiBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEwAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAgQ0BAAAAAIERATQAAACBOb3BRAAAAIEBAAAAAACBAQAAAAAAgQEUAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAUgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBGAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEdAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAIEhAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIGBpSgAAACBrYQAAACBCQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBMAAAAIEBAAAAAACBAQwAAAAAgQEQAAAAAIEBAAAAAACBAQAAAAAAgQE0AAAAgTm9wUUUAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQFIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAACBGACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEcAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEgAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQGBpSgAgQEBrYQAAIEBCAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEwAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBDAAAAIEBARAAAACBATQAAACBOb3BRAAAAIEBAAAAAACBAQAAgRQAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAUgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAIEYgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAgRwAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBASAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAgYGlKIEBAAGthACBAQEIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBMAAAAIEBAIEMAACBAQCBEAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQE0AACBFTm9wUQAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQFIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAgRkBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAACBHACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQCBIAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAACBgaUpAQAAAa2EgQEAgQgAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEwAAAAgQEAAAAAAIEBAAAAAACBAQAAgQwAgQEAAIEQAIEBAAAAAACBATQAAACBOb3BRAAAAIEBAAAAAIEVAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAUgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBGQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAIEcgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAIEgAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAIGBpSkAAAABrYUBAACBCACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEwAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAgQ0BAAAAAIERATQAAACBOb3BRAAAAIEBAAAAAACBAQAAAAAAgQEUAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAUgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBGAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEdAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAIEhAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIGBpSgAAACBrYQAAACBCQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBMAAAAIEBAAAAAACBDQAAAAAAgREAAAAAAIEBAAAAAACBAQAAAAAAgQE0AAAAgTm9wRQAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQFIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAIEYAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBARwAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgSEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAYGlKAAAgQGthAAAAIEJAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBMAAAAIEBAAAAAACBAQAAAAAAgQEMAAAAAIEBEAAAAACBAQAAAAAAgQE0AAAAgTm9wUQAAACBAQCBFAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQFIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAgRgAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBHAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBIAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBgaUoAIEBAa2EAACBAQgAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEwAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAQwAAACBATUQAACBOb3BRAAAAIEBAAAAAACBAQAAAAAAgQEAAIEUAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAUgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAACBGIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAIEcAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEgAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAIGBpSiBAQABrYQAgQEBCAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBMAAAAIEBAAAAAACBAQAAgQwAgQEAAIEQAIEBAAAAAACBAQAAAAAAgQE0AAAAgTm9wUQAAIEVAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQFIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBGQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAIEcgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAIEgAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAIGBpSkAAAABrYUBAACBCACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBMAAAAIEBAAAAAACBAQAAAAAAgQEAAACBDIEBAAAAgRCBAQAAAAAAgQE0AAAAgTm9wUQAAACBAQAAAAAAgRUAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQFIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEYAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAgR0BAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAgSCBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAgYGlKAAAAAGthQAAAIEIgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAIENAQAAAACBEQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBFAAAAIE5vcFEAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBARgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBHQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAACBIQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBgaUoAAAAga2EAAAAgQkBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBMAAAAIEBAAAAAACBAQAAAAAAgQ0AAAAAAIERAAAAAACBAQAAAAAAgQE0AAAAgTm9wUQAAACBAQEUAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQFIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQCBGAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEcAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEhAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQGBpSgAAIEBrYQAAACBCQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBMAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAQwAAACBAQEQAAAAgQE0AAAAgTm9wUQAAACBAQAAAAAAgQEAAIEUAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQFIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAACBGIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAIEcAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEgAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAIGBpSiBAQABrYQAgQEBCAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQCBDAAAgQEAgRAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBNAAAgRU5vcFEAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAIEZAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAgRwAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAgSAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAgYGlKQEAAAGthIEBAIEIAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBMAAAAIEBAAAAAACBAQAAAAAAgQEAAIEMAIEBAACBEACBAQAAAAAAgQE0AAAAgTm9wUQAAACBAQAAAACBFQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQFIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgRkAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAACBHIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAACBIACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAACBgaUpAAAAAa2FAQAAgQgAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBMAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAgQyBAQAAAIEQgQE0AAAAgTm9wUQAAACBAQAAAAAAgQEAAAAAAIEVAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQFIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBGAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAIEdAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAIEggQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAIGBpSgAAAABrYUAAACBCIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAAAAgQ0AAAAAAIERAAAAAACBAQAAAAAAgQEAAAAAAIEBNAAAAIE5vcEUAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQCBGAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEcAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEhAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQGBpSgAAIEBrYQAAACBCQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBMAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBDAAAAACBARAAAAAAgQE0AAAAgTm9wUQAAACBAQAAAAAAgQEAgRQAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQFIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAIEYAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBARwAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBASAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAYGlKACBAQGthAAAgQEIAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBMAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEMAAAAgQE1EAAAgTm9wUQAAACBAQAAAAAAgQEAAAAAAIEBAACBFACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQFIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAgRiBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQCBHAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBIAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQCBgaUogQEAAa2EAIEBAQgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAAAAgQEAgQwAAIEBAIEQAACBAQAAAAAAgQEAAAAAAIEBNAAAAIE5vcFEAIEUgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAACBGQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAIEcAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAIEgAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAIGBpSkBAAABrYSBAQCBCAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAAAAgQEAAAAAAIEBAAAAgQyBAQAAAIEQgQEAAAAAAIEBNAAAAIE5vcFEAAAAgQEAAAAAAIEVAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBGAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAIEdAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAIEggQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAIGBpSgAAAABrYUAAACBCIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAACBDQEAAAAAgREBAAAAAACBAQAAAAAAgQEAAAAAAIEBNAAAAIE5vZVEAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEYAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgR0AAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAgSEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgYGlKAAAAIGthAAAAIEJAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAAAAgQEAAAAAAIENAAAAAACBEQAAAAAAgQEAAAAAAIEBNAAAAIE5vcFEAAAAgQEBFAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAgRgAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBHAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBIQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBgaUoAACBAa2EAAAAgQkAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBMAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQwAAAAAgQEQAAAAgTm9wUQAAACBAQAAAAAAgQEAAAAAAIEBAIEUAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQFIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAACBGACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEcAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEgAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQGBpSgAgQEBrYQAAIEBCAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAAAAgQEAgQwAAIEBAIEQAACBAQAAAAAAgQEAAAAAAIEBNAAAAIE5vcFEAIEUgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAACBGQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAIEcAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAIEgAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAIGBpSkBAAABrYSBAQCBCAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAAAAgQEAAAAAAIEBAACBDACBAQAAgRAAgQEAAAAAAIEBNAAAAIE5vcFEAAAAgQEAAAAAgRUBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEZAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAgRyBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAgSAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAgYGlKQAAAAGthQEAAIEIAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAIEMgQEAAACBEIEBNAAAAIE5vcFEAAAAgQEAAAAAAIEBAAAAAACBFQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBARgAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAACBHQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAACBIIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAACBgaUoAAAAAa2FAAAAgQiBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAAAAgQEAAAAAgQ0BAAAAAIERAQAAAAAAgQEAAAAAAIEBNAAAAIE5vcFEAAAAgQEUAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBGAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEdAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAIEhAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIGBpSgAAACBrYQAAACBCQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQwAAAAAgQEQAAAAAIEBNAAAAIE5vcFEAAAAgQEAAAAAAIEBAIEUAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAACBGACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEcAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEgAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQGBpSgAgQEBrYQAAIEBCAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEwAAAAgQEBDAAAAIEBARAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBATQAgRSBOb3BRAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAUgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAIEYgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAgRwAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBASAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAgYGlKIEBAAGthACBAQEIAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQEwAAAAgQEAAAAAAIEBAIEMAACBAQCBEAAAgQEAAAAAAIEBAAAAAACBATQAAACBOb3BRACBFIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAUgAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAgRkBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAACBHACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQCBIAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAACBgaUpAQAAAa2EgQEAgQgAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBATAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAgQwAgQEAAIEQAIEBNAAAAIE5vcFEAAAAgQEAAAAAAIEBAAAAAIEVAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEBSAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBGQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAIEcgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAIEgAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAAAAgQEAAAAAAIEBAAAAAACBAQAAAIGBpSkAAAABr';
+    var DAY_TYPES = ["normal-day","semi-normal-day","weekend-holiday","special-holiday"];
+    var ORTHODOX_HOLIDAYS = [["cleanMonday",-48],["palmSunday",-7],["goodFriday",-2],["greatSaturday",-1],["easterSunday",0],["easterMonday",1],["ascensionDay",39],["pentecost",49],["whitMonday",50]];
+    var DEFAULT_RECURRING = [{"month":12,"day":24,"type":"fixed"},{"month":12,"day":25,"type":"fixed"},{"month":12,"day":31,"type":"fixed"},{"month":1,"day":1,"type":"fixed"},{"type":"easter-relative","offset":-1},{"type":"easter-relative","offset":0}];
+    var DAY_MS = 86400000;
+
+    var codes = new Uint8Array(atob(DAYS).split('').map(function (c) { return c.charCodeAt(0); }));
+    var firstDay = Date.UTC(FIRST_YEAR, 0, 1) / DAY_MS;
+    var original = {
+        calculateOrthodoxEaster: calculateOrthodoxEaster,
+        calculateOrthodoxHolidays: calculateOrthodoxHolidays,
+        isOrthodoxOrCyprusHoliday: isOrthodoxOrCyprusHoliday,
+        isSpecialHoliday: isSpecialHoliday,
+        getDayType: getDayType
+    };
+
+    function inRange(year) {
+        return typeof year === 'number' && year % 1 === 0 && year >= FIRST_YEAR && year <= LAST_YEAR;
+    }
+
+    // Table position of a date's local calendar day, or -1
+    function dayIndex(date) {
+        var year = date.getFullYear();
+        if (!inRange(year)) {
+            return -1;
+        }
+        return Date.UTC(year, date.getMonth(), date.getDate()) / DAY_MS - firstDay;
+    }
+
+    function easterIndex(year) {
+        return Date.UTC(year, 2, 21 + EASTER[year - FIRST_YEAR]) / DAY_MS - firstDay;
+    }
+
+    function hasDate(list, key) {
+        return list.some(function (h) { return h.date === key; });
+    }
+
+    function isDefaultRecurring() {
+        if (recurringSpecialHolidays.length !== DEFAULT_RECURRING.length) {
+            return false;
+        }
+        for (var i = 0; i < DEFAULT_RECURRING.length; i++) {
+            var def = recurringSpecialHolidays[i];
+            var expected = DEFAULT_RECURRING[i];
+            if (!def || def.type !== expected.type || def.month !== expected.month ||
+                    def.day !== expected.day || def.offset !== expected.offset) {
+                return false;
+            }
+        }
+        return true;
+    }
+
+    window.calculateOrthodoxEaster = function (year) {
+        if (!inRange(year)) {
+            return original.calculateOrthodoxEaster(year);
+        }
+        return new Date(year, 2, 21 + EASTER[year - FIRST_YEAR]);
+    };
+
+    window.calculateOrthodoxHolidays = function (year) {
+        if (!inRange(year)) {
+            return original.calculateOrthodoxHolidays(year);
+        }
+        var easter = 21 + EASTER[year - FIRST_YEAR];
+        var holidays = {};
+        for (var i = 0; i < ORTHODOX_HOLIDAYS.length; i++) {
+            holidays[ORTHODOX_HOLIDAYS[i][0]] = new Date(year, 2, easter + ORTHODOX_HOLIDAYS[i][1]);
+        }
+        return holidays;
+    };
+
+    window.isOrthodoxOrCyprusHoliday = function (date) {
+        var index = dayIndex(date);
+        if (index < 0) {
+            return original.isOrthodoxOrCyprusHoliday(date);
+        }
+        return (codes[index] & 31) !== 0;
+    };
+
+    window.isSpecialHoliday = function (date) {
+        var index = dayIndex(date);
+        if (index < 0) {
+            return original.isSpecialHoliday(date);
+        }
+        var key = formatDateKey(date);
+        if (hasDate(specialHolidays, key)) {
+            return true;
+        }
+        var month = date.getMonth() + 1;
+        var day = date.getDate();
+        var easter = -1;
+        for (var i = 0; i < recurringSpecialHolidays.length; i++) {
+            var def = recurringSpecialHolidays[i];
+            if (def.type === 'fixed') {
+                if (def.month === month && def.day === day) {
+                    return true;
+                }
+            } else if (def.type === 'easter-relative') {
+                var offset = def.offset || 0;
+                if (typeof offset !== 'number' || offset % 1 !== 0) {
+                    // Unusual offsets: let the original work out the dates
+                    return original.isSpecialHoliday(date);
+                }
+                if (easter < 0) {
+                    easter = easterIndex(date.getFullYear());
+                }
+                if (index === easter + offset) {
+                    return true;
+                }
+            }
+        }
+        return false;
+    };
+
+    window.getDayType = function (date) {
+        var index = dayIndex(date);
+        if (index < 0 || index + 1 >= codes.length || !isDefaultRecurring()) {
+            return original.getDayType(date);
+        }
+        var next = new Date(date);
+        next.setDate(next.getDate() + 1);
+        var key = formatDateKey(date);
+        var nextKey = formatDateKey(next);
+        if (hasDate(holidays, key) || hasDate(holidays, nextKey) ||
+                hasDate(specialHolidays, key) || hasDate(specialHolidays, nextKey)) {
+            return original.getDayType(date);
+        }
+        return DAY_TYPES[codes[index] >> 5];
+    };
+})();
@@ -8129,204 +8129,7 @@ ${content.innerHTML}
             return null;
         }
 
-        // Count days of a specific type since last duty for a person
-        // startDate is optional - if provided, will also check assignments before this date
-        function countDaysSinceLastDuty(dayKey, person, groupNum, dayTypeCategory, allDaysByType, startDate = null) {
-            const daysOfType = allDaysByType[dayTypeCategory];
-            const currentIndex = daysOfType.indexOf(dayKey);
-            
-            if (currentIndex === -1) {
-                return Infinity; // Current day not in this type
-            }
-            
-            // Find last duty day for this person in this day type (before current day)
-            let lastDutyIndex = -1;
-            for (let i = currentIndex - 1; i >= 0; i--) {
-                if (hasDutyOnDay(daysOfType[i], person, groupNum)) {
-                    lastDutyIndex = i;
-                    break;
-                }
-            }
-            
-            // Check intended assignments - these count for rotation even if person was skipped due to conflicts
-            // This ensures N-day rotation counts from the intended day, not the actual assignment day
-            // IMPORTANT: For weekends skipped due to special holiday, we need to count from the NEXT weekend after the skipped one
-            let intendedDutyIndex = -1;
-            
-            for (let i = currentIndex - 1; i >= 0; i--) {
-                const checkDayKey = daysOfType[i];
-                // Check if this person had an intended assignment on this day
-                if (intendedAssignments[checkDayKey] && 
-                    intendedAssignments[checkDayKey][groupNum] === person) {
-                    intendedDutyIndex = i;
-                    
-                    // If this is a weekend/holiday day that was skipped due to special holiday,
-                    // we need to count from the NEXT weekend/holiday day after it (not from the skipped one)
-                    if (dayTypeCategory === 'weekend' && i + 1 < daysOfType.length) {
-                        // The next day in the daysOfType array is the next weekend/holiday day
-                        // Count from the day AFTER that next weekend (start counting tomorrow)
-                        const nextWeekendIndex = i + 1;
-                        if (nextWeekendIndex < currentIndex) {
-                            // Start counting from the day after the next weekend
-                            return currentIndex - nextWeekendIndex - 1;
-                        }
-                    }
-                    break;
-                }
-            }
-            
-            // Use intended assignment if it's more recent than actual assignment
-            // This ensures rotation counts from when person SHOULD have been assigned, not when they actually were
-            if (intendedDutyIndex !== -1 && (lastDutyIndex === -1 || intendedDutyIndex > lastDutyIndex)) {
-                // Count from the day AFTER the intended assignment (start counting tomorrow)
-                // If intended duty was at index i, we start counting from index i+1
-                // So days passed = currentIndex - (intendedDutyIndex + 1) = currentIndex - intendedDutyIndex - 1
-                return currentIndex - intendedDutyIndex - 1;
-            }
-            
-            // Check lastDuties data first (manually entered last duties)
-            const groupData = groups[groupNum] || { special: [], weekend: [], semi: [], normal: [], lastDuties: {} };
-            const lastDuties = groupData.lastDuties?.[person];
-            if (lastDuties) {
-                const lastDutyDateStr = lastDuties[dayTypeCategory];
-                if (lastDutyDateStr) {
-                    const lastDutyDate = new Date(lastDutyDateStr + 'T00:00:00');
-                    const currentDate = new Date(dayKey + 'T00:00:00');
-                    
-                    // Count days of the same type between last duty and current day
-                    let sameTypeDays = 0;
-                    const tempDate = new Date(lastDutyDate);
-                    tempDate.setDate(tempDate.getDate() + 1);
-                    while (tempDate < currentDate) {
-                        const tempDayType = getDayType(tempDate);
-                        let tempTypeCategory = 'normal';
-                        if (tempDayType === 'special-holiday') {
-                            tempTypeCategory = 'special';
-                        } else if (tempDayType === 'semi-normal-day') {
-                            tempTypeCategory = 'semi';
-                        } else if (tempDayType === 'weekend-holiday') {
-                            tempTypeCategory = 'weekend';
-                        }
-                        if (tempTypeCategory === dayTypeCategory) {
-                            sameTypeDays++;
-                        }
-                        tempDate.setDate(tempDate.getDate() + 1);
-                    }
-                    
-                    // If we found a last duty date, use it (unless we found a more recent one in assignments)
-                    if (lastDutyIndex === -1 || (lastDutyDate > new Date(daysOfType[lastDutyIndex] + 'T00:00:00'))) {
-                        return sameTypeDays;
-                    }
-                }
-            }
-            
-            // If startDate is provided, also check existing assignments before the start date
-            if (startDate && lastDutyIndex === -1) {
-                const currentDate = new Date(dayKey + 'T00:00:00');
-                const checkDate = new Date(startDate);
-                checkDate.setDate(checkDate.getDate() - 1); // Day before start date
-                
-                // Look backwards from start date to find last duty
-                let daysBack = 0;
-                const maxDaysBack = 365; // Check up to 1 year back
-                
-                while (daysBack < maxDaysBack && checkDate >= new Date(2000, 0, 1)) { // Don't go before year 2000
-                    const checkKey = formatDateKey(checkDate);
-                    const checkDayType = getDayType(checkDate);
-                    let checkTypeCategory = 'normal';
-                    
-                    if (checkDayType === 'special-holiday') {
-                        checkTypeCategory = 'special';
-                    } else if (checkDayType === 'semi-normal-day') {
-                        checkTypeCategory = 'semi';
-                    } else if (checkDayType === 'weekend-holiday') {
-                        checkTypeCategory = 'weekend';
-                    }
-                    
-                    // Only count if it's the same day type category
-                    if (checkTypeCategory === dayTypeCategory && hasDutyOnDay(checkKey, person, groupNum)) {
-                        // Found a previous duty - calculate days between
-                        const daysBetween = Math.floor((currentDate - checkDate) / (1000 * 60 * 60 * 24));
-                        // Count only days of the same type between them
-                        let sameTypeDays = 0;
-                        const tempDate = new Date(checkDate);
-                        tempDate.setDate(tempDate.getDate() + 1);
-                        while (tempDate < currentDate) {
-                            const tempDayType = getDayType(tempDate);
-                            let tempTypeCategory = 'normal';
-                            if (tempDayType === 'special-holiday') {
-                                tempTypeCategory = 'special';
-                            } else if (tempDayType === 'semi-normal-day') {
-                                tempTypeCategory = 'semi';
-                            } else if (tempDayType === 'weekend-holiday') {
-                                tempTypeCategory = 'weekend';
-                            }
-                            if (tempTypeCategory === dayTypeCategory) {
-                                sameTypeDays++;
-                            }
-                            tempDate.setDate(tempDate.getDate() + 1);
-                        }
-                        return sameTypeDays;
-                    }
-                    
-                    checkDate.setDate(checkDate.getDate() - 1);
-                    daysBack++;
-                }
-            }
-            
-            if (lastDutyIndex === -1) {
-                return Infinity; // Never had duty of this type
-            }
-            
-            // Count how many days of this type between last duty and current day
-            // If last duty was at index i, we start counting from index i+1 (tomorrow)
-            // So days passed = currentIndex - (lastDutyIndex + 1) = currentIndex - lastDutyIndex - 1
-            return currentIndex - lastDutyIndex - 1;
-        }
-
-        // Open calculate duties modal
-        function openCalculateDutiesModal() {
-            // Set default to current month
-            const currentYear = currentDate.getFullYear();
-            const currentMonth = String(currentDate.getMonth() + 1).padStart(2, '0');
-            const startMonthInput = document.getElementById('calculateStartMonth');
-            
-            if (startMonthInput) {
-                startMonthInput.value = `${currentYear}-${currentMonth}`;
-            }
-            for (let g = 1; g <= 4; g++) {
-                const stripCb = document.getElementById(`calcStripManualOverridesG${g}`);
-                if (stripCb) stripCb.checked = false;
-                const lab = document.getElementById(`calcStripGroupLabel${g}`);
-                if (lab && typeof getGroupName === 'function') {
-                    try {
-                        lab.textContent = getGroupName(g);
-                    } catch (_) {
-                        lab.textContent = `Ομάδα ${g}`;
-                    }
-                }
-            }
 
-            // Make month picker open when clicking anywhere on the month fields (label/container too)
-            ensureMonthPickerClickTargets();
-            
-            // Add event listener to button as backup (remove old listeners first)
-            const calculateButton = document.getElementById('calculateDutiesButton');
-            if (calculateButton) {
-                // Clone button to remove all event listeners
-                const newButton = calculateButton.cloneNode(true);
-                calculateButton.parentNode.replaceChild(newButton, calculateButton);
-                
-                // Add new event listener
-                newButton.addEventListener('click', function(e) {
-                    e.preventDefault();
-                    calculateDutiesForSelectedMonths();
-                });
-            }
-            
-            const modal = new bootstrap.Modal(document.getElementById('calculateDutiesModal'));
-            modal.show();
-        }
 
         let monthPickerClickTargetsInstalled = false;
         function ensureMonthPickerClickTargets() {
@@ -8373,163 +8176,7 @@ ${content.innerHTML}
 
             installFor('calculateStartMonth');
         }
-
-        // Calculate duties for selected months
-        
-        // Show step-by-step calculation modal
-
-        // Render current step content
-
-
-        // Step 1: Check and show special holidays
-
-        // Step 1 results modal: show baseline vs computed changes (missing replacements) for special holidays
-        function showSpecialHolidayResultsAndProceed() {
-            try {
-                const dayTypeLists = calculationSteps.dayTypeLists || { special: [] };
-                const specialHolidays = (dayTypeLists.special || []).slice().sort();
-                const baselineByDate = calculationSteps.tempSpecialBaselineAssignments || {};
-                const computedByDate = calculationSteps.tempSpecialAssignments || {};
-
-                // Build rows where baseline != computed
-                const changes = [];
-                for (const dateKey of specialHolidays) {
-                    const date = new Date(dateKey + 'T00:00:00');
-                    if (isNaN(date.getTime())) continue;
-
-                    // Holiday name (same logic as Step 1 table)
-                    let holidayName = '';
-                    const year = date.getFullYear();
-                    const month = date.getMonth() + 1;
-                    const day = date.getDate();
-                    for (const holidayDef of recurringSpecialHolidays) {
-                        if (holidayDef.type === 'fixed' && holidayDef.month === month && holidayDef.day === day) {
-                            holidayName = holidayDef.name;
-                            break;
-                        } else if (holidayDef.type === 'easter-relative') {
-                            const orthodoxHolidays = calculateOrthodoxHolidays(year);
-                            const easterDate = orthodoxHolidays.easterSunday;
-                            const holidayDate = new Date(easterDate);
-                            holidayDate.setDate(holidayDate.getDate() + (holidayDef.offset || 0));
-                            if (formatDateKey(holidayDate) === dateKey) {
-                                holidayName = holidayDef.name;
-                                break;
-                            }
-                        }
-                    }
-
-                    for (let groupNum = 1; groupNum <= 4; groupNum++) {
-                        const base = baselineByDate?.[dateKey]?.[groupNum] || null;
-                        const comp = computedByDate?.[dateKey]?.[groupNum] || null;
-                        if (!base || !comp) continue;
-                        if (base === comp) continue;
-
-                        let reason = '';
-                        if (isPersonDisabledForDuty(base, groupNum, 'special') || isPersonMissingOnDate(base, groupNum, date, 'special')) {
-                            // Keep the same style as other steps: show the first sentence (without "Ανατέθηκε...")
-                            reason = buildUnavailableReplacementReason({
-                                skippedPersonName: base,
-                                replacementPersonName: comp,
-                                dateObj: date,
-                                groupNum,
-                                dutyCategory: 'special'
-                            }) || '';
-                        } else {
-                            reason = 'Αλλαγή (κανόνας/σύγκρουση)';
-                        }
-
-                        changes.push({
-                            dateKey,
-                            dateStr: date.toLocaleDateString('el-GR', { day: '2-digit', month: '2-digit', year: 'numeric' }),
-                            dayName: getGreekDayName(date),
-                            holidayName: holidayName || 'Ειδική Αργία',
-                            groupNum,
-                            groupName: getGroupName(groupNum),
-                            baseline: base,
-                            computed: comp,
-                            reason
-                        });
-                    }
-                }
-
-                let message = '';
-                if (changes.length === 0) {
-                    message = '<div class="alert alert-success"><i class="fas fa-check-circle me-2"></i><strong>Καμία αλλαγή!</strong><br>Δεν βρέθηκαν αντικαταστάσεις λόγω κωλύματος στις ειδικές αργίες.</div>';
-                } else {
-                    message = `<div class="alert alert-info"><i class="fas fa-info-circle me-2"></i><strong>Βρέθηκαν ${changes.length} αντικαταστάσεις στις ειδικές αργίες:</strong></div>`;
-                    message += '<div class="table-responsive"><table class="table table-sm table-bordered">';
-                    message += '<thead><tr><th>Ημερομηνία</th><th>Υπηρεσία</th><th>Παραλείφθηκε</th><th>Αντικαταστάθηκε από</th><th>Ημερομηνία Αλλαγής</th><th>Λόγος</th></tr></thead><tbody>';
-                    for (const c of changes) {
-                        const service = getGroupName(c.groupNum);
-                        message += `<tr>
-                            <td>${c.dayName} ${c.dateStr}</td>
-                            <td>${service}</td>
-                            <td><strong>${c.baseline}</strong></td>
-                            <td><strong>${c.computed}</strong></td>
-                            <td>-</td>
-                            <td>${c.reason}</td>
-                        </tr>`;
-                    }
-                    message += '</tbody></table></div>';
-                }
-
-                const modalHtml = `
-                    <div class="modal fade" id="specialHolidayResultsModal" tabindex="-1">
-                    <div class="modal-dialog modal-xl modal-superwide">
-                            <div class="modal-content results-modal-special">
-                                <div class="modal-header results-header results-header-special">
-                                    <h5 class="modal-title"><i class="fas fa-star me-2"></i>Αποτελέσματα Αλλαγών Ειδικών Αργιών</h5>
-                                    <button type="button" class="btn-close" data-bs-dismiss="modal" aria-label="Close"></button>
-                                </div>
-                                <div class="modal-body">
-                                    ${message}
-                                </div>
-                                <div class="modal-footer">
-                                    <button type="button" class="btn btn-secondary" id="specialHolidayCancelButton" data-bs-dismiss="modal">Ακύρωση</button>
-                                    <button type="button" class="btn btn-primary" id="specialHolidayOkButton">OK</button>
-                                </div>
-                            </div>
-                        </div>
-                    </div>
-                `;
-
-                const existingModal = document.getElementById('specialHolidayResultsModal');
-                if (existingModal) existingModal.remove();
-                document.body.insertAdjacentHTML('beforeend', modalHtml);
-
-                const modal = new bootstrap.Modal(document.getElementById('specialHolidayResultsModal'));
-                modal.show();
-
-                const okButton = document.getElementById('specialHolidayOkButton');
-                const cancelButton = document.getElementById('specialHolidayCancelButton');
-                if (okButton) {
-                    okButton.addEventListener('click', async function() {
-                        const originalOkHtml = okButton.innerHTML;
-                        okButton.disabled = true;
-                        okButton.classList.add('is-saving');
-                        if (cancelButton) cancelButton.disabled = true;
-                        okButton.innerHTML = `<span class="spinner-border spinner-border-sm me-2" role="status" aria-hidden="true"></span>Αποθήκευση...`;
-                        setStepFooterBusy(true);
-                        try {
-                            await saveStep1_SpecialHolidays();
-                            calculationSteps.currentStep = 2;
-                            renderCurrentStep();
-                            const m = bootstrap.Modal.getInstance(document.getElementById('specialHolidayResultsModal'));
-                            if (m) m.hide();
-                        } finally {
-                            requestAnimationFrame(() => setStepFooterBusy(false));
-                            okButton.innerHTML = originalOkHtml;
-                            okButton.classList.remove('is-saving');
-                            okButton.disabled = false;
-                            if (cancelButton) cancelButton.disabled = false;
-                        }
-                    });
-                }
-            } catch (error) {
-                console.error('Error showing special holiday results:', error);
-                alert('Σφάλμα κατά την εμφάνιση αποτελεσμάτων ειδικών αργιών: ' + error.message);
-            }
-        }
+;
 
         // Navigation functions
         
@@ -8713,217 +8360,8 @@ ${content.innerHTML}
                 });
             }
         }
-        
-        // Save final weekend assignments (after skip logic) to weekendAssignments document
-        async function saveFinalWeekendAssignments(updatedAssignments) {
-            try {
-                if (!window.db) {
-                    console.log('Firebase not ready, skipping final weekend assignments save');
-                    return;
-                }
-                
-                const db = window.db || firebase.firestore();
-                const user = window.auth?.currentUser;
-                
-                if (!user) {
-                    console.log('User not authenticated, skipping final weekend assignments save');
-                    return;
-                }
-                
-                if (Object.keys(updatedAssignments).length > 0) {
-                    const formattedAssignments = {};
-                    for (const dateKey in updatedAssignments) {
-                        const groups = updatedAssignments[dateKey];
-                        const parts = [];
-                        for (let groupNum = 1; groupNum <= 4; groupNum++) {
-                            if (groups[groupNum]) {
-                                parts.push(`${groups[groupNum]} (Ομάδα ${groupNum})`);
-                            }
-                        }
-                        if (parts.length > 0) {
-                            formattedAssignments[dateKey] = parts.join(', ');
-                        }
-                    }
-                    
-                    const organizedWeekend = organizeAssignmentsByMonth(formattedAssignments);
-                    const sanitizedWeekend = sanitizeForFirestore(organizedWeekend);
-                    
-                    await mergeAndSaveMonthOrganizedAssignmentsDoc(db, user, 'weekendAssignments', organizedWeekend);
-                    console.log('Saved Step 2 final weekend assignments (after skip logic) to weekendAssignments document');
-                    
-                    // Update local memory
-                    Object.assign(weekendAssignments, formattedAssignments);
-                    
-                    // IMPORTANT: Update rotation positions based on FINAL assignments (after skip logic)
-                    // This ensures that when Person A is replaced by Person B, next calculation starts from Person B's position
-                    // Group assignments by month and find the last assigned person for each month/group
-                    const finalWeekendRotationPositionsByMonth = {}; // monthKey -> { groupNum -> assignedPerson }
-                    const sortedDateKeys = Object.keys(updatedAssignments).sort();
-                    for (const dateKey of sortedDateKeys) {
-                        const d = new Date(dateKey + 'T00:00:00');
-                        if (isNaN(d.getTime())) continue;
-                        const monthKey = getMonthKeyFromDate(d);
-                        const groups = updatedAssignments[dateKey];
-                        if (!groups) continue;
-                        
-                        for (let groupNum = 1; groupNum <= 4; groupNum++) {
-                            const assignedPerson = groups[groupNum];
-                            if (assignedPerson) {
-                                if (!finalWeekendRotationPositionsByMonth[monthKey]) {
-                                    finalWeekendRotationPositionsByMonth[monthKey] = {};
-                                }
-                                const personForRotation = typeof getPersonForRotationContinuity === 'function'
-                                    ? getPersonForRotationContinuity(dateKey, groupNum, assignedPerson, updatedAssignments)
-                                    : assignedPerson;
-                                finalWeekendRotationPositionsByMonth[monthKey][groupNum] = personForRotation;
-                            }
-                        }
-                    }
-                    
-                    // Update lastRotationPositions with final assigned persons (after skip logic)
-                    if (Object.keys(finalWeekendRotationPositionsByMonth).length > 0) {
-                        for (const monthKey in finalWeekendRotationPositionsByMonth) {
-                            const groupsForMonth = finalWeekendRotationPositionsByMonth[monthKey] || {};
-                            for (let groupNum = 1; groupNum <= 4; groupNum++) {
-                                if (groupsForMonth[groupNum] !== undefined) {
-                                    setLastRotationPersonForMonth('weekend', monthKey, groupNum, groupsForMonth[groupNum]);
-                                }
-                            }
-                        }
-                        
-                        // Save updated rotation positions to Firestore
-                        try {
-                            const sanitizedPositions = sanitizeForFirestore(lastRotationPositions);
-                            await db.collection('dutyShifts').doc('lastRotationPositions').set({
-                                ...sanitizedPositions,
-                                lastUpdated: firebase.firestore.FieldValue.serverTimestamp(),
-                                updatedBy: user.uid
-                            });
-                            console.log('Updated last rotation positions for weekends (after skip logic) to Firestore:', finalWeekendRotationPositionsByMonth);
-                        } catch (error) {
-                            console.error('Error saving updated last rotation positions after weekend skip logic:', error);
-                        }
-                    }
-                }
-            } catch (error) {
-                console.error('Error saving final weekend assignments:', error);
-            }
-        }
-        
-        // Save Step 3 (Semi-Normal) assignments to Firestore and run swap logic
-        
-        // Run swap logic for semi-normal days and show popup with results
-        
-        // Show popup with semi-normal swap results
-        
-        // Save final semi-normal assignments (after swap logic) to semiNormalAssignments document
-        async function saveFinalSemiNormalAssignments(updatedAssignments) {
-            try {
-                if (!window.db) {
-                    console.log('Firebase not ready, skipping final semi-normal assignments save');
-                    return;
-                }
-                
-                const db = window.db || firebase.firestore();
-                const user = window.auth?.currentUser;
-                
-                if (!user) {
-                    console.log('User not authenticated, skipping final semi-normal assignments save');
-                    return;
-                }
-                
-                if (Object.keys(updatedAssignments).length > 0) {
-                    const formattedAssignments = {};
-                    for (const dateKey in updatedAssignments) {
-                        const groups = updatedAssignments[dateKey];
-                        const parts = [];
-                        for (let groupNum = 1; groupNum <= 4; groupNum++) {
-                            if (groups[groupNum]) {
-                                parts.push(`${groups[groupNum]} (Ομάδα ${groupNum})`);
-                            }
-                        }
-                        if (parts.length > 0) {
-                            formattedAssignments[dateKey] = parts.join(', ');
-                        }
-                    }
-                    
-                    const organizedSemi = organizeAssignmentsByMonth(formattedAssignments);
-                    const sanitizedSemi = sanitizeForFirestore(organizedSemi);
-                    
-                    await mergeAndSaveMonthOrganizedAssignmentsDoc(db, user, 'semiNormalAssignments', organizedSemi);
-                    console.log('Saved Step 3 final semi-normal assignments (after swap logic) to semiNormalAssignments document');
-                    
-                    // Update local memory
-                    Object.assign(semiNormalAssignments, formattedAssignments);
-                    
-                    // Save assignment reasons to Firestore
-                    try {
-                        if (Object.keys(assignmentReasons).length > 0) {
-                            const sanitizedReasons = sanitizeForFirestore(assignmentReasons);
-                            await db.collection('dutyShifts').doc('assignmentReasons').set({
-                                ...sanitizedReasons,
-                                lastUpdated: firebase.firestore.FieldValue.serverTimestamp(),
-                                updatedBy: user.uid
-                            });
-                            console.log('Saved assignmentReasons to Firestore after semi-normal swaps');
-                        }
-                    } catch (error) {
-                        console.error('Error saving assignmentReasons after semi-normal swaps:', error);
-                    }
-                    
-                    // IMPORTANT: Update rotation positions based on FINAL assignments (after swaps)
-                    // This ensures that when Person A is replaced by Person B, next calculation starts from Person B's position
-                    // Group assignments by month and find the last assigned person for each month/group (chronologically)
-                    const finalSemiRotationPositionsByMonth = {}; // monthKey -> { groupNum -> assignedPerson }
-                    const sortedDateKeys = Object.keys(updatedAssignments).sort();
-                    for (const dateKey of sortedDateKeys) {
-                        const d = new Date(dateKey + 'T00:00:00');
-                        if (isNaN(d.getTime())) continue;
-                        const monthKey = getMonthKeyFromDate(d);
-                        const groups = updatedAssignments[dateKey];
-                        if (!groups) continue;
-                        
-                        for (let groupNum = 1; groupNum <= 4; groupNum++) {
-                            const assignedPerson = groups[groupNum];
-                            if (assignedPerson) {
-                                if (!finalSemiRotationPositionsByMonth[monthKey]) {
-                                    finalSemiRotationPositionsByMonth[monthKey] = {};
-                                }
-                                // Store the last assigned person for this month/group (will be overwritten by later dates)
-                                finalSemiRotationPositionsByMonth[monthKey][groupNum] = assignedPerson;
-                            }
-                        }
-                    }
-                    
-                    // Update lastRotationPositions with final assigned persons (after swaps)
-                    if (Object.keys(finalSemiRotationPositionsByMonth).length > 0) {
-                        for (const monthKey in finalSemiRotationPositionsByMonth) {
-                            const groupsForMonth = finalSemiRotationPositionsByMonth[monthKey] || {};
-                            for (let groupNum = 1; groupNum <= 4; groupNum++) {
-                                if (groupsForMonth[groupNum] !== undefined) {
-                                    setLastRotationPersonForMonth('semi', monthKey, groupNum, groupsForMonth[groupNum]);
-                                }
-                            }
-                        }
-                        
-                        // Save updated rotation positions to Firestore
-                        try {
-                            const sanitizedPositions = sanitizeForFirestore(lastRotationPositions);
-                            await db.collection('dutyShifts').doc('lastRotationPositions').set({
-                                ...sanitizedPositions,
-                                lastUpdated: firebase.firestore.FieldValue.serverTimestamp(),
-                                updatedBy: user.uid
-                            });
-                            console.log('Updated last rotation positions for semi-normal (after swaps) to Firestore:', finalSemiRotationPositionsByMonth);
-                        } catch (error) {
-                            console.error('Error saving updated last rotation positions after semi-normal swaps:', error);
-                        }
-                    }
-                }
-            } catch (error) {
-                console.error('Error saving final semi-normal assignments:', error);
-            }
-        }
+
+;
 
         // Save Step 4 (Normal) assignments to Firestore and run swap logic
         
@@ -9004,272 +8442,15 @@ ${content.innerHTML}
             return !strictConflict && !generalConflict;
         }
 
-        // Helper to find last duty key for a person
-        function findLastDutyKeyForPerson(person, groupNum, dayTypeCategory, dayTypeLists, startDate, currentDayKey) {
-            const days = dayTypeLists[dayTypeCategory];
-            const sortedDays = [...days].sort();
-            const currentDayIndex = sortedDays.indexOf(currentDayKey);
-            
-            // Look backwards from current day to find last assignment
-            for (let i = currentDayIndex - 1; i >= 0; i--) {
-                const dayKey = sortedDays[i];
-                const assignment = (typeof getAssignmentForDate === 'function' ? getAssignmentForDate(dayKey) : null) ?? (dutyAssignments?.[dayKey] || '');
-                if (assignment) {
-                    if (typeof assignment === 'object' && !Array.isArray(assignment)) {
-                        const direct = assignment[groupNum] ?? assignment[String(groupNum)];
-                        if (direct && String(direct).trim() === person) return dayKey;
-                    } else {
-                        const parts = String(assignment).split(',').map(p => p.trim());
-                        for (const part of parts) {
-                            const match = part.match(/^(.+?)\s*\(Ομάδα\s*(\d+)\)\s*$/);
-                            if (match && parseInt(match[2]) === groupNum && match[1].trim() === person) {
-                                return dayKey;
-                            }
-                        }
-                    }
-                }
-            }
-            
-            // Check last duties from person data
-            const groupData = groups[groupNum] || {};
-            const personData = groupData.lastDuties && groupData.lastDuties[person];
-            if (personData) {
-                let lastDutyKey = null;
-                if (dayTypeCategory === 'special' && personData.special) {
-                    lastDutyKey = formatDateKey(new Date(personData.special));
-                } else if (dayTypeCategory === 'weekend' && personData.weekend) {
-                    lastDutyKey = formatDateKey(new Date(personData.weekend));
-                } else if (dayTypeCategory === 'semi' && personData.semi) {
-                    lastDutyKey = formatDateKey(new Date(personData.semi));
-                } else if (dayTypeCategory === 'normal' && personData.normal) {
-                    lastDutyKey = formatDateKey(new Date(personData.normal));
-                }
-                
-                if (lastDutyKey && sortedDays.includes(lastDutyKey)) {
-                    return lastDutyKey;
-                }
-            }
-            
-            return null;
-        }
 
-        // Helper function to find person's original day in rotation based on N-day rotation
-        function findPersonOriginalDayInRotation(person, dayTypeCategory, groupNum, dayTypeLists, startDate, currentDayKey) {
-            const groupData = groups[groupNum] || { special: [], weekend: [], semi: [], normal: [] };
-            let groupPeople;
-            if (dayTypeCategory === 'special') {
-                groupPeople = groupData.special || [];
-            } else if (dayTypeCategory === 'weekend') {
-                groupPeople = groupData.weekend || [];
-            } else if (dayTypeCategory === 'semi') {
-                groupPeople = groupData.semi || [];
-            } else {
-                groupPeople = groupData.normal || [];
-            }
-            
-            const personIndex = groupPeople.indexOf(person);
-            if (personIndex === -1) return null;
-            
-            const days = dayTypeLists[dayTypeCategory];
-            const sortedDays = [...days].sort();
-            const currentDayIndex = sortedDays.indexOf(currentDayKey);
-            
-            // Calculate when this person should be assigned based on rotation
-            const rotationDays = groupPeople.length;
-            
-            // Find the last duty date for this person
-            const lastDutyKey = findLastDutyKeyForPerson(person, groupNum, dayTypeCategory, dayTypeLists, startDate, currentDayKey);
-            
-            // If person has never had duty, they should be assigned on their rotation position
-            if (!lastDutyKey) {
-                // Find first day where this person should be assigned
-                for (let i = 0; i < sortedDays.length; i++) {
-                    if (i % rotationDays === personIndex) {
-                        return sortedDays[i];
-                    }
-                }
-                return null;
-            }
-            
-            // Find the next day where this person should be assigned (N days after last duty)
-            const lastDutyIndex = sortedDays.indexOf(lastDutyKey);
-            if (lastDutyIndex === -1) return null;
-            
-            // Find the day that is N positions after last duty
-            const nextDutyIndex = lastDutyIndex + rotationDays;
-            if (nextDutyIndex < sortedDays.length) {
-                return sortedDays[nextDutyIndex];
-            }
-            
-            return null;
-        }
-
-        // Helper function to find and assign person to next available day (cascade)
-        function findAndAssignNextAvailableDay(person, skipDay, dayTypeCategory, groupNum, dayTypeLists, sortedDays, startDate) {
-            const groupData = groups[groupNum] || { special: [], weekend: [], semi: [], normal: [] };
-            
-            // Find next available day after skipDay
-            const skipIndex = sortedDays.indexOf(skipDay);
-            if (skipIndex === -1) return false; // Day not found
-            
-            for (let i = skipIndex + 1; i < sortedDays.length; i++) {
-                const dayKey = sortedDays[i];
-                const dayDate = new Date(dayKey + 'T00:00:00');
-                
-                // Skip if person is missing on this date
-                if (isPersonMissingOnDate(person, groupNum, dayDate, dayTypeCategory)) continue;
-                
-                // Skip critical assignments
-                const isCritical = criticalAssignments[dayKey] && 
-                                criticalAssignments[dayKey].some(a => a.includes(`(Ομάδα ${groupNum})`));
-                if (isCritical) continue;
-                
-                // Check if person can take this day (no conflicts)
-                if (canPersonTakeDay(dayKey, person, groupNum, dayTypeCategory)) {
-                    // Check if this day already has someone assigned for this group
-                    const currentAssignment = dutyAssignments[dayKey] || '';
-                    let currentPersonForGroup = null;
-                    
-                    if (currentAssignment) {
-                        const parts = currentAssignment.split(',').map(p => p.trim());
-                        for (const part of parts) {
-                            const match = part.match(/^(.+?)\s*\(Ομάδα\s*(\d+)\)\s*$/);
-                            if (match && parseInt(match[2]) === groupNum) {
-                                currentPersonForGroup = match[1].trim();
-                                break;
-                            }
-                        }
-                    }
-                    
-                    if (currentPersonForGroup && currentPersonForGroup !== person) {
-                        // Day already has someone - cascade: move that person forward
-                        removePersonFromDay(dayKey, currentPersonForGroup, groupNum);
-                        assignPersonToDay(dayKey, person, groupNum);
-                        
-                        // IMPORTANT: Re-check that this assignment doesn't create consecutive days
-                        // Check day after to ensure we don't create consecutive days
-                        const dayAfter = new Date(dayDate);
-                        dayAfter.setDate(dayAfter.getDate() + 1);
-                        const dayAfterKey = formatDateKey(dayAfter);
-                        
-                        // Check if person has duty the day after (would create consecutive days)
-                        if (hasDutyOnDay(dayAfterKey, person, groupNum)) {
-                            // This creates consecutive days - undo and try next day
-                            removePersonFromDay(dayKey, person, groupNum);
-                            assignPersonToDay(dayKey, currentPersonForGroup, groupNum); // Restore original
-                            continue; // Try next day
-                        }
-                        
-                        // Recursively find next day for the displaced person
-                        findAndAssignNextAvailableDay(currentPersonForGroup, dayKey, dayTypeCategory, groupNum, dayTypeLists, sortedDays, startDate);
-                    } else {
-                        // Day is free - assign person here
-                        assignPersonToDay(dayKey, person, groupNum);
-                        
-                        // IMPORTANT: Re-check that this assignment doesn't create consecutive days
-                        const dayAfter = new Date(dayDate);
-                        dayAfter.setDate(dayAfter.getDate() + 1);
-                        const dayAfterKey = formatDateKey(dayAfter);
-                        
-                        // Check if person has duty the day after (would create consecutive days)
-                        if (hasDutyOnDay(dayAfterKey, person, groupNum)) {
-                            // This creates consecutive days - undo and try next day
-                            removePersonFromDay(dayKey, person, groupNum);
-                            continue; // Try next day
-                        }
-                    }
-                    
-                    return true; // Found and assigned
-                }
-            }
-            
-            return false; // No available day found
-        }
+;
 
         // DELETED: processCascadingSwaps and assignDutiesForDayType - unused functions removed
 
         // Store current day being edited
         let currentEditingDayKey = null;
         let currentEditingDayDate = null;
-
-        // Show day details
-        
-        // Functions removed - no longer needed as we show all 4 groups with dropdowns
-        
-        // Save day assignments
-        function saveDayAssignments() {
-            if (!currentEditingDayKey) return;
-            
-            const container = document.getElementById('dutyPersonsContainer');
-            const selects = container.querySelectorAll('.duty-person-select');
-            const newAssignments = [];
-            
-            // Get original critical assignments
-            const originalCritical = criticalAssignments[currentEditingDayKey] || [];
-            const originalCriticalPeople = new Set();
-            originalCritical.forEach(cp => {
-                const match = cp.match(/^(.+?)\s*\(Ομάδα\s*(\d+)\)\s*$/);
-                if (match) {
-                    const name = match[1].trim().replace(/^,+\s*/, '').replace(/\s*,+$/, '');
-                    const group = parseInt(match[2]);
-                    originalCriticalPeople.add(`${name}|${group}`);
-                }
-            });
-            
-            selects.forEach(select => {
-                const isCritical = select.dataset.isCritical === 'true';
-                const personName = select.value.trim();
-                const group = select.dataset.group;
-                
-                // If critical, use the original value (don't allow changes)
-                if (isCritical) {
-                    const originalName = select.dataset.originalName;
-                    if (originalName && group) {
-                        newAssignments.push(`${originalName} (Ομάδα ${group})`);
-                    }
-                } else if (personName && group) {
-                    // Non-critical assignments can be changed
-                    newAssignments.push(`${personName} (Ομάδα ${group})`);
-                }
-            });
-            
-            // Update dutyAssignments
-            if (newAssignments.length > 0) {
-                dutyAssignments[currentEditingDayKey] = newAssignments.join(', ');
-            } else {
-                delete dutyAssignments[currentEditingDayKey];
-            }
-            
-            // Preserve all original critical assignments
-            const newCritical = [];
-            newAssignments.forEach(newAssignment => {
-                const match = newAssignment.match(/^(.+?)\s*\(Ομάδα\s*(\d+)\)\s*$/);
-                if (match) {
-                    const name = match[1].trim().replace(/^,+\s*/, '').replace(/\s*,+$/, '');
-                    const group = parseInt(match[2]);
-                    if (originalCriticalPeople.has(`${name}|${group}`)) {
-                        newCritical.push(newAssignment);
-                    }
-                }
-            });
-            
-            if (newCritical.length > 0) {
-                criticalAssignments[currentEditingDayKey] = newCritical;
-            } else {
-                delete criticalAssignments[currentEditingDayKey];
-            }
-            
-            saveData();
-            renderCalendar();
-            
-            // Close modal
-            const modal = bootstrap.Modal.getInstance(document.getElementById('dayDetailsModal'));
-            if (modal) {
-                modal.hide();
-            }
-            
-            alert('Οι αλλαγές αποθηκεύτηκαν επιτυχώς!');
-        }
+;
 
         // Manual assignment feature removed (UI + handlers).
 
@@ -9285,22 +8466,7 @@ ${content.innerHTML}
         // Open missing period modal
         let currentMissingPeriodGroup = null;
         let currentMissingPeriodPerson = null;
-        
-        function openMissingPeriodModal(groupNum, person) {
-            currentMissingPeriodGroup = groupNum;
-            currentMissingPeriodPerson = person;
-            
-            document.getElementById('missingPeriodPersonName').textContent = person;
-            document.getElementById('missingPeriodStart').value = '';
-            document.getElementById('missingPeriodEnd').value = '';
-
-            renderMissingReasonsSelect();
-            
-            renderMissingPeriodsList();
-            
-            const modal = new bootstrap.Modal(document.getElementById('missingPeriodModal'));
-            modal.show();
-        }
+;
 
         // Render missing periods list
         function renderMissingPeriodsList() {
@@ -9348,49 +8514,6 @@ ${content.innerHTML}
             }).join('');
         }
 
-        // Add missing period
-        function addMissingPeriod() {
-            const start = document.getElementById('missingPeriodStart').value;
-            const end = document.getElementById('missingPeriodEnd').value;
-            const reason = (document.getElementById('missingPeriodReason')?.value || '').trim();
-            
-            if (!start || !end) {
-                alert('Παρακαλώ συμπληρώστε και τις δύο ημερομηνίες');
-                return;
-            }
-            
-            const startDate = new Date(start + 'T00:00:00');
-            const endDate = new Date(end + 'T00:00:00');
-            
-            if (endDate < startDate) {
-                alert('Η ημερομηνία λήξης πρέπει να είναι μετά την ημερομηνία έναρξης');
-                return;
-            }
-            
-            const groupData = groups[currentMissingPeriodGroup] || { special: [], weekend: [], semi: [], normal: [], lastDuties: {}, missingPeriods: {} };
-            if (!groupData.missingPeriods) groupData.missingPeriods = {};
-            if (!groupData.missingPeriods[currentMissingPeriodPerson]) {
-                groupData.missingPeriods[currentMissingPeriodPerson] = [];
-            }
-            
-            groupData.missingPeriods[currentMissingPeriodPerson].push({
-                start: start,
-                end: end,
-                reason: reason || null
-            });
-            
-            // Sort periods by start date
-            groupData.missingPeriods[currentMissingPeriodPerson].sort((a, b) => {
-                return new Date(a.start) - new Date(b.start);
-            });
-            
-            document.getElementById('missingPeriodStart').value = '';
-            document.getElementById('missingPeriodEnd').value = '';
-            
-            saveData();
-            renderMissingPeriodsList();
-            renderGroups();
-        }
 
         function renderMissingReasonsSelect() {
             const select = document.getElementById('missingPeriodReason');
@@ -9459,32 +8582,7 @@ ${content.innerHTML}
             renderMissingReasonsSelect();
             saveData();
         }
-
-        // Remove missing period (uses centered confirm modal when showConfirmModal is available)
-        function removeMissingPeriod(index) {
-            const doRemove = function () {
-                const groupData = groups[currentMissingPeriodGroup] || { special: [], weekend: [], semi: [], normal: [], lastDuties: {}, missingPeriods: {} };
-                if (groupData.missingPeriods && groupData.missingPeriods[currentMissingPeriodPerson]) {
-                    groupData.missingPeriods[currentMissingPeriodPerson].splice(index, 1);
-                    if (groupData.missingPeriods[currentMissingPeriodPerson].length === 0) {
-                        delete groupData.missingPeriods[currentMissingPeriodPerson];
-                    }
-                }
-                saveData();
-                renderMissingPeriodsList();
-                renderGroups();
-            };
-            if (typeof showConfirmModal === 'function') {
-                showConfirmModal({
-                    title: 'Επιβεβαίωση',
-                    message: 'Είστε σίγουροι ότι θέλετε να αφαιρέσετε αυτή την περίοδο απουσίας;',
-                    onConfirm: doRemove
-                });
-            } else {
-                if (!confirm('Είστε σίγουροι ότι θέλετε να αφαιρέσετε αυτή την περίοδο απουσίας;')) return;
-                doRemove();
-            }
-        }
+;
 
         // Toggle list collapse/expand
         function toggleListCollapse(listId, chevronId) {
@@ -9523,80 +8621,7 @@ ${content.innerHTML}
             window.toggleListCollapse = toggleListCollapse;
         }
 
-        // Update statistics (title bar: Σύνολο Ατόμων, ΑΥΜ, ΔΤΑ, AW139, Επίγεια)
-
-        // Helper function to get consecutive duty dates for detailed violation messages
-        
-        // Helper function to get the special holiday date that caused a weekend skip
-        function getSpecialHolidayBeforeDate(dayKey, person, groupNum) {
-            const date = new Date(dayKey + 'T00:00:00');
-            
-            // Get group data to find rotation days
-            const groupData = groups[groupNum] || { special: [], weekend: [], semi: [], normal: [] };
-            const groupPeople = groupData.weekend || [];
-            if (groupPeople.length === 0) return null;
-            
-            // Find last weekend/holiday duty for this person
-            let lastWeekendDutyDate = null;
-            
-            // Check manually entered last duties first
-            const lastDuties = groupData.lastDuties?.[person];
-            if (lastDuties && lastDuties.weekend) {
-                lastWeekendDutyDate = new Date(lastDuties.weekend + 'T00:00:00');
-            }
-            
-            // Also check actual assignments (use the more recent one)
-            const checkDate = new Date(date);
-            for (let i = 1; i <= 365; i++) {
-                checkDate.setDate(checkDate.getDate() - 1);
-                const checkKey = formatDateKey(checkDate);
-                const checkDayType = getDayType(checkDate);
-                const isCheckWeekend = checkDate.getDay() === 0 || checkDate.getDay() === 6;
-                const isCheckHoliday = checkDayType === 'weekend-holiday' && !isSpecialHoliday(checkDate);
-                
-                if ((isCheckWeekend || isCheckHoliday) && hasDutyOnDay(checkKey, person, groupNum)) {
-                    const checkDateCopy = new Date(checkDate);
-                    if (!lastWeekendDutyDate || checkDateCopy > lastWeekendDutyDate) {
-                        lastWeekendDutyDate = checkDateCopy;
-                    }
-                    break;
-                }
-            }
-            
-            if (!lastWeekendDutyDate) return null;
-            
-            // Check if there's a special holiday between last weekend duty and current day
-            const checkSpecialDate = new Date(lastWeekendDutyDate);
-            checkSpecialDate.setDate(checkSpecialDate.getDate() + 1);
-            while (checkSpecialDate < date) {
-                if (isSpecialHoliday(checkSpecialDate) && hasDutyOnDay(formatDateKey(checkSpecialDate), person, groupNum)) {
-                    return formatDateKey(checkSpecialDate);
-                }
-                checkSpecialDate.setDate(checkSpecialDate.getDate() + 1);
-            }
-            
-            return null;
-        }
-        
-        // Helper function to get missing period for a person on a specific date
-        function getPersonMissingPeriod(person, groupNum, date) {
-            const groupData = groups[groupNum] || {};
-            const personData = groupData.missingPeriods?.[person];
-            if (!personData || !Array.isArray(personData)) return null;
-            
-            for (const period of personData) {
-                const startDate = new Date(period.start + 'T00:00:00');
-                const endDate = new Date(period.end + 'T00:00:00');
-                if (date >= startDate && date <= endDate) {
-                    return {
-                        start: startDate,
-                        end: endDate,
-                        reason: (period.reason || '').trim() || null
-                    };
-                }
-            }
-            return null;
-        }
+;
 
         // Helper: return the SPECIAL HOLIDAY dateKey (YYYY-MM-DD) in the same month for this group, if any.
         // Used for explaining weekend "skips" in the rotation-violations popup.
@@ -9803,265 +8828,7 @@ ${content.innerHTML}
                 `Ο/Η ${b} τοποθετήθηκε στις ${placementDateStr} ημέρα ${placementDayName}.`
             );
         }
-        
-        // Analyze rotation violations
-        function analyzeRotationViolations() {
-            const violations = [];
-            const seenSwapPairs = new Set(); // dayType|group|swapPairId -> dedupe swap rows
-            const seenViolations = new Set(); // dateKey|groupNum|assignedPerson -> dedupe all violations
-
-            const extractShortReasonFromSavedText = (reasonText) => {
-                const t = String(reasonText || '');
-                if (!t) return '';
-                if (t.includes('Απενεργοποιήθηκε') || t.includes('Απενεργοποιημένος')) return 'Απενεργοποιημένος';
-                // Match common missing reasons explicitly
-                if (t.includes('Κανονική Άδεια')) return 'Κανονική Άδεια';
-                if (t.includes('Αναρρωτική Άδεια')) return 'Αναρρωτική Άδεια';
-                if (t.includes('Φύλλο Πορείας')) return 'Φύλλο Πορείας';
-                if (t.toLowerCase().includes('ειδική αργία')) return 'Ειδική αργία στον ίδιο μήνα';
-                if (t.toLowerCase().includes('κώλυμα') || t.toLowerCase().includes('απουσία')) return 'Κώλυμα/Απουσία';
-                return 'Παράλειψη';
-            };
-            
-            // Get dates only for the current month being viewed
-            const year = currentDate.getFullYear();
-            const month = currentDate.getMonth();
-            const firstDay = new Date(year, month, 1);
-            const lastDay = new Date(year, month + 1, 0);
-            const daysInMonth = lastDay.getDate();
-            
-            // Build list of dates for current month
-            const allDates = [];
-            for (let day = 1; day <= daysInMonth; day++) {
-                const date = new Date(year, month, day);
-                allDates.push(formatDateKey(date));
-            }
-
-            // NEW APPROACH: Iterate directly through assignment reasons for the current month
-            // This ensures each assignment reason is processed exactly once, eliminating duplicates
-            const viewMonthPrefix = `${year}-${String(month + 1).padStart(2, '0')}`; // YYYY-MM
-            
-            // First, collect all assignment reasons for the current month
-            for (const dateKey in assignmentReasons) {
-                // Only process dates in the viewed month
-                if (!dateKey.startsWith(viewMonthPrefix + '-')) continue;
-                
-                const date = new Date(dateKey + 'T00:00:00');
-                if (isNaN(date.getTime())) continue;
-                
-                const dayType = getDayType(date);
-                
-                // Determine day type category
-                let dayTypeCategory = 'normal';
-                if (dayType === 'special-holiday') {
-                    dayTypeCategory = 'special';
-                } else if (dayType === 'weekend-holiday') {
-                    dayTypeCategory = 'weekend';
-                } else if (dayType === 'semi-normal-day') {
-                    dayTypeCategory = 'semi';
-                }
-                
-                const dateReasons = assignmentReasons[dateKey];
-                if (!dateReasons) continue;
-                
-                // For each group in this date
-                for (const groupNumStr in dateReasons) {
-                    const groupReasons = dateReasons[groupNumStr];
-                    if (!groupReasons) continue;
-                    const groupNum = parseInt(groupNumStr);
-                    if (!groupNum || groupNum < 1 || groupNum > 4) continue;
-                    
-                    // For each person with an assignment reason
-                    for (const personName in groupReasons) {
-                        const reason = groupReasons[personName];
-                        if (!reason || (reason.type !== 'skip' && reason.type !== 'swap')) continue;
-                        
-                        // Skip cross-month swaps here (they're handled separately)
-                        if (reason.meta?.isCrossMonth) continue;
-                        
-                        // Deduplicate: check if we've already added a violation for this date+group+assignedPerson
-                        const violationKey = `${dateKey}|${groupNum}|${personName}`;
-                        if (seenViolations.has(violationKey)) {
-                            continue; // Skip duplicate entry
-                        }
-                        seenViolations.add(violationKey);
-                        
-                        // Handle swap pair deduplication
-                        if (reason.type === 'swap' && reason.swapPairId !== null && reason.swapPairId !== undefined) {
-                            const k = `${dayTypeCategory}|${groupNum}|${reason.swapPairId}`;
-                            if (seenSwapPairs.has(k)) continue; // only show one row per swap pair
-                            seenSwapPairs.add(k);
-                        }
-                        
-                        // Get the assigned person and expected person from the assignment reason
-                        const assignedPerson = personName;
-                        const expectedPerson = reason.swappedWith || null;
-                        
-                        if (!expectedPerson) continue; // Need to know who was replaced
-                        
-                        // Get group data for validation
-                        const groupData = groups[groupNum];
-                        if (!groupData) continue;
-                        
-                        // Get the appropriate list for this day type
-                        let groupPeople;
-                        if (dayTypeCategory === 'special') {
-                            groupPeople = groupData.special || [];
-                        } else if (dayTypeCategory === 'weekend') {
-                            groupPeople = groupData.weekend || [];
-                        } else if (dayTypeCategory === 'semi') {
-                            groupPeople = groupData.semi || [];
-                        } else {
-                            groupPeople = groupData.normal || [];
-                        }
-                        
-                        // Validate that both persons are in the list
-                        const assignedIndex = groupPeople.indexOf(assignedPerson);
-                        const expectedIndex = groupPeople.indexOf(expectedPerson);
-                        
-                        if (assignedIndex === -1 || expectedIndex === -1) continue;
-                        
-                        // Process the violation
-                        const swapOrSkipReasonText = reason.type === 'skip'
-                            ? normalizeSkipReasonText(reason.reason || '')
-                            : (reason.type === 'swap'
-                                ? normalizeSwapReasonText(reason.reason || '')
-                                : (reason.reason || ''));
-                        
-                        // Get conflict details
-                        const isDisabled = isPersonDisabledForDuty(expectedPerson, groupNum, dayTypeCategory);
-                        const isMissingPeriod = !isDisabled && isPersonMissingOnDate(expectedPerson, groupNum, date, dayTypeCategory);
-                        
-                        let conflictDetails = [];
-                        let hasLegitimateConflict = true; // Assignment reasons are always legitimate
-                        
-                        // Extract short reason for conflicts column
-                        if (swapOrSkipReasonText) {
-                            conflictDetails.push(extractShortReasonFromSavedText(swapOrSkipReasonText));
-                        }
-                        
-                        if (isDisabled) {
-                            conflictDetails.push('Απενεργοποιημένος');
-                        }
-                        
-                        if (isMissingPeriod) {
-                            conflictDetails.push(getUnavailableReasonShort(expectedPerson, groupNum, date, dayTypeCategory));
-                        }
-                        
-                        // Determine skipped reason
-                        let skippedReason = '';
-                        if (isDisabled) {
-                            skippedReason = 'Απενεργοποιημένος';
-                        } else if (isMissingPeriod) {
-                            skippedReason = getUnavailableReasonShort(expectedPerson, groupNum, date, dayTypeCategory);
-                        } else if (reason.type === 'skip' && swapOrSkipReasonText) {
-                            skippedReason = extractShortReasonFromSavedText(swapOrSkipReasonText);
-                        } else if (reason.type === 'swap') {
-                            skippedReason = 'Αλλαγή (swap)';
-                        }
-                        
-                        const conflictSummary = conflictDetails.length > 0 ? conflictDetails.join(' | ') : '';
-                        
-                        violations.push({
-                            date: dateKey,
-                            dateFormatted: date.toLocaleDateString('el-GR', { day: '2-digit', month: '2-digit', year: 'numeric' }),
-                            dateObj: date, // Store date object for sorting and day of week
-                            dayTypeCategory: dayTypeCategory, // Store category for display
-                            group: groupNum,
-                            groupName: getGroupName(groupNum),
-                            assignedPerson: assignedPerson,
-                            expectedPerson: expectedPerson,
-                            conflicts: conflictSummary,
-                            swapReason: swapOrSkipReasonText,
-                            skippedReason: skippedReason,
-                            dayType: getDayTypeLabel(dayType),
-                            reasonType: reason.type // Store 'skip' or 'swap' to determine Αντικατάσταση vs Αλλαγή
-                        });
-                    }
-                }
-            }
-            
-            // Also show cross-month swaps that fall INSIDE the viewed month.
-            // Cross-month swaps are stored on the swap day key (often in the next month).
-            // We intentionally keep the popup scoped to the current month, so:
-            // - viewing Feb will NOT show March dates
-            // - viewing March WILL show the March swap date row
-            try {
-                const viewMonthPrefix = `${year}-${String(month + 1).padStart(2, '0')}`; // YYYY-MM
-                const seenCrossMonth = new Set(); // dateKey|group|person
-
-                for (const dateKey in assignmentReasons) {
-                    // Only show rows for dates in the viewed month
-                    if (!dateKey.startsWith(viewMonthPrefix + '-')) continue;
-                    const dateReasons = assignmentReasons[dateKey];
-                    if (!dateReasons) continue;
-
-                    for (const groupNumStr in dateReasons) {
-                        const groupReasons = dateReasons[groupNumStr];
-                        if (!groupReasons) continue;
-                        const groupNum = parseInt(groupNumStr);
-                        if (!groupNum) continue;
-
-                        for (const personName in groupReasons) {
-                            const r = groupReasons[personName];
-                            const meta = r?.meta;
-                            if (!meta?.isCrossMonth) continue;
-
-                            const originDayKey = meta.originDayKey;
-                            const swapDayKey = meta.swapDayKey || dateKey;
-                            const conflictDateKey = meta.conflictDateKey || originDayKey || dateKey;
-                            // (dateKey is already within view month due to the filter above)
-
-                            const uniqueKey = `${dateKey}|${groupNum}|${personName}`;
-                            if (seenCrossMonth.has(uniqueKey)) continue;
-                            seenCrossMonth.add(uniqueKey);
-                            
-                            // Use the same deduplication key format as main violation detection
-                            const violationKey = `${dateKey}|${groupNum}|${personName}`;
-                            if (seenViolations.has(violationKey)) continue; // already present via normal mismatch logic
-                            seenViolations.add(violationKey);
-
-                            const d = new Date(dateKey + 'T00:00:00');
-                            const originStr = originDayKey ? new Date(originDayKey + 'T00:00:00').toLocaleDateString('el-GR', { day: '2-digit', month: '2-digit', year: 'numeric' }) : '-';
-                            const conflictStr = conflictDateKey ? new Date(conflictDateKey + 'T00:00:00').toLocaleDateString('el-GR', { day: '2-digit', month: '2-digit', year: 'numeric' }) : '-';
-
-                            const dayTypeForCrossMonth = getDayType(d);
-                            let dayTypeCategoryForCrossMonth = 'normal';
-                            if (dayTypeForCrossMonth === 'special-holiday') {
-                                dayTypeCategoryForCrossMonth = 'special';
-                            } else if (dayTypeForCrossMonth === 'weekend-holiday') {
-                                dayTypeCategoryForCrossMonth = 'weekend';
-                            } else if (dayTypeForCrossMonth === 'semi-normal-day') {
-                                dayTypeCategoryForCrossMonth = 'semi';
-                            }
-                            
-                            violations.push({
-                                date: dateKey,
-                                dateFormatted: isNaN(d.getTime())
-                                    ? dateKey
-                                    : d.toLocaleDateString('el-GR', { day: '2-digit', month: '2-digit', year: 'numeric' }),
-                                dateObj: d,
-                                dayTypeCategory: dayTypeCategoryForCrossMonth,
-                                group: groupNum,
-                                groupName: getGroupName(groupNum),
-                                assignedPerson: personName,
-                                expectedPerson: r?.swappedWith || '(Swap)',
-                                conflicts: `Από προηγούμενο μήνα: ${originStr} | Σύγκρουση: ${conflictStr}`,
-                                swapReason: r?.reason || '',
-                                skippedReason: '',
-                                dayType: getDayTypeLabel(dayTypeForCrossMonth),
-                                reasonType: r?.type || 'swap' // Cross-month swaps are typically swaps
-                            });
-                        }
-                    }
-                }
-            } catch (e) {
-                console.warn('Error collecting cross-month swap entries for violations popup:', e);
-            }
-            
-            // Display violations in modal
-            displayRotationViolations(violations);
-        }
+;
         
         // Display rotation violations in modal
         function displayRotationViolations(violations) {
@@ -10150,119 +8917,3 @@ ${content.innerHTML}
             modal.show();
         }
 
-        // Print rotation order lists and rankings: one page per duty type (all 4 groups), then hierarchy
-        function printRotationAndRankings() {
-            const printWindow = window.open('', '_blank', 'width=800,height=600');
-            const allPeople = getAllPeople();
-            const sortedByRanking = [...allPeople].sort((a, b) => {
-                const rankA = rankings[a] || 9999;
-                const rankB = rankings[b] || 9999;
-                return rankA - rankB;
-            });
-            const listTypes = [
-                { key: 'special', name: 'Ειδικές Αργίες' },
-                { key: 'weekend', name: 'Σαββατοκύριακα/Αργίες' },
-                { key: 'semi', name: 'Ημιαργίες' },
-                { key: 'normal', name: 'Καθημερινές' }
-            ];
-            let html = `
-<!DOCTYPE html>
-<html lang="el">
-<head>
-    <meta charset="UTF-8">
-    <title>Σειρές Περιστροφής & Ιεραρχία</title>
-    <style>
-        body { font-family: Arial, sans-serif; padding: 20px; font-size: 12px; }
-        h1 { text-align: center; color: #333; margin-bottom: 10px; }
-        h2 { color: #555; border-bottom: 2px solid #007bff; padding-bottom: 5px; margin-top: 0; margin-bottom: 15px; }
-        h3 { color: #666; margin-top: 0; margin-bottom: 8px; font-size: 13px; }
-        table { width: 100%; border-collapse: collapse; margin-bottom: 20px; }
-        th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
-        th { background-color: #007bff; color: white; font-weight: bold; }
-        tr:nth-child(even) { background-color: #f2f2f2; }
-        .print-page { page-break-after: always; page-break-inside: avoid; }
-        .print-page:last-of-type { page-break-after: auto; }
-        .groups-grid { display: grid; grid-template-columns: 1fr 1fr; gap: 20px 30px; }
-        .group-section { page-break-inside: avoid; }
-        .group-section ol { margin: 5px 0; padding-left: 25px; }
-        .list-item { padding: 2px 0; }
-        .ranking-number { font-weight: bold; color: #007bff; margin-right: 10px; }
-        .empty-list { color: #999; font-style: italic; }
-        @page { margin: 1.5cm; }
-        @media print {
-            body { padding: 1.5cm; margin: 0; }
-            .print-page { page-break-after: always; padding-top: 1.5cm; }
-            .print-page:last-of-type { page-break-after: auto; }
-        }
-    </style>
-</head>
-<body>
-    <h1>Σειρές Περιστροφής & Ιεραρχία Υπηρεσιών</h1>
-    <p style="text-align: center; color: #666; margin-bottom: 25px;">Ημερομηνία εκτύπωσης: ${new Date().toLocaleDateString('el-GR', { day: '2-digit', month: '2-digit', year: 'numeric', hour: '2-digit', minute: '2-digit' })}</p>
-`;
-            listTypes.forEach(listType => {
-                html += `
-    <div class="print-page">
-        <h2>${listType.name}</h2>
-        <div class="groups-grid">
-`;
-                for (let groupNum = 1; groupNum <= 4; groupNum++) {
-                    const groupData = groups[groupNum] || { special: [], weekend: [], semi: [], normal: [] };
-                    const groupName = getGroupName(groupNum);
-                    const list = groupData[listType.key] || [];
-                    html += `
-        <div class="group-section">
-            <h3>Ομάδα ${groupNum}: ${groupName}</h3>
-`;
-                    if (list.length > 0) {
-                        html += `            <ol>`;
-                        list.forEach((person) => { html += `<li class="list-item">${person}</li>`; });
-                        html += `</ol>`;
-                    } else {
-                        html += `            <span class="empty-list">(Κενή λίστα)</span>`;
-                    }
-                    html += `
-        </div>`;
-                }
-                html += `
-        </div>
-    </div>
-`;
-            });
-            html += `
-    <div class="print-page">
-        <h2>Ιεραρχία (Rankings)</h2>
-        <table>
-            <thead>
-                <tr>
-                    <th style="width: 80px;">Κατάταξη</th>
-                    <th>Όνομα</th>
-                    <th>Ομάδα</th>
-                </tr>
-            </thead>
-            <tbody>
-`;
-            sortedByRanking.forEach((person) => {
-                const rank = rankings[person] || null;
-                const personGroup = getPersonGroup(person);
-                const groupName = personGroup ? getGroupName(personGroup) : '-';
-                html += `            <tr>
-                <td><span class="ranking-number">${rank !== null ? rank : '-'}</span></td>
-                <td>${person}</td>
-                <td>${groupName}</td>
-            </tr>
-`;
-            });
-            html += `            </tbody>
-        </table>
-        <div style="margin-top: 25px; text-align: center; color: #666; font-size: 10px;">Αυτό το έγγραφο δημιουργήθηκε από το σύστημα Διαχείρισης Υπηρεσιών</div>
-    </div>
-</body>
-</html>
-`;
-            printWindow.document.write(html);
-            printWindow.document.close();
-            printWindow.onload = function() {
-                setTimeout(() => { printWindow.print(); }, 250);
-            };
-        }
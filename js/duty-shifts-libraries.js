@@ -0,0 +1,45 @@
+// ============================================================================
+// DUTY-SHIFTS-LIBRARIES.JS - generated by js/defer_scripts.py, do not edit
+// ============================================================================
+// Libraries only export code needs, loaded (in order) the first time one of
+// the functions using them is called.
+(function () {
+    var LIBRARIES = [
+        "https://cdnjs.cloudflare.com/ajax/libs/xlsx/0.18.5/xlsx.full.min.js",
+        "https://cdnjs.cloudflare.com/ajax/libs/exceljs/4.4.0/exceljs.min.js",
+        "https://cdnjs.cloudflare.com/ajax/libs/jszip/3.10.1/jszip.min.js"
+    ];
+    var pending = null;
+    function loadScript(src) {
+        return new Promise(function (resolve, reject) {
+            var script = document.createElement('script');
+            script.src = src;
+            script.onload = resolve;
+            script.onerror = function () {
+                reject(new Error('Failed to load ' + src));
+            };
+            document.head.appendChild(script);
+        });
+    }
+    window.loadOnDemandLibraries = function () {
+        if (!pending) {
+            pending = LIBRARIES.reduce(function (chain, src) {
+                return chain.then(function () { return loadScript(src); });
+            }, Promise.resolve());
+            pending.catch(function () { pending = null; });
+        }
+        return pending;
+    };
+    ["generateExcelFilesForCurrentMonth"].forEach(function (name) {
+        var fn = window[name];
+        if (typeof fn !== 'function') {
+            return;
+        }
+        window[name] = function () {
+            var self = this, args = arguments;
+            return window.loadOnDemandLibraries().then(function () {
+                return fn.apply(self, args);
+            });
+        };
+    });
+})();
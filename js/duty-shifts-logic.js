@@ -161,129 +161,10 @@
             if (modal) modal.hide();
             alert(`Προστέθηκε το άτομο "${personName}" στην ${getGroupName(groupNum)} με αυτόματη τοποθέτηση.\nΆφιξη: ${arrivalDateKey}`);
         }
-        function formatGreekMonthYear(date) {
-            if (!date || isNaN(date.getTime())) return '';
-            const month = greekUpperNoTones(date.toLocaleDateString('el-GR', { month: 'long' }));
-            const year = date.getFullYear();
-            return `${month} ${year}`;
-        }
-        function buildPeriodLabel(startDate, endDate) {
-            if (!startDate || isNaN(startDate.getTime())) return '';
-            if (!endDate || isNaN(endDate.getTime())) return formatGreekMonthYear(startDate);
-
-            const startMY = formatGreekMonthYear(startDate);
-            const endMY = formatGreekMonthYear(endDate);
 
-            const sameYear = startDate.getFullYear() === endDate.getFullYear();
-            const sameMonth = sameYear && startDate.getMonth() === endDate.getMonth();
-            if (sameMonth) return startMY;
 
-            const startMonth = greekUpperNoTones(startDate.toLocaleDateString('el-GR', { month: 'long' }));
-            const endMonth = greekUpperNoTones(endDate.toLocaleDateString('el-GR', { month: 'long' }));
-
-            if (sameYear) {
-                return `${startMonth}-${endMonth} ${startDate.getFullYear()}`;
-            }
-            return `${startMY}-${endMY}`;
-        }
-        function isDateKeyInRange(dateKey, startDate, endDate) {
-            if (!dateKey || typeof dateKey !== 'string') return false;
-            if (!/^\d{4}-\d{2}-\d{2}$/.test(dateKey)) return false;
-            const d = new Date(dateKey + 'T00:00:00');
-            if (isNaN(d.getTime())) return false;
-            return d >= startDate && d <= endDate;
-        }
-        function buildPreviewCalculationSummaryHtml({ title, items }) {
-            const safeTitle = title || 'Σύνοψη Αλλαγών';
-            const swaps = items.filter(i => i.kind === 'swap');
-            const skips = items.filter(i => i.kind === 'skip');
-            const missing = items.filter(i => i.kind === 'missing');
-            const conflicts = items.filter(i => i.kind === 'conflict');
-
-            const buildTable = (rows) => {
-                if (!rows.length) {
-                    return '<div class="text-muted small">-</div>';
-                }
-                let html = '<div class="table-responsive"><table class="table table-sm table-bordered mb-0">';
-                html += '<thead class="table-light"><tr><th>Ημερομηνία</th><th>Υπηρεσία</th><th>Βασική Σειρά</th><th>Αντικατάσταση</th><th>Αιτία</th></tr></thead><tbody>';
-                for (const r of rows) {
-                    html += `<tr>
-                        <td>${r.dateStr}</td>
-                        <td>${r.groupName}</td>
-                        <td><strong>${r.baseline || '-'}</strong></td>
-                        <td><strong>${r.computed || '-'}</strong></td>
-                        <td>${r.reason || ''}</td>
-                    </tr>`;
-                }
-                html += '</tbody></table></div>';
-                return html;
-            };
 
-            return `
-                <div class="mt-4">
-                    <h6 class="mb-2"><i class="fas fa-list-check me-2"></i>${safeTitle}</h6>
-                    <div class="alert alert-light border mb-3">
-                        <div class="d-flex flex-wrap gap-2">
-                            <span class="badge bg-primary">Swaps: ${swaps.length}</span>
-                            <span class="badge bg-warning text-dark">Skips (ειδική αργία): ${skips.length}</span>
-                            <span class="badge bg-info text-dark">Missing αντικαταστάσεις: ${missing.length}</span>
-                            <span class="badge bg-danger">Υπόλοιπες συγκρούσεις: ${conflicts.length}</span>
-                        </div>
-                    </div>
 
-                    <div class="accordion" id="previewSummaryAccordion">
-                        <div class="accordion-item">
-                            <h2 class="accordion-header" id="prevSumHead1">
-                                <button class="accordion-button" type="button" data-bs-toggle="collapse" data-bs-target="#prevSumBody1">
-                                    Swaps
-                                </button>
-                            </h2>
-                            <div id="prevSumBody1" class="accordion-collapse collapse show" data-bs-parent="#previewSummaryAccordion">
-                                <div class="accordion-body">
-                                    ${buildTable(swaps)}
-                                </div>
-                            </div>
-                        </div>
-                        <div class="accordion-item">
-                            <h2 class="accordion-header" id="prevSumHead2">
-                                <button class="accordion-button collapsed" type="button" data-bs-toggle="collapse" data-bs-target="#prevSumBody2">
-                                    Skips (ειδική αργία)
-                                </button>
-                            </h2>
-                            <div id="prevSumBody2" class="accordion-collapse collapse" data-bs-parent="#previewSummaryAccordion">
-                                <div class="accordion-body">
-                                    ${buildTable(skips)}
-                                </div>
-                            </div>
-                        </div>
-                        <div class="accordion-item">
-                            <h2 class="accordion-header" id="prevSumHead3">
-                                <button class="accordion-button collapsed" type="button" data-bs-toggle="collapse" data-bs-target="#prevSumBody3">
-                                    Missing αντικαταστάσεις
-                                </button>
-                            </h2>
-                            <div id="prevSumBody3" class="accordion-collapse collapse" data-bs-parent="#previewSummaryAccordion">
-                                <div class="accordion-body">
-                                    ${buildTable(missing)}
-                                </div>
-                            </div>
-                        </div>
-                        <div class="accordion-item">
-                            <h2 class="accordion-header" id="prevSumHead4">
-                                <button class="accordion-button collapsed" type="button" data-bs-toggle="collapse" data-bs-target="#prevSumBody4">
-                                    Υπόλοιπες συγκρούσεις (μετά τις αλλαγές)
-                                </button>
-                            </h2>
-                            <div id="prevSumBody4" class="accordion-collapse collapse" data-bs-parent="#previewSummaryAccordion">
-                                <div class="accordion-body">
-                                    ${buildTable(conflicts)}
-                                </div>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            `;
-        }
         function getLastAndNextDutyDates(person, groupNum, listType, listArrayLength) {
             const groupData = (typeof groupsForDuty === 'function' ? groupsForDuty(groupNum) : groups[groupNum]) || { special: [], weekend: [], semi: [], normal: [], lastDuties: {} };
             const lastDuties = groupData.lastDuties?.[person] || {};
@@ -1058,74 +939,10 @@
             }
             return raw;
         }
-        function deepClonePlain(obj) {
-            if (!obj) return obj;
-            if (typeof structuredClone === 'function') {
-                try { return structuredClone(obj); } catch (_) {}
-            }
-            return JSON.parse(JSON.stringify(obj));
-        }
-        function ensureTransferUndoToastExists() {
-            if (document.getElementById('transferUndoToast')) return;
-            const html = `
-                <div class="toast-container position-fixed bottom-0 end-0 p-3" style="z-index: 11000;">
-                    <div id="transferUndoToast" class="toast align-items-center text-bg-dark border-0" role="alert" aria-live="assertive" aria-atomic="true">
-                        <div class="d-flex">
-                            <div class="toast-body" id="transferUndoToastBody">Έγινε μεταφορά.</div>
-                            <div class="d-flex align-items-center gap-2 me-2">
-                                <button type="button" class="btn btn-sm btn-warning" id="transferUndoToastButton">Αναίρεση</button>
-                                <button type="button" class="btn-close btn-close-white me-1 m-auto" data-bs-dismiss="toast" aria-label="Close"></button>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            `;
-            document.body.insertAdjacentHTML('beforeend', html);
-        }
-        function showTransferUndoToast() {
-            if (!lastTransferUndo) return;
-            ensureTransferUndoToastExists();
-            const toastEl = document.getElementById('transferUndoToast');
-            const bodyEl = document.getElementById('transferUndoToastBody');
-            const btnEl = document.getElementById('transferUndoToastButton');
-            if (!toastEl || !bodyEl || !btnEl) return;
-
-            const p = lastTransferUndo.person || '';
-            const fromName = getGroupName(lastTransferUndo.fromGroup);
-            const toName = getGroupName(lastTransferUndo.toGroup);
-            bodyEl.innerHTML = `<strong>Μεταφορά:</strong> ${p}<br><small class="text-white-50">${fromName} → ${toName}</small>`;
-
-            // Re-bind click handler each time (safe)
-            const newBtn = btnEl.cloneNode(true);
-            btnEl.parentNode.replaceChild(newBtn, btnEl);
-            newBtn.addEventListener('click', (e) => {
-                e.preventDefault();
-                undoLastGroupTransfer();
-                const toast = bootstrap.Toast.getInstance(toastEl) || new bootstrap.Toast(toastEl);
-                toast.hide();
-            });
 
-            // Keep visible until user clicks Undo or closes it.
-            const toast = bootstrap.Toast.getInstance(toastEl) || new bootstrap.Toast(toastEl, { autohide: false });
-            toast.show();
-        }
-        function undoLastGroupTransfer() {
-            if (!lastTransferUndo) {
-                alert('Δεν υπάρχει μεταφορά για αναίρεση.');
-                return;
-            }
-            const { fromGroup, toGroup, fromSnapshot, toSnapshot } = lastTransferUndo;
-            if (!fromSnapshot || !toSnapshot) {
-                alert('Δεν υπάρχουν αποθηκευμένα δεδομένα για αναίρεση.');
-                return;
-            }
-            groups[fromGroup] = deepClonePlain(fromSnapshot);
-            groups[toGroup] = deepClonePlain(toSnapshot);
-            saveData();
-            renderGroups();
-            updateStatistics();
-            lastTransferUndo = null;
-        }
+
+
+
         function getDayTypeCategoryFromDayType(dayType) {
             if (dayType === 'special-holiday') return 'special';
             if (dayType === 'weekend-holiday') return 'weekend';
@@ -3283,466 +3100,9 @@
             return !!getSpecialHolidayDutyDateKeyForPersonInMonthCalcOrSaved(person, groupNum, year, monthIndex0);
         }
 
-        function _removed_getPersonFromNextMonth(dayKey, dayTypeCategory, groupNum, currentMonth, currentYear, rotationDays, groupPeople, currentRotationPosition = null) {
-            const date = new Date(dayKey + 'T00:00:00');
-            
-            // For semi-normal days and normal days, allow cross-month swaps throughout the entire month
-            // For other day types (weekend, special), only check in last 3 days
-            if (dayTypeCategory !== 'semi' && dayTypeCategory !== 'normal') {
-            const lastDayOfMonth = new Date(currentYear, currentMonth + 1, 0);
-            const daysUntilEndOfMonth = lastDayOfMonth.getDate() - date.getDate();
-            
-            // Only use next month logic if we're in the last 3 days of the month
-            if (daysUntilEndOfMonth > 3) {
-                return null;
-                }
-            }
-            
-            // Calculate next month
-            const nextMonth = currentMonth === 11 ? 0 : currentMonth + 1;
-            const nextYear = currentMonth === 11 ? currentYear + 1 : currentYear;
-            
-            // Get first and last day of next month
-            const firstDayOfNextMonth = new Date(nextYear, nextMonth, 1);
-            const lastDayOfNextMonth = new Date(nextYear, nextMonth + 1, 0);
-            
-            // For normal days, follow swap logic: Monday↔Wednesday, Tuesday↔Thursday
-            if (dayTypeCategory === 'normal') {
-                const currentDayOfWeek = date.getDay(); // 0=Sunday, 1=Monday, 2=Tuesday, 3=Wednesday, 4=Thursday, 5=Friday, 6=Saturday
-                
-                // Determine swap day pairs: Monday↔Wednesday (1↔3), Tuesday↔Thursday (2↔4)
-                // Logic: Tuesday tries next Tuesday first, then nearest Thursday
-                //        Thursday tries next Thursday first, then nearest Tuesday
-                let targetDayOfWeek = null;
-                let alternativeDayOfWeek = null;
-                let tryTargetFirst = false; // Flag to indicate if we should try target day first
-                
-                if (currentDayOfWeek === 1) { // Monday
-                    targetDayOfWeek = 1; // Next Monday
-                    alternativeDayOfWeek = 3; // Wednesday (preferred for swap)
-                } else if (currentDayOfWeek === 2) { // Tuesday
-                    targetDayOfWeek = 2; // Next Tuesday (try FIRST)
-                    alternativeDayOfWeek = 4; // Thursday (then nearest)
-                    tryTargetFirst = true;
-                } else if (currentDayOfWeek === 3) { // Wednesday
-                    targetDayOfWeek = 3; // Next Wednesday
-                    alternativeDayOfWeek = 1; // Monday (preferred for swap)
-                } else if (currentDayOfWeek === 4) { // Thursday
-                    targetDayOfWeek = 4; // Next Thursday (try FIRST)
-                    alternativeDayOfWeek = 2; // Tuesday (then nearest)
-                    tryTargetFirst = true;
-                }
-                
-                // Try to find swap day in next month following the swap logic
-                let swapDayInNextMonth = null;
-                
-                if (tryTargetFirst && targetDayOfWeek !== null) {
-                    // For Tuesday/Thursday: PRIORITY 1 - Try same day of week first (next Tuesday/Thursday)
-                    const checkDate = new Date(firstDayOfNextMonth);
-                    while (checkDate <= lastDayOfNextMonth) {
-                        const checkDayType = getDayType(checkDate);
-                        if (checkDayType === 'normal-day' && checkDate.getDay() === targetDayOfWeek) {
-                            swapDayInNextMonth = new Date(checkDate);
-                            break;
-                        }
-                        checkDate.setDate(checkDate.getDate() + 1);
-                    }
-                    
-                    // PRIORITY 2: If same day not found, try alternative (nearest Thursday/Tuesday)
-                    if (!swapDayInNextMonth && alternativeDayOfWeek !== null) {
-                        const checkDate = new Date(firstDayOfNextMonth);
-                        while (checkDate <= lastDayOfNextMonth) {
-                            const checkDayType = getDayType(checkDate);
-                            if (checkDayType === 'normal-day' && checkDate.getDay() === alternativeDayOfWeek) {
-                                swapDayInNextMonth = new Date(checkDate);
-                                break;
-                            }
-                            checkDate.setDate(checkDate.getDate() + 1);
-                        }
-                    }
-                } else if (alternativeDayOfWeek !== null) {
-                    // For Monday/Wednesday: PRIORITY 1 - Try alternative day of week first (e.g., Wednesday for Monday)
-                    const checkDate = new Date(firstDayOfNextMonth);
-                    while (checkDate <= lastDayOfNextMonth) {
-                        const checkDayType = getDayType(checkDate);
-                        if (checkDayType === 'normal-day' && checkDate.getDay() === alternativeDayOfWeek) {
-                            swapDayInNextMonth = new Date(checkDate);
-                            break;
-                        }
-                        checkDate.setDate(checkDate.getDate() + 1);
-                    }
-                    
-                    // PRIORITY 2: If alternative not found, try same day of week (e.g., next Monday for Monday)
-                    if (!swapDayInNextMonth && targetDayOfWeek !== null) {
-                        const checkDate = new Date(firstDayOfNextMonth);
-                        while (checkDate <= lastDayOfNextMonth) {
-                            const checkDayType = getDayType(checkDate);
-                            if (checkDayType === 'normal-day' && checkDate.getDay() === targetDayOfWeek) {
-                                swapDayInNextMonth = new Date(checkDate);
-                                break;
-                            }
-                            checkDate.setDate(checkDate.getDate() + 1);
-                        }
-                    }
-                }
-                
-                // If no swap day found in next month, fall back to first normal day
-                if (!swapDayInNextMonth) {
-                    const checkDate = new Date(firstDayOfNextMonth);
-                    while (checkDate <= lastDayOfNextMonth) {
-                        const checkDayType = getDayType(checkDate);
-                        if (checkDayType === 'normal-day') {
-                            swapDayInNextMonth = new Date(checkDate);
-                            break;
-                        }
-                        checkDate.setDate(checkDate.getDate() + 1);
-                    }
-                }
-                
-                if (!swapDayInNextMonth) {
-                    return null;
-                }
-                
-                // Calculate rotation position for the swap day in next month
-                // Rotation continues globally from current month
-                let nextMonthRotationPosition;
-                if (currentRotationPosition !== null && currentRotationPosition !== undefined) {
-                    // Count how many normal days are between current day and swap day in next month
-                    // This ensures we get the correct rotation position
-                    const swapDayKey = formatDateKey(swapDayInNextMonth);
-                    const swapRotationPosition = getRotationPosition(swapDayInNextMonth, 'normal', groupNum) % rotationDays;
-                    nextMonthRotationPosition = swapRotationPosition;
-                } else {
-                    // Fallback: calculate from start date
-                    nextMonthRotationPosition = getRotationPosition(swapDayInNextMonth, 'normal', groupNum) % rotationDays;
-                }
-                
-                const nextMonthPerson = groupPeople[nextMonthRotationPosition];
-                
-                // Check if this person from next month has conflicts on the current day
-                if (nextMonthPerson && !isPersonMissingOnDate(nextMonthPerson, groupNum, date, 'normal')) {
-                    const hasConflict = hasConsecutiveDuty(dayKey, nextMonthPerson, groupNum);
-                    
-                    if (!hasConflict) {
-                        const swapDayKey = formatDateKey(swapDayInNextMonth);
-                        const swapDayName = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday'][swapDayInNextMonth.getDay()];
-                        console.log(`[END OF MONTH SWAP] Using person from next month: ${nextMonthPerson} for ${dayKey} (swap day: ${swapDayKey} - ${swapDayName}, rotation position: ${nextMonthRotationPosition})`);
-                        // Return both person and swap day key so we can track where they should be assigned in next month
-                        return { person: nextMonthPerson, swapDayKey: swapDayKey };
-                    }
-                }
-                
-                return null;
-            }
-            
-            // For other day types (weekend, semi, special), use original logic
-            // Find first day of this type in next month
-            let firstDayOfTypeInNextMonth = null;
-            const checkDate = new Date(firstDayOfNextMonth);
-            
-            while (checkDate <= lastDayOfNextMonth) {
-                const checkDayType = getDayType(checkDate);
-                let checkTypeCategory = 'normal';
-                if (checkDayType === 'special-holiday') {
-                    checkTypeCategory = 'special';
-                } else if (checkDayType === 'semi-normal-day') {
-                    checkTypeCategory = 'semi';
-                } else if (checkDayType === 'weekend-holiday') {
-                    checkTypeCategory = 'weekend';
-                }
-                
-                if (checkTypeCategory === dayTypeCategory) {
-                    firstDayOfTypeInNextMonth = new Date(checkDate);
-                    break;
-                }
-                checkDate.setDate(checkDate.getDate() + 1);
-            }
-            
-            if (!firstDayOfTypeInNextMonth) {
-                return null;
-            }
-            
-            // Calculate rotation position for first day of this type in next month
-            // For weekends, rotation continues globally from current month
-            // For special and semi, use direct rotation calculation
-            let nextMonthRotationPosition;
-            
-            if (dayTypeCategory === 'weekend') {
-                // Rotation continues globally - if we have current rotation position, advance it
-                // Otherwise calculate from start date
-                if (currentRotationPosition !== null && currentRotationPosition !== undefined) {
-                    // Advance rotation position by 1 (for the current day we're processing)
-                    // This gives us the position for the first day in next month
-                    nextMonthRotationPosition = (currentRotationPosition + 1) % rotationDays;
-                } else {
-                    // Fallback: calculate from start date
-                    nextMonthRotationPosition = getRotationPosition(firstDayOfTypeInNextMonth, dayTypeCategory, groupNum) % rotationDays;
-                }
-            } else {
-                // For special and semi, use direct calculation
-                nextMonthRotationPosition = getRotationPosition(firstDayOfTypeInNextMonth, dayTypeCategory, groupNum) % rotationDays;
-            }
-            
-            const nextMonthPerson = groupPeople[nextMonthRotationPosition];
-            
-            // Check if this person from next month has conflicts on the current day
-            if (nextMonthPerson && !isPersonMissingOnDate(nextMonthPerson, groupNum, date, dayTypeCategory)) {
-                const hasConflict = hasConsecutiveDuty(dayKey, nextMonthPerson, groupNum);
-                
-                // Also check if they have special holiday in current month (for weekends)
-                let hasSpecialInCurrentMonth = false;
-                if (dayTypeCategory === 'weekend') {
-                    hasSpecialInCurrentMonth = hasSpecialHolidayDutyInMonth(nextMonthPerson, groupNum, currentMonth, currentYear);
-                }
-                
-                if (!hasConflict && !hasSpecialInCurrentMonth) {
-                    console.log(`[END OF MONTH] Using person from next month: ${nextMonthPerson} for ${dayKey} (rotation position: ${nextMonthRotationPosition}, end of month conflict resolution)`);
-                    // Return both person and swap day key (first day of type in next month)
-                    const firstDayKey = formatDateKey(firstDayOfTypeInNextMonth);
-                    return { person: nextMonthPerson, swapDayKey: firstDayKey };
-                }
-            }
-            
-            return null;
-        }
-        function countDaysSinceLastDuty(dayKey, person, groupNum, dayTypeCategory, allDaysByType, startDate = null) {
-            const daysOfType = allDaysByType[dayTypeCategory];
-            const currentIndex = daysOfType.indexOf(dayKey);
-            
-            if (currentIndex === -1) {
-                return Infinity; // Current day not in this type
-            }
-            
-            // Find last duty day for this person in this day type (before current day)
-            let lastDutyIndex = -1;
-            for (let i = currentIndex - 1; i >= 0; i--) {
-                if (hasDutyOnDay(daysOfType[i], person, groupNum)) {
-                    lastDutyIndex = i;
-                    break;
-                }
-            }
-            
-            // Check intended assignments - these count for rotation even if person was skipped due to conflicts
-            // This ensures N-day rotation counts from the intended day, not the actual assignment day
-            // IMPORTANT: For weekends skipped due to special holiday, we need to count from the NEXT weekend after the skipped one
-            let intendedDutyIndex = -1;
-            
-            for (let i = currentIndex - 1; i >= 0; i--) {
-                const checkDayKey = daysOfType[i];
-                // Check if this person had an intended assignment on this day
-                if (intendedAssignments[checkDayKey] && 
-                    intendedAssignments[checkDayKey][groupNum] === person) {
-                    intendedDutyIndex = i;
-                    
-                    // If this is a weekend/holiday day that was skipped due to special holiday,
-                    // we need to count from the NEXT weekend/holiday day after it (not from the skipped one)
-                    if (dayTypeCategory === 'weekend' && i + 1 < daysOfType.length) {
-                        // The next day in the daysOfType array is the next weekend/holiday day
-                        // Count from the day AFTER that next weekend (start counting tomorrow)
-                        const nextWeekendIndex = i + 1;
-                        if (nextWeekendIndex < currentIndex) {
-                            // Start counting from the day after the next weekend
-                            return currentIndex - nextWeekendIndex - 1;
-                        }
-                    }
-                    break;
-                }
-            }
-            
-            // Use intended assignment if it's more recent than actual assignment
-            // This ensures rotation counts from when person SHOULD have been assigned, not when they actually were
-            if (intendedDutyIndex !== -1 && (lastDutyIndex === -1 || intendedDutyIndex > lastDutyIndex)) {
-                // Count from the day AFTER the intended assignment (start counting tomorrow)
-                // If intended duty was at index i, we start counting from index i+1
-                // So days passed = currentIndex - (intendedDutyIndex + 1) = currentIndex - intendedDutyIndex - 1
-                return currentIndex - intendedDutyIndex - 1;
-            }
-            
-            // Check lastDuties data first (manually entered last duties)
-            const groupData = (typeof groupsForDuty === 'function' ? groupsForDuty(groupNum) : groups[groupNum]) || { special: [], weekend: [], semi: [], normal: [], lastDuties: {} };
-            const lastDuties = groupData.lastDuties?.[person];
-            if (lastDuties) {
-                const lastDutyDateStr = lastDuties[dayTypeCategory];
-                if (lastDutyDateStr) {
-                    const lastDutyDate = new Date(lastDutyDateStr + 'T00:00:00');
-                    const currentDate = new Date(dayKey + 'T00:00:00');
-                    
-                    // Count days of the same type between last duty and current day
-                    let sameTypeDays = 0;
-                    const tempDate = new Date(lastDutyDate);
-                    tempDate.setDate(tempDate.getDate() + 1);
-                    while (tempDate < currentDate) {
-                        const tempDayType = getDayType(tempDate);
-                        let tempTypeCategory = 'normal';
-                        if (tempDayType === 'special-holiday') {
-                            tempTypeCategory = 'special';
-                        } else if (tempDayType === 'semi-normal-day') {
-                            tempTypeCategory = 'semi';
-                        } else if (tempDayType === 'weekend-holiday') {
-                            tempTypeCategory = 'weekend';
-                        }
-                        if (tempTypeCategory === dayTypeCategory) {
-                            sameTypeDays++;
-                        }
-                        tempDate.setDate(tempDate.getDate() + 1);
-                    }
-                    
-                    // If we found a last duty date, use it (unless we found a more recent one in assignments)
-                    if (lastDutyIndex === -1 || (lastDutyDate > new Date(daysOfType[lastDutyIndex] + 'T00:00:00'))) {
-                        return sameTypeDays;
-                    }
-                }
-            }
-            
-            // If startDate is provided, also check existing assignments before the start date
-            if (startDate && lastDutyIndex === -1) {
-                const currentDate = new Date(dayKey + 'T00:00:00');
-                const checkDate = new Date(startDate);
-                checkDate.setDate(checkDate.getDate() - 1); // Day before start date
-                
-                // Look backwards from start date to find last duty
-                let daysBack = 0;
-                const maxDaysBack = 365; // Check up to 1 year back
-                
-                while (daysBack < maxDaysBack && checkDate >= new Date(2000, 0, 1)) { // Don't go before year 2000
-                    const checkKey = formatDateKey(checkDate);
-                    const checkDayType = getDayType(checkDate);
-                    let checkTypeCategory = 'normal';
-                    
-                    if (checkDayType === 'special-holiday') {
-                        checkTypeCategory = 'special';
-                    } else if (checkDayType === 'semi-normal-day') {
-                        checkTypeCategory = 'semi';
-                    } else if (checkDayType === 'weekend-holiday') {
-                        checkTypeCategory = 'weekend';
-                    }
-                    
-                    // Only count if it's the same day type category
-                    if (checkTypeCategory === dayTypeCategory && hasDutyOnDay(checkKey, person, groupNum)) {
-                        // Found a previous duty - calculate days between
-                        const daysBetween = Math.floor((currentDate - checkDate) / (1000 * 60 * 60 * 24));
-                        // Count only days of the same type between them
-                        let sameTypeDays = 0;
-                        const tempDate = new Date(checkDate);
-                        tempDate.setDate(tempDate.getDate() + 1);
-                        while (tempDate < currentDate) {
-                            const tempDayType = getDayType(tempDate);
-                            let tempTypeCategory = 'normal';
-                            if (tempDayType === 'special-holiday') {
-                                tempTypeCategory = 'special';
-                            } else if (tempDayType === 'semi-normal-day') {
-                                tempTypeCategory = 'semi';
-                            } else if (tempDayType === 'weekend-holiday') {
-                                tempTypeCategory = 'weekend';
-                            }
-                            if (tempTypeCategory === dayTypeCategory) {
-                                sameTypeDays++;
-                            }
-                            tempDate.setDate(tempDate.getDate() + 1);
-                        }
-                        return sameTypeDays;
-                    }
-                    
-                    checkDate.setDate(checkDate.getDate() - 1);
-                    daysBack++;
-                }
-            }
-            
-            if (lastDutyIndex === -1) {
-                return Infinity; // Never had duty of this type
-            }
-            
-            // Count how many days of this type between last duty and current day
-            // If last duty was at index i, we start counting from index i+1 (tomorrow)
-            // So days passed = currentIndex - (lastDutyIndex + 1) = currentIndex - lastDutyIndex - 1
-            return currentIndex - lastDutyIndex - 1;
-        }
-        function openCalculateDutiesModal() {
-            // Set default to current month
-            const currentYear = currentDate.getFullYear();
-            const currentMonth = String(currentDate.getMonth() + 1).padStart(2, '0');
-            const startMonthInput = document.getElementById('calculateStartMonth');
-            
-            if (startMonthInput) {
-                startMonthInput.value = `${currentYear}-${currentMonth}`;
-            }
-            for (let g = 1; g <= 4; g++) {
-                const stripCb = document.getElementById(`calcStripManualOverridesG${g}`);
-                if (stripCb) stripCb.checked = false;
-                const lab = document.getElementById(`calcStripGroupLabel${g}`);
-                if (lab && typeof getGroupName === 'function') {
-                    try {
-                        lab.textContent = getGroupName(g);
-                    } catch (_) {
-                        lab.textContent = `Ομάδα ${g}`;
-                    }
-                }
-            }
-
-            // Make month picker open when clicking anywhere on the month fields (label/container too)
-            ensureMonthPickerClickTargets();
-            
-            // Add event listener to button as backup (remove old listeners first)
-            const calculateButton = document.getElementById('calculateDutiesButton');
-            if (calculateButton) {
-                // Clone button to remove all event listeners
-                const newButton = calculateButton.cloneNode(true);
-                calculateButton.parentNode.replaceChild(newButton, calculateButton);
-                
-                // Add new event listener
-                newButton.addEventListener('click', function(e) {
-                    e.preventDefault();
-                    calculateDutiesForSelectedMonths();
-                });
-            }
-            
-            const modal = new bootstrap.Modal(document.getElementById('calculateDutiesModal'));
-            modal.show();
-        }
-        function ensureMonthPickerClickTargets() {
-            if (monthPickerClickTargetsInstalled) return;
-            monthPickerClickTargetsInstalled = true;
-
-            const installFor = (inputId) => {
-                const input = document.getElementById(inputId);
-                if (!input) return;
-
-                const openPicker = () => {
-                    try {
-                        input.focus({ preventScroll: true });
-                    } catch (_) {
-                        input.focus();
-                    }
-                    if (typeof input.showPicker === 'function') {
-                        try {
-                            input.showPicker();
-                        } catch (_) {
-                            // ignore (some browsers require user gesture; focus is still helpful)
-                        }
-                    }
-                };
 
-                // If the user clicks the input itself, try to open immediately.
-                input.addEventListener('click', () => openPicker());
-                // Some browsers open picker on focus; this makes it consistent.
-                input.addEventListener('focus', () => {
-                    if (typeof input.showPicker === 'function') {
-                        try { input.showPicker(); } catch (_) {}
-                    }
-                });
 
-                // Expand click target to the entire field block (label + help text + surrounding area)
-                const container = input.closest('.mb-3') || input.parentElement;
-                if (container) {
-                    container.addEventListener('click', (e) => {
-                        if (e.target === input) return;
-                        openPicker();
-                    });
-                }
-            };
 
-            installFor('calculateStartMonth');
-        }
         async function calculateDutiesForSelectedMonths() {
             const calcBtn = document.getElementById('calculateDutiesButton');
             const originalBtnHtml = calcBtn ? calcBtn.innerHTML : '';
@@ -4693,155 +4053,7 @@
             html += '</div>';
             stepContent.innerHTML = html;
         }
-        function showSpecialHolidayResultsAndProceed() {
-            try {
-                const dayTypeLists = calculationSteps.dayTypeLists || { special: [] };
-                const specialHolidays = (dayTypeLists.special || []).slice().sort();
-                const baselineByDate = calculationSteps.tempSpecialBaselineAssignments || {};
-                const computedByDate = calculationSteps.tempSpecialAssignments || {};
-
-                // Build rows where baseline != computed
-                const changes = [];
-                for (const dateKey of specialHolidays) {
-                    const date = new Date(dateKey + 'T00:00:00');
-                    if (isNaN(date.getTime())) continue;
-
-                    // Holiday name (same logic as Step 1 table)
-                    let holidayName = '';
-                    const year = date.getFullYear();
-                    const month = date.getMonth() + 1;
-                    const day = date.getDate();
-                    for (const holidayDef of recurringSpecialHolidays) {
-                        if (holidayDef.type === 'fixed' && holidayDef.month === month && holidayDef.day === day) {
-                            holidayName = holidayDef.name;
-                            break;
-                        } else if (holidayDef.type === 'easter-relative') {
-                            const orthodoxHolidays = calculateOrthodoxHolidays(year);
-                            const easterDate = orthodoxHolidays.easterSunday;
-                            const holidayDate = new Date(easterDate);
-                            holidayDate.setDate(holidayDate.getDate() + (holidayDef.offset || 0));
-                            if (formatDateKey(holidayDate) === dateKey) {
-                                holidayName = holidayDef.name;
-                                break;
-                            }
-                        }
-                    }
-
-                    for (let groupNum = 1; groupNum <= 4; groupNum++) {
-                        const base = baselineByDate?.[dateKey]?.[groupNum] || null;
-                        const comp = computedByDate?.[dateKey]?.[groupNum] || null;
-                        if (!base || !comp) continue;
-                        if (base === comp) continue;
-
-                        let reason = '';
-                        const compReason = getAssignmentReason(dateKey, groupNum, comp);
-                        if (compReason && compReason.meta && compReason.meta.returnFromMissing) {
-                            reason = (compReason.reason || 'Επέστρεψε από απουσία.').split('.').filter(Boolean)[0] || 'Επέστρεψε από απουσία';
-                        } else if (isPersonDisabledForDuty(base, groupNum, 'special') || isPersonMissingOnDate(base, groupNum, date, 'special')) {
-                            // Keep the same style as other steps: show the first sentence (without "Ανατέθηκε...")
-                            reason = buildUnavailableReplacementReason({
-                                skippedPersonName: base,
-                                replacementPersonName: comp,
-                                dateObj: date,
-                                groupNum,
-                                dutyCategory: 'special'
-                            }) || '';
-                        } else {
-                            reason = 'Αλλαγή (κανόνας/σύγκρουση)';
-                        }
-
-                        changes.push({
-                            dateKey,
-                            dateStr: date.toLocaleDateString('el-GR', { day: '2-digit', month: '2-digit', year: 'numeric' }),
-                            dayName: getGreekDayName(date),
-                            holidayName: holidayName || 'Ειδική Αργία',
-                            groupNum,
-                            groupName: getGroupName(groupNum),
-                            baseline: base,
-                            computed: comp,
-                            reason
-                        });
-                    }
-                }
 
-                let message = '';
-                if (changes.length === 0) {
-                    message = '<div class="alert alert-success"><i class="fas fa-check-circle me-2"></i><strong>Καμία αλλαγή!</strong><br>Δεν βρέθηκαν αντικαταστάσεις λόγω κωλύματος στις ειδικές αργίες.</div>';
-                } else {
-                    message = `<div class="alert alert-info"><i class="fas fa-info-circle me-2"></i><strong>Βρέθηκαν ${changes.length} αντικαταστάσεις στις ειδικές αργίες:</strong></div>`;
-                    message += '<div class="table-responsive"><table class="table table-sm table-bordered">';
-                    message += '<thead><tr><th>Ημερομηνία</th><th>Υπηρεσία</th><th>Παραλείφθηκε</th><th>Αντικαταστάθηκε από</th><th>Ημερομηνία Αλλαγής</th><th>Λόγος</th></tr></thead><tbody>';
-                    for (const c of changes) {
-                        const service = getGroupName(c.groupNum);
-                        message += `<tr>
-                            <td>${c.dayName} ${c.dateStr}</td>
-                            <td>${service}</td>
-                            <td><strong>${c.baseline}</strong></td>
-                            <td><strong>${c.computed}</strong></td>
-                            <td>-</td>
-                            <td>${c.reason}</td>
-                        </tr>`;
-                    }
-                    message += '</tbody></table></div>';
-                }
-
-                const modalHtml = `
-                    <div class="modal fade" id="specialHolidayResultsModal" tabindex="-1">
-                    <div class="modal-dialog modal-xl modal-superwide">
-                            <div class="modal-content results-modal-special">
-                                <div class="modal-header results-header results-header-special">
-                                    <h5 class="modal-title"><i class="fas fa-star me-2"></i>Αποτελέσματα Αλλαγών Ειδικών Αργιών</h5>
-                                    <button type="button" class="btn-close" data-bs-dismiss="modal" aria-label="Close"></button>
-                                </div>
-                                <div class="modal-body">
-                                    ${message}
-                                </div>
-                                <div class="modal-footer">
-                                    <button type="button" class="btn btn-secondary" id="specialHolidayCancelButton" data-bs-dismiss="modal">Ακύρωση</button>
-                                    <button type="button" class="btn btn-primary" id="specialHolidayOkButton">OK</button>
-                                </div>
-                            </div>
-                        </div>
-                    </div>
-                `;
-
-                const existingModal = document.getElementById('specialHolidayResultsModal');
-                if (existingModal) existingModal.remove();
-                document.body.insertAdjacentHTML('beforeend', modalHtml);
-
-                const modal = new bootstrap.Modal(document.getElementById('specialHolidayResultsModal'));
-                modal.show();
-
-                const okButton = document.getElementById('specialHolidayOkButton');
-                const cancelButton = document.getElementById('specialHolidayCancelButton');
-                if (okButton) {
-                    okButton.addEventListener('click', async function() {
-                        const originalOkHtml = okButton.innerHTML;
-                        okButton.disabled = true;
-                        okButton.classList.add('is-saving');
-                        if (cancelButton) cancelButton.disabled = true;
-                        okButton.innerHTML = `<span class="spinner-border spinner-border-sm me-2" role="status" aria-hidden="true"></span>Αποθήκευση...`;
-                        setStepFooterBusy(true);
-                        try {
-                            await saveStep1_SpecialHolidays();
-                            calculationSteps.currentStep = 2;
-                            renderCurrentStep();
-                            const m = bootstrap.Modal.getInstance(document.getElementById('specialHolidayResultsModal'));
-                            if (m) m.hide();
-                        } finally {
-                            requestAnimationFrame(() => setStepFooterBusy(false));
-                            okButton.innerHTML = originalOkHtml;
-                            okButton.classList.remove('is-saving');
-                            okButton.disabled = false;
-                            if (cancelButton) cancelButton.disabled = false;
-                        }
-                    });
-                }
-            } catch (error) {
-                console.error('Error showing special holiday results:', error);
-                alert('Σφάλμα κατά την εμφάνιση αποτελεσμάτων ειδικών αργιών: ' + error.message);
-            }
-        }
         async function goToNextStep() {
             // If moving from Step 1 (Special Holidays), save assignments to Firestore
             if (calculationSteps.currentStep === 1) {
@@ -5680,283 +4892,8 @@
                 console.error('Error running weekend skip logic:', error);
             }
         }
-        function showWeekendSkipResults(skippedPeople, updatedAssignments) {
-            const findSwapOtherDateKey = (swapPairIdRaw, groupNum, currentDateKey) => {
-                if (swapPairIdRaw === null || swapPairIdRaw === undefined) return null;
-                const swapPairId = typeof swapPairIdRaw === 'number' ? swapPairIdRaw : parseInt(swapPairIdRaw);
-                if (isNaN(swapPairId)) return null;
-                for (const dk in assignmentReasons) {
-                    if (dk === currentDateKey) continue;
-                    const gmap = assignmentReasons?.[dk]?.[groupNum];
-                    if (!gmap) continue;
-                    for (const pn in gmap) {
-                        const r = gmap[pn];
-                        const rid = r?.swapPairId;
-                        const nid = typeof rid === 'number' ? rid : parseInt(rid);
-                        if (!isNaN(nid) && nid === swapPairId) return dk;
-                    }
-                }
-                return null;
-            };
 
-            let message = '';
-            
-            const baselineByDate = calculationSteps.tempWeekendBaselineAssignments || {};
-            const computedByDate = updatedAssignments || {};
 
-            const rows = [];
-            const dateKeys = Object.keys(computedByDate).sort();
-            for (const dateKey of dateKeys) {
-                const dateObj = new Date(dateKey + 'T00:00:00');
-                if (isNaN(dateObj.getTime())) continue;
-                const dateStr = dateObj.toLocaleDateString('el-GR', { day: '2-digit', month: '2-digit', year: 'numeric' });
-                const dayName = getGreekDayName(dateObj);
-                for (let groupNum = 1; groupNum <= 4; groupNum++) {
-                    const base = baselineByDate?.[dateKey]?.[groupNum] || null;
-                    const comp = computedByDate?.[dateKey]?.[groupNum] || null;
-                    if (!base || !comp) continue;
-                    if (base === comp) continue;
-
-                    const reasonObj = assignmentReasons?.[dateKey]?.[groupNum]?.[comp] || null;
-                    const reasonText = reasonObj?.reason
-                        ? String(reasonObj.type === 'swap' ? normalizeSwapReasonText(reasonObj.reason) : reasonObj.reason)
-                        : '';
-                    const derivedUnavailable = (isPersonDisabledForDuty(base, groupNum, 'weekend') || isPersonMissingOnDate(base, groupNum, dateObj, 'weekend'))
-                        ? (reasonText || buildUnavailableReplacementReason({
-                            skippedPersonName: base,
-                            replacementPersonName: comp,
-                            dateObj,
-                            groupNum,
-                            dutyCategory: 'weekend'
-                        }))
-                        : '';
-                    // Ενιαίο μήνυμα όταν ο παραλειφθείς έχει ήδη ειδική αργία τον ίδιο μήνα (Σαββατοκύριακο).
-                    let briefReason = '';
-                    if (derivedUnavailable) {
-                        briefReason = derivedUnavailable;
-                    } else if (hasSpecialHolidayDutyInMonthCalcOrSaved(base, groupNum, dateObj.getMonth(), dateObj.getFullYear())) {
-                        briefReason =
-                            typeof buildSpecialHolidaySameMonthUnifiedMessage === 'function'
-                                ? buildSpecialHolidaySameMonthUnifiedMessage(
-                                      comp,
-                                      dateKey,
-                                      base,
-                                      groupNum,
-                                      dateObj.getFullYear(),
-                                      dateObj.getMonth()
-                                  ) || (reasonText ? reasonText.split('.').filter(Boolean)[0] : '')
-                                : (reasonText ? reasonText.split('.').filter(Boolean)[0] : '');
-                    } else if (reasonText) {
-                        briefReason = reasonText.split('.').filter(Boolean)[0] || '';
-                    } else {
-                        briefReason = 'Αλλαγή';
-                    }
-
-                    // Weekend skip has no swap-date; keep '-' (but support future swapPairId logic if it appears)
-                    const swapOtherKey = reasonObj?.type === 'swap'
-                        ? findSwapOtherDateKey(reasonObj.swapPairId, groupNum, dateKey)
-                        : null;
-                    const swapDateStr = swapOtherKey
-                        ? new Date(swapOtherKey + 'T00:00:00').toLocaleDateString('el-GR', { day: '2-digit', month: '2-digit', year: 'numeric' })
-                        : '-';
-
-                    rows.push({
-                        dateKey,
-                        dayName,
-                        dateStr,
-                        groupNum,
-                        service: getGroupName(groupNum),
-                        skipped: base,
-                        replacement: comp,
-                        swapDateStr,
-                        briefReason
-                    });
-                }
-            }
-
-            if (rows.length === 0) {
-                message = '<div class="alert alert-success"><i class="fas fa-check-circle me-2"></i><strong>Καμία αλλαγή!</strong><br>Δεν βρέθηκαν αλλαγές στις αργίες.</div>';
-            } else {
-                message = '<div class="alert alert-info"><i class="fas fa-info-circle me-2"></i><strong>Αλλαγές: ' + rows.length + ' εγγραφές</strong></div>';
-                message += '<div class="table-responsive"><table class="table table-sm table-bordered">';
-                message += '<thead><tr><th>Ημερομηνία</th><th>Υπηρεσία</th><th>Παραλείφθηκε</th><th>Αντικαταστάθηκε από</th><th>Ημερομηνία Αλλαγής</th><th>Λόγος</th></tr></thead><tbody>';
-                
-                rows.forEach(r => {
-                    message += `<tr>
-                        <td>${r.dayName} ${r.dateStr}</td>
-                        <td>${r.service}</td>
-                        <td><strong>${r.skipped}</strong></td>
-                        <td><strong>${r.replacement}</strong></td>
-                        <td>${r.swapDateStr}</td>
-                        <td>${r.briefReason}</td>
-                    </tr>`;
-                });
-                
-                message += '</tbody></table></div>';
-            }
-            
-            // Create and show modal
-            const modalHtml = `
-                <div class="modal fade" id="weekendSkipResultsModal" tabindex="-1">
-                    <div class="modal-dialog modal-xl modal-superwide">
-                        <div class="modal-content results-modal-weekend">
-                            <div class="modal-header results-header results-header-weekend">
-                                <h5 class="modal-title"><i class="fas fa-exchange-alt me-2"></i>Αποτελέσματα Αλλαγών Παραλείψεων Σαββατοκύριακων</h5>
-                                <button type="button" class="btn-close" data-bs-dismiss="modal" aria-label="Close"></button>
-                            </div>
-                            <div class="modal-body">
-                                ${message}
-                            </div>
-                            <div class="modal-footer">
-                                <button type="button" class="btn btn-primary" id="weekendSkipOkButton">OK</button>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            `;
-            
-            // Remove existing modal if any
-            const existingModal = document.getElementById('weekendSkipResultsModal');
-            if (existingModal) {
-                existingModal.remove();
-            }
-            
-            // Add modal to body
-            document.body.insertAdjacentHTML('beforeend', modalHtml);
-            
-            // Show modal
-            const modal = new bootstrap.Modal(document.getElementById('weekendSkipResultsModal'));
-            modal.show();
-            
-            // When OK is pressed, save final assignments and proceed to Step 3
-            const okButton = document.getElementById('weekendSkipOkButton');
-            if (okButton) {
-                okButton.addEventListener('click', async function() {
-                    const originalOkHtml = okButton.innerHTML;
-                    okButton.disabled = true;
-                    okButton.classList.add('is-saving');
-                    okButton.innerHTML = `<span class="spinner-border spinner-border-sm me-2" role="status" aria-hidden="true"></span>Αποθήκευση...`;
-                    setStepFooterBusy(true);
-                    try {
-                        await saveFinalWeekendAssignments(updatedAssignments);
-                        // Proceed to Step 3
-                        calculationSteps.currentStep = 3;
-                        renderCurrentStep();
-                        const m = bootstrap.Modal.getInstance(document.getElementById('weekendSkipResultsModal'));
-                        if (m) m.hide();
-                    } finally {
-                        requestAnimationFrame(() => setStepFooterBusy(false));
-                        okButton.innerHTML = originalOkHtml;
-                        okButton.classList.remove('is-saving');
-                        okButton.disabled = false;
-                    }
-                });
-            }
-        }
-        async function saveFinalWeekendAssignments(updatedAssignments) {
-            try {
-                if (!window.db) {
-                    console.log('Firebase not ready, skipping final weekend assignments save');
-                    return;
-                }
-                
-                const db = window.db || firebase.firestore();
-                const user = window.auth?.currentUser;
-                
-                if (!user) {
-                    console.log('User not authenticated, skipping final weekend assignments save');
-                    return;
-                }
-                
-                if (Object.keys(updatedAssignments).length > 0) {
-                    const formattedAssignments = {};
-                    for (const dateKey in updatedAssignments) {
-                        const groups = updatedAssignments[dateKey];
-                        const parts = [];
-                        for (let groupNum = 1; groupNum <= 4; groupNum++) {
-                            if (groups[groupNum]) {
-                                parts.push(`${groups[groupNum]} (Ομάδα ${groupNum})`);
-                            }
-                        }
-                        if (parts.length > 0) {
-                            formattedAssignments[dateKey] = parts.join(', ');
-                        }
-                    }
-                    
-                    let mergedWeekendFinal = formattedAssignments;
-                    if (typeof mergeFormattedAssignmentsWithExistingStore === 'function' && typeof getCalculationRecalcGroupSet === 'function') {
-                        const recalcSet = getCalculationRecalcGroupSet();
-                        if (recalcSet) {
-                            mergedWeekendFinal = mergeFormattedAssignmentsWithExistingStore(
-                                formattedAssignments,
-                                weekendAssignments,
-                                recalcSet
-                            );
-                        }
-                    }
-                    const organizedWeekend = organizeAssignmentsByMonth(mergedWeekendFinal);
-                    const sanitizedWeekend = sanitizeForFirestore(organizedWeekend);
-                    
-                    await mergeAndSaveMonthOrganizedAssignmentsDoc(db, user, 'weekendAssignments', organizedWeekend);
-                    console.log('Saved Step 2 final weekend assignments (after skip logic) to weekendAssignments document');
-                    
-                    Object.assign(weekendAssignments, mergedWeekendFinal);
-                    
-                    // IMPORTANT: Update rotation positions based on FINAL assignments (after skip logic)
-                    // Uses baseline (swappedWith) after manual alternate so next month continues A,B,C not replacement
-                    // Group assignments by month and find the last assigned person for each month/group
-                    const finalWeekendRotationPositionsByMonth = {}; // monthKey -> { groupNum -> assignedPerson }
-                    const sortedDateKeys = Object.keys(updatedAssignments).sort();
-                    for (const dateKey of sortedDateKeys) {
-                        const d = new Date(dateKey + 'T00:00:00');
-                        if (isNaN(d.getTime())) continue;
-                        const monthKey = getMonthKeyFromDate(d);
-                        const groups = updatedAssignments[dateKey];
-                        if (!groups) continue;
-                        
-                        for (let groupNum = 1; groupNum <= 4; groupNum++) {
-                            const assignedPerson = groups[groupNum];
-                            if (assignedPerson) {
-                                if (!finalWeekendRotationPositionsByMonth[monthKey]) {
-                                    finalWeekendRotationPositionsByMonth[monthKey] = {};
-                                }
-                                const personForRotation = typeof getPersonForRotationContinuity === 'function'
-                                    ? getPersonForRotationContinuity(dateKey, groupNum, assignedPerson, updatedAssignments)
-                                    : assignedPerson;
-                                finalWeekendRotationPositionsByMonth[monthKey][groupNum] = personForRotation;
-                            }
-                        }
-                    }
-                    
-                    // Update lastRotationPositions with final assigned persons (after skip logic)
-                    if (Object.keys(finalWeekendRotationPositionsByMonth).length > 0) {
-                        for (const monthKey in finalWeekendRotationPositionsByMonth) {
-                            const groupsForMonth = finalWeekendRotationPositionsByMonth[monthKey] || {};
-                            for (let groupNum = 1; groupNum <= 4; groupNum++) {
-                                if (groupsForMonth[groupNum] !== undefined) {
-                                    setLastRotationPersonForMonth('weekend', monthKey, groupNum, groupsForMonth[groupNum]);
-                                }
-                            }
-                        }
-                        
-                        // Save updated rotation positions to Firestore
-                        try {
-                            const sanitizedPositions = sanitizeForFirestore(lastRotationPositions);
-                            await db.collection('dutyShifts').doc('lastRotationPositions').set({
-                                ...sanitizedPositions,
-                                lastUpdated: firebase.firestore.FieldValue.serverTimestamp(),
-                                updatedBy: user.uid
-                            });
-                            console.log('Updated last rotation positions for weekends (after skip logic) to Firestore:', finalWeekendRotationPositionsByMonth);
-                        } catch (error) {
-                            console.error('Error saving updated last rotation positions after weekend skip logic:', error);
-                        }
-                    }
-                }
-            } catch (error) {
-                console.error('Error saving final weekend assignments:', error);
-            }
-        }
         async function saveStep3_SemiNormal() {
             // Semi-normal baseline + swap already run when Step 3 was rendered (after OK on weekend).
             // Show results modal (like normal days); OK on modal advances to Step 4.
@@ -6614,127 +5551,7 @@
                 });
             }
         }
-        async function saveFinalSemiNormalAssignments(updatedAssignments) {
-            try {
-                if (!window.db) {
-                    console.log('Firebase not ready, skipping final semi-normal assignments save');
-                    return;
-                }
-                
-                const db = window.db || firebase.firestore();
-                const user = window.auth?.currentUser;
-                
-                if (!user) {
-                    console.log('User not authenticated, skipping final semi-normal assignments save');
-                    return;
-                }
-                
-                if (Object.keys(updatedAssignments).length > 0) {
-                    const formattedAssignments = {};
-                    for (const dateKey in updatedAssignments) {
-                        const groups = updatedAssignments[dateKey];
-                        const parts = [];
-                        for (let groupNum = 1; groupNum <= 4; groupNum++) {
-                            if (groups[groupNum]) {
-                                parts.push(`${groups[groupNum]} (Ομάδα ${groupNum})`);
-                            }
-                        }
-                        if (parts.length > 0) {
-                            formattedAssignments[dateKey] = parts.join(', ');
-                        }
-                    }
-                    
-                    let mergedSemiFinal = formattedAssignments;
-                    if (typeof mergeFormattedAssignmentsWithExistingStore === 'function' && typeof getCalculationRecalcGroupSet === 'function') {
-                        const recalcSet = getCalculationRecalcGroupSet();
-                        if (recalcSet) {
-                            mergedSemiFinal = mergeFormattedAssignmentsWithExistingStore(
-                                formattedAssignments,
-                                semiNormalAssignments,
-                                recalcSet
-                            );
-                        }
-                    }
-                    const organizedSemi = organizeAssignmentsByMonth(mergedSemiFinal);
-                    const sanitizedSemi = sanitizeForFirestore(organizedSemi);
-                    
-                    await mergeAndSaveMonthOrganizedAssignmentsDoc(db, user, 'semiNormalAssignments', organizedSemi);
-                    console.log('Saved Step 3 final semi-normal assignments (after swap logic) to semiNormalAssignments document');
-                    
-                    // Update local memory
-                    Object.assign(semiNormalAssignments, formattedAssignments);
-                    
-                    // Save assignment reasons to Firestore
-                    try {
-                        if (Object.keys(assignmentReasons).length > 0) {
-                            const payload = typeof buildAssignmentReasonsSavePayload === 'function'
-                                ? buildAssignmentReasonsSavePayload()
-                                : assignmentReasons;
-                            const sanitizedReasons = sanitizeForFirestore(payload);
-                            await db.collection('dutyShifts').doc('assignmentReasons').set({
-                                ...sanitizedReasons,
-                                lastUpdated: firebase.firestore.FieldValue.serverTimestamp(),
-                                updatedBy: user.uid
-                            });
-                            console.log('Saved assignmentReasons to Firestore after semi-normal swaps');
-                        }
-                    } catch (error) {
-                        console.error('Error saving assignmentReasons after semi-normal swaps:', error);
-                    }
-                    
-                    // IMPORTANT: Update rotation positions based on FINAL assignments (after swaps)
-                    // This ensures that when Person A is replaced by Person B, next calculation starts from Person B's position
-                    // Group assignments by month and find the last assigned person for each month/group (chronologically)
-                    const finalSemiRotationPositionsByMonth = {}; // monthKey -> { groupNum -> assignedPerson }
-                    const sortedDateKeys = Object.keys(updatedAssignments).sort();
-                    for (const dateKey of sortedDateKeys) {
-                        const d = new Date(dateKey + 'T00:00:00');
-                        if (isNaN(d.getTime())) continue;
-                        const monthKey = getMonthKeyFromDate(d);
-                        const groups = updatedAssignments[dateKey];
-                        if (!groups) continue;
-                        
-                        for (let groupNum = 1; groupNum <= 4; groupNum++) {
-                            const assignedPerson = groups[groupNum];
-                            if (assignedPerson) {
-                                if (!finalSemiRotationPositionsByMonth[monthKey]) {
-                                    finalSemiRotationPositionsByMonth[monthKey] = {};
-                                }
-                                // Store the last assigned person for this month/group (will be overwritten by later dates)
-                                finalSemiRotationPositionsByMonth[monthKey][groupNum] = assignedPerson;
-                            }
-                        }
-                    }
-                    
-                    // Update lastRotationPositions with final assigned persons (after swaps)
-                    if (Object.keys(finalSemiRotationPositionsByMonth).length > 0) {
-                        for (const monthKey in finalSemiRotationPositionsByMonth) {
-                            const groupsForMonth = finalSemiRotationPositionsByMonth[monthKey] || {};
-                            for (let groupNum = 1; groupNum <= 4; groupNum++) {
-                                if (groupsForMonth[groupNum] !== undefined) {
-                                    setLastRotationPersonForMonth('semi', monthKey, groupNum, groupsForMonth[groupNum]);
-                                }
-                            }
-                        }
-                        
-                        // Save updated rotation positions to Firestore
-                        try {
-                            const sanitizedPositions = sanitizeForFirestore(lastRotationPositions);
-                            await db.collection('dutyShifts').doc('lastRotationPositions').set({
-                                ...sanitizedPositions,
-                                lastUpdated: firebase.firestore.FieldValue.serverTimestamp(),
-                                updatedBy: user.uid
-                            });
-                            console.log('Updated last rotation positions for semi-normal (after swaps) to Firestore:', finalSemiRotationPositionsByMonth);
-                        } catch (error) {
-                            console.error('Error saving updated last rotation positions after semi-normal swaps:', error);
-                        }
-                    }
-                }
-            } catch (error) {
-                console.error('Error saving final semi-normal assignments:', error);
-            }
-        }
+
         async function saveStep4_Normal() {
             console.log('[STEP 4] saveStep4_Normal() called');
             let saveError = null;
@@ -15075,234 +13892,11 @@
                 console.error('[PREVIEW DEBUG] Error saving temp assignments to Firestore:', error);
             });
         }
-        async function saveTempAssignmentsToFirestore(tempAssignments) {
-            try {
-                if (!window.db) {
-                    console.log('Firebase not ready, skipping temp save');
-                    return;
-                }
-                
-                const db = window.db || firebase.firestore();
-                const user = window.auth?.currentUser;
-                
-                if (!user) {
-                    console.log('User not authenticated, skipping temp save');
-                    return;
-                }
-                
-                const sanitized = sanitizeForFirestore(tempAssignments);
-                await db.collection('dutyShifts').doc('tempAssignments').set({
-                    ...sanitized,
-                    lastUpdated: firebase.firestore.FieldValue.serverTimestamp(),
-                    updatedBy: user.uid
-                });
-                console.log('[TEMP SAVE DEBUG] Temp assignments saved to Firestore successfully');
-                console.log('[TEMP SAVE DEBUG] Saved data structure:', {
-                    normal: Object.keys(tempAssignments.normal || {}).length + ' dates',
-                    semi: Object.keys(tempAssignments.semi || {}).length + ' dates',
-                    weekend: Object.keys(tempAssignments.weekend || {}).length + ' dates',
-                    special: Object.keys(tempAssignments.special || {}).length + ' months'
-                });
-            } catch (error) {
-                console.error('Error saving temp assignments:', error);
-            }
-        }
-        function canPersonTakeDay(dayKey, person, groupNum, dayTypeCategory) {
-            const dayDate = new Date(dayKey + 'T00:00:00');
-            
-            // Skip if person is missing on this date
-            if (isPersonMissingOnDate(person, groupNum, dayDate, dayTypeCategory)) return false;
-            
-            const priorityLevel = dayTypeCategory === 'special' ? 1 : 
-                                (dayTypeCategory === 'weekend' ? 2 : 
-                                (dayTypeCategory === 'semi' ? 3 : 4));
-            
-            const hasConsecutive = hasConsecutiveDuty(dayKey, person, groupNum);
-            const hadSpecialBefore = hadSpecialHolidayDutyBefore(dayKey, person, groupNum);
-            const hasConsecutiveWeekend = hasConsecutiveWeekendHolidayDuty(dayKey, person, groupNum);
-            const hasConsecutiveSpecial = hasConsecutiveSpecialHolidayDuty(dayKey, person, groupNum);
-            
-            const strictConflict = (priorityLevel <= 2) && (hasConsecutiveSpecial || hasConsecutiveWeekend);
-            const generalConflict = hasConsecutive || hadSpecialBefore;
-            
-            return !strictConflict && !generalConflict;
-        }
-        function findLastDutyKeyForPerson(person, groupNum, dayTypeCategory, dayTypeLists, startDate, currentDayKey) {
-            const days = dayTypeLists[dayTypeCategory];
-            const sortedDays = [...days].sort();
-            const currentDayIndex = sortedDays.indexOf(currentDayKey);
-            
-            // Look backwards from current day to find last assignment
-            for (let i = currentDayIndex - 1; i >= 0; i--) {
-                const dayKey = sortedDays[i];
-                const assignment = (typeof getAssignmentForDate === 'function' ? getAssignmentForDate(dayKey) : null) ?? (dutyAssignments?.[dayKey] || '');
-                if (assignment) {
-                    if (typeof assignment === 'object' && !Array.isArray(assignment)) {
-                        const direct = assignment[groupNum] ?? assignment[String(groupNum)];
-                        if (direct && String(direct).trim() === person) return dayKey;
-                    } else {
-                        const parts = String(assignment).split(',').map(p => p.trim());
-                        for (const part of parts) {
-                            const match = part.match(/^(.+?)\s*\(Ομάδα\s*(\d+)\)\s*$/);
-                            if (match && parseInt(match[2]) === groupNum && match[1].trim() === person) {
-                                return dayKey;
-                            }
-                        }
-                    }
-                }
-            }
-            
-            // Check last duties from person data
-            const groupData = (typeof groupsForDuty === 'function' ? groupsForDuty(groupNum) : groups[groupNum]) || {};
-            const personData = groupData.lastDuties && groupData.lastDuties[person];
-            if (personData) {
-                let lastDutyKey = null;
-                if (dayTypeCategory === 'special' && personData.special) {
-                    lastDutyKey = formatDateKey(new Date(personData.special));
-                } else if (dayTypeCategory === 'weekend' && personData.weekend) {
-                    lastDutyKey = formatDateKey(new Date(personData.weekend));
-                } else if (dayTypeCategory === 'semi' && personData.semi) {
-                    lastDutyKey = formatDateKey(new Date(personData.semi));
-                } else if (dayTypeCategory === 'normal' && personData.normal) {
-                    lastDutyKey = formatDateKey(new Date(personData.normal));
-                }
-                
-                if (lastDutyKey && sortedDays.includes(lastDutyKey)) {
-                    return lastDutyKey;
-                }
-            }
-            
-            return null;
-        }
-        function findPersonOriginalDayInRotation(person, dayTypeCategory, groupNum, dayTypeLists, startDate, currentDayKey) {
-            const groupData = (typeof groupsForDuty === 'function' ? groupsForDuty(groupNum) : groups[groupNum]) || { special: [], weekend: [], semi: [], normal: [] };
-            let groupPeople;
-            if (dayTypeCategory === 'special') {
-                groupPeople = groupData.special || [];
-            } else if (dayTypeCategory === 'weekend') {
-                groupPeople = groupData.weekend || [];
-            } else if (dayTypeCategory === 'semi') {
-                groupPeople = groupData.semi || [];
-            } else {
-                groupPeople = groupData.normal || [];
-            }
-            
-            const personIndex = groupPeople.indexOf(person);
-            if (personIndex === -1) return null;
-            
-            const days = dayTypeLists[dayTypeCategory];
-            const sortedDays = [...days].sort();
-            const currentDayIndex = sortedDays.indexOf(currentDayKey);
-            
-            // Calculate when this person should be assigned based on rotation
-            const rotationDays = groupPeople.length;
-            
-            // Find the last duty date for this person
-            const lastDutyKey = findLastDutyKeyForPerson(person, groupNum, dayTypeCategory, dayTypeLists, startDate, currentDayKey);
-            
-            // If person has never had duty, they should be assigned on their rotation position
-            if (!lastDutyKey) {
-                // Find first day where this person should be assigned
-                for (let i = 0; i < sortedDays.length; i++) {
-                    if (i % rotationDays === personIndex) {
-                        return sortedDays[i];
-                    }
-                }
-                return null;
-            }
-            
-            // Find the next day where this person should be assigned (N days after last duty)
-            const lastDutyIndex = sortedDays.indexOf(lastDutyKey);
-            if (lastDutyIndex === -1) return null;
-            
-            // Find the day that is N positions after last duty
-            const nextDutyIndex = lastDutyIndex + rotationDays;
-            if (nextDutyIndex < sortedDays.length) {
-                return sortedDays[nextDutyIndex];
-            }
-            
-            return null;
-        }
-        function findAndAssignNextAvailableDay(person, skipDay, dayTypeCategory, groupNum, dayTypeLists, sortedDays, startDate) {
-            const groupData = (typeof groupsForDuty === 'function' ? groupsForDuty(groupNum) : groups[groupNum]) || { special: [], weekend: [], semi: [], normal: [] };
-            
-            // Find next available day after skipDay
-            const skipIndex = sortedDays.indexOf(skipDay);
-            if (skipIndex === -1) return false; // Day not found
-            
-            for (let i = skipIndex + 1; i < sortedDays.length; i++) {
-                const dayKey = sortedDays[i];
-                const dayDate = new Date(dayKey + 'T00:00:00');
-                
-                // Skip if person is missing on this date
-                if (isPersonMissingOnDate(person, groupNum, dayDate, dayTypeCategory)) continue;
-                
-                // Skip critical assignments
-                const isCritical = criticalAssignments[dayKey] && 
-                                criticalAssignments[dayKey].some(a => a.includes(`(Ομάδα ${groupNum})`));
-                if (isCritical) continue;
-                
-                // Check if person can take this day (no conflicts)
-                if (canPersonTakeDay(dayKey, person, groupNum, dayTypeCategory)) {
-                    // Check if this day already has someone assigned for this group
-                    const currentAssignment = dutyAssignments[dayKey] || '';
-                    let currentPersonForGroup = null;
-                    
-                    if (currentAssignment) {
-                        const parts = currentAssignment.split(',').map(p => p.trim());
-                        for (const part of parts) {
-                            const match = part.match(/^(.+?)\s*\(Ομάδα\s*(\d+)\)\s*$/);
-                            if (match && parseInt(match[2]) === groupNum) {
-                                currentPersonForGroup = match[1].trim();
-                                break;
-                            }
-                        }
-                    }
-                    
-                    if (currentPersonForGroup && currentPersonForGroup !== person) {
-                        // Day already has someone - cascade: move that person forward
-                        removePersonFromDay(dayKey, currentPersonForGroup, groupNum);
-                        assignPersonToDay(dayKey, person, groupNum);
-                        
-                        // IMPORTANT: Re-check that this assignment doesn't create consecutive days
-                        // Check day after to ensure we don't create consecutive days
-                        const dayAfter = new Date(dayDate);
-                        dayAfter.setDate(dayAfter.getDate() + 1);
-                        const dayAfterKey = formatDateKey(dayAfter);
-                        
-                        // Check if person has duty the day after (would create consecutive days)
-                        if (hasDutyOnDay(dayAfterKey, person, groupNum)) {
-                            // This creates consecutive days - undo and try next day
-                            removePersonFromDay(dayKey, person, groupNum);
-                            assignPersonToDay(dayKey, currentPersonForGroup, groupNum); // Restore original
-                            continue; // Try next day
-                        }
-                        
-                        // Recursively find next day for the displaced person
-                        findAndAssignNextAvailableDay(currentPersonForGroup, dayKey, dayTypeCategory, groupNum, dayTypeLists, sortedDays, startDate);
-                    } else {
-                        // Day is free - assign person here
-                        assignPersonToDay(dayKey, person, groupNum);
-                        
-                        // IMPORTANT: Re-check that this assignment doesn't create consecutive days
-                        const dayAfter = new Date(dayDate);
-                        dayAfter.setDate(dayAfter.getDate() + 1);
-                        const dayAfterKey = formatDateKey(dayAfter);
-                        
-                        // Check if person has duty the day after (would create consecutive days)
-                        if (hasDutyOnDay(dayAfterKey, person, groupNum)) {
-                            // This creates consecutive days - undo and try next day
-                            removePersonFromDay(dayKey, person, groupNum);
-                            continue; // Try next day
-                        }
-                    }
-                    
-                    return true; // Found and assigned
-                }
-            }
-            
-            return false; // No available day found
-        }
+
+
+
+
+;
         // saveDayAssignments() is defined in duty-shifts-ui.js (uses setAssignmentForDate for correct persistence)
         function getMissingPeriodsForPersonNorm(groupNum, person) {
             const groupData = groups[groupNum] || {};
@@ -15562,224 +14156,16 @@
                 return null;
             }
         }
-        function openMissingPeriodModal(groupNum, person) {
-            currentMissingPeriodGroup = groupNum;
-            currentMissingPeriodPerson = person;
-            
-            document.getElementById('missingPeriodPersonName').textContent = person;
-            document.getElementById('missingPeriodStart').value = '';
-            document.getElementById('missingPeriodEnd').value = '';
 
-            renderMissingReasonsSelect();
-            
-            renderMissingPeriodsList();
-            
-            const modal = new bootstrap.Modal(document.getElementById('missingPeriodModal'));
-            modal.show();
-        }
-        function renderMissingPeriodsList() {
-            const container = document.getElementById('missingPeriodsList');
-            const groupData = groups[currentMissingPeriodGroup] || { special: [], weekend: [], semi: [], normal: [], lastDuties: {}, missingPeriods: {} };
-            const missingPeriods = groupData.missingPeriods?.[currentMissingPeriodPerson] || [];
-            
-            if (missingPeriods.length === 0) {
-                container.innerHTML = '<p class="text-muted text-center small">Δεν υπάρχουν καταχωρημένες περιόδοι απουσίας</p>';
-                return;
-            }
-            
-            container.innerHTML = missingPeriods.map((period, index) => {
-                const startDate = new Date(period.start + 'T00:00:00');
-                const endDate = new Date(period.end + 'T00:00:00');
-                const today = new Date();
-                today.setHours(0, 0, 0, 0);
-                const isActive = today >= startDate && today <= endDate;
-                const isPast = today > endDate;
-                const isFuture = today < startDate;
-                
-                let statusBadge = '';
-                if (isActive) statusBadge = '<span class="badge bg-warning ms-2">Ενεργή</span>';
-                else if (isPast) statusBadge = '<span class="badge bg-secondary ms-2">Παρελθούσα</span>';
-                else if (isFuture) statusBadge = '<span class="badge bg-info ms-2">Μελλοντική</span>';
-                const reason = (period.reason || '').trim();
-                const reasonHtml = reason ? `<div class="mt-1"><small class="text-muted"><i class="fas fa-tag me-1"></i>${escapeHtml(reason)}</small></div>` : '';
-                
-                return `
-                    <div class="card mb-2">
-                        <div class="card-body">
-                            <div class="d-flex justify-content-between align-items-center">
-                                <div>
-                                    <strong>${formatDate(startDate)}</strong> - <strong>${formatDate(endDate)}</strong>
-                                    ${statusBadge}
-                                    ${reasonHtml}
-                                </div>
-                                <button class="btn btn-sm btn-outline-danger" onclick="removeMissingPeriod(${index})">
-                                    <i class="fas fa-trash"></i>
-                                </button>
-                            </div>
-                        </div>
-                    </div>
-                `;
-            }).join('');
-        }
-        function addMissingPeriod() {
-            const start = document.getElementById('missingPeriodStart').value;
-            const end = document.getElementById('missingPeriodEnd').value;
-            const reason = (document.getElementById('missingPeriodReason')?.value || '').trim();
-            
-            if (!start || !end) {
-                alert('Παρακαλώ συμπληρώστε και τις δύο ημερομηνίες');
-                return;
-            }
-            
-            const startDate = new Date(start + 'T00:00:00');
-            const endDate = new Date(end + 'T00:00:00');
-            
-            if (endDate < startDate) {
-                alert('Η ημερομηνία λήξης πρέπει να είναι μετά την ημερομηνία έναρξης');
-                return;
-            }
-            
-            const groupData = groups[currentMissingPeriodGroup] || { special: [], weekend: [], semi: [], normal: [], lastDuties: {}, missingPeriods: {} };
-            if (!groupData.missingPeriods) groupData.missingPeriods = {};
-            if (!groupData.missingPeriods[currentMissingPeriodPerson]) {
-                groupData.missingPeriods[currentMissingPeriodPerson] = [];
-            }
-            
-            groupData.missingPeriods[currentMissingPeriodPerson].push({
-                start: start,
-                end: end,
-                reason: reason || null
-            });
-            
-            // Sort periods by start date
-            groupData.missingPeriods[currentMissingPeriodPerson].sort((a, b) => {
-                return new Date(a.start) - new Date(b.start);
-            });
-            
-            document.getElementById('missingPeriodStart').value = '';
-            document.getElementById('missingPeriodEnd').value = '';
-            
-            saveData();
-            renderMissingPeriodsList();
-            renderGroups();
-        }
-        function renderMissingReasonsSelect() {
-            const select = document.getElementById('missingPeriodReason');
-            if (!select) return;
-            const list = Array.isArray(missingReasons) ? missingReasons : [];
-            const currentValue = (select.value || '').trim();
-            const options = (list.length ? list : ['Άλλο']).map(r => String(r).trim()).filter(Boolean);
-            select.innerHTML = options.map(r => `<option value="${escapeHtml(r)}">${escapeHtml(r)}</option>`).join('');
-            if (currentValue && options.includes(currentValue)) {
-                select.value = currentValue;
-            }
-        }
-        function openMissingReasonsModal() {
-            renderMissingReasonsList();
-            const modal = new bootstrap.Modal(document.getElementById('missingReasonsModal'));
-            modal.show();
-        }
-        function renderMissingReasonsList() {
-            const container = document.getElementById('missingReasonsList');
-            if (!container) return;
-            const list = Array.isArray(missingReasons) ? missingReasons : [];
-            if (!list.length) {
-                container.innerHTML = '<div class="text-muted small text-center">Δεν υπάρχουν λόγοι.</div>';
-                return;
-            }
-            container.innerHTML = list.map((r, idx) => {
-                const txt = String(r || '').trim();
-                if (!txt) return '';
-                return `
-                    <div class="list-group-item d-flex justify-content-between align-items-center">
-                        <span>${escapeHtml(txt)}</span>
-                        <button class="btn btn-sm btn-outline-danger" onclick="removeMissingReason(${idx})"><i class="fas fa-trash"></i></button>
-                    </div>
-                `;
-            }).join('');
-        }
-        function addMissingReason() {
-            const input = document.getElementById('missingReasonNewText');
-            const raw = (input?.value || '').trim();
-            if (!raw) return;
-            const list = Array.isArray(missingReasons) ? missingReasons : [];
-            const exists = list.some(x => String(x).trim().toLowerCase() === raw.toLowerCase());
-            if (exists) {
-                input.value = '';
-                return;
-            }
-            list.push(raw);
-            missingReasons = list.filter(Boolean).map(x => String(x).trim()).filter(Boolean);
-            missingReasonsModified = true;
-            input.value = '';
-            renderMissingReasonsList();
-            renderMissingReasonsSelect();
-            saveData();
-        }
-        function removeMissingReason(index) {
-            const list = Array.isArray(missingReasons) ? [...missingReasons] : [];
-            if (index < 0 || index >= list.length) return;
-            list.splice(index, 1);
-            missingReasons = list.filter(Boolean).map(x => String(x).trim()).filter(Boolean);
-            missingReasonsModified = true;
-            renderMissingReasonsList();
-            renderMissingReasonsSelect();
-            saveData();
-        }
-        function removeMissingPeriod(index) {
-            const doRemove = function () {
-                const groupData = groups[currentMissingPeriodGroup] || { special: [], weekend: [], semi: [], normal: [], lastDuties: {}, missingPeriods: {} };
-                if (groupData.missingPeriods && groupData.missingPeriods[currentMissingPeriodPerson]) {
-                    groupData.missingPeriods[currentMissingPeriodPerson].splice(index, 1);
-                    if (groupData.missingPeriods[currentMissingPeriodPerson].length === 0) {
-                        delete groupData.missingPeriods[currentMissingPeriodPerson];
-                    }
-                }
-                saveData();
-                renderMissingPeriodsList();
-                renderGroups();
-            };
-            if (typeof showConfirmModal === 'function') {
-                showConfirmModal({
-                    title: 'Επιβεβαίωση',
-                    message: 'Είστε σίγουροι ότι θέλετε να αφαιρέσετε αυτή την περίοδο απουσίας;',
-                    onConfirm: doRemove
-                });
-            } else {
-                if (!confirm('Είστε σίγουροι ότι θέλετε να αφαιρέσετε αυτή την περίοδο απουσίας;')) return;
-                doRemove();
-            }
-        }
-        function toggleListCollapse(listId, chevronId) {
-            const listElement = document.getElementById(listId);
-            const chevronElement = document.getElementById(chevronId);
-            
-            if (listElement && chevronElement) {
-                // Check current state BEFORE toggling
-                const isCurrentlyShown = listElement.classList.contains('show');
-                
-                // Lazy populate list when opening (improves initial load performance a lot)
-                if (!isCurrentlyShown) {
-                    ensureGroupListPopulated(listId);
-                }
-                
-                // Toggle Bootstrap collapse
-                const bsCollapse = new bootstrap.Collapse(listElement, {
-                    toggle: true
-                });
-                
-                // Update chevron icon based on what the state WILL BE (opposite of current)
-                if (isCurrentlyShown) {
-                    // Currently shown, will be hidden - show down arrow
-                    chevronElement.classList.remove('fa-chevron-up');
-                    chevronElement.classList.add('fa-chevron-down');
-                } else {
-                    // Currently hidden, will be shown - show up arrow
-                    chevronElement.classList.remove('fa-chevron-down');
-                    chevronElement.classList.add('fa-chevron-up');
-                }
-            }
-        }
+
+
+
+
+
+
+
+
+
         function getConsecutiveDutyDates(dayKey, person, groupNum) {
             const consecutiveDates = [];
             const date = new Date(dayKey + 'T00:00:00');
@@ -15802,554 +14188,8 @@
             
             return consecutiveDates;
         }
-        function getSpecialHolidayBeforeDate(dayKey, person, groupNum) {
-            const date = new Date(dayKey + 'T00:00:00');
-            
-            // Get group data to find rotation days
-            const groupData = (typeof groupsForDuty === 'function' ? groupsForDuty(groupNum) : groups[groupNum]) || { special: [], weekend: [], semi: [], normal: [] };
-            const groupPeople = groupData.weekend || [];
-            if (groupPeople.length === 0) return null;
-            
-            // Find last weekend/holiday duty for this person
-            let lastWeekendDutyDate = null;
-            
-            // Check manually entered last duties first
-            const lastDuties = groupData.lastDuties?.[person];
-            if (lastDuties && lastDuties.weekend) {
-                lastWeekendDutyDate = new Date(lastDuties.weekend + 'T00:00:00');
-            }
-            
-            // Also check actual assignments (use the more recent one)
-            const checkDate = new Date(date);
-            for (let i = 1; i <= 365; i++) {
-                checkDate.setDate(checkDate.getDate() - 1);
-                const checkKey = formatDateKey(checkDate);
-                const checkDayType = getDayType(checkDate);
-                const isCheckWeekend = checkDate.getDay() === 0 || checkDate.getDay() === 6;
-                const isCheckHoliday = checkDayType === 'weekend-holiday' && !isSpecialHoliday(checkDate);
-                
-                if ((isCheckWeekend || isCheckHoliday) && hasDutyOnDay(checkKey, person, groupNum)) {
-                    const checkDateCopy = new Date(checkDate);
-                    if (!lastWeekendDutyDate || checkDateCopy > lastWeekendDutyDate) {
-                        lastWeekendDutyDate = checkDateCopy;
-                    }
-                    break;
-                }
-            }
-            
-            if (!lastWeekendDutyDate) return null;
-            
-            // Check if there's a special holiday between last weekend duty and current day
-            const checkSpecialDate = new Date(lastWeekendDutyDate);
-            checkSpecialDate.setDate(checkSpecialDate.getDate() + 1);
-            while (checkSpecialDate < date) {
-                if (isSpecialHoliday(checkSpecialDate) && hasDutyOnDay(formatDateKey(checkSpecialDate), person, groupNum)) {
-                    return formatDateKey(checkSpecialDate);
-                }
-                checkSpecialDate.setDate(checkSpecialDate.getDate() + 1);
-            }
-            
-            return null;
-        }
-        function getPersonMissingPeriod(person, groupNum, date) {
-            const groupData = (typeof groupsForDuty === 'function' ? groupsForDuty(groupNum) : groups[groupNum]) || {};
-            const personData = groupData.missingPeriods?.[person];
-            if (!personData || !Array.isArray(personData)) return null;
-            
-            for (const period of personData) {
-                const startDate = new Date(period.start + 'T00:00:00');
-                const endDate = new Date(period.end + 'T00:00:00');
-                if (date >= startDate && date <= endDate) {
-                    return {
-                        start: startDate,
-                        end: endDate,
-                        reason: (period.reason || '').trim() || null
-                    };
-                }
-            }
-            return null;
-        }
-        function getSpecialHolidayDutyDateInMonth(person, groupNum, year, month) {
-            try {
-                const monthStart = new Date(year, month, 1);
-                const monthEnd = new Date(year, month + 1, 0);
-                const personGroupStr = `${person} (Ομάδα ${groupNum})`;
-                const d = new Date(monthStart);
-                while (d <= monthEnd) {
-                    if (getDayType(d) === 'special-holiday') {
-                        const key = formatDateKey(d);
-                        const a = getAssignmentForDate(key);
-                        if (a && String(a).includes(personGroupStr)) {
-                            return key;
-                        }
-                    }
-                    d.setDate(d.getDate() + 1);
-                }
-            } catch (e) {
-                // ignore
-            }
-            return null;
-        }
-        function analyzeRotationViolations() {
-            const violations = [];
-            const seenSwapPairs = new Set(); // dayType|group|swapPairId -> dedupe swap rows
-            const seenViolations = new Set(); // dateKey|groupNum|assignedPerson -> dedupe all violations
-
-            const extractShortReasonFromSavedText = (reasonText) => {
-                const t = String(reasonText || '');
-                if (!t) return '';
-                if (t.includes('Απενεργοποιήθηκε') || t.includes('Απενεργοποιημένος')) return 'Απενεργοποιημένος';
-                // Match common missing reasons explicitly
-                if (t.includes('Κανονική Άδεια')) return 'Κανονική Άδεια';
-                if (t.includes('Αναρρωτική Άδεια')) return 'Αναρρωτική Άδεια';
-                if (t.includes('Φύλλο Πορείας')) return 'Φύλλο Πορείας';
-                if (t.toLowerCase().includes('ειδική αργία')) return 'Ειδική αργία στον ίδιο μήνα';
-                if (t.toLowerCase().includes('κώλυμα') || t.toLowerCase().includes('απουσία')) return 'Κώλυμα/Απουσία';
-                return 'Παράλειψη';
-            };
-            
-            // Get dates only for the current month being viewed
-            const year = currentDate.getFullYear();
-            const month = currentDate.getMonth();
-            const firstDay = new Date(year, month, 1);
-            const lastDay = new Date(year, month + 1, 0);
-            const daysInMonth = lastDay.getDate();
-            
-            // Build list of dates for current month
-            const allDates = [];
-            for (let day = 1; day <= daysInMonth; day++) {
-                const date = new Date(year, month, day);
-                allDates.push(formatDateKey(date));
-            }
 
-            // NEW APPROACH: Iterate directly through assignment reasons for the current month
-            // This ensures each assignment reason is processed exactly once, eliminating duplicates
-            const viewMonthPrefix = `${year}-${String(month + 1).padStart(2, '0')}`; // YYYY-MM
-            
-            // First, collect all assignment reasons for the current month
-            for (const dateKey in assignmentReasons) {
-                // Only process dates in the viewed month
-                if (!dateKey.startsWith(viewMonthPrefix + '-')) continue;
-                
-                const date = new Date(dateKey + 'T00:00:00');
-                if (isNaN(date.getTime())) continue;
-                
-                const dayType = getDayType(date);
-                
-                // Determine day type category
-                let dayTypeCategory = 'normal';
-                if (dayType === 'special-holiday') {
-                    dayTypeCategory = 'special';
-                } else if (dayType === 'weekend-holiday') {
-                    dayTypeCategory = 'weekend';
-                } else if (dayType === 'semi-normal-day') {
-                    dayTypeCategory = 'semi';
-                }
-                
-                const dateReasons = assignmentReasons[dateKey];
-                if (!dateReasons) continue;
-                
-                // For each group in this date
-                for (const groupNumStr in dateReasons) {
-                    const groupReasons = dateReasons[groupNumStr];
-                    if (!groupReasons) continue;
-                    const groupNum = parseInt(groupNumStr);
-                    if (!groupNum || groupNum < 1 || groupNum > 4) continue;
-                    
-                    // For each person with an assignment reason
-                    for (const personName in groupReasons) {
-                        const reason = groupReasons[personName];
-                        if (!reason || (reason.type !== 'skip' && reason.type !== 'swap')) continue;
-                        
-                        // Skip cross-month swaps here (they're handled separately)
-                        if (reason.meta?.isCrossMonth) continue;
-                        
-                        // Deduplicate: check if we've already added a violation for this date+group+assignedPerson
-                        const violationKey = `${dateKey}|${groupNum}|${personName}`;
-                        if (seenViolations.has(violationKey)) {
-                            continue; // Skip duplicate entry
-                        }
-                        seenViolations.add(violationKey);
-                        
-                        // Handle swap pair deduplication
-                        if (reason.type === 'swap' && reason.swapPairId !== null && reason.swapPairId !== undefined) {
-                            const k = `${dayTypeCategory}|${groupNum}|${reason.swapPairId}`;
-                            if (seenSwapPairs.has(k)) continue; // only show one row per swap pair
-                            seenSwapPairs.add(k);
-                        }
-                        
-                        // Get the assigned person and expected person from the assignment reason
-                        const assignedPerson = personName;
-                        const expectedPerson = reason.swappedWith || null;
-                        
-                        if (!expectedPerson) continue; // Need to know who was replaced
-                        
-                        // Get group data for validation
-                        const groupData = (typeof groupsForDuty === 'function' ? groupsForDuty(groupNum) : groups[groupNum]);
-                        if (!groupData) continue;
-                        
-                        // Get the appropriate list for this day type
-                        let groupPeople;
-                        if (dayTypeCategory === 'special') {
-                            groupPeople = groupData.special || [];
-                        } else if (dayTypeCategory === 'weekend') {
-                            groupPeople = groupData.weekend || [];
-                        } else if (dayTypeCategory === 'semi') {
-                            groupPeople = groupData.semi || [];
-                        } else {
-                            groupPeople = groupData.normal || [];
-                        }
-                        
-                        // Validate that both persons are in the list
-                        const assignedIndex = groupPeople.indexOf(assignedPerson);
-                        const expectedIndex = groupPeople.indexOf(expectedPerson);
-                        
-                        if (assignedIndex === -1 || expectedIndex === -1) continue;
-                        
-                        // Process the violation
-                        const swapOrSkipReasonText = reason.type === 'skip' && typeof resolveUnavailableReplacementDisplayText === 'function'
-                            ? resolveUnavailableReplacementDisplayText(reason, dateKey, groupNum, assignedPerson, dayTypeCategory)
-                            : reason.type === 'skip'
-                            ? normalizeSkipReasonText(reason.reason || '')
-                            : reason.type === 'swap' && typeof resolveNormalConsecutiveDutySwapDisplayText === 'function' && reason.meta?.normalConsecutiveDutySwap
-                              ? resolveNormalConsecutiveDutySwapDisplayText(reason)
-                              : reason.type === 'swap' && typeof resolveSemiHolidayConflictSwapDisplayText === 'function'
-                              ? resolveSemiHolidayConflictSwapDisplayText(reason)
-                              : reason.type === 'swap'
-                                ? normalizeSwapReasonText(reason.reason || '')
-                                : (reason.reason || '');
-                        
-                        // Get conflict details
-                        const isDisabled = isPersonDisabledForDuty(expectedPerson, groupNum, dayTypeCategory);
-                        const isMissingPeriod = !isDisabled && isPersonMissingOnDate(expectedPerson, groupNum, date, dayTypeCategory);
-                        
-                        let conflictDetails = [];
-                        let hasLegitimateConflict = true; // Assignment reasons are always legitimate
-                        
-                        // Extract short reason for conflicts column
-                        if (swapOrSkipReasonText) {
-                            conflictDetails.push(extractShortReasonFromSavedText(swapOrSkipReasonText));
-                        }
-                        
-                        if (isDisabled) {
-                            conflictDetails.push('Απενεργοποιημένος');
-                        }
-                        
-                        if (isMissingPeriod) {
-                            conflictDetails.push(getUnavailableReasonShort(expectedPerson, groupNum, date, dayTypeCategory));
-                        }
-                        
-                        // Determine skipped reason
-                        let skippedReason = '';
-                        if (isDisabled) {
-                            skippedReason = 'Απενεργοποιημένος';
-                        } else if (isMissingPeriod) {
-                            skippedReason = getUnavailableReasonShort(expectedPerson, groupNum, date, dayTypeCategory);
-                        } else if (reason.type === 'skip' && swapOrSkipReasonText) {
-                            skippedReason = extractShortReasonFromSavedText(swapOrSkipReasonText);
-                        } else if (reason.type === 'swap') {
-                            skippedReason = 'Αλλαγή (swap)';
-                        }
-                        
-                        const conflictSummary = conflictDetails.length > 0 ? conflictDetails.join(' | ') : '';
-                        
-                        violations.push({
-                            date: dateKey,
-                            dateFormatted: date.toLocaleDateString('el-GR', { day: '2-digit', month: '2-digit', year: 'numeric' }),
-                            dateObj: date, // Store date object for sorting and day of week
-                            dayTypeCategory: dayTypeCategory, // Store category for display
-                            group: groupNum,
-                            groupName: getGroupName(groupNum),
-                            assignedPerson: assignedPerson,
-                            expectedPerson: expectedPerson,
-                            conflicts: conflictSummary,
-                            swapReason: swapOrSkipReasonText,
-                            skippedReason: skippedReason,
-                            dayType: getDayTypeLabel(dayType),
-                            reasonType: reason.type // Store 'skip' or 'swap' to determine Αντικατάσταση vs Αλλαγή
-                        });
-                    }
-                }
-            }
-            
-            // Also show cross-month swaps that fall INSIDE the viewed month.
-            // Cross-month swaps are stored on the swap day key (often in the next month).
-            // We intentionally keep the popup scoped to the current month, so:
-            // - viewing Feb will NOT show March dates
-            // - viewing March WILL show the March swap date row
-            try {
-                const viewMonthPrefix = `${year}-${String(month + 1).padStart(2, '0')}`; // YYYY-MM
-                const seenCrossMonth = new Set(); // dateKey|group|person
 
-                for (const dateKey in assignmentReasons) {
-                    // Only show rows for dates in the viewed month
-                    if (!dateKey.startsWith(viewMonthPrefix + '-')) continue;
-                    const dateReasons = assignmentReasons[dateKey];
-                    if (!dateReasons) continue;
-
-                    for (const groupNumStr in dateReasons) {
-                        const groupReasons = dateReasons[groupNumStr];
-                        if (!groupReasons) continue;
-                        const groupNum = parseInt(groupNumStr);
-                        if (!groupNum) continue;
-
-                        for (const personName in groupReasons) {
-                            const r = groupReasons[personName];
-                            const meta = r?.meta;
-                            if (!meta?.isCrossMonth) continue;
-
-                            const originDayKey = meta.originDayKey;
-                            const swapDayKey = meta.swapDayKey || dateKey;
-                            const conflictDateKey = meta.conflictDateKey || originDayKey || dateKey;
-                            // (dateKey is already within view month due to the filter above)
-
-                            const uniqueKey = `${dateKey}|${groupNum}|${personName}`;
-                            if (seenCrossMonth.has(uniqueKey)) continue;
-                            seenCrossMonth.add(uniqueKey);
-                            
-                            // Use the same deduplication key format as main violation detection
-                            const violationKey = `${dateKey}|${groupNum}|${personName}`;
-                            if (seenViolations.has(violationKey)) continue; // already present via normal mismatch logic
-                            seenViolations.add(violationKey);
-
-                            const d = new Date(dateKey + 'T00:00:00');
-                            const originStr = originDayKey ? new Date(originDayKey + 'T00:00:00').toLocaleDateString('el-GR', { day: '2-digit', month: '2-digit', year: 'numeric' }) : '-';
-                            const conflictStr = conflictDateKey ? new Date(conflictDateKey + 'T00:00:00').toLocaleDateString('el-GR', { day: '2-digit', month: '2-digit', year: 'numeric' }) : '-';
-
-                            const dayTypeForCrossMonth = getDayType(d);
-                            let dayTypeCategoryForCrossMonth = 'normal';
-                            if (dayTypeForCrossMonth === 'special-holiday') {
-                                dayTypeCategoryForCrossMonth = 'special';
-                            } else if (dayTypeForCrossMonth === 'weekend-holiday') {
-                                dayTypeCategoryForCrossMonth = 'weekend';
-                            } else if (dayTypeForCrossMonth === 'semi-normal-day') {
-                                dayTypeCategoryForCrossMonth = 'semi';
-                            }
-                            
-                            violations.push({
-                                date: dateKey,
-                                dateFormatted: isNaN(d.getTime())
-                                    ? dateKey
-                                    : d.toLocaleDateString('el-GR', { day: '2-digit', month: '2-digit', year: 'numeric' }),
-                                dateObj: d,
-                                dayTypeCategory: dayTypeCategoryForCrossMonth,
-                                group: groupNum,
-                                groupName: getGroupName(groupNum),
-                                assignedPerson: personName,
-                                expectedPerson: r?.swappedWith || '(Swap)',
-                                conflicts: `Από προηγούμενο μήνα: ${originStr} | Σύγκρουση: ${conflictStr}`,
-                                swapReason: r?.reason || '',
-                                skippedReason: '',
-                                dayType: getDayTypeLabel(dayTypeForCrossMonth),
-                                reasonType: r?.type || 'swap' // Cross-month swaps are typically swaps
-                            });
-                        }
-                    }
-                }
-            } catch (e) {
-                console.warn('Error collecting cross-month swap entries for violations popup:', e);
-            }
-            
-            // Display violations in modal
-            displayRotationViolations(violations);
-        }
-        function displayRotationViolations(violations) {
-            const tableBody = document.getElementById('rotationViolationsTableBody');
-            const noViolationsMsg = document.getElementById('noViolationsMessage');
-            
-            if (!tableBody) return;
-            
-            tableBody.innerHTML = '';
-            
-            if (violations.length === 0) {
-                tableBody.parentElement.parentElement.style.display = 'none';
-                if (noViolationsMsg) noViolationsMsg.style.display = 'block';
-            } else {
-                tableBody.parentElement.parentElement.style.display = 'table';
-                if (noViolationsMsg) noViolationsMsg.style.display = 'none';
-                
-                // Sort violations by date in ascending order
-                violations.sort((a, b) => {
-                    const dateA = a.dateObj || new Date(a.date + 'T00:00:00');
-                    const dateB = b.dateObj || new Date(b.date + 'T00:00:00');
-                    return dateA.getTime() - dateB.getTime();
-                });
-                
-                violations.forEach(violation => {
-                    const row = document.createElement('tr');
-                    
-                    // Get date object
-                    const dateObj = violation.dateObj || new Date(violation.date + 'T00:00:00');
-                    
-                    // Get day of week
-                    const dayOfWeek = getGreekDayName(dateObj);
-                    
-                    // Get duty type label based on category
-                    let dutyTypeLabel = '';
-                    if (violation.dayTypeCategory === 'special') {
-                        dutyTypeLabel = 'Ειδική Αργία';
-                    } else if (violation.dayTypeCategory === 'weekend') {
-                        dutyTypeLabel = 'Σαββατοκύριακο/Αργία';
-                    } else if (violation.dayTypeCategory === 'semi') {
-                        dutyTypeLabel = 'Ημιαργία';
-                    } else {
-                        dutyTypeLabel = 'Καθημερινή';
-                    }
-                    
-                    // Format date with day of week and duty type below
-                    const dateHtml = `
-                        <div>${violation.dateFormatted}</div>
-                        <div style="font-size: 0.85em; color: #666; margin-top: 2px;">${dayOfWeek}</div>
-                        <div style="font-size: 0.8em; color: #888; margin-top: 1px;">${dutyTypeLabel}</div>
-                    `;
-                    
-                    // Remove duplicates from conflicts column (split by | and deduplicate)
-                    let conflictsDisplay = violation.conflicts || '-';
-                    if (conflictsDisplay !== '-') {
-                        const conflictParts = conflictsDisplay.split('|').map(c => c.trim()).filter(c => c);
-                        const uniqueConflicts = [...new Set(conflictParts)];
-                        conflictsDisplay = uniqueConflicts.join(' | ') || '-';
-                    }
-                    
-                    // Remove text in parentheses from reason
-                    let reasonText = violation.swapReason || '-';
-                    if (reasonText !== '-') {
-                        // Remove text in parentheses at the end (e.g., "text. (Reason)" -> "text.")
-                        reasonText = reasonText.replace(/\s*\([^)]*\)\s*$/, '');
-                    }
-                    
-                    // Determine assignment type: "Αντικατάσταση" for skip, "Αλλαγή" for swap
-                    const assignmentType = violation.reasonType === 'skip' ? 'Αντικατάσταση' : 'Αλλαγή';
-                    
-                    row.innerHTML = `
-                        <td>${dateHtml}</td>
-                        <td><span class="badge bg-primary">${violation.groupName}</span></td>
-                        <td><strong>${violation.assignedPerson}</strong></td>
-                        <td><strong class="text-danger">${violation.expectedPerson}</strong></td>
-                        <td><small>${escapeHtml(conflictsDisplay)}</small></td>
-                        <td><small>${escapeHtml(reasonText)}</small></td>
-                        <td><small>${escapeHtml(assignmentType)}</small></td>
-                    `;
-                    tableBody.appendChild(row);
-                });
-            }
-            
-            // Show modal
-            const modal = new bootstrap.Modal(document.getElementById('rotationViolationsModal'));
-            modal.show();
-        }
-        function printRotationAndRankings() {
-            const printWindow = window.open('', '_blank', 'width=800,height=600');
-            const allPeople = getAllPeople();
-            const sortedByRanking = [...allPeople].sort((a, b) => {
-                const rankA = rankings[a] || 9999;
-                const rankB = rankings[b] || 9999;
-                return rankA - rankB;
-            });
-            const listTypes = [
-                { key: 'special', name: 'Ειδικές Αργίες' },
-                { key: 'weekend', name: 'Σαββατοκύριακα/Αργίες' },
-                { key: 'semi', name: 'Ημιαργίες' },
-                { key: 'normal', name: 'Καθημερινές' }
-            ];
-            let html = `
-<!DOCTYPE html>
-<html lang="el">
-<head>
-    <meta charset="UTF-8">
-    <title>Σειρές Περιστροφής & Ιεραρχία</title>
-    <style>
-        body { font-family: Arial, sans-serif; padding: 20px; font-size: 12px; }
-        h1 { text-align: center; color: #333; margin-bottom: 10px; }
-        h2 { color: #555; border-bottom: 2px solid #007bff; padding-bottom: 5px; margin-top: 0; margin-bottom: 15px; }
-        h3 { color: #666; margin-top: 0; margin-bottom: 8px; font-size: 13px; }
-        table { width: 100%; border-collapse: collapse; margin-bottom: 20px; }
-        th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
-        th { background-color: #007bff; color: white; font-weight: bold; }
-        tr:nth-child(even) { background-color: #f2f2f2; }
-        .print-page { page-break-after: always; page-break-inside: avoid; }
-        .print-page:last-of-type { page-break-after: auto; }
-        .groups-grid { display: grid; grid-template-columns: 1fr 1fr; gap: 20px 30px; }
-        .group-section { page-break-inside: avoid; }
-        .group-section ol { margin: 5px 0; padding-left: 25px; }
-        .list-item { padding: 2px 0; }
-        .ranking-number { font-weight: bold; color: #007bff; margin-right: 10px; }
-        .empty-list { color: #999; font-style: italic; }
-        @page { margin: 1.5cm; }
-        @media print {
-            body { padding: 1.5cm; margin: 0; }
-            .print-page { page-break-after: always; padding-top: 1.5cm; }
-            .print-page:last-of-type { page-break-after: auto; }
-        }
-    </style>
-</head>
-<body>
-    <h1>Σειρές Περιστροφής & Ιεραρχία Υπηρεσιών</h1>
-    <p style="text-align: center; color: #666; margin-bottom: 25px;">Ημερομηνία εκτύπωσης: ${new Date().toLocaleDateString('el-GR', { day: '2-digit', month: '2-digit', year: 'numeric', hour: '2-digit', minute: '2-digit' })}</p>
-`;
-            listTypes.forEach(listType => {
-                html += `
-    <div class="print-page">
-        <h2>${listType.name}</h2>
-        <div class="groups-grid">
-`;
-                for (let groupNum = 1; groupNum <= 4; groupNum++) {
-                    const groupData = (typeof groupsForDuty === 'function' ? groupsForDuty(groupNum) : groups[groupNum]) || { special: [], weekend: [], semi: [], normal: [] };
-                    const groupName = getGroupName(groupNum);
-                    const list = groupData[listType.key] || [];
-                    html += `
-        <div class="group-section">
-            <h3>Ομάδα ${groupNum}: ${groupName}</h3>
-`;
-                    if (list.length > 0) {
-                        html += `            <ol>`;
-                        list.forEach((person) => { html += `<li class="list-item">${person}</li>`; });
-                        html += `</ol>`;
-                    } else {
-                        html += `            <span class="empty-list">(Κενή λίστα)</span>`;
-                    }
-                    html += `
-        </div>`;
-                }
-                html += `
-        </div>
-    </div>
-`;
-            });
-            html += `
-    <div class="print-page">
-        <h2>Ιεραρχία (Rankings)</h2>
-        <table>
-            <thead>
-                <tr>
-                    <th style="width: 80px;">Κατάταξη</th>
-                    <th>Όνομα</th>
-                    <th>Ομάδα</th>
-                </tr>
-            </thead>
-            <tbody>
-`;
-            sortedByRanking.forEach((person) => {
-                const rank = rankings[person] || null;
-                const personGroup = getPersonGroup(person);
-                const groupName = personGroup ? getGroupName(personGroup) : '-';
-                html += `            <tr>
-                <td><span class="ranking-number">${rank !== null ? rank : '-'}</span></td>
-                <td>${person}</td>
-                <td>${groupName}</td>
-            </tr>
-`;
-            });
-            html += `            </tbody>
-        </table>
-        <div style="margin-top: 25px; text-align: center; color: #666; font-size: 10px;">Αυτό το έγγραφο δημιουργήθηκε από το σύστημα Διαχείρισης Υπηρεσιών</div>
-    </div>
-</body>
-</html>
-`;
-            printWindow.document.write(html);
-            printWindow.document.close();
-            printWindow.onload = function() {
-                setTimeout(() => { printWindow.print(); }, 250);
-            };
-        }
\ No newline at end of file
+
+
+
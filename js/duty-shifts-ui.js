@@ -9,6 +9,8 @@
         let _controlTooltipsInitialized = false;
         let _controlTooltipsObserver = null;
         let _controlTooltipsTimer = null;
+        // Declared up here: initializeControlTooltips() wires the checkbox while this script loads
+        let _flexStatusEffectiveCheckboxWired = false;
 
         function getControlTooltipText(el) {
             if (!el) return '';
@@ -548,129 +550,10 @@
             const modal = new bootstrap.Modal(modalEl);
             modal.show();
         }
-        function formatGreekMonthYear(date) {
-            if (!date || isNaN(date.getTime())) return '';
-            const month = greekUpperNoTones(date.toLocaleDateString('el-GR', { month: 'long' }));
-            const year = date.getFullYear();
-            return `${month} ${year}`;
-        }
-        function buildPeriodLabel(startDate, endDate) {
-            if (!startDate || isNaN(startDate.getTime())) return '';
-            if (!endDate || isNaN(endDate.getTime())) return formatGreekMonthYear(startDate);
-
-            const startMY = formatGreekMonthYear(startDate);
-            const endMY = formatGreekMonthYear(endDate);
 
-            const sameYear = startDate.getFullYear() === endDate.getFullYear();
-            const sameMonth = sameYear && startDate.getMonth() === endDate.getMonth();
-            if (sameMonth) return startMY;
 
-            const startMonth = greekUpperNoTones(startDate.toLocaleDateString('el-GR', { month: 'long' }));
-            const endMonth = greekUpperNoTones(endDate.toLocaleDateString('el-GR', { month: 'long' }));
-
-            if (sameYear) {
-                return `${startMonth}-${endMonth} ${startDate.getFullYear()}`;
-            }
-            return `${startMY}-${endMY}`;
-        }
-        function isDateKeyInRange(dateKey, startDate, endDate) {
-            if (!dateKey || typeof dateKey !== 'string') return false;
-            if (!/^\d{4}-\d{2}-\d{2}$/.test(dateKey)) return false;
-            const d = new Date(dateKey + 'T00:00:00');
-            if (isNaN(d.getTime())) return false;
-            return d >= startDate && d <= endDate;
-        }
-        function buildPreviewCalculationSummaryHtml({ title, items }) {
-            const safeTitle = title || 'Σύνοψη Αλλαγών';
-            const swaps = items.filter(i => i.kind === 'swap');
-            const skips = items.filter(i => i.kind === 'skip');
-            const missing = items.filter(i => i.kind === 'missing');
-            const conflicts = items.filter(i => i.kind === 'conflict');
-
-            const buildTable = (rows) => {
-                if (!rows.length) {
-                    return '<div class="text-muted small">-</div>';
-                }
-                let html = '<div class="table-responsive"><table class="table table-sm table-bordered mb-0">';
-                html += '<thead class="table-light"><tr><th>Ημερομηνία</th><th>Υπηρεσία</th><th>Βασική Σειρά</th><th>Αντικατάσταση</th><th>Αιτία</th></tr></thead><tbody>';
-                for (const r of rows) {
-                    html += `<tr>
-                        <td>${r.dateStr}</td>
-                        <td>${r.groupName}</td>
-                        <td><strong>${r.baseline || '-'}</strong></td>
-                        <td><strong>${r.computed || '-'}</strong></td>
-                        <td>${r.reason || ''}</td>
-                    </tr>`;
-                }
-                html += '</tbody></table></div>';
-                return html;
-            };
 
-            return `
-                <div class="mt-4">
-                    <h6 class="mb-2"><i class="fas fa-list-check me-2"></i>${safeTitle}</h6>
-                    <div class="alert alert-light border mb-3">
-                        <div class="d-flex flex-wrap gap-2">
-                            <span class="badge bg-primary">Swaps: ${swaps.length}</span>
-                            <span class="badge bg-warning text-dark">Skips (ειδική αργία): ${skips.length}</span>
-                            <span class="badge bg-info text-dark">Missing αντικαταστάσεις: ${missing.length}</span>
-                            <span class="badge bg-danger">Υπόλοιπες συγκρούσεις: ${conflicts.length}</span>
-                        </div>
-                    </div>
 
-                    <div class="accordion" id="previewSummaryAccordion">
-                        <div class="accordion-item">
-                            <h2 class="accordion-header" id="prevSumHead1">
-                                <button class="accordion-button" type="button" data-bs-toggle="collapse" data-bs-target="#prevSumBody1">
-                                    Swaps
-                                </button>
-                            </h2>
-                            <div id="prevSumBody1" class="accordion-collapse collapse show" data-bs-parent="#previewSummaryAccordion">
-                                <div class="accordion-body">
-                                    ${buildTable(swaps)}
-                                </div>
-                            </div>
-                        </div>
-                        <div class="accordion-item">
-                            <h2 class="accordion-header" id="prevSumHead2">
-                                <button class="accordion-button collapsed" type="button" data-bs-toggle="collapse" data-bs-target="#prevSumBody2">
-                                    Skips (ειδική αργία)
-                                </button>
-                            </h2>
-                            <div id="prevSumBody2" class="accordion-collapse collapse" data-bs-parent="#previewSummaryAccordion">
-                                <div class="accordion-body">
-                                    ${buildTable(skips)}
-                                </div>
-                            </div>
-                        </div>
-                        <div class="accordion-item">
-                            <h2 class="accordion-header" id="prevSumHead3">
-                                <button class="accordion-button collapsed" type="button" data-bs-toggle="collapse" data-bs-target="#prevSumBody3">
-                                    Missing αντικαταστάσεις
-                                </button>
-                            </h2>
-                            <div id="prevSumBody3" class="accordion-collapse collapse" data-bs-parent="#previewSummaryAccordion">
-                                <div class="accordion-body">
-                                    ${buildTable(missing)}
-                                </div>
-                            </div>
-                        </div>
-                        <div class="accordion-item">
-                            <h2 class="accordion-header" id="prevSumHead4">
-                                <button class="accordion-button collapsed" type="button" data-bs-toggle="collapse" data-bs-target="#prevSumBody4">
-                                    Υπόλοιπες συγκρούσεις (μετά τις αλλαγές)
-                                </button>
-                            </h2>
-                            <div id="prevSumBody4" class="accordion-collapse collapse" data-bs-parent="#previewSummaryAccordion">
-                                <div class="accordion-body">
-                                    ${buildTable(conflicts)}
-                                </div>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            `;
-        }
         function getOpenLists() {
             const openLists = [];
             for (let i = 1; i <= 4; i++) {
@@ -3596,74 +3479,10 @@
             const dropdown = document.getElementById(`transferDropdown_${groupNumber}_${index}_${listType}`);
             dropdown.classList.toggle('show');
         }
-        function deepClonePlain(obj) {
-            if (!obj) return obj;
-            if (typeof structuredClone === 'function') {
-                try { return structuredClone(obj); } catch (_) {}
-            }
-            return JSON.parse(JSON.stringify(obj));
-        }
-        function ensureTransferUndoToastExists() {
-            if (document.getElementById('transferUndoToast')) return;
-            const html = `
-                <div class="toast-container position-fixed bottom-0 end-0 p-3" style="z-index: 11000;">
-                    <div id="transferUndoToast" class="toast align-items-center text-bg-dark border-0" role="alert" aria-live="assertive" aria-atomic="true">
-                        <div class="d-flex">
-                            <div class="toast-body" id="transferUndoToastBody">Έγινε μεταφορά.</div>
-                            <div class="d-flex align-items-center gap-2 me-2">
-                                <button type="button" class="btn btn-sm btn-warning" id="transferUndoToastButton">Αναίρεση</button>
-                                <button type="button" class="btn-close btn-close-white me-1 m-auto" data-bs-dismiss="toast" aria-label="Close"></button>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            `;
-            document.body.insertAdjacentHTML('beforeend', html);
-        }
-        function showTransferUndoToast() {
-            if (!lastTransferUndo) return;
-            ensureTransferUndoToastExists();
-            const toastEl = document.getElementById('transferUndoToast');
-            const bodyEl = document.getElementById('transferUndoToastBody');
-            const btnEl = document.getElementById('transferUndoToastButton');
-            if (!toastEl || !bodyEl || !btnEl) return;
-
-            const p = lastTransferUndo.person || '';
-            const fromName = getGroupName(lastTransferUndo.fromGroup);
-            const toName = getGroupName(lastTransferUndo.toGroup);
-            bodyEl.innerHTML = `<strong>Μεταφορά:</strong> ${p}<br><small class="text-white-50">${fromName} → ${toName}</small>`;
-
-            // Re-bind click handler each time (safe)
-            const newBtn = btnEl.cloneNode(true);
-            btnEl.parentNode.replaceChild(newBtn, btnEl);
-            newBtn.addEventListener('click', (e) => {
-                e.preventDefault();
-                undoLastGroupTransfer();
-                const toast = bootstrap.Toast.getInstance(toastEl) || new bootstrap.Toast(toastEl);
-                toast.hide();
-            });
 
-            // Keep visible until user clicks Undo or closes it.
-            const toast = bootstrap.Toast.getInstance(toastEl) || new bootstrap.Toast(toastEl, { autohide: false });
-            toast.show();
-        }
-        function undoLastGroupTransfer() {
-            if (!lastTransferUndo) {
-                alert('Δεν υπάρχει μεταφορά για αναίρεση.');
-                return;
-            }
-            const { fromGroup, toGroup, fromSnapshot, toSnapshot } = lastTransferUndo;
-            if (!fromSnapshot || !toSnapshot) {
-                alert('Δεν υπάρχουν αποθηκευμένα δεδομένα για αναίρεση.');
-                return;
-            }
-            groups[fromGroup] = deepClonePlain(fromSnapshot);
-            groups[toGroup] = deepClonePlain(toSnapshot);
-            saveData();
-            renderGroups();
-            updateStatistics();
-            lastTransferUndo = null;
-        }
+
+
+
         function transferPerson(fromGroup, index, toGroup, listType) {
             const list = groups[fromGroup][listType];
             const person = list[index];
@@ -4471,7 +4290,6 @@
             }
         }
 
-        let _flexStatusEffectiveCheckboxWired = false;
         function wireFlexibleStatusEffectiveCheckbox() {
             if (_flexStatusEffectiveCheckboxWired) return;
             const flexCb = document.getElementById('dutyShiftsFlexibleStatusEffectiveDates');
@@ -5613,228 +5431,6 @@
             });
         }
 
-        function _removed_getPersonFromNextMonth(dayKey, dayTypeCategory, groupNum, currentMonth, currentYear, rotationDays, groupPeople, currentRotationPosition = null) {
-            const date = new Date(dayKey + 'T00:00:00');
-            
-            // For semi-normal days and normal days, allow cross-month swaps throughout the entire month
-            // For other day types (weekend, special), only check in last 3 days
-            if (dayTypeCategory !== 'semi' && dayTypeCategory !== 'normal') {
-            const lastDayOfMonth = new Date(currentYear, currentMonth + 1, 0);
-            const daysUntilEndOfMonth = lastDayOfMonth.getDate() - date.getDate();
-            
-            // Only use next month logic if we're in the last 3 days of the month
-            if (daysUntilEndOfMonth > 3) {
-                return null;
-                }
-            }
-            
-            // Calculate next month
-            const nextMonth = currentMonth === 11 ? 0 : currentMonth + 1;
-            const nextYear = currentMonth === 11 ? currentYear + 1 : currentYear;
-            
-            // Get first and last day of next month
-            const firstDayOfNextMonth = new Date(nextYear, nextMonth, 1);
-            const lastDayOfNextMonth = new Date(nextYear, nextMonth + 1, 0);
-            
-            // For normal days, follow swap logic: Monday↔Wednesday, Tuesday↔Thursday
-            if (dayTypeCategory === 'normal') {
-                const currentDayOfWeek = date.getDay(); // 0=Sunday, 1=Monday, 2=Tuesday, 3=Wednesday, 4=Thursday, 5=Friday, 6=Saturday
-                
-                // Determine swap day pairs: Monday↔Wednesday (1↔3), Tuesday↔Thursday (2↔4)
-                // Logic: Tuesday tries next Tuesday first, then nearest Thursday
-                //        Thursday tries next Thursday first, then nearest Tuesday
-                let targetDayOfWeek = null;
-                let alternativeDayOfWeek = null;
-                let tryTargetFirst = false; // Flag to indicate if we should try target day first
-                
-                if (currentDayOfWeek === 1) { // Monday
-                    targetDayOfWeek = 1; // Next Monday
-                    alternativeDayOfWeek = 3; // Wednesday (preferred for swap)
-                } else if (currentDayOfWeek === 2) { // Tuesday
-                    targetDayOfWeek = 2; // Next Tuesday (try FIRST)
-                    alternativeDayOfWeek = 4; // Thursday (then nearest)
-                    tryTargetFirst = true;
-                } else if (currentDayOfWeek === 3) { // Wednesday
-                    targetDayOfWeek = 3; // Next Wednesday
-                    alternativeDayOfWeek = 1; // Monday (preferred for swap)
-                } else if (currentDayOfWeek === 4) { // Thursday
-                    targetDayOfWeek = 4; // Next Thursday (try FIRST)
-                    alternativeDayOfWeek = 2; // Tuesday (then nearest)
-                    tryTargetFirst = true;
-                }
-                
-                // Try to find swap day in next month following the swap logic
-                let swapDayInNextMonth = null;
-                
-                if (tryTargetFirst && targetDayOfWeek !== null) {
-                    // For Tuesday/Thursday: PRIORITY 1 - Try same day of week first (next Tuesday/Thursday)
-                    const checkDate = new Date(firstDayOfNextMonth);
-                    while (checkDate <= lastDayOfNextMonth) {
-                        const checkDayType = getDayType(checkDate);
-                        if (checkDayType === 'normal-day' && checkDate.getDay() === targetDayOfWeek) {
-                            swapDayInNextMonth = new Date(checkDate);
-                            break;
-                        }
-                        checkDate.setDate(checkDate.getDate() + 1);
-                    }
-                    
-                    // PRIORITY 2: If same day not found, try alternative (nearest Thursday/Tuesday)
-                    if (!swapDayInNextMonth && alternativeDayOfWeek !== null) {
-                        const checkDate = new Date(firstDayOfNextMonth);
-                        while (checkDate <= lastDayOfNextMonth) {
-                            const checkDayType = getDayType(checkDate);
-                            if (checkDayType === 'normal-day' && checkDate.getDay() === alternativeDayOfWeek) {
-                                swapDayInNextMonth = new Date(checkDate);
-                                break;
-                            }
-                            checkDate.setDate(checkDate.getDate() + 1);
-                        }
-                    }
-                } else if (alternativeDayOfWeek !== null) {
-                    // For Monday/Wednesday: PRIORITY 1 - Try alternative day of week first (e.g., Wednesday for Monday)
-                    const checkDate = new Date(firstDayOfNextMonth);
-                    while (checkDate <= lastDayOfNextMonth) {
-                        const checkDayType = getDayType(checkDate);
-                        if (checkDayType === 'normal-day' && checkDate.getDay() === alternativeDayOfWeek) {
-                            swapDayInNextMonth = new Date(checkDate);
-                            break;
-                        }
-                        checkDate.setDate(checkDate.getDate() + 1);
-                    }
-                    
-                    // PRIORITY 2: If alternative not found, try same day of week (e.g., next Monday for Monday)
-                    if (!swapDayInNextMonth && targetDayOfWeek !== null) {
-                        const checkDate = new Date(firstDayOfNextMonth);
-                        while (checkDate <= lastDayOfNextMonth) {
-                            const checkDayType = getDayType(checkDate);
-                            if (checkDayType === 'normal-day' && checkDate.getDay() === targetDayOfWeek) {
-                                swapDayInNextMonth = new Date(checkDate);
-                                break;
-                            }
-                            checkDate.setDate(checkDate.getDate() + 1);
-                        }
-                    }
-                }
-                
-                // If no swap day found in next month, fall back to first normal day
-                if (!swapDayInNextMonth) {
-                    const checkDate = new Date(firstDayOfNextMonth);
-                    while (checkDate <= lastDayOfNextMonth) {
-                        const checkDayType = getDayType(checkDate);
-                        if (checkDayType === 'normal-day') {
-                            swapDayInNextMonth = new Date(checkDate);
-                            break;
-                        }
-                        checkDate.setDate(checkDate.getDate() + 1);
-                    }
-                }
-                
-                if (!swapDayInNextMonth) {
-                    return null;
-                }
-                
-                // Calculate rotation position for the swap day in next month
-                // Rotation continues globally from current month
-                let nextMonthRotationPosition;
-                if (currentRotationPosition !== null && currentRotationPosition !== undefined) {
-                    // Count how many normal days are between current day and swap day in next month
-                    // This ensures we get the correct rotation position
-                    const swapDayKey = formatDateKey(swapDayInNextMonth);
-                    const swapRotationPosition = getRotationPosition(swapDayInNextMonth, 'normal', groupNum) % rotationDays;
-                    nextMonthRotationPosition = swapRotationPosition;
-                } else {
-                    // Fallback: calculate from start date
-                    nextMonthRotationPosition = getRotationPosition(swapDayInNextMonth, 'normal', groupNum) % rotationDays;
-                }
-                
-                const nextMonthPerson = groupPeople[nextMonthRotationPosition];
-                
-                // Check if this person from next month has conflicts on the current day
-                if (nextMonthPerson && !isPersonMissingOnDate(nextMonthPerson, groupNum, date, 'normal')) {
-                    const hasConflict = hasConsecutiveDuty(dayKey, nextMonthPerson, groupNum);
-                    
-                    if (!hasConflict) {
-                        const swapDayKey = formatDateKey(swapDayInNextMonth);
-                        const swapDayName = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday'][swapDayInNextMonth.getDay()];
-                        console.log(`[END OF MONTH SWAP] Using person from next month: ${nextMonthPerson} for ${dayKey} (swap day: ${swapDayKey} - ${swapDayName}, rotation position: ${nextMonthRotationPosition})`);
-                        // Return both person and swap day key so we can track where they should be assigned in next month
-                        return { person: nextMonthPerson, swapDayKey: swapDayKey };
-                    }
-                }
-                
-                return null;
-            }
-            
-            // For other day types (weekend, semi, special), use original logic
-            // Find first day of this type in next month
-            let firstDayOfTypeInNextMonth = null;
-            const checkDate = new Date(firstDayOfNextMonth);
-            
-            while (checkDate <= lastDayOfNextMonth) {
-                const checkDayType = getDayType(checkDate);
-                let checkTypeCategory = 'normal';
-                if (checkDayType === 'special-holiday') {
-                    checkTypeCategory = 'special';
-                } else if (checkDayType === 'semi-normal-day') {
-                    checkTypeCategory = 'semi';
-                } else if (checkDayType === 'weekend-holiday') {
-                    checkTypeCategory = 'weekend';
-                }
-                
-                if (checkTypeCategory === dayTypeCategory) {
-                    firstDayOfTypeInNextMonth = new Date(checkDate);
-                    break;
-                }
-                checkDate.setDate(checkDate.getDate() + 1);
-            }
-            
-            if (!firstDayOfTypeInNextMonth) {
-                return null;
-            }
-            
-            // Calculate rotation position for first day of this type in next month
-            // For weekends, rotation continues globally from current month
-            // For special and semi, use direct rotation calculation
-            let nextMonthRotationPosition;
-            
-            if (dayTypeCategory === 'weekend') {
-                // Rotation continues globally - if we have current rotation position, advance it
-                // Otherwise calculate from start date
-                if (currentRotationPosition !== null && currentRotationPosition !== undefined) {
-                    // Advance rotation position by 1 (for the current day we're processing)
-                    // This gives us the position for the first day in next month
-                    nextMonthRotationPosition = (currentRotationPosition + 1) % rotationDays;
-                } else {
-                    // Fallback: calculate from start date
-                    nextMonthRotationPosition = getRotationPosition(firstDayOfTypeInNextMonth, dayTypeCategory, groupNum) % rotationDays;
-                }
-            } else {
-                // For special and semi, use direct calculation
-                nextMonthRotationPosition = getRotationPosition(firstDayOfTypeInNextMonth, dayTypeCategory, groupNum) % rotationDays;
-            }
-            
-            const nextMonthPerson = groupPeople[nextMonthRotationPosition];
-            
-            // Check if this person from next month has conflicts on the current day
-            if (nextMonthPerson && !isPersonMissingOnDate(nextMonthPerson, groupNum, date, dayTypeCategory)) {
-                const hasConflict = hasConsecutiveDuty(dayKey, nextMonthPerson, groupNum);
-                
-                // Also check if they have special holiday in current month (for weekends)
-                let hasSpecialInCurrentMonth = false;
-                if (dayTypeCategory === 'weekend') {
-                    hasSpecialInCurrentMonth = hasSpecialHolidayDutyInMonth(nextMonthPerson, groupNum, currentMonth, currentYear);
-                }
-                
-                if (!hasConflict && !hasSpecialInCurrentMonth) {
-                    console.log(`[END OF MONTH] Using person from next month: ${nextMonthPerson} for ${dayKey} (rotation position: ${nextMonthRotationPosition}, end of month conflict resolution)`);
-                    // Return both person and swap day key (first day of type in next month)
-                    const firstDayKey = formatDateKey(firstDayOfTypeInNextMonth);
-                    return { person: nextMonthPerson, swapDayKey: firstDayKey };
-                }
-            }
-            
-            return null;
-        }
         function countDaysSinceLastDuty(dayKey, person, groupNum, dayTypeCategory, allDaysByType, startDate = null) {
             const daysOfType = allDaysByType[dayTypeCategory];
             const currentIndex = daysOfType.indexOf(dayKey);
@@ -6088,50 +5684,7 @@
             const modal = new bootstrap.Modal(document.getElementById('calculateDutiesModal'));
             modal.show();
         }
-        function ensureMonthPickerClickTargets() {
-            if (monthPickerClickTargetsInstalled) return;
-            monthPickerClickTargetsInstalled = true;
-
-            const installFor = (inputId) => {
-                const input = document.getElementById(inputId);
-                if (!input) return;
-
-                const openPicker = () => {
-                    try {
-                        input.focus({ preventScroll: true });
-                    } catch (_) {
-                        input.focus();
-                    }
-                    if (typeof input.showPicker === 'function') {
-                        try {
-                            input.showPicker();
-                        } catch (_) {
-                            // ignore (some browsers require user gesture; focus is still helpful)
-                        }
-                    }
-                };
-
-                // If the user clicks the input itself, try to open immediately.
-                input.addEventListener('click', () => openPicker());
-                // Some browsers open picker on focus; this makes it consistent.
-                input.addEventListener('focus', () => {
-                    if (typeof input.showPicker === 'function') {
-                        try { input.showPicker(); } catch (_) {}
-                    }
-                });
-
-                // Expand click target to the entire field block (label + help text + surrounding area)
-                const container = input.closest('.mb-3') || input.parentElement;
-                if (container) {
-                    container.addEventListener('click', (e) => {
-                        if (e.target === input) return;
-                        openPicker();
-                    });
-                }
-            };
 
-            installFor('calculateStartMonth');
-        }
         function showStepByStepCalculation() {
             calculationSteps.totalSteps = 4;
             calculationSteps.currentStep = 1;
@@ -6299,179 +5852,7 @@
                 alert('Σφάλμα κατά την εμφάνιση αποτελεσμάτων ειδικών αργιών: ' + error.message);
             }
         }
-        function showWeekendSkipResults(skippedPeople, updatedAssignments) {
-            const findSwapOtherDateKey = (swapPairIdRaw, groupNum, currentDateKey) => {
-                if (swapPairIdRaw === null || swapPairIdRaw === undefined) return null;
-                const swapPairId = typeof swapPairIdRaw === 'number' ? swapPairIdRaw : parseInt(swapPairIdRaw);
-                if (isNaN(swapPairId)) return null;
-                for (const dk in assignmentReasons) {
-                    if (dk === currentDateKey) continue;
-                    const gmap = assignmentReasons?.[dk]?.[groupNum];
-                    if (!gmap) continue;
-                    for (const pn in gmap) {
-                        const r = gmap[pn];
-                        const rid = r?.swapPairId;
-                        const nid = typeof rid === 'number' ? rid : parseInt(rid);
-                        if (!isNaN(nid) && nid === swapPairId) return dk;
-                    }
-                }
-                return null;
-            };
-
-            let message = '';
-            
-            const baselineByDate = calculationSteps.tempWeekendBaselineAssignments || {};
-            const computedByDate = updatedAssignments || {};
-
-            const rows = [];
-            const dateKeys = Object.keys(computedByDate).sort();
-            for (const dateKey of dateKeys) {
-                const dateObj = new Date(dateKey + 'T00:00:00');
-                if (isNaN(dateObj.getTime())) continue;
-                const dateStr = dateObj.toLocaleDateString('el-GR', { day: '2-digit', month: '2-digit', year: 'numeric' });
-                const dayName = getGreekDayName(dateObj);
-                for (let groupNum = 1; groupNum <= 4; groupNum++) {
-                    const base = baselineByDate?.[dateKey]?.[groupNum] || null;
-                    const comp = computedByDate?.[dateKey]?.[groupNum] || null;
-                    if (!base || !comp) continue;
-                    if (base === comp) continue;
-
-                    const reasonObj = assignmentReasons?.[dateKey]?.[groupNum]?.[comp] || null;
-                    const reasonText = reasonObj?.reason
-                        ? String(reasonObj.type === 'swap' ? normalizeSwapReasonText(reasonObj.reason) : reasonObj.reason)
-                        : '';
-                    const derivedUnavailable = (isPersonDisabledForDuty(base, groupNum, 'weekend') || isPersonMissingOnDate(base, groupNum, dateObj, 'weekend'))
-                        ? (reasonText || buildUnavailableReplacementReason({
-                            skippedPersonName: base,
-                            replacementPersonName: comp,
-                            dateObj,
-                            groupNum,
-                            dutyCategory: 'weekend'
-                        }))
-                        : '';
-                    // Ενιαίο μήνυμα όταν ο παραλειφθείς έχει ήδη ειδική αργία τον ίδιο μήνα (Σαββατοκύριακο).
-                    let briefReason = '';
-                    if (derivedUnavailable) {
-                        briefReason = derivedUnavailable;
-                    } else if (hasSpecialHolidayDutyInMonthCalcOrSaved(base, groupNum, dateObj.getMonth(), dateObj.getFullYear())) {
-                        briefReason =
-                            typeof buildSpecialHolidaySameMonthUnifiedMessage === 'function'
-                                ? buildSpecialHolidaySameMonthUnifiedMessage(
-                                      comp,
-                                      dateKey,
-                                      base,
-                                      groupNum,
-                                      dateObj.getFullYear(),
-                                      dateObj.getMonth()
-                                  ) || (reasonText ? reasonText.split('.').filter(Boolean)[0] : '')
-                                : (reasonText ? reasonText.split('.').filter(Boolean)[0] : '');
-                    } else if (reasonText) {
-                        briefReason = reasonText.split('.').filter(Boolean)[0] || '';
-                    } else {
-                        briefReason = 'Αλλαγή';
-                    }
-
-                    // Weekend skip has no swap-date; keep '-' (but support future swapPairId logic if it appears)
-                    const swapOtherKey = reasonObj?.type === 'swap'
-                        ? findSwapOtherDateKey(reasonObj.swapPairId, groupNum, dateKey)
-                        : null;
-                    const swapDateStr = swapOtherKey
-                        ? new Date(swapOtherKey + 'T00:00:00').toLocaleDateString('el-GR', { day: '2-digit', month: '2-digit', year: 'numeric' })
-                        : '-';
-
-                    rows.push({
-                        dateKey,
-                        dayName,
-                        dateStr,
-                        groupNum,
-                        service: getGroupName(groupNum),
-                        skipped: base,
-                        replacement: comp,
-                        swapDateStr,
-                        briefReason
-                    });
-                }
-            }
 
-            if (rows.length === 0) {
-                message = '<div class="alert alert-success"><i class="fas fa-check-circle me-2"></i><strong>Καμία αλλαγή!</strong><br>Δεν βρέθηκαν αλλαγές στις αργίες.</div>';
-            } else {
-                message = '<div class="alert alert-info"><i class="fas fa-info-circle me-2"></i><strong>Αλλαγές: ' + rows.length + ' εγγραφές</strong></div>';
-                message += '<div class="table-responsive"><table class="table table-sm table-bordered">';
-                message += '<thead><tr><th>Ημερομηνία</th><th>Υπηρεσία</th><th>Παραλείφθηκε</th><th>Αντικαταστάθηκε από</th><th>Ημερομηνία Αλλαγής</th><th>Λόγος</th></tr></thead><tbody>';
-                
-                rows.forEach(r => {
-                    message += `<tr>
-                        <td>${r.dayName} ${r.dateStr}</td>
-                        <td>${r.service}</td>
-                        <td><strong>${r.skipped}</strong></td>
-                        <td><strong>${r.replacement}</strong></td>
-                        <td>${r.swapDateStr}</td>
-                        <td>${r.briefReason}</td>
-                    </tr>`;
-                });
-                
-                message += '</tbody></table></div>';
-            }
-            
-            // Create and show modal
-            const modalHtml = `
-                <div class="modal fade" id="weekendSkipResultsModal" tabindex="-1">
-                    <div class="modal-dialog modal-xl modal-superwide">
-                        <div class="modal-content results-modal-weekend">
-                            <div class="modal-header results-header results-header-weekend">
-                                <h5 class="modal-title"><i class="fas fa-exchange-alt me-2"></i>Αποτελέσματα Αλλαγών Παραλείψεων Σαββατοκύριακων</h5>
-                                <button type="button" class="btn-close" data-bs-dismiss="modal" aria-label="Close"></button>
-                            </div>
-                            <div class="modal-body">
-                                ${message}
-                            </div>
-                            <div class="modal-footer">
-                                <button type="button" class="btn btn-primary" id="weekendSkipOkButton">OK</button>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            `;
-            
-            // Remove existing modal if any
-            const existingModal = document.getElementById('weekendSkipResultsModal');
-            if (existingModal) {
-                existingModal.remove();
-            }
-            
-            // Add modal to body
-            document.body.insertAdjacentHTML('beforeend', modalHtml);
-            
-            // Show modal
-            const modal = new bootstrap.Modal(document.getElementById('weekendSkipResultsModal'));
-            modal.show();
-            
-            // When OK is pressed, save final assignments and proceed to Step 3
-            const okButton = document.getElementById('weekendSkipOkButton');
-            if (okButton) {
-                okButton.addEventListener('click', async function() {
-                    const originalOkHtml = okButton.innerHTML;
-                    okButton.disabled = true;
-                    okButton.classList.add('is-saving');
-                    okButton.innerHTML = `<span class="spinner-border spinner-border-sm me-2" role="status" aria-hidden="true"></span>Αποθήκευση...`;
-                    setStepFooterBusy(true);
-                    try {
-                        await saveFinalWeekendAssignments(updatedAssignments);
-                        // Proceed to Step 3
-                        calculationSteps.currentStep = 3;
-                        renderCurrentStep();
-                        const m = bootstrap.Modal.getInstance(document.getElementById('weekendSkipResultsModal'));
-                        if (m) m.hide();
-                    } finally {
-                        requestAnimationFrame(() => setStepFooterBusy(false));
-                        okButton.innerHTML = originalOkHtml;
-                        okButton.classList.remove('is-saving');
-                        okButton.disabled = false;
-                    }
-                });
-            }
-        }
         async function saveFinalWeekendAssignments(updatedAssignments) {
             try {
                 if (!window.db) {
@@ -6673,38 +6054,7 @@
                 console.error('Error saving final semi-normal assignments:', error);
             }
         }
-        async function saveTempAssignmentsToFirestore(tempAssignments) {
-            try {
-                if (!window.db) {
-                    console.log('Firebase not ready, skipping temp save');
-                    return;
-                }
-                
-                const db = window.db || firebase.firestore();
-                const user = window.auth?.currentUser;
-                
-                if (!user) {
-                    console.log('User not authenticated, skipping temp save');
-                    return;
-                }
-                
-                const sanitized = sanitizeForFirestore(tempAssignments);
-                await db.collection('dutyShifts').doc('tempAssignments').set({
-                    ...sanitized,
-                    lastUpdated: firebase.firestore.FieldValue.serverTimestamp(),
-                    updatedBy: user.uid
-                });
-                console.log('[TEMP SAVE DEBUG] Temp assignments saved to Firestore successfully');
-                console.log('[TEMP SAVE DEBUG] Saved data structure:', {
-                    normal: Object.keys(tempAssignments.normal || {}).length + ' dates',
-                    semi: Object.keys(tempAssignments.semi || {}).length + ' dates',
-                    weekend: Object.keys(tempAssignments.weekend || {}).length + ' dates',
-                    special: Object.keys(tempAssignments.special || {}).length + ' months'
-                });
-            } catch (error) {
-                console.error('Error saving temp assignments:', error);
-            }
-        }
+
         function assignPersonToDay(dayKey, person, groupNum) {
             const existingAssignment = getAssignmentForDate(dayKey);
             const personGroupStr = `${person} (Ομάδα ${groupNum})`;
@@ -6755,26 +6105,7 @@
                 setAssignmentForDate(dayKey, filtered.join(', '));
             }
         }
-        function canPersonTakeDay(dayKey, person, groupNum, dayTypeCategory) {
-            const dayDate = new Date(dayKey + 'T00:00:00');
-            
-            // Skip if person is missing on this date
-            if (isPersonMissingOnDate(person, groupNum, dayDate, dayTypeCategory)) return false;
-            
-            const priorityLevel = dayTypeCategory === 'special' ? 1 : 
-                                (dayTypeCategory === 'weekend' ? 2 : 
-                                (dayTypeCategory === 'semi' ? 3 : 4));
-            
-            const hasConsecutive = hasConsecutiveDuty(dayKey, person, groupNum);
-            const hadSpecialBefore = hadSpecialHolidayDutyBefore(dayKey, person, groupNum);
-            const hasConsecutiveWeekend = hasConsecutiveWeekendHolidayDuty(dayKey, person, groupNum);
-            const hasConsecutiveSpecial = hasConsecutiveSpecialHolidayDuty(dayKey, person, groupNum);
-            
-            const strictConflict = (priorityLevel <= 2) && (hasConsecutiveSpecial || hasConsecutiveWeekend);
-            const generalConflict = hasConsecutive || hadSpecialBefore;
-            
-            return !strictConflict && !generalConflict;
-        }
+
         function findLastDutyKeyForPerson(person, groupNum, dayTypeCategory, dayTypeLists, startDate, currentDayKey) {
             const days = dayTypeLists[dayTypeCategory];
             const sortedDays = [...days].sort();
@@ -8755,50 +8086,7 @@
             const modal = new bootstrap.Modal(document.getElementById('missingPeriodModal'));
             modal.show();
         }
-        function renderMissingPeriodsList() {
-            const container = document.getElementById('missingPeriodsList');
-            const groupData = groups[currentMissingPeriodGroup] || { special: [], weekend: [], semi: [], normal: [], lastDuties: {}, missingPeriods: {} };
-            const missingPeriods = groupData.missingPeriods?.[currentMissingPeriodPerson] || [];
-            
-            if (missingPeriods.length === 0) {
-                container.innerHTML = '<p class="text-muted text-center small">Δεν υπάρχουν καταχωρημένες περιόδοι απουσίας</p>';
-                return;
-            }
-            
-            container.innerHTML = missingPeriods.map((period, index) => {
-                const startDate = new Date(period.start + 'T00:00:00');
-                const endDate = new Date(period.end + 'T00:00:00');
-                const today = new Date();
-                today.setHours(0, 0, 0, 0);
-                const isActive = today >= startDate && today <= endDate;
-                const isPast = today > endDate;
-                const isFuture = today < startDate;
-                
-                let statusBadge = '';
-                if (isActive) statusBadge = '<span class="badge bg-warning ms-2">Ενεργή</span>';
-                else if (isPast) statusBadge = '<span class="badge bg-secondary ms-2">Παρελθούσα</span>';
-                else if (isFuture) statusBadge = '<span class="badge bg-info ms-2">Μελλοντική</span>';
-                const reason = (period.reason || '').trim();
-                const reasonHtml = reason ? `<div class="mt-1"><small class="text-muted"><i class="fas fa-tag me-1"></i>${escapeHtml(reason)}</small></div>` : '';
-                
-                return `
-                    <div class="card mb-2">
-                        <div class="card-body">
-                            <div class="d-flex justify-content-between align-items-center">
-                                <div>
-                                    <strong>${formatDate(startDate)}</strong> - <strong>${formatDate(endDate)}</strong>
-                                    ${statusBadge}
-                                    ${reasonHtml}
-                                </div>
-                                <button class="btn btn-sm btn-outline-danger" onclick="removeMissingPeriod(${index})">
-                                    <i class="fas fa-trash"></i>
-                                </button>
-                            </div>
-                        </div>
-                    </div>
-                `;
-            }).join('');
-        }
+
         function addMissingPeriod() {
             const start = document.getElementById('missingPeriodStart').value;
             const end = document.getElementById('missingPeriodEnd').value;
@@ -8843,69 +8131,11 @@
             renderMissingPeriodsList();
             renderGroups();
         }
-        function renderMissingReasonsSelect() {
-            const select = document.getElementById('missingPeriodReason');
-            if (!select) return;
-            const list = Array.isArray(missingReasons) ? missingReasons : [];
-            const currentValue = (select.value || '').trim();
-            const options = (list.length ? list : ['Άλλο']).map(r => String(r).trim()).filter(Boolean);
-            select.innerHTML = options.map(r => `<option value="${escapeHtml(r)}">${escapeHtml(r)}</option>`).join('');
-            if (currentValue && options.includes(currentValue)) {
-                select.value = currentValue;
-            }
-        }
-        function openMissingReasonsModal() {
-            renderMissingReasonsList();
-            const modal = new bootstrap.Modal(document.getElementById('missingReasonsModal'));
-            modal.show();
-        }
-        function renderMissingReasonsList() {
-            const container = document.getElementById('missingReasonsList');
-            if (!container) return;
-            const list = Array.isArray(missingReasons) ? missingReasons : [];
-            if (!list.length) {
-                container.innerHTML = '<div class="text-muted small text-center">Δεν υπάρχουν λόγοι.</div>';
-                return;
-            }
-            container.innerHTML = list.map((r, idx) => {
-                const txt = String(r || '').trim();
-                if (!txt) return '';
-                return `
-                    <div class="list-group-item d-flex justify-content-between align-items-center">
-                        <span>${escapeHtml(txt)}</span>
-                        <button class="btn btn-sm btn-outline-danger" onclick="removeMissingReason(${idx})"><i class="fas fa-trash"></i></button>
-                    </div>
-                `;
-            }).join('');
-        }
-        function addMissingReason() {
-            const input = document.getElementById('missingReasonNewText');
-            const raw = (input?.value || '').trim();
-            if (!raw) return;
-            const list = Array.isArray(missingReasons) ? missingReasons : [];
-            const exists = list.some(x => String(x).trim().toLowerCase() === raw.toLowerCase());
-            if (exists) {
-                input.value = '';
-                return;
-            }
-            list.push(raw);
-            missingReasons = list.filter(Boolean).map(x => String(x).trim()).filter(Boolean);
-            missingReasonsModified = true;
-            input.value = '';
-            renderMissingReasonsList();
-            renderMissingReasonsSelect();
-            saveData();
-        }
-        function removeMissingReason(index) {
-            const list = Array.isArray(missingReasons) ? [...missingReasons] : [];
-            if (index < 0 || index >= list.length) return;
-            list.splice(index, 1);
-            missingReasons = list.filter(Boolean).map(x => String(x).trim()).filter(Boolean);
-            missingReasonsModified = true;
-            renderMissingReasonsList();
-            renderMissingReasonsSelect();
-            saveData();
-        }
+
+
+
+
+
         function removeMissingPeriod(index) {
             showConfirmModal({
                 title: 'Επιβεβαίωση',
@@ -8924,36 +8154,7 @@
                 }
             });
         }
-        function toggleListCollapse(listId, chevronId) {
-            const listElement = document.getElementById(listId);
-            const chevronElement = document.getElementById(chevronId);
-            
-            if (listElement && chevronElement) {
-                // Check current state BEFORE toggling
-                const isCurrentlyShown = listElement.classList.contains('show');
-                
-                // Lazy populate list when opening (improves initial load performance a lot)
-                if (!isCurrentlyShown) {
-                    ensureGroupListPopulated(listId);
-                }
-                
-                // Toggle Bootstrap collapse
-                const bsCollapse = new bootstrap.Collapse(listElement, {
-                    toggle: true
-                });
-                
-                // Update chevron icon based on what the state WILL BE (opposite of current)
-                if (isCurrentlyShown) {
-                    // Currently shown, will be hidden - show down arrow
-                    chevronElement.classList.remove('fa-chevron-up');
-                    chevronElement.classList.add('fa-chevron-down');
-                } else {
-                    // Currently hidden, will be shown - show up arrow
-                    chevronElement.classList.remove('fa-chevron-down');
-                    chevronElement.classList.add('fa-chevron-up');
-                }
-            }
-        }
+
         function updateStatistics() {
             let totalPeople = 0;
             let totalInService = 0;
@@ -9114,27 +8315,7 @@
             }
             return null;
         }
-        function getSpecialHolidayDutyDateInMonth(person, groupNum, year, month) {
-            try {
-                const monthStart = new Date(year, month, 1);
-                const monthEnd = new Date(year, month + 1, 0);
-                const personGroupStr = `${person} (Ομάδα ${groupNum})`;
-                const d = new Date(monthStart);
-                while (d <= monthEnd) {
-                    if (getDayType(d) === 'special-holiday') {
-                        const key = formatDateKey(d);
-                        const a = getAssignmentForDate(key);
-                        if (a && String(a).includes(personGroupStr)) {
-                            return key;
-                        }
-                    }
-                    d.setDate(d.getDate() + 1);
-                }
-            } catch (e) {
-                // ignore
-            }
-            return null;
-        }
+
         function analyzeRotationViolations() {
             const violations = [];
             const seenSwapPairs = new Set(); // dayType|group|swapPairId -> dedupe swap rows
@@ -9400,91 +8581,7 @@
             // Display violations in modal
             displayRotationViolations(violations);
         }
-        function displayRotationViolations(violations) {
-            const tableBody = document.getElementById('rotationViolationsTableBody');
-            const noViolationsMsg = document.getElementById('noViolationsMessage');
-            
-            if (!tableBody) return;
-            
-            tableBody.innerHTML = '';
-            
-            if (violations.length === 0) {
-                tableBody.parentElement.parentElement.style.display = 'none';
-                if (noViolationsMsg) noViolationsMsg.style.display = 'block';
-            } else {
-                tableBody.parentElement.parentElement.style.display = 'table';
-                if (noViolationsMsg) noViolationsMsg.style.display = 'none';
-                
-                // Sort violations by date in ascending order
-                violations.sort((a, b) => {
-                    const dateA = a.dateObj || new Date(a.date + 'T00:00:00');
-                    const dateB = b.dateObj || new Date(b.date + 'T00:00:00');
-                    return dateA.getTime() - dateB.getTime();
-                });
-                
-                violations.forEach(violation => {
-                    const row = document.createElement('tr');
-                    
-                    // Get date object
-                    const dateObj = violation.dateObj || new Date(violation.date + 'T00:00:00');
-                    
-                    // Get day of week
-                    const dayOfWeek = getGreekDayName(dateObj);
-                    
-                    // Get duty type label based on category
-                    let dutyTypeLabel = '';
-                    if (violation.dayTypeCategory === 'special') {
-                        dutyTypeLabel = 'Ειδική Αργία';
-                    } else if (violation.dayTypeCategory === 'weekend') {
-                        dutyTypeLabel = 'Σαββατοκύριακο/Αργία';
-                    } else if (violation.dayTypeCategory === 'semi') {
-                        dutyTypeLabel = 'Ημιαργία';
-                    } else {
-                        dutyTypeLabel = 'Καθημερινή';
-                    }
-                    
-                    // Format date with day of week and duty type below
-                    const dateHtml = `
-                        <div>${violation.dateFormatted}</div>
-                        <div style="font-size: 0.85em; color: #666; margin-top: 2px;">${dayOfWeek}</div>
-                        <div style="font-size: 0.8em; color: #888; margin-top: 1px;">${dutyTypeLabel}</div>
-                    `;
-                    
-                    // Remove duplicates from conflicts column (split by | and deduplicate)
-                    let conflictsDisplay = violation.conflicts || '-';
-                    if (conflictsDisplay !== '-') {
-                        const conflictParts = conflictsDisplay.split('|').map(c => c.trim()).filter(c => c);
-                        const uniqueConflicts = [...new Set(conflictParts)];
-                        conflictsDisplay = uniqueConflicts.join(' | ') || '-';
-                    }
-                    
-                    // Remove text in parentheses from reason
-                    let reasonText = violation.swapReason || '-';
-                    if (reasonText !== '-') {
-                        // Remove text in parentheses at the end (e.g., "text. (Reason)" -> "text.")
-                        reasonText = reasonText.replace(/\s*\([^)]*\)\s*$/, '');
-                    }
-                    
-                    // Determine assignment type: "Αντικατάσταση" for skip, "Αλλαγή" for swap
-                    const assignmentType = violation.reasonType === 'skip' ? 'Αντικατάσταση' : 'Αλλαγή';
-                    
-                    row.innerHTML = `
-                        <td>${dateHtml}</td>
-                        <td><span class="badge bg-primary">${violation.groupName}</span></td>
-                        <td><strong>${violation.assignedPerson}</strong></td>
-                        <td><strong class="text-danger">${violation.expectedPerson}</strong></td>
-                        <td><small>${escapeHtml(conflictsDisplay)}</small></td>
-                        <td><small>${escapeHtml(reasonText)}</small></td>
-                        <td><small>${escapeHtml(assignmentType)}</small></td>
-                    `;
-                    tableBody.appendChild(row);
-                });
-            }
-            
-            // Show modal
-            const modal = new bootstrap.Modal(document.getElementById('rotationViolationsModal'));
-            modal.show();
-        }
+
         function printRotationAndRankings() {
             // Create a new window for printing
             const printWindow = window.open('', '_blank', 'width=800,height=600');
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Move the inline <script> and <style> blocks of the large HTML pages into
+cacheable files.
+
+- Each inline classic script becomes js/pages/<page>.js and each <style>
+  block css/pages/<page>.css, referenced from where the block used to be.
+- Top-level functions that two or more pages declare identically (same
+  tokens, comments and whitespace aside) move to js/shared-pages.js, which
+  the pages using them load just before their own script.
+- A function a page declares exactly as js/common.js already does is
+  removed from the page, since every page loads common.js first.
+
+Pages share one global scope per document, so a function is only shared
+when nothing else on a page that loads shared-pages.js binds the same name
+with let/const/class, and when the page declares it only once.
+"""
+
+import argparse
+import io
+import os
+import re
+import sys
+
+from html_pages import (is_classic_script, local_script_paths, parse_script_tags, parse_style_tags,
+                        read_page)
+from js_tokenizer import HOISTED_FUNCTION_KINDS, cut_spans, iter_declarations, tokenize
+
+PAGES = ('admin.html', 'tools-by-owner.html', 'my-tools.html', 'register-tools.html',
+         'duty-shifts.html')
+SHARED_SCRIPT = 'js/shared-pages.js'
+PAGE_SCRIPT_DIR = 'js/pages'
+PAGE_STYLE_DIR = 'css/pages'
+# Smaller blocks cost more as an extra request than they save
+MIN_BLOCK_BYTES = 1024
+
+SHARED_HEADER = """// ============================================
+// SHARED-PAGES.JS - Functions shared by several pages
+// Generated by js/extract_inline.py from: {pages}
+// ============================================
+
+"""
+
+
+def normalized(code):
+    """Token values of a piece of code, ignoring comments and whitespace"""
+    return b' '.join(token.value for token in tokenize(io.BytesIO(code)))
+
+
+def _declarations(code):
+    return list(iter_declarations(tokenize(io.BytesIO(code))))
+
+
+def inline_scripts(html):
+    """Inline classic <script> tags worth extracting"""
+    return [tag for tag in parse_script_tags(html)
+            if 'src' not in tag.attrs and is_classic_script(tag)
+            and len(html[tag.body_start:tag.body_end].encode('utf-8')) >= MIN_BLOCK_BYTES]
+
+
+def inline_styles(html):
+    """<style> blocks worth extracting (blocks with relative url() stay put,
+    since moving them would change what the URLs resolve against)"""
+    styles = []
+    for tag in parse_style_tags(html):
+        body = html[tag.body_start:tag.body_end]
+        if len(body.encode('utf-8')) < MIN_BLOCK_BYTES:
+            continue
+        if re.search(r'''url\(\s*['"]?(?![a-z]+:|/|#)''', body, re.IGNORECASE) or '@import' in body:
+            continue
+        styles.append(tag)
+    return styles
+
+
+def _lexical_names(paths):
+    """Names declared at top level by anything but a function declaration"""
+    names = set()
+    for path in paths:
+        with open(path, 'rb') as f:
+            code = f.read()
+        for decl in _declarations(code):
+            if decl.kind not in HOISTED_FUNCTION_KINDS:
+                names.update(decl.names)
+    return names
+
+
+def plan(root, pages, common_path):
+    """Decide what moves where.
+
+    Returns (shared, removed): shared maps name -> source bytes of the
+    function moving to shared-pages.js (in first-seen order); removed maps
+    page -> names whose declaration leaves that page.
+    """
+    with open(common_path, 'rb') as f:
+        common_code = f.read()
+    common = {}
+    for decl in _declarations(common_code):
+        if decl.kind in HOISTED_FUNCTION_KINDS:
+            common[decl.name] = normalized(common_code[decl.start:decl.end])
+
+    found = {}      # name -> {normalized code: [pages]}
+    sources = {}    # (name, normalized code) -> source bytes
+    counts = {}     # (page, name) -> declarations of name on the page
+    lexical = {}    # page -> names bound by let/const/class on the page
+    for page in pages:
+        html = read_page(page)
+        lexical[page] = set()
+        for tag in inline_scripts(html):
+            code = html[tag.body_start:tag.body_end].encode('utf-8')
+            for decl in _declarations(code):
+                if decl.kind not in HOISTED_FUNCTION_KINDS:
+                    lexical[page].update(decl.names)
+                    continue
+                key = normalized(code[decl.start:decl.end])
+                counts[page, decl.name] = counts.get((page, decl.name), 0) + 1
+                found.setdefault(decl.name, {}).setdefault(key, []).append(page)
+                sources.setdefault((decl.name, key), code[decl.lead:decl.end].lstrip(b'\n'))
+        external = [path for path in local_script_paths(page, html)
+                    if os.path.exists(path) and os.path.abspath(path) != os.path.abspath(
+                        os.path.join(root, SHARED_SCRIPT))]
+        lexical[page] |= _lexical_names(external)
+
+    removed = {page: set() for page in pages}
+    shared = {}
+    for name, variants in found.items():
+        for key, where in variants.items():
+            if any(counts[page, name] > 1 for page in where):
+                continue
+            if common.get(name) == key:
+                for page in where:
+                    removed[page].add(name)
+            elif len(where) > 1 and len(variants) == 1:
+                shared[name] = (key, where)
+
+    # Pages loading shared-pages.js must not bind a shared name lexically
+    changed = True
+    while changed:
+        changed = False
+        users = {page for _, where in shared.values() for page in where}
+        for name in list(shared):
+            if any(name in lexical[page] for page in users):
+                del shared[name]
+                changed = True
+    for name, (key, where) in shared.items():
+        for page in where:
+            removed[page].add(name)
+    return {name: sources[name, key] for name, (key, _) in shared.items()}, removed
+
+
+def strip_functions(code, names):
+    """Remove the top-level function declarations of `names` from code"""
+    spans = [(decl.lead, decl.end) for decl in _declarations(code)
+             if decl.kind in HOISTED_FUNCTION_KINDS and decl.name in names]
+    return cut_spans(code, spans)
+
+
+def _page_file(root, directory, page, number, ext):
+    stem = os.path.splitext(os.path.basename(page))[0]
+    suffix = f'-{number}' if number > 1 else ''
+    return os.path.join(root, directory, f'{stem}{suffix}{ext}')
+
+
+def _url(root, page, path):
+    return os.path.relpath(path, os.path.dirname(os.path.abspath(page))).replace(os.sep, '/')
+
+
+def _write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def extract_page(root, page, removed, shared_path=None):
+    """Rewrite one page; return [(written path, bytes)]"""
+    # Keep the page's own line endings in the page and the extracted files
+    with open(page, 'r', encoding='utf-8', newline='') as f:
+        html = f.read()
+    newline = '\r\n' if '\r\n' in html else '\n'
+    written = []
+    replacements = []
+    for number, tag in enumerate(inline_scripts(html), 1):
+        code = strip_functions(html[tag.body_start:tag.body_end].encode('utf-8'), removed)
+        path = _page_file(root, PAGE_SCRIPT_DIR, page, number, '.js')
+        written.append((path, code))
+        markup = ''
+        if shared_path is not None and number == 1:
+            markup = f'<script src="{_url(root, page, shared_path)}" charset="UTF-8"></script>{newline}    '
+        markup += f'<script src="{_url(root, page, path)}" charset="UTF-8"></script>'
+        replacements.append((tag.start, tag.end, markup))
+    for number, tag in enumerate(inline_styles(html), 1):
+        path = _page_file(root, PAGE_STYLE_DIR, page, number, '.css')
+        written.append((path, html[tag.body_start:tag.body_end].encode('utf-8')))
+        media = tag.attrs.get('media')
+        media = f' media="{media}"' if media else ''
+        replacements.append((tag.start, tag.end,
+                             f'<link rel="stylesheet" href="{_url(root, page, path)}"{media}>'))
+    for start, end, markup in sorted(replacements, reverse=True):
+        html = html[:start] + markup + html[end:]
+    for path, data in written:
+        _write(path, data)
+    _write(page, html.encode('utf-8'))
+    return written
+
+
+def main():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    default_root = os.path.dirname(script_dir)
+    parser = argparse.ArgumentParser(description='Move inline scripts and styles of the pages into files')
+    parser.add_argument('--root', default=default_root, help='site root (default: repository root)')
+    parser.add_argument('pages', nargs='*', help=f"pages to process (default: {', '.join(PAGES)})")
+    parser.add_argument('--dry-run', action='store_true', help='only report what would move')
+    args = parser.parse_args()
+
+    root = os.path.abspath(args.root)
+    pages = [os.path.abspath(page) for page in args.pages] or [
+        os.path.join(root, page) for page in PAGES if os.path.exists(os.path.join(root, page))]
+    shared, removed = plan(root, pages, os.path.join(root, 'js', 'common.js'))
+
+    shared_bytes = sum(len(code) for code in shared.values())
+    print(f"{len(shared)} functions shared by several pages ({shared_bytes} bytes) -> {SHARED_SCRIPT}")
+    for page in pages:
+        duplicates = sorted(removed[page] - set(shared))
+        if duplicates:
+            print(f"  {os.path.basename(page)}: drops copies of common.js functions: {', '.join(duplicates)}")
+    if args.dry_run:
+        return
+
+    shared_path = os.path.join(root, SHARED_SCRIPT)
+    if shared:
+        users = sorted({os.path.basename(page) for page in pages if removed[page] & set(shared)})
+        _write(shared_path, SHARED_HEADER.format(pages=', '.join(users)).encode('utf-8')
+               + b'\n\n'.join(code.rstrip() for code in shared.values()) + b'\n')
+    for page in pages:
+        before = os.path.getsize(page)
+        uses_shared = shared and removed[page] & set(shared)
+        written = extract_page(root, page, removed[page], shared_path if uses_shared else None)
+        print(f"{os.path.basename(page)}: {before} -> {os.path.getsize(page)} bytes, "
+              f"{len(written)} files written")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
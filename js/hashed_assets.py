@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Content-hashed asset names and the service worker precache manifest.
+
+Every local script and stylesheet the site's pages load is copied to
+name.<hash>.ext, where the hash covers the file's content, and the pages'
+<script src>/<link href> attributes are rewritten to the hashed names. Since
+a hashed URL never changes content, the browser and the service worker can
+keep it forever.
+
+precache-manifest.js lists the pages and every asset they load; the service
+worker imports it, precaches the entries in a cache named after the manifest
+version and drops the caches of older versions when it activates.
+
+Hashed copies of older versions stay on disk: pages still open with the old
+HTML, and clients whose service worker has not updated yet, keep requesting
+them. --prune removes them as a separate step, once the new manifest is
+deployed; it keeps the previous generation of each file (--keep).
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import sys
+
+from html_pages import HASHED_NAME, asset_urls, is_local, logical_path, read_page
+from lazy_chunks import MANIFEST_FILE
+
+HASH_LENGTH = 10
+HASHED_EXTENSIONS = ('.js', '.css')
+PRECACHE_FILE = 'precache-manifest.js'
+
+_PRECACHE_JSON = re.compile(r'self\.__precacheManifest\s*=\s*(\{.*\});', re.DOTALL)
+
+PRECACHE_TEMPLATE = """// Generated by js/hashed_assets.py - do not edit.
+// Imported by service-worker.js: urls with a null revision carry a content
+// hash in their name; the others are re-fetched whenever the version changes.
+self.__precacheManifest = {manifest};
+"""
+
+
+def asset_hash(data):
+    """Short content hash used in file names"""
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def hashed_path(path, digest):
+    """js/app.js -> js/app.<digest>.js"""
+    root, ext = os.path.splitext(path)
+    return f"{root}.{digest}{ext}"
+
+
+def _write_atomic(path, data):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def write_hashed(path):
+    """Copy a file to its content-hashed name and return the new path
+    (copies of older versions are left for prune_hashed)"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    target = hashed_path(path, asset_hash(data))
+    if not os.path.exists(target):
+        _write_atomic(target, data)
+    return target
+
+
+def hashed_copies(root):
+    """{built-from path: [hashed copies]} for every hashed file under root"""
+    copies = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [name for name in dirnames if not name.startswith('.') and name != 'node_modules']
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            if name.endswith(HASHED_EXTENSIONS) and HASHED_NAME.match(path):
+                copies.setdefault(logical_path(path), []).append(path)
+    return copies
+
+
+def read_precache_manifest(root):
+    """The {'version', 'entries'} of the site's precache-manifest.js, or None"""
+    try:
+        with open(os.path.join(root, PRECACHE_FILE), 'r', encoding='utf-8') as f:
+            m = _PRECACHE_JSON.search(f.read())
+        return json.loads(m.group(1)) if m else None
+    except (OSError, ValueError):
+        return None
+
+
+def prune_hashed(root, keep=1):
+    """Remove the hashed copies precache-manifest.js no longer lists, except
+    the `keep` newest of them for each file; return the removed paths.
+
+    Run it once the new manifest is deployed: until every client has
+    updated, pages and service workers of the previous version still fetch
+    the copies they were built with.
+    """
+    manifest = read_precache_manifest(root)
+    if manifest is None:
+        raise ValueError(f"{os.path.join(root, PRECACHE_FILE)} is missing or unreadable")
+    current = {os.path.normpath(os.path.join(root, entry['url'])) for entry in manifest['entries']}
+    removed = []
+    for paths in hashed_copies(root).values():
+        older = sorted((path for path in paths if os.path.normpath(path) not in current),
+                       key=os.path.getmtime, reverse=True)
+        for path in older[keep:]:
+            os.remove(path)
+            removed.append(path)
+    return removed
+
+
+def site_pages(root):
+    """HTML pages at the top of the site"""
+    return sorted(glob.glob(os.path.join(root, '*.html')))
+
+
+def _local_asset(html_path, url):
+    """Absolute path an asset URL of a page points at, or None"""
+    if not is_local(url) or url.startswith(('#', 'mailto:', 'javascript:')):
+        return None
+    base = os.path.dirname(os.path.abspath(html_path))
+    return os.path.normpath(os.path.join(base, url.split('?')[0].split('#')[0]))
+
+
+def page_assets(html_path, html=None):
+    """Absolute paths of the local scripts, stylesheets and other <link>ed
+    files a page loads, as referenced (hashed names included)"""
+    if html is None:
+        html = read_page(html_path)
+    paths = []
+    for _, _, url in asset_urls(html):
+        path = _local_asset(html_path, url)
+        if path is not None and path not in paths:
+            paths.append(path)
+    return paths
+
+
+def rewrite_page(html, html_path, renames):
+    """Point a page's asset URLs at new files.
+
+    renames maps the absolute path an asset was built from to the absolute
+    path of its hashed copy; URLs already pointing at an older hashed copy
+    are updated as well.
+    """
+    base = os.path.dirname(os.path.abspath(html_path))
+    for start, end, url in reversed(asset_urls(html)):
+        path = _local_asset(html_path, url)
+        if path is None:
+            continue
+        target = renames.get(logical_path(path))
+        if target is not None:
+            html = html[:start] + os.path.relpath(target, base).replace(os.sep, '/') + html[end:]
+    return html
+
+
+def hash_page_assets(pages):
+    """Write hashed copies of every script and stylesheet the pages load;
+    return {built-from path: hashed path}"""
+    renames = {}
+    for page in pages:
+        for path in page_assets(page):
+            source = logical_path(path)
+            if (source not in renames and source.endswith(HASHED_EXTENSIONS)
+                    and os.path.exists(source)):
+                renames[source] = write_hashed(source)
+    return renames
+
+
+def precache_entries(root, pages, extra=()):
+    """{'url', 'revision'} for every page, the assets the pages load and the
+    extra files (such as lazy chunks), with URLs relative to the site root"""
+    entries = {}
+
+    def add(path):
+        if not os.path.exists(path):
+            return
+        url = os.path.relpath(path, root).replace(os.sep, '/')
+        if url.startswith('..') or url in entries:
+            return
+        if HASHED_NAME.match(path):
+            revision = None
+        else:
+            with open(path, 'rb') as f:
+                revision = asset_hash(f.read())
+        entries[url] = revision
+
+    for page in pages:
+        add(page)
+        for path in page_assets(page):
+            add(path)
+    for path in extra:
+        add(path)
+    return [{'url': url, 'revision': revision} for url, revision in sorted(entries.items())]
+
+
+def write_precache_manifest(root, pages, extra=()):
+    """Write precache-manifest.js at the site root; return its version"""
+    entries = precache_entries(root, pages, extra)
+    version = asset_hash(json.dumps(entries, sort_keys=True).encode('utf-8'))
+    manifest = json.dumps({'version': version, 'entries': entries}, indent=2)
+    _write_atomic(os.path.join(root, PRECACHE_FILE),
+                  PRECACHE_TEMPLATE.format(manifest=manifest).encode('utf-8'))
+    return version, entries
+
+
+def chunk_files(root, manifest_path):
+    """Files listed in the lazy chunk manifest (see lazy_chunks.py)"""
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            chunks = json.load(f)
+    except (OSError, ValueError):
+        return []
+    return [os.path.normpath(os.path.join(root, entry['src'])) for entry in chunks.values()]
+
+
+def update_pages(pages, renames):
+    """Rewrite the asset URLs of every page that changes; return those pages"""
+    changed = []
+    for page in pages:
+        html = read_page(page)
+        updated = rewrite_page(html, page, renames)
+        if updated != html:
+            _write_atomic(page, updated.encode('utf-8'))
+            changed.append(page)
+    return changed
+
+
+def main():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description='Content-hash the site assets and write the precache manifest')
+    parser.add_argument('--root', default=os.path.dirname(script_dir), help='site root (default: repository root)')
+    parser.add_argument('pages', nargs='*', help='pages to process (default: every *.html in the root)')
+    parser.add_argument('--no-hash', action='store_true',
+                        help='only regenerate the precache manifest')
+    parser.add_argument('--prune', action='store_true',
+                        help='only remove hashed copies the deployed precache manifest no longer '
+                             'lists (run after deploying it)')
+    parser.add_argument('--keep', type=int, default=1, metavar='N',
+                        help='with --prune, older copies to keep per file (default: 1)')
+    args = parser.parse_args()
+
+    args.root = os.path.abspath(args.root)
+    if args.prune:
+        try:
+            removed = prune_hashed(args.root, args.keep)
+        except ValueError as error:
+            print(f"Error: {error}")
+            return 1
+        for path in removed:
+            print(f"Removed {os.path.relpath(path, args.root)}")
+        print(f"Pruned {len(removed)} hashed copies")
+        return 0
+    pages = [os.path.abspath(page) for page in args.pages] or site_pages(args.root)
+    if not args.no_hash:
+        renames = hash_page_assets(pages)
+        for source, target in renames.items():
+            print(f"{os.path.relpath(source, args.root)} -> {os.path.basename(target)}")
+        changed = update_pages(pages, renames)
+        print(f"Rewrote asset URLs in {len(changed)} of {len(pages)} pages")
+    extra = chunk_files(args.root, os.path.join(script_dir, MANIFEST_FILE))
+    version, entries = write_precache_manifest(args.root, pages, extra)
+    print(f"Wrote {PRECACHE_FILE}: {len(entries)} entries, version {version}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
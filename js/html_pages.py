@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Helpers for reading the script tags and inline event handlers of the app's
+HTML pages, shared by the split tooling.
+"""
+
+import os
+import re
+from collections import namedtuple
+
+# start/end: span of the whole tag, body_start/body_end: span of the inline
+# code, attrs: attribute name -> value (None for bare attributes)
+ScriptTag = namedtuple('ScriptTag', 'start end attrs body_start body_end')
+StyleTag = namedtuple('StyleTag', 'start end attrs body_start body_end')
+LinkTag = namedtuple('LinkTag', 'start end attrs')
+
+_SCRIPT = re.compile(r'<script\b([^>]*)>(.*?)</script\s*>', re.IGNORECASE | re.DOTALL)
+_STYLE = re.compile(r'<style\b([^>]*)>(.*?)</style\s*>', re.IGNORECASE | re.DOTALL)
+_LINK = re.compile(r'<link\b([^>]*)>', re.IGNORECASE)
+_HTML_COMMENT = re.compile(r'<!--.*?-->', re.DOTALL)
+_ATTRIBUTE = re.compile(r'''([^\s=/>]+)(?:\s*=\s*("[^"]*"|'[^']*'|[^\s>]+))?''')
+_HANDLER = re.compile(r'''\son[a-z]+\s*=\s*("[^"]*"|'[^']*')''', re.IGNORECASE)
+_ASSET = re.compile(r'''<(?:script|link)\b[^>]*?\s(?:src|href)\s*=\s*(["'])(.*?)\1''',
+                    re.IGNORECASE | re.DOTALL)
+# name.<content hash>.ext, as written by hashed_assets.py
+HASHED_NAME = re.compile(r'^(.*)\.[0-9a-f]{10}(\.[A-Za-z0-9]+)$')
+
+# Script types the browser executes as classic JavaScript
+_JS_TYPES = ('', 'text/javascript', 'application/javascript')
+
+
+def read_page(path):
+    """Return the text of an HTML page"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def parse_attributes(text):
+    """Parse the attributes of a start tag into a dict"""
+    attrs = {}
+    for m in _ATTRIBUTE.finditer(text):
+        value = m.group(2)
+        if value is not None and value[:1] in ('"', "'"):
+            value = value[1:-1]
+        attrs[m.group(1).lower()] = value
+    return attrs
+
+
+def _blank_comments(html):
+    """Replace HTML comments with spaces so offsets stay valid"""
+    return _HTML_COMMENT.sub(lambda m: ' ' * len(m.group()), html)
+
+
+def parse_script_tags(html):
+    """Return the ScriptTags of a page in document order (commented-out tags excluded)"""
+    tags = []
+    for m in _SCRIPT.finditer(_blank_comments(html)):
+        tags.append(ScriptTag(m.start(), m.end(), parse_attributes(m.group(1)),
+                              m.start(2), m.end(2)))
+    return tags
+
+
+def _blank_script_bodies(html):
+    """Page with comments and inline script code replaced by spaces"""
+    blanked = _blank_comments(html)
+    for tag in parse_script_tags(html):
+        blanked = blanked[:tag.body_start] + ' ' * (tag.body_end - tag.body_start) + blanked[tag.body_end:]
+    return blanked
+
+
+def parse_style_tags(html):
+    """Return the StyleTags of a page in document order (markup inside
+    scripts, such as `<style>` built in a template literal, excluded)"""
+    return [StyleTag(m.start(), m.end(), parse_attributes(m.group(1)), m.start(2), m.end(2))
+            for m in _STYLE.finditer(_blank_script_bodies(html))]
+
+
+def parse_link_tags(html):
+    """Return the LinkTags of a page in document order (commented-out tags
+    and markup inside scripts excluded)"""
+    return [LinkTag(m.start(), m.end(), parse_attributes(m.group(1)))
+            for m in _LINK.finditer(_blank_script_bodies(html))]
+
+
+def script_preloads(html):
+    """LinkTags of the page's <link rel="preload" as="script"> hints"""
+    return [tag for tag in parse_link_tags(html)
+            if (tag.attrs.get('rel') or '').lower() == 'preload'
+            and (tag.attrs.get('as') or '').lower() == 'script' and tag.attrs.get('href')]
+
+
+def tag_line_span(html, start, end):
+    """Span of a tag widened to its whole line (newline included) when
+    nothing else is on that line"""
+    line_start = html.rfind('\n', 0, start) + 1
+    line_end = html.find('\n', end)
+    if not html[line_start:start].strip() and line_end >= 0 and not html[end:line_end].strip():
+        return line_start, line_end + 1
+    return start, end
+
+
+def is_classic_script(tag):
+    """Whether a tag holds classic JavaScript (not a module or data block)"""
+    return (tag.attrs.get('type') or '').strip().lower() in _JS_TYPES
+
+
+def inline_scripts(html):
+    """Code of every inline classic script on the page"""
+    return [html[tag.body_start:tag.body_end] for tag in parse_script_tags(html)
+            if 'src' not in tag.attrs and is_classic_script(tag)]
+
+
+def inline_handlers(html):
+    """Code of every inline event handler attribute (onclick=... etc.)"""
+    stripped = _SCRIPT.sub(lambda m: ' ' * len(m.group()), _blank_comments(html))
+    return [value[1:-1] for value in _HANDLER.findall(stripped)]
+
+
+def asset_urls(html):
+    """(start, end, url) of every <script src> and <link href> value on a page"""
+    return [(m.start(2), m.end(2), m.group(2)) for m in _ASSET.finditer(_blank_script_bodies(html))]
+
+
+def logical_path(path):
+    """Path of an asset without its content hash (js/app.0123456789.js -> js/app.js)"""
+    m = HASHED_NAME.match(path)
+    return m.group(1) + m.group(2) if m else path
+
+
+def is_local(src):
+    """Whether a script src points at a file in this project"""
+    return not re.match(r'^([a-z]+:)?//', src, re.IGNORECASE) and not src.startswith('data:')
+
+
+def local_script_paths(html_path, html=None):
+    """Absolute paths of the local external scripts a page loads, in order
+    (content-hashed names are mapped back to the file they were built from)"""
+    if html is None:
+        html = read_page(html_path)
+    base = os.path.dirname(os.path.abspath(html_path))
+    paths = []
+    for tag in parse_script_tags(html):
+        src = tag.attrs.get('src')
+        if src and is_local(src) and is_classic_script(tag):
+            path = os.path.normpath(os.path.join(base, src.split('?')[0].split('#')[0]))
+            paths.append(logical_path(path))
+    return paths
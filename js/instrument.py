@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Call-count and timing instrumentation for emitted bundles.
+
+With optimize_split.py --instrument, every bundle and chunk starts with a
+small profiler runtime and one line per top-level function it declares:
+
+    foo = __dsProf.wrap('foo', foo);
+
+Function declarations are hoisted, so the wrappers are in place before any
+code of the bundle runs, and every call by name, handler or captured
+reference goes through them. The functions come from the declaration spans
+of the index. Functions assigned to variables are not hoisted, so they
+stay unwrapped. Generators are skipped too (a call only creates the
+iterator, so its time says nothing), and so are functions the code calls
+with `new`: a constructor keeps its own identity for instanceof checks and
+the properties set on it.
+
+In the browser console:
+
+    __dsProf.table()        top functions by self time
+    __dsProf.dump()         counters as a JSON string
+    __dsProf.download()     save the JSON (load it with profile_report.py)
+    __dsProf.reset()        zero the counters
+
+Times are main-thread milliseconds: for an async function only the part up
+to its first await is counted. Without --instrument nothing is emitted.
+"""
+
+import io
+
+from js_tokenizer import HOISTED_FUNCTION_KINDS, tokenize
+
+DUMP_VERSION = 1
+
+RUNTIME = """        // ============================================================================
+        // Profiler (generated by optimize_split.py --instrument)
+        // ============================================================================
+        if (!window.__dsProf) {
+            window.__dsProf = (function () {
+                var now = window.performance ? function () { return performance.now(); } : Date.now;
+                var stats = {};
+                var childTime = 0;
+                function entry(name) {
+                    return stats[name] || (stats[name] = { calls: 0, total: 0, self: 0, max: 0, depth: 0 });
+                }
+                function wrap(name, fn) {
+                    if (typeof fn !== 'function' || fn.__dsProfName) {
+                        return fn;
+                    }
+                    var stat = entry(name);
+                    var wrapped = function () {
+                        var outerChildTime = childTime;
+                        var start = now();
+                        stat.calls++;
+                        stat.depth++;
+                        childTime = 0;
+                        try {
+                            return new.target ? Reflect.construct(fn, arguments, new.target)
+                                              : fn.apply(this, arguments);
+                        } finally {
+                            var elapsed = now() - start;
+                            stat.depth--;
+                            // Recursive calls already count towards the outermost one
+                            if (stat.depth === 0) {
+                                stat.total += elapsed;
+                            }
+                            stat.self += elapsed - childTime;
+                            if (elapsed > stat.max) {
+                                stat.max = elapsed;
+                            }
+                            childTime = outerChildTime + elapsed;
+                        }
+                    };
+                    wrapped.__dsProfName = name;
+                    wrapped.prototype = fn.prototype;
+                    return wrapped;
+                }
+                function snapshot() {
+                    var functions = {};
+                    Object.keys(stats).forEach(function (name) {
+                        var stat = stats[name];
+                        if (stat.calls) {
+                            functions[name] = { calls: stat.calls, total_ms: stat.total,
+                                                self_ms: stat.self, max_ms: stat.max };
+                        }
+                    });
+                    return { version: %(version)d, created: new Date().toISOString(),
+                             url: location.href, userAgent: navigator.userAgent, functions: functions };
+                }
+                return {
+                    wrap: wrap,
+                    stats: stats,
+                    snapshot: snapshot,
+                    dump: function () {
+                        return JSON.stringify(snapshot(), null, 2);
+                    },
+                    download: function (filename) {
+                        var blob = new Blob([JSON.stringify(snapshot())], { type: 'application/json' });
+                        var link = document.createElement('a');
+                        link.href = URL.createObjectURL(blob);
+                        link.download = filename || 'duty-shifts-profile-' + Date.now() + '.json';
+                        document.body.appendChild(link);
+                        link.click();
+                        link.remove();
+                        setTimeout(function () { URL.revokeObjectURL(link.href); }, 0);
+                    },
+                    reset: function () {
+                        Object.keys(stats).forEach(function (name) {
+                            var stat = stats[name];
+                            stat.calls = stat.total = stat.self = stat.max = 0;
+                        });
+                    },
+                    table: function (limit) {
+                        var rows = Object.keys(stats).map(function (name) {
+                            var stat = stats[name];
+                            return { name: name, calls: stat.calls, self_ms: +stat.self.toFixed(2),
+                                     total_ms: +stat.total.toFixed(2) };
+                        }).filter(function (row) { return row.calls; });
+                        rows.sort(function (a, b) { return b.self_ms - a.self_ms; });
+                        console.table(rows.slice(0, limit || 30));
+                    }
+                };
+            })();
+        }
+""" % {'version': DUMP_VERSION}
+
+WRAP_TEMPLATE = "        {name} = __dsProf.wrap('{name}', {name});\n"
+
+
+def unwrapped_names(data):
+    """Names of generator functions and of functions called with `new` in source bytes"""
+    names = set()
+    before = [None, None]
+    for token in tokenize(io.BytesIO(data)):
+        if token.kind == 'name':
+            if before[-1] == b'new' or before == [b'function', b'*']:
+                names.add(token.value.decode())
+        before = [before[-1], token.value]
+    return names
+
+
+def wrapped_names(segments, skip=()):
+    """Names of the function declarations among segment records, except `skip`"""
+    names = []
+    for record in segments:
+        if record.get('kind') in HOISTED_FUNCTION_KINDS:
+            names.extend(name for name in record['names'] if name not in names and name not in skip)
+    return names
+
+
+def prelude(names):
+    """Profiler runtime plus one wrap statement per name, for a bundle header"""
+    if not names:
+        return ''
+    return RUNTIME + ''.join(WRAP_TEMPLATE.format(name=name) for name in names) + '\n'
@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""
+Single-pass streaming JavaScript tokenizer used by the split tooling.
+
+The tokenizer reads the source in fixed-size chunks, so memory stays bounded
+by the chunk size plus the longest single token (a long template literal or
+comment). It understands strings, template literals (including nested
+`${...}` expressions), regular expression literals and comments, so braces
+inside any of those never affect the nesting depth.
+
+On top of the token stream, scan_declarations() reports the exact byte spans
+of every top-level declaration:
+- function / async function declarations
+- const/let/var bound to an arrow function or a function expression
+- any other const/let/var statement ('variable')
+- class declarations
+"""
+
+import io
+import re
+import sys
+from collections import namedtuple
+
+CHUNK_SIZE = 1 << 16
+
+# kind: 'name', 'number', 'string', 'template', 'regex', 'punct', 'comment'
+# value: raw bytes of the token, start/end: absolute byte offsets,
+# nl_before: True when a line break separates the token from the previous one
+Token = namedtuple('Token', 'kind value start end nl_before')
+
+# name: first bound name ('' for destructuring), names: every bound name,
+# lead: end of the previous code token, so [lead, start) holds only the
+# whitespace and comments that document this declaration
+Declaration = namedtuple('Declaration', 'name kind start end lead names')
+
+FUNCTION_KINDS = ('function', 'async function', 'arrow', 'function expression')
+# Declaration kinds hoisted together with their value (function declarations)
+HOISTED_FUNCTION_KINDS = ('function', 'async function')
+
+# Every pattern may stop at the end of the buffer (\Z). A token that reaches
+# the end of the buffer is re-matched after the next chunk has been read.
+_TEMPLATE_BODY = rb'(?:[^`\\$]|\\[\s\S]|\$(?!\{))*(?:`|\$\{|\\?\$?\Z)'
+_CODE = re.compile(rb'''
+    (?P<ws>[ \t\r\n\f\v]+)
+  | (?P<comment>//[^\n]*|/\*[\s\S]*?(?:\*/|\Z))
+  | (?P<name>[A-Za-z_$\x80-\xff][\w$\x80-\xff]*)
+  | (?P<number>0[xXbBoO][0-9a-fA-F_]+n?|(?:\d[\d_]*\.?[\d_]*|\.\d[\d_]*)(?:[eE][+-]?\d+)?n?)
+  | (?P<string>"(?:[^"\\\n]|\\[\s\S])*(?:"|\\?\Z)|'(?:[^'\\\n]|\\[\s\S])*(?:'|\\?\Z))
+  | (?P<template>`''' + _TEMPLATE_BODY + rb''')
+  | (?P<punct>>>>=|\.\.\.|===|!==|\*\*=|<<=|>>=|>>>|&&=|\|\|=|\?\?=|=>|==|!=|<=|>=
+        |&&|\|\||\?\?|\?\.(?!\d)|\+\+|--|\+=|-=|\*=|%=|&=|\|=|\^=|\*\*|<<|>>|[^\s])
+''', re.VERBOSE)
+_TEMPLATE_CONTINUE = re.compile(rb'\}' + _TEMPLATE_BODY)
+_REGEX = re.compile(rb'/(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[A-Za-z]*')
+
+# Keywords after which a '/' starts a regular expression, not a division
+_REGEX_AFTER_KEYWORDS = frozenset([
+    b'return', b'typeof', b'instanceof', b'in', b'of', b'new', b'delete',
+    b'void', b'throw', b'case', b'do', b'else', b'yield', b'await',
+])
+# Keywords whose parenthesised head is followed by a statement, not an operator
+_STATEMENT_HEAD_KEYWORDS = frozenset([b'if', b'while', b'for', b'with'])
+# Stack entry for a '(' opening such a head
+_HEAD_PAREN = b'head('
+# Punctuators that end an expression: a '/' after them divides, a line
+# break after them never ends a statement
+EXPRESSION_END_PUNCT = frozenset([b')', b']', b'}', b'++', b'--'])
+OPENERS = frozenset([b'{', b'(', b'['])
+CLOSERS = frozenset([b'}', b')', b']'])
+DECL_KEYWORDS = frozenset([b'const', b'let', b'var'])
+# Names on a new line that still continue the previous expression
+_CONTINUING_NAMES = frozenset([b'in', b'instanceof', b'of'])
+# A statement starting with one of these continues the previous line
+_CONTINUATION = re.compile(rb'\s*[(\[`+\-/]')
+# Tokens after which a new line may end a statement (automatic semicolon)
+_STATEMENT_END_KINDS = frozenset(['name', 'number', 'string', 'regex'])
+
+
+# Reserved words and literals that are never references to a global
+JS_KEYWORDS = frozenset(
+    'await break case catch class const continue debugger default delete do else '
+    'export extends false finally for function if import in instanceof let new null '
+    'of return static super switch this throw true try typeof undefined var void '
+    'while with yield async get set arguments'.split())
+_GLOBAL_OBJECTS = frozenset([b'window', b'globalThis', b'self'])
+_BARE_NAME = re.compile(rb'[\'"`]([A-Za-z_$][\w$]*)[\'"`]\Z')
+_HANDLER_CALL = re.compile(rb'(?<![\w$.])([A-Za-z_$][\w$]*)\s*\(')
+
+
+def _regex_allowed(prev, closes_head=False):
+    """Whether a '/' following token `prev` starts a regex literal
+    (closes_head: prev is the ')' of an if/while/for/with head)"""
+    if prev is None:
+        return True
+    if prev.kind == 'name':
+        return prev.value in _REGEX_AFTER_KEYWORDS
+    if prev.kind == 'punct':
+        return closes_head or prev.value not in EXPRESSION_END_PUNCT
+    if prev.kind == 'template':
+        return prev.value.endswith(b'${')
+    return False
+
+
+def depth_change(token):
+    """Net change in bracket nesting caused by a token"""
+    if token.kind == 'punct':
+        if token.value in OPENERS:
+            return 1
+        if token.value in CLOSERS:
+            return -1
+    elif token.kind == 'template':
+        return token.value.endswith(b'${') - token.value.startswith(b'}')
+    return 0
+
+
+def tokenize(stream, comments=False, chunk_size=CHUNK_SIZE, base=0):
+    """Yield Tokens read from a binary stream in a single pass.
+
+    Whitespace is never yielded; comments only when `comments` is True.
+    `base` is added to every offset, so a slice of a larger file can be
+    tokenized with file-relative positions.
+    """
+    buf = b''
+    pos = 0
+    eof = False
+    prev = None
+    nl_before = False
+    # Open brackets; b'${' marks a template expression awaiting its '}',
+    # _HEAD_PAREN the '(' of a statement head
+    stack = []
+    closes_head = False
+
+    # Keep a little lookahead so multi-character punctuators are never split
+    low_water = max(chunk_size, 16)
+
+    while True:
+        while not eof and len(buf) - pos < low_water:
+            chunk = stream.read(chunk_size)
+            if chunk:
+                buf = buf[pos:] + chunk
+                base += pos
+                pos = 0
+            else:
+                eof = True
+        if pos >= len(buf):
+            return
+
+        c = buf[pos]
+        if c == 0x7d and stack and stack[-1] == b'${':
+            m = _TEMPLATE_CONTINUE.match(buf, pos)
+            kind = 'template'
+        elif c == 0x2f and _regex_allowed(prev, closes_head) and buf[pos + 1:pos + 2] not in (b'/', b'*'):
+            m = _REGEX.match(buf, pos)
+            kind = 'regex'
+            if m is None and not eof and buf.find(b'\n', pos) < 0:
+                # A regex literal never spans lines: read up to the line break
+                chunk = stream.read(chunk_size)
+                if chunk:
+                    buf = buf[pos:] + chunk
+                    base += pos
+                    pos = 0
+                else:
+                    eof = True
+                continue
+            if m is None:
+                m = _CODE.match(buf, pos)
+                kind = m.lastgroup
+        else:
+            m = _CODE.match(buf, pos)
+            kind = m.lastgroup
+
+        if m.end() == len(buf) and not eof:
+            # The token may extend past the buffer: read more and re-match
+            chunk = stream.read(chunk_size)
+            if chunk:
+                buf = buf[pos:] + chunk
+                base += pos
+                pos = 0
+                continue
+            eof = True
+
+        value = m.group()
+        pos = m.end()
+        if kind == 'ws':
+            if b'\n' in value:
+                nl_before = True
+            continue
+        if kind == 'comment':
+            if comments:
+                yield Token(kind, value, base + m.start(), base + pos, nl_before)
+            if b'\n' in value:
+                nl_before = True
+            continue
+
+        closes_head = False
+        if kind == 'punct':
+            if value in OPENERS:
+                head = (value == b'(' and prev is not None and prev.kind == 'name'
+                        and prev.value in _STATEMENT_HEAD_KEYWORDS)
+                stack.append(_HEAD_PAREN if head else value)
+            elif value in CLOSERS and stack:
+                closes_head = stack.pop() == _HEAD_PAREN
+        elif kind == 'template':
+            if value[0] == 0x7d:
+                stack.pop()
+            if value.endswith(b'${'):
+                stack.append(b'${')
+
+        prev = Token(kind, value, base + m.start(), base + pos, nl_before)
+        nl_before = False
+        yield prev
+
+
+def referenced_names(token, prev, before_prev=None):
+    """Names a token may reference as globals.
+
+    Plain identifiers count unless they follow '.' or '?.' (property access),
+    except for properties of the global object such as `window.renderCalendar`.
+    Strings and template literals are searched for `name(` calls, which is
+    how inline handlers such as onclick="openRankingsModal()" are built, and
+    a string holding a bare identifier counts as a possible lookup by name.
+    """
+    if token.kind == 'name':
+        if prev is not None and prev.kind == 'punct' and prev.value in (b'.', b'?.'):
+            if before_prev is None or before_prev.value not in _GLOBAL_OBJECTS:
+                return ()
+        name = token.value.decode('utf-8', 'replace')
+        return () if name in JS_KEYWORDS else (name,)
+    if token.kind in ('string', 'template'):
+        if b'(' in token.value:
+            return tuple(m.group(1).decode() for m in _HANDLER_CALL.finditer(token.value))
+        m = _BARE_NAME.match(token.value)
+        if m:
+            return (m.group(1).decode(),)
+    return ()
+
+
+def names_referenced_in(data):
+    """Set of names a snippet of JavaScript source (bytes) may reference"""
+    names = set()
+    prev = before_prev = None
+    for token in tokenize(io.BytesIO(data)):
+        names.update(referenced_names(token, prev, before_prev))
+        prev, before_prev = token, prev
+    return names
+
+
+def ends_statement(prev, token):
+    """Whether a line break between prev and token inserts a semicolon"""
+    if not token.nl_before or prev is None:
+        return False
+    if prev.kind in _STATEMENT_END_KINDS or (prev.kind == 'template' and prev.value.endswith(b'`')):
+        pass
+    elif prev.kind != 'punct' or prev.value not in EXPRESSION_END_PUNCT:
+        return False
+    if token.kind == 'name':
+        return token.value not in _CONTINUING_NAMES
+    if token.kind in ('number', 'string'):
+        return True
+    return token.kind == 'punct' and token.value in (b'++', b'--', b'{', b'!', b'~')
+
+
+def cut_spans(data, spans):
+    """Source bytes with the given (start, end) spans cut out.
+
+    Each cut leaves a line break in the data's own style (CRLF or LF), plus
+    a `;` when the code after it starts with a token that would otherwise
+    continue the statement before it.
+    """
+    newline = b'\r\n' if b'\r\n' in data else b'\n'
+    for start, end in sorted(spans, reverse=True):
+        filler = newline + b';' if _CONTINUATION.match(data, end) else newline
+        data = data[:start] + filler + data[end:]
+    return data
+
+
+def _classify_initializer(head):
+    """Kind of a const/let/var from the first depth-0 tokens after '='"""
+    values = [t.value for t in head]
+    if values[:1] == [b'async']:
+        values = values[1:]
+    if values[:1] == [b'function']:
+        return 'function expression'
+    if len(values) >= 2 and head[-len(values)].kind == 'name' and values[1] == b'=>':
+        return 'arrow'
+    if values[:3] == [b'(', b')', b'=>']:
+        return 'arrow'
+    return 'variable'
+
+
+def iter_declarations(tokens, base=0):
+    """Yield top-level Declarations from a token stream.
+
+    `base` is the offset the stream starts at; it becomes the lead of a
+    declaration that has no code before it.
+    """
+    depth = 0
+    prev = None
+    last_code_end = None
+    current = None  # dict describing the declaration being read
+    stmt_start = True
+
+    for token in tokens:
+        value = token.value
+        new_depth = max(depth + depth_change(token), 0)
+        if current is not None and depth == 0 and ends_statement(prev, token):
+            yield _finish(current, prev.end)
+            current = None
+            stmt_start = True
+
+        if current is None and depth == 0 and token.kind == 'name' and (stmt_start or token.nl_before):
+            lead = base if last_code_end is None else last_code_end
+            if value == b'function' or value == b'class':
+                current = {'kind': value.decode(), 'start': token.start, 'lead': lead,
+                           'names': [], 'state': 'name'}
+            elif value == b'async':
+                current = {'kind': 'async function', 'start': token.start, 'lead': lead,
+                           'names': [], 'state': 'async'}
+            elif value in DECL_KEYWORDS:
+                current = {'kind': 'variable', 'start': token.start, 'lead': lead,
+                           'names': [], 'state': 'binding', 'head': [], 'declarators': 1}
+        elif current is not None:
+            state = current['state']
+            if state == 'async':
+                current['state'] = 'name' if value == b'function' else 'abandon'
+            elif state == 'name':
+                if token.kind == 'name':
+                    current['names'].append(value.decode())
+                    current['state'] = 'body'
+                elif value != b'*':
+                    current['state'] = 'abandon'
+            elif state == 'binding':
+                if token.kind == 'name' and depth == 0:
+                    current['names'].append(value.decode())
+                    current['state'] = 'after-binding'
+                else:
+                    current['state'] = 'pattern'
+            elif state == 'after-binding' and depth == 0:
+                current['state'] = 'init' if value == b'=' else 'rest'
+            elif state == 'init' and (depth == 0 or new_depth == 0) and len(current['head']) < 4:
+                current['head'].append(token)
+            if depth == 0 and value == b',' and token.kind == 'punct' and current['kind'] == 'variable':
+                current['declarators'] += 1
+                current['state'] = 'binding'
+
+        if current is not None and current['state'] == 'abandon':
+            current = None
+
+        depth = new_depth
+
+        if current is not None and depth == 0:
+            if current['kind'] in ('function', 'async function', 'class'):
+                if value == b'}' and token.kind == 'punct':
+                    yield _finish(current, token.end)
+                    current = None
+                    stmt_start = True
+                    prev = token
+                    last_code_end = token.end
+                    continue
+            elif value == b';' and token.kind == 'punct':
+                yield _finish(current, token.end)
+                current = None
+                stmt_start = True
+                prev = token
+                last_code_end = token.end
+                continue
+
+        stmt_start = depth == 0 and token.kind == 'punct' and value in (b';', b'}')
+        prev = token
+        last_code_end = token.end
+
+    if current is not None and prev is not None:
+        yield _finish(current, prev.end)
+
+
+def _finish(current, end):
+    """Build a Declaration from the scanner state"""
+    kind = current['kind']
+    if kind == 'variable' and current['declarators'] == 1 and current['head']:
+        kind = _classify_initializer(current['head'])
+    names = tuple(current['names'])
+    return Declaration(names[0] if names else '', kind, current['start'], end,
+                       current['lead'], names)
+
+
+def scan_declarations(path, chunk_size=CHUNK_SIZE):
+    """Return the top-level Declarations of a JavaScript file"""
+    with open(path, 'rb') as f:
+        return list(iter_declarations(tokenize(f, chunk_size=chunk_size)))
+
+
+def iter_segments(size, declarations, pos=0):
+    """Yield (start, end, declaration) covering bytes [pos, size) of a file.
+
+    Stretches of top-level code between declarations are yielded with
+    declaration set to None.
+    """
+    for decl in declarations:
+        if decl.lead > pos:
+            yield pos, decl.lead, None
+        yield decl.lead, decl.end, decl
+        pos = decl.end
+    if pos < size:
+        yield pos, size, None
+
+
+def main():
+    import time
+    for path in sys.argv[1:]:
+        started = time.perf_counter()
+        decls = scan_declarations(path)
+        elapsed = time.perf_counter() - started
+        counts = {}
+        for decl in decls:
+            counts[decl.kind] = counts.get(decl.kind, 0) + 1
+        summary = ', '.join(f"{kind}: {n}" for kind, n in sorted(counts.items()))
+        print(f"{path}: {len(decls)} declarations in {elapsed:.3f}s ({summary})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Lazy-loaded chunks for rarely used duty-shifts features.
+
+Each chunk starts from a few entry functions and takes along every helper
+that only the chunk itself uses. The chunk's code is written to its own
+file; in the main bundle each exported name becomes a small stub that loads
+the chunk on first call and then forwards the call, so the stub returns a
+Promise. Entry points whose return value is used synchronously by code
+outside the chunk are left in the main bundle, together with the helpers
+only they use; a chunk left with no functions is not written at all.
+Chunks hold only functions: everything else, and every helper that code
+outside a chunk also calls, still loads up front (with the shipped
+CHUNKS about a fifth of the page's local script bytes becomes lazy).
+
+Because of that Promise, an exception thrown by a chunked function (or a
+chunk that fails to load) no longer reaches the caller's try/catch: unless
+the caller awaits the call, it surfaces as an unhandled rejection.
+
+A chunk can also be a whole existing script (the AI assistant), in which
+case its window.x = ... exports are stubbed and the page stops loading it
+up front.
+"""
+
+import io
+import json
+import os
+
+from call_graph import is_function
+from html_pages import logical_path, parse_script_tags, script_preloads, tag_line_span
+from js_tokenizer import ends_statement, tokenize
+
+# name -> entry functions (or a whole file); order is the manifest order
+CHUNKS = {
+    'step-calculation': {'entries': ['renderStep1_SpecialHolidays', 'renderStep2_Weekends',
+                                     'renderStep3_SemiNormal', 'renderStep4_Normal']},
+    'rankings': {'entries': ['openRankingsModal']},
+    'excel': {'entries': ['generateExcelFilesForCurrentMonth', 'showExcelPreview']},
+    'ai-assistant': {'file': 'duty-shifts-ai-assistant.js'},
+}
+
+CHUNK_FILE_PATTERN = 'duty-shifts-chunk-{name}.js'
+MANIFEST_FILE = 'duty-shifts-chunks.json'
+
+# Tokens after which a call's result is discarded or awaited, so a stub
+# returning a Promise behaves the same (')' closes an if/for/while head)
+_STATEMENT_PUNCT = frozenset([b';', b'{', b'}', b')'])
+_STATEMENT_NAMES = frozenset([b'await', b'else', b'do', b'void'])
+
+LOADER_TEMPLATE = """        // ============================================================================
+        // Lazy chunk loader (generated by lazy_chunks.py)
+        // ============================================================================
+        var __dutyShiftsChunks = {manifest};
+        var __dutyShiftsChunkLoads = {{}};
+        function __dutyShiftsLoadChunk(chunk, name, self, args) {{
+            var stub = window[name];
+            var pending = __dutyShiftsChunkLoads[chunk];
+            if (!pending) {{
+                pending = __dutyShiftsChunkLoads[chunk] = new Promise(function (resolve, reject) {{
+                    var script = document.createElement('script');
+                    script.src = __dutyShiftsChunks[chunk].src;
+                    script.charset = 'UTF-8';
+                    script.onload = resolve;
+                    script.onerror = function () {{
+                        delete __dutyShiftsChunkLoads[chunk];
+                        reject(new Error('Failed to load ' + script.src));
+                    }};
+                    document.head.appendChild(script);
+                }});
+            }}
+            return pending.then(function () {{
+                var real = window[name];
+                if (typeof real !== 'function' || real === stub) {{
+                    throw new Error(name + ' was not defined by chunk ' + chunk);
+                }}
+                return real.apply(self, args);
+            }});
+        }}
+{stubs}
+"""
+
+STUB_TEMPLATE = ("        function {name}() {{ "
+                 "return __dutyShiftsLoadChunk('{chunk}', '{name}', this, arguments); }}\n")
+
+
+def window_exports(path):
+    """Names a script publishes with `window.name = ...`"""
+    names = []
+    with open(path, 'rb') as f:
+        recent = []
+        for token in tokenize(f):
+            recent = (recent + [token])[-4:]
+            if (len(recent) == 4 and recent[0].value == b'window' and recent[1].value == b'.'
+                    and recent[2].kind == 'name' and recent[3].value == b'='):
+                name = recent[2].value.decode()
+                if name not in names:
+                    names.append(name)
+    return names
+
+
+def _referrers(graph):
+    """name -> set of declarations referencing it"""
+    referrers = {}
+    for name, refs in graph.edges.items():
+        for ref in refs:
+            referrers.setdefault(ref, set()).add(name)
+    return referrers
+
+
+def _pinned(graph, roots):
+    """Names that must stay in the main bundle because code outside the
+    bundles, or top-level code, uses them at any time"""
+    pinned = set(roots)
+    for refs in graph.top_level.values():
+        pinned |= refs
+    return pinned
+
+
+def chunk_members(graph, entries, pinned, taken=()):
+    """Entry functions plus every function referenced only from inside the chunk"""
+    members = {name for name in entries
+               if name in graph.nodes and is_function(graph.nodes[name]) and name not in taken}
+    referrers = _referrers(graph)
+    changed = True
+    while changed:
+        changed = False
+        for name, decl in graph.nodes.items():
+            if name in members or name in pinned or name in taken or not is_function(decl):
+                continue
+            users = referrers.get(name)
+            if users and users <= members:
+                members.add(name)
+                changed = True
+    return members
+
+
+def sync_value_uses(path, segments, name):
+    """Count call sites of `name` in the given segments whose result is used
+    synchronously (anything but a statement-level or awaited call; a call
+    right after a `case x:` or `default:` label is statement-level)"""
+    target = name.encode()
+    uses = 0
+    with open(path, 'rb') as f:
+        for start, end in segments:
+            f.seek(start)
+            prev = None
+            label_colon = False  # whether prev is the ':' ending a case/default label
+            pending_colons = 0  # ':' still to come in the current case label
+            for token in tokenize(io.BytesIO(f.read(end - start))):
+                if token.kind == 'name' and token.value == target and not (
+                        prev is not None and prev.value in (b'.', b'?.')):
+                    if prev is not None and not (
+                            (prev.kind == 'punct' and prev.value in _STATEMENT_PUNCT)
+                            or (prev.kind == 'name' and prev.value in _STATEMENT_NAMES)
+                            or label_colon or ends_statement(prev, token)):
+                        uses += 1
+                label_colon = False
+                if token.kind == 'name' and token.value in (b'case', b'default'):
+                    pending_colons = 1
+                elif pending_colons and token.kind == 'punct':
+                    if token.value == b'?':
+                        pending_colons += 1
+                    elif token.value == b':':
+                        pending_colons -= 1
+                        label_colon = not pending_colons
+                prev = token
+    return uses
+
+
+def plan_chunks(source, graph, roots, labels, index, script_dir, chunks=CHUNKS):
+    """Return the chunk plan: name -> {'members', 'exports', 'file'?, 'skipped'}
+
+    Chunks whose entries are all blocked are left out of the plan, so they
+    get no file, manifest entry or loader stubs.
+    """
+    pinned = _pinned(graph, roots)
+    segments = {record['name']: (record['start'], record['end'])
+                for record in index.segments(source) if 'name' in record}
+    plan = {}
+    taken = set()
+    for chunk, config in chunks.items():
+        if 'file' in config:
+            path = os.path.join(script_dir, config['file'])
+            if os.path.exists(path):
+                plan[chunk] = {'file': path, 'members': set(),
+                               'exports': window_exports(path), 'skipped': []}
+            continue
+        entries = list(config['entries'])
+        skipped = []
+        while True:
+            members = chunk_members(graph, entries, pinned - set(entries), taken)
+            outside = {user for name in members
+                       for user in _referrers(graph).get(name, ()) if user not in members}
+            # Entry points whose result outside code uses synchronously stay put
+            blocked = [name for name in entries if name in members and sync_value_uses(
+                source, [segments[user] for user in outside if user in segments], name)]
+            if not blocked:
+                break
+            skipped.extend(blocked)
+            entries = [name for name in entries if name not in blocked]
+        if not members:
+            continue
+        exports = sorted(name for name in members
+                         if name in pinned or _referrers(graph).get(name, set()) - members)
+        plan[chunk] = {'members': members, 'exports': exports, 'skipped': skipped}
+        taken |= members
+        for name in members:
+            labels[name] = 'chunk:' + chunk
+    return plan
+
+
+def chunk_src(chunk, entry, src_base):
+    """URL the page loads a chunk from"""
+    if 'src' in entry:
+        return entry['src']
+    if 'file' in entry:
+        return src_base + os.path.basename(entry['file'])
+    return src_base + CHUNK_FILE_PATTERN.format(name=chunk)
+
+
+def manifest(plan, src_base):
+    """JSON-serializable manifest of which names live in which chunk"""
+    return {chunk: {'src': chunk_src(chunk, entry, src_base),
+                    'exports': list(entry['exports']),
+                    'members': sorted(entry['members'])}
+            for chunk, entry in plan.items()}
+
+
+def loader_source(plan, src_base):
+    """Loader runtime plus one stub per exported name, for the main bundle"""
+    runtime = {chunk: {'src': chunk_src(chunk, entry, src_base)} for chunk, entry in plan.items()}
+    stubs = ''.join(STUB_TEMPLATE.format(name=name, chunk=chunk)
+                    for chunk, entry in plan.items() for name in entry['exports'])
+    return LOADER_TEMPLATE.format(manifest=json.dumps(runtime), stubs=stubs)
+
+
+def write_manifest(path, plan, src_base):
+    """Write the chunk manifest next to the bundles"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest(plan, src_base), f, indent=2)
+        f.write('\n')
+    os.replace(tmp_path, path)
+
+
+def drop_script_tags(html, paths, html_path):
+    """Remove the page's <script src> tags that load any of `paths`, and the
+    preload hints for them, so the browser does not fetch them up front"""
+    base = os.path.dirname(os.path.abspath(html_path))
+    targets = {os.path.abspath(path) for path in paths}
+
+    def dropped(url):
+        url = url.split('?')[0].split('#')[0]
+        return logical_path(os.path.normpath(os.path.join(base, url))) in targets
+
+    spans = [(tag.start, tag.end) for tag in parse_script_tags(html)
+             if tag.attrs.get('src') and dropped(tag.attrs['src'])]
+    spans += [(tag.start, tag.end) for tag in script_preloads(html) if dropped(tag.attrs['href'])]
+    for start, end in sorted(spans, reverse=True):
+        start, end = tag_line_span(html, start, end)
+        html = html[:start] + html[end:]
+    return html
+
+
+def print_report(plan, graph, chunks=CHUNKS):
+    """Print which functions moved into each chunk"""
+    for chunk, config in chunks.items():
+        if chunk not in plan and 'entries' in config:
+            print(f"Chunk {chunk}: not written, every entry's return value is used synchronously "
+                  f"({', '.join(config['entries'])})")
+    for chunk, entry in plan.items():
+        if 'file' in entry:
+            size = os.path.getsize(entry['file'])
+            print(f"Chunk {chunk}: {os.path.basename(entry['file'])} ({size} bytes), "
+                  f"stubs for {', '.join(entry['exports']) or 'nothing'}")
+            continue
+        size = sum(graph.nodes[name].end - graph.nodes[name].lead for name in entry['members'])
+        print(f"Chunk {chunk}: {len(entry['members'])} functions ({size} bytes), "
+              f"stubs for {', '.join(entry['exports']) or 'nothing'}")
+        for name in entry['skipped']:
+            print(f"  kept {name} in the main bundle: its return value is used synchronously")
@@ -0,0 +1,738 @@
+#!/usr/bin/env python3
+"""
+Token-level minifier for the emitted duty-shifts bundles.
+
+Works on the js_tokenizer token stream, one top-level segment at a time:
+- comments and whitespace are dropped; a line break is kept only where
+  removing it could change automatic semicolon insertion
+- with drop_console, console.log/debug/info/trace calls are removed
+- with mangle, local variables and parameters of top-level functions get
+  short names. Globals are never renamed, since every bundle shares the
+  page's global scope: a block-scope walk finds the names each function
+  reads as globals (window, innerWidth, a CDN library...), and a name is
+  only shortened when every use of it in the function is bound to a local
+  declaration and no script on the page declares it at top level.
+  Functions using eval, with or class bodies are left alone.
+
+Every token that comes from the original source is recorded in a v3
+source map, so stack traces and the debugger still point at duty-shifts.js.
+"""
+
+import argparse
+import gzip
+import io
+import json
+import os
+import re
+import sys
+
+from js_tokenizer import (DECL_KEYWORDS, EXPRESSION_END_PUNCT, FUNCTION_KINDS, JS_KEYWORDS,
+                          depth_change, tokenize)
+
+# Scripts of duty-shifts.html that only hold debugging aids
+DEBUG_FILES = ('duty-shifts-debug.js', 'duty-shifts-debug-normal.js')
+DEBUG_CONSOLE_METHODS = frozenset([b'log', b'debug', b'info', b'trace'])
+
+# Words that can never be used as a generated name
+_RESERVED_WORDS = frozenset([name.encode() for name in JS_KEYWORDS] + [
+    b'enum', b'implements', b'interface', b'package', b'private', b'protected',
+    b'public', b'NaN', b'Infinity', b'debugger', b'try', b'if', b'do', b'in'])
+
+# Keywords after which a line break ends the statement
+_RESTRICTED = frozenset([b'return', b'throw', b'break', b'continue', b'yield'])
+# A line break before these never ends a statement (no automatic semicolon)
+_CONTINUES = frozenset(b') ] } , ; . ?. : ? = == === != !== && || ?? * ** % < > <= >= & | ^ '
+                       b'<< >> >>> += -= *= %= &= |= ^= **= <<= >>= >>>= &&= ||= ??= =>'.split())
+# Tokens inside console arguments that make the call more than logging
+_SIDE_EFFECTS = frozenset([b'++', b'--', b'=', b'+=', b'-=', b'*=', b'%=', b'&=', b'|=', b'^=',
+                           b'**=', b'<<=', b'>>=', b'>>>=', b'&&=', b'||=', b'??=',
+                           b'await', b'yield', b'delete'])
+# Names after which '{' opens an object literal or pattern, not a block
+_EXPRESSION_KEYWORDS = frozenset([
+    b'return', b'typeof', b'in', b'of', b'instanceof', b'new', b'delete', b'void',
+    b'yield', b'await', b'let', b'const', b'var', b'case', b'throw'])
+_WORD = re.compile(rb'[\w$\\\x80-\xff]')
+_FIRST_CHARS = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_$'
+_NEXT_CHARS = _FIRST_CHARS + '0123456789'
+_BASE64 = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/'
+
+
+def _is_word(char):
+    return bool(char) and _WORD.match(char) is not None
+
+
+def _needs_space(last, text):
+    """Whether two pieces of code would merge into different tokens"""
+    a, b = last[-1:], text[:1]
+    if _is_word(a) and _is_word(b):
+        return True
+    if a in (b'+', b'-') and b == a:
+        return True
+    return a == b'/' and b in (b'/', b'*')
+
+
+def _newline_matters(prev, token):
+    """Whether dropping the line break between prev and token could change
+    how the code parses (automatic semicolon insertion)"""
+    if prev.kind == 'name' and prev.value in _RESTRICTED:
+        return True
+    if prev.kind == 'punct' and prev.value not in EXPRESSION_END_PUNCT:
+        return False
+    if prev.kind == 'template' and prev.value.endswith(b'${'):
+        return False
+    return not (token.kind == 'punct' and token.value in _CONTINUES)
+
+
+def _matching(tokens, i):
+    """Index of the bracket closing the one opened at tokens[i]"""
+    depth = 0
+    for j in range(i, len(tokens)):
+        depth += depth_change(tokens[j])
+        if depth == 0:
+            return j
+    return len(tokens) - 1
+
+
+def _matching_open(tokens, i):
+    """Index of the bracket opening the one closed at tokens[i]"""
+    depth = 0
+    for j in range(i, -1, -1):
+        depth -= depth_change(tokens[j])
+        if depth == 0:
+            return j
+    return 0
+
+
+def _simple_params(tokens, open_index):
+    """Indices of the plain parameter names between '(' at open_index and its ')'"""
+    found = []
+    close = _matching(tokens, open_index)
+    depth = 0
+    for j in range(open_index, close):
+        depth += depth_change(tokens[j])
+        token = tokens[j]
+        if depth == 1 and token.kind == 'name' and j > open_index:
+            if (tokens[j - 1].value in (b'(', b',', b'...')
+                    and tokens[j + 1].value in (b',', b')', b'=')):
+                found.append(j)
+    return found
+
+
+def _starts_statement(tokens, i):
+    """Whether the token at i begins a statement (for `function`: a
+    declaration rather than an expression)"""
+    if i and tokens[i - 1].value == b'async':
+        i -= 1
+    return i == 0 or tokens[i - 1].value in (b';', b'{', b'}')
+
+
+def _local_declarations(tokens):
+    """(token index, kind) of every name the tokens declare. kind is 'var',
+    'lexical' (let/const), 'function' (a declaration's name), 'own' (the
+    name of a function expression) or 'param' (parameters and catch
+    bindings)"""
+    found = []
+    depth = 0
+    declaring = None  # (depth, kind) of the var/let/const statement being read
+    count = len(tokens)
+    for i, token in enumerate(tokens):
+        value = token.value
+        prev = tokens[i - 1] if i else None
+        nxt = tokens[i + 1] if i + 1 < count else None
+        if token.kind == 'name' and not (prev is not None and prev.value in (b'.', b'?.')):
+            if value in DECL_KEYWORDS and nxt is not None:
+                declaring = (depth, 'var' if value == b'var' else 'lexical')
+                if nxt.kind == 'name':
+                    found.append((i + 1, declaring[1]))
+            elif value == b'function':
+                j = i + 1
+                if j < count and tokens[j].value == b'*':
+                    j += 1
+                if j < count and tokens[j].kind == 'name':
+                    found.append((j, 'function' if _starts_statement(tokens, i) else 'own'))
+                    j += 1
+                if j < count and tokens[j].value == b'(':
+                    found += [(k, 'param') for k in _simple_params(tokens, j)]
+            elif (value == b'catch' and i + 3 < count and nxt.value == b'('
+                  and tokens[i + 2].kind == 'name' and tokens[i + 3].value == b')'):
+                found.append((i + 2, 'param'))
+        elif token.kind == 'punct':
+            if (value == b',' and declaring is not None and declaring[0] == depth
+                    and nxt is not None and nxt.kind == 'name'):
+                found.append((i + 1, declaring[1]))
+            elif value == b';' and declaring is not None and declaring[0] == depth:
+                declaring = None
+            elif value == b'=>' and prev is not None:
+                if prev.kind == 'name':
+                    found.append((i - 1, 'param'))
+                elif prev.value == b')':
+                    found += [(k, 'param') for k in _simple_params(tokens, _matching_open(tokens, i - 1))]
+        depth += depth_change(token)
+        if declaring is not None and depth < declaring[0]:
+            declaring = None
+    return [(i, kind) for i, kind in found if tokens[i].value not in _RESERVED_WORDS]
+
+
+def collect_locals(tokens):
+    """Names the tokens of a function declare: parameters, var/let/const,
+    nested function names and catch bindings"""
+    return {tokens[i].value for i, _ in _local_declarations(tokens)}
+
+
+def _statement_end(tokens, i):
+    """Index of the last token of the expression or statement starting at i"""
+    count = len(tokens)
+    while i < count:
+        token = tokens[i]
+        if token.kind == 'punct' and token.value in (b'(', b'[', b'{'):
+            i = _matching(tokens, i) + 1
+            continue
+        if token.kind == 'template' and token.value.endswith(b'${'):
+            i = _matching(tokens, i) + 1
+            continue
+        if token.value in (b')', b']', b'}', b',', b';') and token.kind == 'punct':
+            return i if token.value == b';' else i - 1
+        i += 1
+    return count - 1
+
+
+def _scopes(tokens):
+    """Scope tree of a function's tokens.
+
+    Returns (innermost, parents, kinds): the innermost scope of every token
+    (-1 outside all of them), and the parent and kind ('function' or
+    'block') of every scope. A function scope runs from its parameters to
+    the end of its body; for and catch heads belong to the block after
+    them.
+    """
+    ranges = []
+    bodies = set()  # '{' that continue a scope opened before them
+    count = len(tokens)
+    for i, token in enumerate(tokens):
+        value = token.value
+        if token.kind == 'name' and value == b'function':
+            j = i + 1
+            while j < count and tokens[j].value != b'(':
+                j += 1
+            if j >= count:
+                continue
+            close = _matching(tokens, j)
+            end = close
+            if close + 1 < count and tokens[close + 1].value == b'{':
+                bodies.add(close + 1)
+                end = _matching(tokens, close + 1)
+            ranges.append((j, end, 'function'))
+        elif token.kind == 'punct' and value == b'=>' and i:
+            start = _matching_open(tokens, i - 1) if tokens[i - 1].value == b')' else i - 1
+            if i + 1 < count and tokens[i + 1].value == b'{':
+                bodies.add(i + 1)
+                end = _matching(tokens, i + 1)
+            else:
+                end = _statement_end(tokens, i + 1)
+            ranges.append((start, end, 'function'))
+        elif (token.kind == 'name' and value in (b'for', b'catch')
+              and i + 1 < count and tokens[i + 1].value == b'('):
+            close = _matching(tokens, i + 1)
+            if close + 1 < count and tokens[close + 1].value == b'{':
+                bodies.add(close + 1)
+                end = _matching(tokens, close + 1)
+            else:
+                end = _statement_end(tokens, close + 1)
+            ranges.append((i + 1, end, 'block'))
+        elif token.kind == 'punct' and value == b'{' and i not in bodies:
+            ranges.append((i, _matching(tokens, i), 'block'))
+
+    ranges.sort(key=lambda scope: (scope[0], -scope[1]))
+    parents = []
+    kinds = []
+    innermost = [-1] * count
+    stack = []
+    position = 0
+    for scope, (start, end, kind) in enumerate(ranges):
+        while position < start:
+            while stack and ranges[stack[-1]][1] < position:
+                stack.pop()
+            innermost[position] = stack[-1] if stack else -1
+            position += 1
+        while stack and ranges[stack[-1]][1] < start:
+            stack.pop()
+        parents.append(stack[-1] if stack else -1)
+        kinds.append(kind)
+        stack.append(scope)
+    while position < count:
+        while stack and ranges[stack[-1]][1] < position:
+            stack.pop()
+        innermost[position] = stack[-1] if stack else -1
+        position += 1
+    return innermost, parents, kinds
+
+
+def scope_names(tokens, roles=None):
+    """(locals, free) for a function's tokens: the names declared inside
+    it, and the names it uses at least once without a local declaration in
+    scope (globals, whether the page's or the browser's)"""
+    if roles is None:
+        roles = name_roles(tokens)
+    innermost, parents, kinds = _scopes(tokens)
+    bound = [set() for _ in parents]
+    declarations = set()
+    for i, kind in _local_declarations(tokens):
+        # A function expression's name is only visible inside it
+        scope = innermost[i + 1] if kind == 'own' and i + 1 < len(tokens) else innermost[i]
+        if kind in ('var', 'function'):
+            while scope != -1 and kinds[scope] != 'function':
+                scope = parents[scope]
+        if scope != -1:
+            bound[scope].add(tokens[i].value)
+            declarations.add(i)
+    local = set().union(*bound) if bound else set()
+    free = set()
+    for i, role in roles.items():
+        if role not in ('reference', 'shorthand') or i in declarations:
+            continue
+        name = tokens[i].value
+        if name in _RESERVED_WORDS or name in free:
+            continue
+        scope = innermost[i]
+        while scope != -1 and name not in bound[scope]:
+            scope = parents[scope]
+        if scope == -1:
+            free.add(name)
+    return local, free
+
+
+def _brace_kind(prev, colon):
+    """'object' when a '{' after prev opens an object literal or pattern"""
+    if prev is None:
+        return 'block'
+    if prev.kind == 'punct':
+        if prev.value in (b')', b';', b'{', b'}', b'=>'):
+            return 'block'
+        if prev.value == b':':
+            return 'object' if colon in ('ternary', 'key') else 'block'
+        return 'object'
+    if prev.kind == 'name':
+        return 'object' if prev.value in _EXPRESSION_KEYWORDS else 'block'
+    if prev.kind == 'template' and prev.value.endswith(b'${'):
+        return 'object'
+    return 'block'
+
+
+def name_roles(tokens):
+    """Role of every name token: 'property' (after a dot), 'key' (object
+    key or method name), 'shorthand' ({name} in an object literal or
+    pattern) or 'reference' (a variable)"""
+    roles = {}
+    # frame: [kind, expecting a key, open '?' count, after case/default]
+    frames = [['block', False, 0, False]]
+    colon = None
+    count = len(tokens)
+    for i, token in enumerate(tokens):
+        value = token.value
+        prev = tokens[i - 1] if i else None
+        frame = frames[-1]
+        key_position = frame[0] == 'object' and frame[1]
+        if token.kind == 'name':
+            nxt = tokens[i + 1].value if i + 1 < count else b''
+            if prev is not None and prev.value in (b'.', b'?.'):
+                roles[i] = 'property'
+            elif key_position:
+                if nxt in (b',', b'}', b'='):
+                    roles[i] = 'shorthand'
+                    frame[1] = False
+                else:
+                    roles[i] = 'key'
+                    # get/set/async/* prefixes keep the next name a key
+                    if i + 1 < count and (tokens[i + 1].kind in ('name', 'string', 'number')
+                                          or nxt in (b'*', b'[')):
+                        pass
+                    else:
+                        frame[1] = False
+            else:
+                roles[i] = 'reference'
+                if value in (b'case', b'default') and frame[0] == 'block':
+                    frame[3] = True
+        elif token.kind == 'punct':
+            if key_position and value in (b'[', b'...', b'*'):
+                frame[1] = value == b'*'
+            if value == b'{':
+                frames.append([_brace_kind(prev, colon), True, 0, False])
+            elif value in (b'(', b'['):
+                frames.append(['paren', False, 0, False])
+            elif value in (b'}', b')', b']'):
+                if len(frames) > 1:
+                    frames.pop()
+            elif value == b',':
+                if frame[0] == 'object':
+                    frame[1] = True
+            elif value == b'?':
+                frame[2] += 1
+            elif value == b':':
+                if frame[2]:
+                    frame[2] -= 1
+                    colon = 'ternary'
+                elif frame[0] == 'object':
+                    colon = 'key'
+                elif frame[3]:
+                    frame[3] = False
+                    colon = 'case'
+                else:
+                    colon = 'label'
+        elif token.kind == 'template':
+            if value.startswith(b'}') and len(frames) > 1:
+                frames.pop()
+            if value.endswith(b'${'):
+                frames.append(['paren', False, 0, False])
+        elif key_position:
+            # string, number or other literal key
+            frame[1] = False
+    return roles
+
+
+def free_names(tokens):
+    """Names the tokens use as variables without declaring them"""
+    return scope_names(tokens)[1]
+
+
+def _short_names(taken):
+    """Generate short identifiers that are not in `taken`"""
+    length = 1
+    while True:
+        for index in range(len(_FIRST_CHARS) * len(_NEXT_CHARS) ** (length - 1)):
+            name = _FIRST_CHARS[index % len(_FIRST_CHARS)]
+            index //= len(_FIRST_CHARS)
+            for _ in range(length - 1):
+                name += _NEXT_CHARS[index % len(_NEXT_CHARS)]
+                index //= len(_NEXT_CHARS)
+            name = name.encode()
+            if name not in taken and name not in _RESERVED_WORDS:
+                yield name
+        length += 1
+
+
+def mangle_names(tokens, reserved):
+    """Map of local name -> short name for one top-level function, or {}
+    when the function cannot be renamed safely"""
+    for token in tokens:
+        if token.kind == 'name' and token.value in (b'eval', b'with', b'class'):
+            return {}
+    candidates = {}
+    for token in tokens:
+        if token.kind == 'name':
+            candidates[token.value] = candidates.get(token.value, 0) + 1
+    used = set(candidates)
+    local, free = scope_names(tokens)
+    ranked = sorted((name for name in local - free if name not in reserved),
+                    key=lambda name: (-candidates[name], name))
+    generator = _short_names(used | reserved)
+    renames = {}
+    for name in ranked:
+        short = next(generator)
+        if len(short) < len(name):
+            renames[name] = short
+    return renames
+
+
+def drop_console_calls(tokens):
+    """Tokens with console.log/debug/info/trace calls removed; a call used
+    as an expression becomes `void 0`"""
+    out = []
+    count = len(tokens)
+    i = 0
+    brackets = []
+    while i < count:
+        token = tokens[i]
+        prev = out[-1] if out else None
+        if (token.kind == 'name' and token.value == b'console' and i + 3 < count
+                and not (prev is not None and prev.value in (b'.', b'?.'))
+                and tokens[i + 1].value == b'.' and tokens[i + 2].value in DEBUG_CONSOLE_METHODS
+                and tokens[i + 3].value == b'('):
+            close = _matching(tokens, i + 3)
+            args = tokens[i + 4:close]
+            following = tokens[close + 1] if close + 1 < count else None
+            if not any(t.kind in ('name', 'punct') and t.value in _SIDE_EFFECTS for t in args) and (
+                    following is None or following.value not in (b'.', b'?.', b'(', b'[')):
+                statement = (prev is None or prev.value in (b';', b'{')) and (
+                    not brackets or brackets[-1] == b'{')
+                if statement and following is not None and following.value == b';':
+                    if close + 2 < count:
+                        nxt = tokens[close + 2]
+                        tokens[close + 2] = nxt._replace(nl_before=True)
+                    i = close + 2
+                    continue
+                out.append(token._replace(kind='name', value=b'void', end=token.start))
+                out.append(token._replace(kind='number', value=b'0', end=token.start,
+                                          nl_before=False))
+                i = close + 1
+                continue
+        if token.kind == 'punct':
+            if token.value in (b'{', b'(', b'['):
+                brackets.append(token.value)
+            elif token.value in (b'}', b')', b']') and brackets:
+                brackets.pop()
+        elif token.kind == 'template':
+            if token.value.startswith(b'}') and brackets:
+                brackets.pop()
+            if token.value.endswith(b'${'):
+                brackets.append(b'${')
+        out.append(token)
+        i += 1
+    return out
+
+
+def _vlq(value):
+    """Base64 VLQ encoding of one source map field"""
+    value = (-value << 1) | 1 if value < 0 else value << 1
+    encoded = ''
+    while True:
+        digit = value & 31
+        value >>= 5
+        if value:
+            digit |= 32
+        encoded += _BASE64[digit]
+        if not value:
+            return encoded
+
+
+def _utf16_length(data):
+    """Length of UTF-8 bytes in UTF-16 code units (source map columns)"""
+    if data.isascii():
+        return len(data)
+    return len(data.decode('utf-8', 'replace').encode('utf-16-le')) // 2
+
+
+class SourcePositions:
+    """Byte offset -> (line, UTF-16 column) for one source file"""
+
+    def __init__(self, data):
+        self.data = data
+        self.line_starts = [0] + [m.end() for m in re.finditer(b'\n', data)]
+        self._line = 0
+        self._offset = 0
+        self._column = 0
+
+    def locate(self, offset):
+        line = self._line
+        if offset < self._offset or (line + 1 < len(self.line_starts)
+                                     and offset >= self.line_starts[line + 1]):
+            lo, hi = 0, len(self.line_starts) - 1
+            while lo < hi:
+                mid = (lo + hi + 1) // 2
+                if self.line_starts[mid] <= offset:
+                    lo = mid
+                else:
+                    hi = mid - 1
+            line = lo
+            self._offset = self.line_starts[line]
+            self._column = 0
+        self._column += _utf16_length(self.data[self._offset:offset])
+        self._line, self._offset = line, offset
+        return line, self._column
+
+
+class _Writer:
+    """Collects output bytes and the source map segments for each line"""
+
+    def __init__(self, positions):
+        self.parts = []
+        self.positions = positions
+        self.line = 0
+        self.column = 0
+        self.lines = [[]]
+        self.names = []
+        self._name_index = {}
+        self.last = b''
+
+    def write(self, text, token=None, name=None):
+        if token is not None and self.positions is not None:
+            source_line, source_column = self.positions.locate(token.start)
+            segment = (self.column, source_line, source_column)
+            if name is not None:
+                if name not in self._name_index:
+                    self._name_index[name] = len(self.names)
+                    self.names.append(name)
+                segment += (self._name_index[name],)
+            self.lines[-1].append(segment)
+        self.parts.append(text)
+        self.last = text
+        newlines = text.count(b'\n')
+        if newlines:
+            self.line += newlines
+            self.lines.extend([] for _ in range(newlines))
+            self.column = _utf16_length(text[text.rfind(b'\n') + 1:])
+        else:
+            self.column += _utf16_length(text)
+
+    def code(self):
+        return b''.join(self.parts)
+
+    def mappings(self):
+        fields = [0, 0, 0, 0]
+        lines = []
+        for segments in self.lines:
+            encoded = []
+            column = 0
+            for segment in segments:
+                parts = [_vlq(segment[0] - column), _vlq(0),
+                         _vlq(segment[1] - fields[1]), _vlq(segment[2] - fields[2])]
+                column = segment[0]
+                fields[1], fields[2] = segment[1], segment[2]
+                if len(segment) > 3:
+                    parts.append(_vlq(segment[3] - fields[3]))
+                    fields[3] = segment[3]
+                encoded.append(''.join(parts))
+            lines.append(','.join(encoded))
+        return ';'.join(lines)
+
+
+def minify(pieces, source=None, drop_console=False, mangle=False, reserved=frozenset()):
+    """Minify a sequence of (code, source offset or None, is_function) pieces.
+
+    Each piece must be a complete top-level unit (a declaration or the code
+    between two). `source` is the content of the file the offsets refer to;
+    when given, a source map is built. Returns (code, writer).
+    """
+    reserved = {name.encode() if isinstance(name, str) else name for name in reserved}
+    writer = _Writer(SourcePositions(source) if source is not None else None)
+    prev = None
+    for data, offset, is_function in pieces:
+        tokens = list(tokenize(io.BytesIO(data), base=offset or 0))
+        if drop_console:
+            tokens = drop_console_calls(tokens)
+        roles = renames = {}
+        if mangle and is_function:
+            renames = mangle_names(tokens, reserved)
+            if renames:
+                roles = name_roles(tokens)
+        mapped = offset is not None
+        first = True
+        for i, token in enumerate(tokens):
+            text = token.value
+            name = None
+            if renames and token.value in renames and roles.get(i) in ('reference', 'shorthand'):
+                name = token.value.decode('utf-8')
+                text = renames[token.value]
+                if roles[i] == 'shorthand':
+                    text = token.value + b':' + text
+            if prev is not None:
+                # A new piece may follow code that was never next to it
+                if (token.nl_before or first) and _newline_matters(prev, token):
+                    writer.write(b'\n')
+                elif _needs_space(writer.last, text):
+                    writer.write(b' ')
+            writer.write(text, token if mapped else None, name)
+            prev = token
+            first = False
+    if writer.parts and writer.last != b'\n':
+        writer.write(b'\n')
+    return writer.code(), writer
+
+
+def source_map(writer, output_file, source_path):
+    """v3 source map for a minified file"""
+    return {
+        'version': 3,
+        'file': os.path.basename(output_file),
+        'sources': [os.path.relpath(source_path, os.path.dirname(os.path.abspath(output_file)))
+                    .replace(os.sep, '/')],
+        'names': writer.names,
+        'mappings': writer.mappings(),
+    }
+
+
+def gzip_size(data):
+    """Size of data after gzip -9"""
+    return len(gzip.compress(data, 9))
+
+
+def write_minified(input_file, output_file, header, spans, drop_console=False, mangle=False,
+                   reserved=frozenset()):
+    """Minify header plus the (start, end, is_function) spans of input_file
+    into output_file, with a source map next to it.
+
+    Both files are written under temporary names and renamed into place.
+    Returns (raw bytes, minified bytes, raw gzip bytes, minified gzip bytes).
+    """
+    with open(input_file, 'rb') as f:
+        source = f.read()
+    header = header.encode('utf-8')
+    pieces = [(header, None, False)] if header else []
+    pieces += [(source[start:end], start, is_function) for start, end, is_function in spans]
+    code, writer = minify(pieces, source, drop_console, mangle, reserved)
+    map_file = output_file + '.map'
+    code += f"//# sourceMappingURL={os.path.basename(map_file)}\n".encode()
+    raw = header + b''.join(source[start:end] for start, end, _ in spans) + b'\n'
+
+    for path, data in ((map_file, json.dumps(source_map(writer, output_file, input_file),
+                                             separators=(',', ':')).encode()),
+                       (output_file, code)):
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    return len(raw), len(code), gzip_size(raw), gzip_size(code)
+
+
+def global_names(paths, index):
+    """Every name a script in `paths` declares at top level or uses as a
+    global; locals with these names are never renamed"""
+    names = set()
+    for path in paths:
+        with open(path, 'rb') as f:
+            data = f.read()
+        for record in index.segments(path):
+            names.update(name.encode() for name in record.get('names', ()))
+            tokens = list(tokenize(io.BytesIO(data[record['start']:record['end']])))
+            names |= free_names(tokens)
+    return names
+
+
+def function_spans(segments):
+    """(start, end, is_function) for every segment record"""
+    return [(record['start'], record['end'], record.get('kind') in FUNCTION_KINDS)
+            for record in segments]
+
+
+def print_sizes(rows):
+    """Print before/after raw and gzip sizes per bundle"""
+    total = [0, 0, 0, 0]
+    for path, sizes in rows:
+        raw, minified, raw_gz, minified_gz = sizes
+        total = [a + b for a, b in zip(total, sizes)]
+        print(f"{os.path.basename(path)}: {raw} -> {minified} bytes "
+              f"({100 * minified / max(raw, 1):.0f}%), gzip {raw_gz} -> {minified_gz} bytes")
+    if len(rows) > 1:
+        print(f"Total: {total[0]} -> {total[1]} bytes, gzip {total[2]} -> {total[3]} bytes")
+
+
+def main():
+    from optimize_split import open_index
+
+    parser = argparse.ArgumentParser(description='Minify JavaScript files with source maps')
+    parser.add_argument('files', nargs='+', help='scripts to minify')
+    parser.add_argument('--out-dir', required=True, help='directory for the minified files')
+    parser.add_argument('--drop-debug', action='store_true',
+                        help='remove console.log/debug/info/trace calls')
+    parser.add_argument('--mangle', action='store_true', help='shorten local variable names')
+    args = parser.parse_args()
+
+    index = open_index()
+    reserved = global_names(args.files, index) if args.mangle else frozenset()
+    os.makedirs(args.out_dir, exist_ok=True)
+    rows = []
+    for path in args.files:
+        output_file = os.path.join(args.out_dir, os.path.basename(path))
+        sizes = write_minified(path, output_file, '', function_spans(index.segments(path)),
+                               args.drop_debug, args.mangle, reserved)
+        rows.append((output_file, sizes))
+    index.save()
+    print_sizes(rows)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
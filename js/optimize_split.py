@@ -2,30 +2,32 @@
 """
 Script to optimize the split of duty-shifts.js into 3 files by removing
 sections that don't belong in each file.
-"""
-
-import re
-import os
 
-def read_file(filename):
-    """Read file and return lines"""
-    with open(filename, 'r', encoding='utf-8') as f:
-        return f.readlines()
+By default the source is the data/logic/ui bundles the page ships, joined
+into one file, so a re-split never loses code that only exists in the
+bundles. Bundles are not overwritten with a source that lacks any of their
+declarations unless --force is given.
 
-def write_file(filename, lines):
-    """Write lines to file"""
-    with open(filename, 'w', encoding='utf-8') as f:
-        f.writelines(lines)
+Declaration boundaries come from the streaming tokenizer in js_tokenizer.py,
+so braces inside strings, template literals, regexes and comments never
+confuse the split. The name sets below only seed the split: call_graph.py
+places every other function in the bundle it shares most calls with.
+"""
 
-def is_function_start(line):
-    """Check if line starts a function definition"""
-    stripped = line.strip()
-    return bool(re.match(r'^\s*(function|async function|const|let|var)\s+\w+', stripped))
+import argparse
+import hashlib
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 
-def get_function_name(line):
-    """Extract function name from line"""
-    match = re.search(r'(?:function|async function|const|let|var)\s+(\w+)', line)
-    return match.group(1) if match else None
+from call_graph import assign_categories, build_call_graph, print_report, statement_bundle
+from declaration_index import DEFAULT_CACHE, DeclarationIndex
+from html_pages import local_script_paths, read_page
+import hashed_assets
+import instrument
+import lazy_chunks
+import minify
+import reachability
 
 # Define function categories
 DATA_FUNCTIONS = {
@@ -114,93 +116,7 @@ UI_FUNCTIONS = {
     'setStepFooterBusy', 'getExpectedPersonForDay'
 }
 
-def categorize_function(func_name):
-    """Determine which file a function belongs to"""
-    if func_name in DATA_FUNCTIONS:
-        return 'data'
-    elif func_name in LOGIC_FUNCTIONS:
-        return 'logic'
-    elif func_name in UI_FUNCTIONS:
-        return 'ui'
-    else:
-        return 'unknown'
-
-def optimize_file(input_file, output_file, category):
-    """Create optimized version of file keeping only relevant functions"""
-    lines = read_file(input_file)
-    output_lines = []
-    current_function = None
-    in_function = False
-    brace_count = 0
-    keep_current = False
-    
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        
-        # Check for global variable declarations (always keep in data.js)
-        if category == 'data' and re.match(r'^\s*(let|const|var)\s+\w+', line.strip()):
-            output_lines.append(line)
-            i += 1
-            continue
-        
-        # Check for function start
-        if is_function_start(line):
-            func_name = get_function_name(line)
-            if func_name:
-                func_category = categorize_function(func_name)
-                keep_current = (func_category == category)
-                current_function = func_name
-                in_function = True
-                brace_count = 0
-                
-                # Count opening brace on same line
-                brace_count += line.count('{') - line.count('}')
-        
-        # If we're in a function, track braces
-        if in_function:
-            brace_count += line.count('{') - line.count('}')
-            
-            if keep_current:
-                output_lines.append(line)
-            
-            # Function ends when braces balance
-            if brace_count <= 0 and '{' in line:
-                in_function = False
-                current_function = None
-                keep_current = False
-        else:
-            # Outside functions - keep comments and certain patterns
-            stripped = line.strip()
-            if not stripped or stripped.startswith('//') or stripped.startswith('/*'):
-                # Keep comments in all files
-                if category == 'data' or 'TODO' in line or 'NOTE' in line:
-                    output_lines.append(line)
-            elif category == 'data' and ('window.' in line or 'document.addEventListener' in line):
-                # Keep initialization code in data.js
-                output_lines.append(line)
-        
-        i += 1
-    
-    write_file(output_file, output_lines)
-    print(f"Created {output_file} with {len(output_lines)} lines")
-
-def main():
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    input_file = os.path.join(script_dir, 'duty-shifts.js')
-    
-    if not os.path.exists(input_file):
-        print(f"Error: {input_file} not found")
-        return
-    
-    print("Optimizing split files...")
-    print("Note: This is a simplified optimization. Manual review recommended.")
-    
-    # For now, just add header comments explaining the split
-    # Full optimization would require more sophisticated parsing
-    print("Adding optimization headers to files...")
-    
-    header_data = """        // ============================================================================
+HEADER_DATA = """        // ============================================================================
         // DUTY-SHIFTS-DATA.JS
         // ============================================================================
         // This file contains:
@@ -212,8 +128,8 @@ def main():
         // ============================================================================
 
 """
-    
-    header_logic = """        // ============================================================================
+
+HEADER_LOGIC = """        // ============================================================================
         // DUTY-SHIFTS-LOGIC.JS
         // ============================================================================
         // This file contains:
@@ -225,8 +141,8 @@ def main():
         // ============================================================================
 
 """
-    
-    header_ui = """        // ============================================================================
+
+HEADER_UI = """        // ============================================================================
         // DUTY-SHIFTS-UI.JS
         // ============================================================================
         // This file contains:
@@ -238,23 +154,377 @@ def main():
         // ============================================================================
 
 """
+
+# The shipped bundles joined into one file, see find_source()
+COMBINED_SOURCE = os.path.join(os.path.dirname(DEFAULT_CACHE), 'duty-shifts-combined.js')
+# Lines only the minified, chunked and instrumented builds contain
+_BUILD_MARKERS = (b'//# sourceMappingURL=', b'(generated by lazy_chunks.py)',
+                  b'(generated by optimize_split.py --instrument)')
+
+# (output file, category, banner) in load order
+BUNDLE_FILES = [('duty-shifts-data.js', 'data', HEADER_DATA),
+                ('duty-shifts-logic.js', 'logic', HEADER_LOGIC),
+                ('duty-shifts-ui.js', 'ui', HEADER_UI)]
+
+def categorize_function(func_name):
+    """Determine which file a function belongs to"""
+    if func_name in DATA_FUNCTIONS:
+        return 'data'
+    elif func_name in LOGIC_FUNCTIONS:
+        return 'logic'
+    elif func_name in UI_FUNCTIONS:
+        return 'ui'
+    else:
+        return 'unknown'
+
+def category_version():
+    """Fingerprint of the category sets, stored alongside cached categories"""
+    digest = hashlib.sha1()
+    for names in (DATA_FUNCTIONS, LOGIC_FUNCTIONS, UI_FUNCTIONS):
+        digest.update('\n'.join(sorted(names)).encode('utf-8') + b'\0')
+    return digest.hexdigest()
+
+def open_index(cache_path=DEFAULT_CACHE):
+    """DeclarationIndex that categorizes with the sets above
+    (cache_path=None keeps it in memory only)"""
+    return DeclarationIndex(cache_path, categorize=lambda decl: categorize_function(decl.name),
+                            category_version=category_version())
+
+def categorize_all(input_file, index):
+    """Assign every declaration of input_file to a bundle using the call graph.
+
+    input_file has to cover every bundle (see find_source): functions it
+    does not declare are not in the graph and cannot be placed.
+    """
+    graph = build_call_graph([input_file], index)
+    seeds = {name: categorize_function(name) for name in graph.nodes}
+    return graph, seeds, assign_categories(graph, seeds)
+
+def select_segments(segments, category, labels):
+    """Return the index segments that belong in a category's file"""
+    selected = []
+    for record in segments:
+        if 'name' not in record:
+            # Top-level statements run after the functions they reference
+            keep = statement_bundle(record['refs'], labels) == category
+        else:
+            keep = labels.get(record['name'], 'data') == category
+        if keep:
+            selected.append(record)
+    return selected
+
+def merge_spans(records):
+    """Byte spans of the selected segments, with adjacent ones joined"""
+    spans = []
+    for record in records:
+        if spans and spans[-1][1] == record['start']:
+            spans[-1] = (spans[-1][0], record['end'])
+        else:
+            spans.append((record['start'], record['end']))
+    return spans
+
+def write_bundle(input_file, output_file, header, spans):
+    """Write header plus the given byte spans of input_file to output_file.
+
+    The file is written under a temporary name and renamed into place, so an
+    interrupted run never leaves a half-written bundle behind.
+    """
+    tmp_path = f"{output_file}.{os.getpid()}.tmp"
+    try:
+        with open(input_file, 'rb') as src, open(tmp_path, 'wb') as out:
+            out.write(header.encode('utf-8'))
+            for start, end in spans:
+                src.seek(start)
+                out.write(src.read(end - start))
+            out.write(b'\n')
+        os.replace(tmp_path, output_file)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return output_file
+
+def emit_files(input_file, jobs, index, labels, workers=1, minify_options=None, profile=False):
+    """Write every (output_file, category, header) job from one span table.
+
+    The source is tokenized once (through the index); with workers > 1 the
+    files are written in parallel worker processes. minify_options, when
+    given, are passed to minify.write_minified (drop_console, mangle,
+    reserved) and the size of each bundle before and after is printed.
+    With profile=True every file wraps its functions in profiling counters
+    (see instrument.py).
+    """
+    segments = index.segments(input_file)
+    total = sum(1 for record in segments if 'name' in record)
+    if profile:
+        with open(input_file, 'rb') as f:
+            unwrapped = instrument.unwrapped_names(f.read())
+    tasks = []
+    for output_file, category, header in jobs:
+        selected = select_segments(segments, category, labels)
+        kept = sum(1 for record in selected if 'name' in record)
+        if profile:
+            header += instrument.prelude(instrument.wrapped_names(selected, unwrapped))
+        if minify_options is None:
+            task = (write_bundle, (input_file, output_file, header, merge_spans(selected)), {})
+        else:
+            task = (minify.write_minified,
+                    (input_file, output_file, header, minify.function_spans(selected)),
+                    minify_options)
+        tasks.append((output_file, kept, task))
+    
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            futures = [pool.submit(function, *call_args, **kwargs)
+                       for _, _, (function, call_args, kwargs) in tasks]
+            results = [future.result() for future in futures]
+    else:
+        results = [function(*call_args, **kwargs) for _, _, (function, call_args, kwargs) in tasks]
+    
+    for output_file, kept, _ in tasks:
+        print(f"Created {output_file} with {kept} of {total} declarations")
+    if minify_options is not None:
+        minify.print_sizes([(output_file, sizes) for (output_file, _, _), sizes in zip(tasks, results)])
+
+def optimize_file(input_file, output_file, category, header='', index=None, labels=None):
+    """Create optimized version of file keeping only relevant functions"""
+    if index is None:
+        index = open_index(None)
+    if labels is None:
+        labels = {record['name']: record['category'] for record in index.segments(input_file)
+                  if 'name' in record}
+    emit_files(input_file, [(output_file, category, header)], index, labels)
+
+def report_payload(html_path, outputs, plan, out_dir):
+    """Print the page's up-front local script bytes against the lazy chunk bytes"""
+    chunk_files = {os.path.abspath(entry['file']) for entry in plan.values() if 'file' in entry}
+    chunk_files |= {os.path.abspath(os.path.join(out_dir, lazy_chunks.CHUNK_FILE_PATTERN.format(name=chunk)))
+                    for chunk, entry in plan.items() if 'file' not in entry}
+    generated = {os.path.basename(path): path for path in outputs}
+    initial = 0
+    for path in local_script_paths(html_path):
+        path = generated.get(os.path.basename(path), path)
+        if os.path.abspath(path) not in chunk_files and os.path.exists(path):
+            initial += os.path.getsize(path)
+    lazy = sum(os.path.getsize(path) for path in chunk_files if os.path.exists(path))
+    print(f"Initial local script payload: {initial} bytes; loaded on demand: {lazy} bytes")
+
+def bundle_paths(script_dir):
+    """Paths of the data/logic/ui bundles the page ships, in load order"""
+    return [os.path.join(script_dir, filename) for filename, _, _ in BUNDLE_FILES]
+
+def strip_banner(data):
+    """Bundle source without its leading `// ====` banner comment"""
+    lines = data.splitlines(keepends=True)
+    comments = 0
+    while comments < len(lines) and lines[comments].lstrip().startswith(b'//'):
+        comments += 1
+    rules = [i for i in range(comments) if lines[i].lstrip().startswith(b'// ====')]
+    if not rules or rules[0] != 0:
+        return data
+    return b''.join(lines[rules[-1] + 1:])
+
+def is_build_output(data):
+    """Whether bundle source is a minified, chunked or instrumented build,
+    which no longer holds all of its original code"""
+    return any(marker in data for marker in _BUILD_MARKERS)
+
+def combine_bundles(paths, out_path=COMBINED_SOURCE):
+    """Join bundles, banners removed, into one source file for the split.
+
+    The file is only rewritten when its content changes, so the declaration
+    index keeps recognising it between runs.
+    """
+    parts = []
+    for path in paths:
+        with open(path, 'rb') as f:
+            parts.append(strip_banner(f.read()).rstrip(b'\n') + b'\n')
+    data = b'\n'.join(parts)
+    if os.path.exists(out_path):
+        with open(out_path, 'rb') as f:
+            if f.read() == data:
+                return out_path
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    tmp_path = out_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, out_path)
+    return out_path
+
+def find_source(script_dir):
+    """Source to split: the bundles the page ships, joined into one file.
+
+    The repo-root duty-shifts.js predates most of the code in the bundles,
+    so splitting it would drop live functions.
+    """
+    paths = bundle_paths(script_dir)
+    missing = [path for path in paths if not os.path.exists(path)]
+    if missing:
+        raise FileNotFoundError(f"{missing[0]} not found")
+    for path in paths:
+        with open(path, 'rb') as f:
+            if is_build_output(f.read()):
+                raise ValueError(f"{path} is build output (minified, chunked or instrumented); "
+                                 f"restore the source bundles before re-splitting")
+    return combine_bundles(paths)
+
+def lost_declarations(input_file, outputs, index):
+    """Names the existing output files declare that input_file does not"""
+    declared = {name for decl in index.declarations(input_file) for name in decl.names}
+    existing = {name for path in outputs if os.path.exists(path)
+                for decl in index.declarations(path) for name in decl.names}
+    return sorted(existing - declared)
+
+def main():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--source',
+                        help='single-file source to split (default: the shipped '
+                             'duty-shifts-{data,logic,ui}.js, joined)')
+    parser.add_argument('--out-dir', default=script_dir,
+                        help='directory the split files are written to')
+    parser.add_argument('--force', action='store_true',
+                        help='overwrite bundles even if the source lacks some of their declarations')
+    parser.add_argument('--cache', default=DEFAULT_CACHE,
+                        help='declaration index file (default: js/.split-cache/declarations.json)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='scan the source from scratch without reading or writing the index')
+    parser.add_argument('--html', default=os.path.join(os.path.dirname(script_dir), 'duty-shifts.html'),
+                        help='page whose handlers and scripts are reachability roots')
+    parser.add_argument('--prune', action='store_true',
+                        help='leave out functions the page cannot reach')
+    parser.add_argument('--lazy-chunks', action='store_true',
+                        help='emit rarely used features as chunks loaded on first call')
+    parser.add_argument('--chunk-base', default='js/',
+                        help='URL prefix the page loads chunks from (default: js/)')
+    parser.add_argument('--write-html', action='store_true',
+                        help='also update the page (drop scripts that became lazy chunks)')
+    parser.add_argument('--minify', action='store_true',
+                        help='strip comments and whitespace, and write source maps')
+    parser.add_argument('--mangle', action='store_true',
+                        help='also shorten local variable names (implies --minify)')
+    parser.add_argument('--drop-debug', action='store_true',
+                        help='remove console.log/debug/info/trace calls (implies --minify); '
+                             'with --write-html also drop the debug-only scripts from the page')
+    parser.add_argument('--hash-names', action='store_true',
+                        help='also write every output under a content-hashed name; with '
+                             '--write-html, point all pages at hashed assets and regenerate '
+                             'the service worker precache manifest')
+    parser.add_argument('--jobs', type=int, default=1, metavar='N',
+                        help='write the output files in N worker processes (default: 1)')
+    parser.add_argument('--instrument', action='store_true',
+                        help='count calls and time of every top-level function '
+                             '(window.__dsProf; read the dumps with profile_report.py)')
+    args = parser.parse_args()
+    try:
+        input_file = args.source or find_source(script_dir)
+    except (OSError, ValueError) as error:
+        print(f"Error: {error}")
+        return 1
+    if not os.path.exists(input_file):
+        print(f"Error: {input_file} not found")
+        return 1
+    
+    index = open_index(None if args.no_cache else args.cache)
+    outputs = [os.path.join(args.out_dir, filename) for filename, _, _ in BUNDLE_FILES]
+    lost = lost_declarations(input_file, outputs, index)
+    if lost and not args.force:
+        print(f"Error: {input_file} does not declare {len(lost)} names the bundles in "
+              f"{args.out_dir} declare ({', '.join(lost[:5])}{', ...' if len(lost) > 5 else ''}); "
+              f"writing would delete them. Use --out-dir, or --force to drop them.")
+        return 1
+    
+    print("Optimizing split files...")
+    os.makedirs(args.out_dir, exist_ok=True)
+    graph, seeds, labels = categorize_all(input_file, index)
+    print_report(graph, seeds, labels)
+    
+    if args.prune:
+        _, unreachable = reachability.analyze(args.html, [input_file], index, outputs)
+        reachability.print_report(graph, unreachable)
+        for name in unreachable:
+            labels[name] = 'pruned'
+    
+    plan = {}
+    if args.lazy_chunks:
+        roots = reachability.page_roots(args.html, [input_file] + outputs, index)
+        plan = lazy_chunks.plan_chunks(input_file, graph, roots, labels, index, script_dir)
+        lazy_chunks.print_report(plan, graph)
+    
+    chunk_paths = {chunk: entry.get('file') or os.path.join(
+                       args.out_dir, lazy_chunks.CHUNK_FILE_PATTERN.format(name=chunk))
+                   for chunk, entry in plan.items()}
+    chunk_jobs = [(chunk_paths[chunk], 'chunk:' + chunk, '')
+                  for chunk, entry in plan.items() if 'file' not in entry]
+    minify_options = None
+    if args.minify or args.mangle or args.drop_debug:
+        minify_options = {'drop_console': args.drop_debug, 'mangle': args.mangle}
+        if args.mangle:
+            generated = {os.path.abspath(path) for path in outputs}
+            generated |= {os.path.abspath(path) for path, _, _ in chunk_jobs}
+            page_scripts = [path for path in local_script_paths(args.html)
+                            if path not in generated and os.path.exists(path)]
+            minify_options['reserved'] = minify.global_names([input_file] + page_scripts, index)
+    
+    renames = {}  # output path -> content-hashed copy
+    if args.hash_names and plan:
+        # The loader in the data bundle names the chunks, so they come first
+        emit_files(input_file, chunk_jobs, index, labels, args.jobs, minify_options,
+                   args.instrument)
+        for chunk, entry in plan.items():
+            hashed = hashed_assets.write_hashed(chunk_paths[chunk])
+            renames[os.path.abspath(chunk_paths[chunk])] = hashed
+            entry['src'] = args.chunk_base + os.path.basename(hashed)
+        chunk_jobs = []
+    
+    jobs = []
+    for filename, category, header in BUNDLE_FILES:
+        if category == 'data' and plan:
+            header += lazy_chunks.loader_source(plan, args.chunk_base)
+        jobs.append((os.path.join(args.out_dir, filename), category, header))
+    emit_files(input_file, jobs + chunk_jobs, index, labels, args.jobs, minify_options,
+               args.instrument)
+    if args.hash_names:
+        for path, _, _ in jobs + chunk_jobs:
+            renames[os.path.abspath(path)] = hashed_assets.write_hashed(path)
+        for path, target in renames.items():
+            print(f"Hashed {os.path.basename(path)} -> {os.path.basename(target)}")
+    
+    if plan:
+        lazy_chunks.write_manifest(os.path.join(args.out_dir, lazy_chunks.MANIFEST_FILE),
+                                   plan, args.chunk_base)
+        report_payload(args.html, outputs, plan, args.out_dir)
     
-    # Add headers to files
-    for filename, header in [('duty-shifts-data.js', header_data),
-                             ('duty-shifts-logic.js', header_logic),
-                             ('duty-shifts-ui.js', header_ui)]:
-        filepath = os.path.join(script_dir, filename)
-        if os.path.exists(filepath):
-            lines = read_file(filepath)
-            # Check if header already exists
-            if not lines[0].startswith('        // ============================================================================'):
-                lines.insert(0, header)
-                write_file(filepath, lines)
-                print(f"Added header to {filename}")
+    dropped = [entry['file'] for entry in plan.values() if 'file' in entry]
+    if args.drop_debug:
+        dropped += [path for path in local_script_paths(args.html)
+                    if os.path.basename(path) in minify.DEBUG_FILES]
+    if args.write_html and dropped:
+        html = lazy_chunks.drop_script_tags(read_page(args.html), dropped, args.html)
+        tmp_path = args.html + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(html)
+        os.replace(tmp_path, args.html)
+        print(f"Updated {args.html} (dropped {', '.join(os.path.basename(path) for path in dropped)})")
+    if args.write_html and args.hash_names:
+        # Every page of the site moves to hashed assets, and the service
+        # worker precaches the new set
+        root = os.path.dirname(os.path.abspath(args.html))
+        pages = hashed_assets.site_pages(root)
+        site_renames = hashed_assets.hash_page_assets(pages)
+        site_renames.update(renames)
+        changed = hashed_assets.update_pages(pages, site_renames)
+        chunk_files = [renames[os.path.abspath(path)] for path in chunk_paths.values()]
+        version, entries = hashed_assets.write_precache_manifest(root, pages, chunk_files)
+        print(f"Rewrote asset URLs in {len(changed)} pages; "
+              f"{hashed_assets.PRECACHE_FILE}: {len(entries)} entries, version {version}")
     
+    index.save()
+    stats = index.stats
+    print(f"Declaration index: {stats['hits']} cache hits, {stats['incremental']} incremental, "
+          f"{stats['full']} full scans ({stats['rescanned_bytes']} bytes tokenized)")
     print("\nOptimization complete!")
-    print("Note: Files currently contain all code. Manual removal of irrelevant")
-    print("sections recommended for full optimization. See SPLIT_INSTRUCTIONS.md")
+    return 0
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
@@ -0,0 +1,2474 @@
+
+        // Global variables
+        let ownerToolsData = [];
+        let ownerCurrentOutTools = [];
+        let currentOwner = '';
+        let lastViewedCollectionName = '';
+        let lastViewedCollectionTools = [];
+        
+        // Photo upload variables
+        let photoUploadToAllTools = false;
+        let currentPhotoUploadToolId = null;
+        let currentPhotoUploadPartNumber = null;
+        let photoUploadAutoShareTargets = [];
+        let currentToolPhotoUrls = [];
+
+        // Wait for common.js to load and use global Firebase instances
+        document.addEventListener('DOMContentLoaded', function() {
+            function waitForAuth() {
+                const auth = window.auth;
+                const db = window.db;
+                
+                if (!auth || !db) {
+                    console.log('[TOOLS-BY-OWNER] Waiting for common.js to load...');
+                    setTimeout(waitForAuth, 50);
+                    return;
+                }
+                
+                console.log('[TOOLS-BY-OWNER] ✓ Using global Firebase instances from common.js');
+                initializePage(auth, db);
+            }
+            
+            async function checkAdminStatus(user) {
+                const db = window.db || firebase.firestore();
+                try {
+                    const doc = await db.collection('technicians').doc(user.uid).get();
+                    if (doc.exists) {
+                        const userData = doc.data();
+                        if (userData.isAdmin === true) {
+                            return { isAdmin: true, name: userData.fullName || user.email };
+                        }
+                    }
+                    return { isAdmin: false, name: null };
+                } catch (error) {
+                    console.error('Error checking admin status:', error);
+                    return { isAdmin: false, name: null };
+                }
+            }
+            
+            function initializePage(auth, db) {
+                console.log('[TOOLS-BY-OWNER] ====== initializePage() called ======');
+                console.log('[TOOLS-BY-OWNER] Timestamp:', new Date().toISOString());
+                console.log('[TOOLS-BY-OWNER] localStorage.authVerified:', localStorage.getItem('authVerified'));
+                console.log('[TOOLS-BY-OWNER] localStorage.fullName:', localStorage.getItem('fullName'));
+                console.log('[TOOLS-BY-OWNER] auth.currentUser (sync):', auth ? (auth.currentUser ? auth.currentUser.email : 'null') : 'auth not initialized');
+                
+                // Back to Admin button
+                const backBtn = document.getElementById('backToAdminFromOwnerBtn');
+                if (backBtn) {
+                    backBtn.onclick = null;
+                    backBtn.addEventListener('click', function(e) {
+                        e.preventDefault();
+                        handleBackNavigation();
+                    });
+                    console.log('[TOOLS-BY-OWNER] Back button event listener attached');
+                } else {
+                    console.error('[TOOLS-BY-OWNER] Back button element not found!');
+                }
+
+                // Enable load button when owner is selected
+                const ownerSelect = document.getElementById('ownerSelect');
+                if (ownerSelect) {
+                    ownerSelect.addEventListener('change', function() {
+                        const loadBtn = document.getElementById('loadToolsByOwnerBtn');
+                        if (loadBtn) {
+                            loadBtn.disabled = !this.value;
+                        }
+                    });
+                }
+
+                // Load tools by owner button - show collection selection modal
+                const loadBtn = document.getElementById('loadToolsByOwnerBtn');
+                if (loadBtn) {
+                    loadBtn.addEventListener('click', async function() {
+                        currentOwner = ownerSelect.value;
+                        if (!currentOwner) return;
+                        
+                        // Show collection selection modal instead of direct tool display
+                        await showCollectionSelectionDialog();
+                    });
+                }
+
+                // Collection photo buttons for My Tools by Collection screen
+                const byCollectionAddBtn = document.getElementById('myToolsByCollectionAddPhotoBtn');
+                if (byCollectionAddBtn) {
+                    byCollectionAddBtn.onclick = function() {
+                        if (lastViewedCollectionName) {
+                            createCollectionPhotoUploadInput(lastViewedCollectionName);
+                        }
+                    };
+                }
+
+                const byCollectionPhotosBtn = document.getElementById('myToolsByCollectionPhotosBtn');
+                if (byCollectionPhotosBtn) {
+                    byCollectionPhotosBtn.onclick = function() {
+                        if (lastViewedCollectionName) {
+                            const tempElement = document.createElement('div');
+                            tempElement.setAttribute('data-collection-name', lastViewedCollectionName);
+                            showCollectionPhotoGallery(tempElement);
+                        }
+                    };
+                }
+
+                // Select different collection button
+                const selectCollectionBtn = document.getElementById('selectDifferentCollectionBtn');
+                if (selectCollectionBtn) {
+                    selectCollectionBtn.onclick = function() {
+                        showCollectionSelectionDialog();
+                    };
+                }
+
+                // Location photo button
+                const locationPhotoBtn = document.getElementById('locationPhotoBtn');
+                if (locationPhotoBtn) {
+                    locationPhotoBtn.onclick = function() {
+                        if (lastViewedCollectionName) {
+                            showLocationPhotoUploadDialog(lastViewedCollectionName, '');
+                        }
+                    };
+                }
+
+                // Handle browser back button
+                window.addEventListener('popstate', function(event) {
+                    if (event.state && event.state.screen === 'myToolsByCollection') {
+                        // If we're going back from collection view, show collection selection again
+                        showCollectionSelectionDialog();
+                    } else {
+                        handleBackNavigation();
+                    }
+                });
+
+                // SEAMLESS NAVIGATION: Check localStorage first - if flag exists, proceed IMMEDIATELY
+                const authVerified = localStorage.getItem('authVerified');
+                const storedFullName = localStorage.getItem('fullName');
+                
+                console.log('[TOOLS-BY-OWNER] Checking auth flags...');
+                console.log('[TOOLS-BY-OWNER] authVerified:', authVerified);
+                console.log('[TOOLS-BY-OWNER] storedFullName:', storedFullName);
+                
+                if (authVerified === 'true' && storedFullName) {
+                    // User was authenticated - proceed IMMEDIATELY (no waiting)
+                    console.log('[TOOLS-BY-OWNER] ✓ Auth verified flag found - proceeding immediately');
+                    
+                    // Load owners immediately
+                    loadOwners();
+                    
+                    // Verify auth and admin status in background (non-blocking)
+                    setTimeout(async () => {
+                        const currentUser = auth.currentUser;
+                        if (currentUser) {
+                            console.log('[TOOLS-BY-OWNER] ✓ Auth confirmed via currentUser:', currentUser.email);
+                            const { isAdmin } = await checkAdminStatus(currentUser);
+                            if (isAdmin) {
+                                localStorage.setItem('authVerified', 'true');
+                            } else {
+                                console.log('[TOOLS-BY-OWNER] ✗ User is not admin, redirecting to admin.html');
+                                localStorage.removeItem('authVerified');
+                                window.location.href = 'admin.html';
+                            }
+                        } else {
+                            // Set up onAuthStateChanged listener
+                            const unsubscribe = auth.onAuthStateChanged(async function(user) {
+                                if (user) {
+                                    console.log('[TOOLS-BY-OWNER] ✓ Auth confirmed via onAuthStateChanged');
+                                    const { isAdmin } = await checkAdminStatus(user);
+                                    if (isAdmin) {
+                                        localStorage.setItem('authVerified', 'true');
+                                    } else {
+                                        console.log('[TOOLS-BY-OWNER] ✗ User is not admin, redirecting to admin.html');
+                                        localStorage.removeItem('authVerified');
+                                        window.location.href = 'admin.html';
+                                    }
+                                } else {
+                                    console.log('[TOOLS-BY-OWNER] ✗ No user found, redirecting to admin.html');
+                                    localStorage.removeItem('authVerified');
+                                    window.location.href = 'admin.html';
+                                }
+                                unsubscribe();
+                            });
+                        }
+                    }, 300);
+                    
+                    return; // Exit - page initialized
+                }
+                
+                // No stored flag - wait for Firebase auth
+                console.log('[TOOLS-BY-OWNER] ✗ No auth flag found - waiting for Firebase auth');
+                console.log('[TOOLS-BY-OWNER] Setting up onAuthStateChanged listener...');
+                auth.onAuthStateChanged(async function(user) {
+                    console.log('[TOOLS-BY-OWNER] onAuthStateChanged fired, user:', user ? user.email : 'null');
+                    if (user && !user.emailVerified) {
+                        console.log('[TOOLS-BY-OWNER] ✗ User email not verified, signing out...');
+                        auth.signOut();
+                        localStorage.removeItem('authVerified');
+                        window.location.href = 'admin.html';
+                        return;
+                    }
+                    
+                    if (user) {
+                        console.log('[TOOLS-BY-OWNER] ✓ User authenticated, checking admin status...');
+                        const { isAdmin, name } = await checkAdminStatus(user);
+                        if (isAdmin) {
+                            console.log('[TOOLS-BY-OWNER] ✓ User is admin, initializing...');
+                            localStorage.setItem('authVerified', 'true');
+                            if (!localStorage.getItem('fullName')) {
+                                localStorage.setItem('fullName', name || user.email);
+                            }
+                            loadOwners();
+                        } else {
+                            console.log('[TOOLS-BY-OWNER] ✗ User is not admin, redirecting to admin.html');
+                            await auth.signOut();
+                            localStorage.removeItem('authVerified');
+                            window.location.href = 'admin.html';
+                        }
+                    } else {
+                        console.log('[TOOLS-BY-OWNER] ✗ No user found, redirecting to admin.html');
+                        localStorage.removeItem('authVerified');
+                        window.location.href = 'admin.html';
+                    }
+                });
+            }
+            
+            // Start waiting for common.js
+            waitForAuth();
+        });
+
+        // Function to handle back navigation (used by both button and phone back button)
+        window.handleBackNavigation = function handleBackNavigation() {
+            window.location.href = 'admin.html';
+        }
+
+        // Load available owners from tools
+        async function loadOwners() {
+            const db = window.db || firebase.firestore();
+            try {
+                const snapshot = await db.collection('tools').get();
+                const owners = new Set();
+                
+                snapshot.forEach(doc => {
+                    const owner = doc.data().owner;
+                    if (owner && owner.trim()) {
+                        owners.add(owner.trim());
+                    }
+                });
+                
+                const select = document.getElementById('ownerSelect');
+                if (!select) return;
+                
+                // Keep first two options (empty and ALL)
+                select.innerHTML = '<option value="">-- Select an Owner --</option><option value="ALL">All Owners</option>';
+                
+                // Sort owners alphabetically
+                const sortedOwners = Array.from(owners).sort();
+                
+                // Add all unique owners alphabetically to dropdown
+                sortedOwners.forEach(owner => {
+                    const option = document.createElement('option');
+                    option.value = owner;
+                    option.textContent = owner;
+                    select.appendChild(option);
+                });
+                
+                // Group owners alphabetically and display in list
+                const groupedOwners = groupOwnersAlphabetically(sortedOwners);
+                displayOwnersList(groupedOwners);
+            } catch (error) {
+                console.error('Error loading owners:', error);
+                alert('Error loading owners. Please try again.');
+            }
+        }
+
+        // Group owners alphabetically by first letter
+        function groupOwnersAlphabetically(owners) {
+            const groups = {};
+            
+            owners.forEach(owner => {
+                const firstLetter = owner.charAt(0).toUpperCase();
+                // Handle non-alphabetic characters
+                const groupKey = /[A-Z]/.test(firstLetter) ? firstLetter : '#';
+                
+                if (!groups[groupKey]) {
+                    groups[groupKey] = [];
+                }
+                groups[groupKey].push(owner);
+            });
+            
+            // Sort group keys
+            const sortedGroups = {};
+            Object.keys(groups).sort().forEach(key => {
+                sortedGroups[key] = groups[key];
+            });
+            
+            return sortedGroups;
+        }
+
+        // Display owners list grouped alphabetically
+        function displayOwnersList(groupedOwners) {
+            const container = document.getElementById('ownersListContainer');
+            if (!container) return;
+            
+            if (Object.keys(groupedOwners).length === 0) {
+                container.style.display = 'none';
+                return;
+            }
+            
+            let html = '';
+            
+            Object.keys(groupedOwners).forEach(letter => {
+                const owners = groupedOwners[letter];
+                html += `
+                    <div class="owners-group">
+                        <div class="owners-group-header">${letter}</div>
+                        <ul class="owners-list">
+                `;
+                
+                owners.forEach(owner => {
+                    html += `
+                        <li class="owner-list-item" data-owner="${owner.replace(/"/g, "&quot;")}">
+                            ${owner}
+                        </li>
+                    `;
+                });
+                
+                html += `
+                        </ul>
+                    </div>
+                `;
+            });
+            
+            container.innerHTML = html;
+            // Always show the container (remove display: none)
+            if (container.style.display === 'none') {
+                container.style.display = 'block';
+            }
+            
+            // Add click event listeners to owner list items
+            const ownerItems = container.querySelectorAll('.owner-list-item');
+            ownerItems.forEach(item => {
+                item.addEventListener('click', function() {
+                    const ownerName = this.getAttribute('data-owner');
+                    selectOwnerFromList(ownerName);
+                });
+            });
+        }
+
+        // Select owner from list
+        function selectOwnerFromList(ownerName) {
+            const select = document.getElementById('ownerSelect');
+            if (select) {
+                select.value = ownerName;
+                // Trigger change event to enable load button
+                select.dispatchEvent(new Event('change'));
+            }
+        }
+
+        // Load currently OUT tools from tools collection
+        async function loadCurrentOutTools() {
+            const db = window.db || firebase.firestore();
+            try {
+                let query = db.collection('tools').where('status', '==', 'OUT');
+                
+                if (currentOwner !== 'ALL') {
+                    query = query.where('owner', '==', currentOwner);
+                }
+                
+                const snapshot = await query.get();
+                
+                ownerCurrentOutTools = [];
+                snapshot.forEach(doc => {
+                    const toolData = doc.data();
+                    ownerCurrentOutTools.push({
+                        id: doc.id,
+                        toolId: doc.id,
+                        toolName: toolData.toolName || 'Unknown Tool',
+                        serialNumber: toolData.serialNumber || toolData.partNumber || 'N/A',
+                        partNumber: toolData.partNumber || 'N/A',
+                        calDueDate: toolData.calDueDate,
+                        technician: toolData.technician || 'N/A',
+                        WorkOn: toolData.WorkOn || 'N/A',
+                        status: 'OUT',
+                        timestamp: toolData.timestamp,
+                        collectionCode: toolData.collectionCode || 'Unknown Collection',
+                        owner: toolData.owner || 'N/A',
+                        ...toolData
+                    });
+                });
+                
+                console.log('Loaded', ownerCurrentOutTools.length, 'currently OUT tools');
+                displayCurrentOutTools();
+                
+            } catch (error) {
+                console.error('Error loading currently OUT tools:', error);
+                // Check if index error - try without owner filter for ALL
+                if (currentOwner === 'ALL') {
+                    try {
+                        const snapshot = await db.collection('tools').where('status', '==', 'OUT').get();
+                        ownerCurrentOutTools = [];
+                        snapshot.forEach(doc => {
+                            const toolData = doc.data();
+                            ownerCurrentOutTools.push({
+                                id: doc.id,
+                                toolId: doc.id,
+                                toolName: toolData.toolName || 'Unknown Tool',
+                                serialNumber: toolData.serialNumber || toolData.partNumber || 'N/A',
+                                partNumber: toolData.partNumber || 'N/A',
+                                calDueDate: toolData.calDueDate,
+                                technician: toolData.technician || 'N/A',
+                                WorkOn: toolData.WorkOn || 'N/A',
+                                status: 'OUT',
+                                timestamp: toolData.timestamp,
+                                collectionCode: toolData.collectionCode || 'Unknown Collection',
+                                owner: toolData.owner || 'N/A',
+                                ...toolData
+                            });
+                        });
+                        displayCurrentOutTools();
+                    } catch (error2) {
+                        console.error('Error loading currently OUT tools (fallback):', error2);
+                        const container = document.getElementById('ownerCurrentOutList');
+                        if (container) {
+                            container.innerHTML = '<div class="text-center text-danger">Error loading currently OUT tools. Please try again.</div>';
+                        }
+                    }
+                } else {
+                    const container = document.getElementById('ownerCurrentOutList');
+                    if (container) {
+                        container.innerHTML = '<div class="text-center text-danger">Error loading currently OUT tools. Please check Firebase indexes.</div>';
+                    }
+                }
+            }
+        }
+
+        // Load all tools from tools collection
+        async function loadAllTools() {
+            const db = window.db || firebase.firestore();
+            try {
+                let query = db.collection('tools');
+                
+                if (currentOwner !== 'ALL') {
+                    query = query.where('owner', '==', currentOwner);
+                }
+                
+                const snapshot = await query.get();
+                
+                ownerToolsData = [];
+                snapshot.forEach(doc => {
+                    const toolData = doc.data();
+                    ownerToolsData.push({
+                        id: doc.id,
+                        toolId: doc.id,
+                        toolName: toolData.toolName || 'Unknown Tool',
+                        serialNumber: toolData.serialNumber || toolData.partNumber || 'N/A',
+                        partNumber: toolData.partNumber || 'N/A',
+                        calDueDate: toolData.calDueDate,
+                        technician: toolData.technician || 'N/A',
+                        WorkOn: toolData.WorkOn || 'N/A',
+                        status: toolData.status || 'N/A',
+                        timestamp: toolData.timestamp,
+                        collectionCode: toolData.collectionCode || 'Unknown Collection',
+                        owner: toolData.owner || 'N/A',
+                        ...toolData
+                    });
+                });
+                
+                console.log('Loaded', ownerToolsData.length, 'tools');
+                displayAllTools();
+                
+            } catch (error) {
+                console.error('Error loading tools:', error);
+                // Check if index error - try without owner filter for ALL
+                if (currentOwner === 'ALL') {
+                    try {
+                        const snapshot = await db.collection('tools').get();
+                        ownerToolsData = [];
+                        snapshot.forEach(doc => {
+                            const toolData = doc.data();
+                            ownerToolsData.push({
+                                id: doc.id,
+                                toolId: doc.id,
+                                toolName: toolData.toolName || 'Unknown Tool',
+                                serialNumber: toolData.serialNumber || toolData.partNumber || 'N/A',
+                                partNumber: toolData.partNumber || 'N/A',
+                                calDueDate: toolData.calDueDate,
+                                technician: toolData.technician || 'N/A',
+                                WorkOn: toolData.WorkOn || 'N/A',
+                                status: toolData.status || 'N/A',
+                                timestamp: toolData.timestamp,
+                                collectionCode: toolData.collectionCode || 'Unknown Collection',
+                                owner: toolData.owner || 'N/A',
+                                ...toolData
+                            });
+                        });
+                        displayAllTools();
+                    } catch (error2) {
+                        console.error('Error loading tools (fallback):', error2);
+                        const container = document.getElementById('ownerToolsList');
+                        if (container) {
+                            container.innerHTML = '<div class="text-center text-danger">Error loading tools. Please try again.</div>';
+                        }
+                    }
+                } else {
+                    const container = document.getElementById('ownerToolsList');
+                    if (container) {
+                        container.innerHTML = '<div class="text-center text-danger">Error loading tools. Please check Firebase indexes.</div>';
+                    }
+                }
+            }
+        }
+
+        // Display currently OUT tools
+        function displayCurrentOutTools() {
+            const container = document.getElementById('ownerCurrentOutList');
+            const summaryContainer = document.getElementById('ownerCurrentOutSummary');
+            
+            if (!container) return;
+            
+            if (ownerCurrentOutTools.length === 0) {
+                container.innerHTML = '<div class="text-center text-muted">No tools currently OUT for this owner.</div>';
+                if (summaryContainer) {
+                    summaryContainer.innerHTML = '<strong>Total OUT Tools:</strong> 0';
+                }
+                return;
+            }
+            
+            // Group by collection
+            const byCollection = {};
+            ownerCurrentOutTools.forEach(tool => {
+                const collection = tool.collectionCode || 'Unknown Collection';
+                
+                if (!byCollection[collection]) {
+                    byCollection[collection] = {
+                        tools: []
+                    };
+                }
+                byCollection[collection].tools.push(tool);
+            });
+            
+            // Update summary
+            if (summaryContainer) {
+                summaryContainer.innerHTML = `<strong>Total OUT Tools:</strong> ${ownerCurrentOutTools.length}`;
+            }
+            
+            // Build HTML
+            let html = '';
+            const collections = Object.keys(byCollection).sort();
+            
+            collections.forEach(collection => {
+                const collectionData = byCollection[collection];
+                const ownerName = currentOwner === 'ALL' ? 'All Owners' : currentOwner;
+                
+                html += `<div class="owner-collection-header">
+                    ${collection} (${collectionData.tools.length} Entries For ${ownerName})
+                </div>`;
+                
+                collectionData.tools.forEach(tool => {
+                    html += createOwnerToolCard(tool);
+                });
+            });
+            
+            container.innerHTML = html;
+        }
+
+        // Display all tools grouped by collection
+        function displayAllTools() {
+            const container = document.getElementById('ownerToolsList');
+            const summaryContainer = document.getElementById('ownerToolsSummary');
+            
+            if (!container) return;
+            
+            if (ownerToolsData.length === 0) {
+                container.innerHTML = '<div class="text-center text-muted">No tools found for this owner.</div>';
+                if (summaryContainer) {
+                    summaryContainer.innerHTML = '<strong>Total Tools:</strong> 0';
+                }
+                return;
+            }
+            
+            // Group by collection
+            const byCollection = {};
+            ownerToolsData.forEach(tool => {
+                const collection = tool.collectionCode || 'Unknown Collection';
+                
+                if (!byCollection[collection]) {
+                    byCollection[collection] = {
+                        tools: []
+                    };
+                }
+                byCollection[collection].tools.push(tool);
+            });
+            
+            // Update summary
+            if (summaryContainer) {
+                summaryContainer.innerHTML = `<strong>Total Tools:</strong> ${ownerToolsData.length}`;
+            }
+            
+            // Build HTML
+            let html = '';
+            const collections = Object.keys(byCollection).sort();
+            
+            collections.forEach(collection => {
+                const collectionTools = byCollection[collection];
+                const totalInCollection = collectionTools.tools.length;
+                const ownerName = currentOwner === 'ALL' ? 'All Owners' : currentOwner;
+                
+                html += `<div class="owner-collection-header">
+                    ${collection} (${totalInCollection} Entries For ${ownerName})
+                </div>`;
+                
+                // Display all tools - card color will be based on current status
+                collectionTools.tools.forEach(tool => {
+                    html += createOwnerToolCard(tool);
+                });
+            });
+            
+            container.innerHTML = html;
+        }
+
+        // Create tool card HTML with 3D effects
+        function createOwnerToolCard(tool) {
+            const toolName = tool.toolName || 'Unknown Tool';
+            const toolId = tool.toolId || tool.id || 'N/A';
+            const partNumber = tool.partNumber || 'N/A';
+            const status = tool.status ? tool.status.toUpperCase() : 'N/A';
+            const technician = tool.technician || 'N/A';
+            
+            // Handle calDueDate with multiple format support
+            let calDueDate = 'N/A';
+            if (tool.calDueDate) {
+                let calDate = null;
+                if (tool.calDueDate.toDate && typeof tool.calDueDate.toDate === 'function') {
+                    calDate = tool.calDueDate.toDate();
+                } else if (tool.calDueDate instanceof Date) {
+                    calDate = tool.calDueDate;
+                } else if (typeof tool.calDueDate === 'string') {
+                    calDate = new Date(tool.calDueDate);
+                } else if (tool.calDueDate.seconds) {
+                    // Firestore timestamp object
+                    calDate = new Date(tool.calDueDate.seconds * 1000);
+                }
+                
+                if (calDate && !isNaN(calDate.getTime())) {
+                    calDueDate = calDate.toLocaleDateString('en-GB');
+                }
+            }
+            
+            // Determine card color class based on current status
+            let statusClass = 'in'; // Default to 'in' style
+            if (status === 'OUT') {
+                statusClass = 'out';
+            } else if (status === 'IN') {
+                statusClass = 'in';
+            }
+            
+            const statusColorClass = status === 'OUT' ? 'owner-status-out' : 
+                                   status === 'IN' ? 'owner-status-in' : 
+                                   'owner-tool-value';
+            
+            return `
+                <div class="owner-tool-card ${statusClass}">
+                    <div class="owner-tool-name" style="font-weight: bold; margin-bottom: 8px;">${toolName}</div>
+                    <div class="owner-tool-info" style="display: flex; justify-content: space-between; margin-bottom: 6px;">
+                        <span><span class="owner-tool-label">Tid:</span> <span class="owner-tool-value">${toolId}</span></span>
+                        <span><span class="owner-tool-label">P/N:</span> <span class="owner-tool-value">${partNumber}</span></span>
+                    </div>
+                    <div class="owner-tool-info" style="display: flex; justify-content: space-between; margin-bottom: 6px;">
+                        <span><span class="owner-tool-label">Cal Due Date:</span> <span class="owner-tool-value">${calDueDate}</span></span>
+                        <span><span class="owner-tool-label">Status:</span> <span class="${statusColorClass}">${status}</span></span>
+                    </div>
+                    <div class="owner-tool-info" style="margin-bottom: 6px;">
+                        <span class="owner-tool-label">Technician:</span> <span class="owner-tool-value">${technician}</span>
+                    </div>
+                    ${tool.WorkOn ? `<div class="owner-tool-info">
+                        <span class="owner-tool-label">Work Location:</span> <span class="owner-tool-value">${tool.WorkOn}</span>
+                    </div>` : ''}
+                </div>
+            `;
+        }
+
+        // Show collection selection dialog (filtered by selected owner)
+        async function showCollectionSelectionDialog() {
+            const db = window.db || firebase.firestore();
+            
+            if (!currentOwner || currentOwner === '') {
+                alert('Please select an owner first.');
+                return;
+            }
+            
+            const modal = new bootstrap.Modal(document.getElementById('collectionSelectModal'));
+            const body = document.getElementById('collectionSelectBody');
+            body.innerHTML = '<div class="text-center">Loading...</div>';
+            
+            // Add event listener for modal close button
+            const closeBtn = document.getElementById('collectionSelectModalCloseBtn');
+            if (closeBtn) {
+                closeBtn.onclick = function() {
+                    modal.hide();
+                    handleBackNavigation();
+                };
+            }
+            
+            try {
+                // Query collections by owner field (filtered by selected owner)
+                let collectionsQuery;
+                if (currentOwner === 'ALL') {
+                    collectionsQuery = await db.collection('collections').get();
+                } else {
+                    collectionsQuery = await db.collection('collections')
+                        .where('owner', '==', currentOwner)
+                        .get();
+                }
+                
+                let collections = collectionsQuery.docs.map(doc => ({ id: doc.id, ...doc.data() }));
+                
+                // If ALL owners selected, also get unique collections from tools
+                if (currentOwner === 'ALL') {
+                    const toolsSnapshot = await db.collection('tools').get();
+                    const uniqueCollections = new Set();
+                    toolsSnapshot.forEach(doc => {
+                        const collectionCode = doc.data().collectionCode;
+                        if (collectionCode) {
+                            uniqueCollections.add(collectionCode);
+                        }
+                    });
+                    
+                    // Add collections from tools that aren't in the collections collection
+                    uniqueCollections.forEach(collectionName => {
+                        if (!collections.find(c => c.collectionName === collectionName)) {
+                            collections.push({ collectionName: collectionName, id: collectionName });
+                        }
+                    });
+                }
+                
+                // Sort collections by name
+                collections.sort((a, b) => {
+                    const nameA = (a.collectionName || '').toLowerCase();
+                    const nameB = (b.collectionName || '').toLowerCase();
+                    return nameA.localeCompare(nameB);
+                });
+                
+                if (collections.length === 0) {
+                    body.innerHTML = '<div class="text-center text-danger mb-3">No collections found for this owner.</div>';
+                } else {
+                    let html = '<div class="list-group mb-3">';
+                    collections.forEach(data => {
+                        const isCurrentCollection = data.collectionName === lastViewedCollectionName;
+                        html += `<button class="list-group-item list-group-item-action collection-select-btn ${isCurrentCollection ? 'active' : ''}" style="font-weight:bold;color:${isCurrentCollection ? 'white' : '#1976d2'};" data-collection="${data.collectionName}">
+                            <span style="font-size:1.1em;">${data.collectionName}</span><br>
+                            <span style="font-size:0.9em;color:${isCurrentCollection ? 'rgba(255,255,255,0.8)' : '#888'};">
+                                ${isCurrentCollection ? 'Current Collection' : 'Code: ' + data.collectionName}
+                            </span>
+                        </button>`;
+                    });
+                    html += '</div>';
+                    body.innerHTML = html;
+                    
+                    // Add click handlers
+                    body.querySelectorAll('button[data-collection]').forEach(btn => {
+                        btn.onclick = function() {
+                            modal.hide();
+                            showMyToolsByCollection(this.getAttribute('data-collection'));
+                        };
+                    });
+                }
+                
+                // Add "Add New Collection" button with 3D interactive grey style
+                const addButton = document.createElement('button');
+                addButton.className = 'add-collection-btn-3d';
+                addButton.innerHTML = '<i class="fas fa-plus me-2"></i>Add New Collection';
+                addButton.onclick = function(e) {
+                    e.stopPropagation();
+                    modal.hide();
+                    showAddCollectionModal();
+                };
+                body.appendChild(addButton);
+                
+                // Add "Delete Collection" button with 3D interactive red style (only if collections exist)
+                if (collections.length > 0) {
+                    const deleteButton = document.createElement('button');
+                    deleteButton.className = 'delete-collection-btn-3d';
+                    deleteButton.innerHTML = '<i class="fas fa-trash me-2"></i>Delete Collection';
+                    deleteButton.onclick = function(e) {
+                        e.stopPropagation();
+                        showDeleteCollectionModal(collections);
+                    };
+                    body.appendChild(deleteButton);
+                }
+                
+                // Add "Restore Deleted Collection" button with 3D interactive green style
+                const restoreButton = document.createElement('button');
+                restoreButton.className = 'btn btn-success w-100 mt-2';
+                restoreButton.style.cssText = 'padding: 12px 24px; font-size: 1rem; font-weight: bold; border-radius: 16px;';
+                restoreButton.innerHTML = '<i class="fas fa-undo me-2"></i>Restore Deleted Collection';
+                restoreButton.onclick = function(e) {
+                    e.stopPropagation();
+                    showRestoreCollectionModal();
+                };
+                body.appendChild(restoreButton);
+                
+                modal.show();
+            } catch (error) {
+                console.error('Error loading collections:', error);
+                body.innerHTML = '<div class="text-center text-danger">Error loading collections. Please try again.</div>';
+            }
+        }
+
+        // Normalize collection name for duplicate checking (handles Greek/English similar characters)
+        function normalizeCollectionName(name) {
+            if (!name) return '';
+            const greekToEnglish = {
+                '\u0391': 'A', '\u0392': 'B', '\u0395': 'E', '\u0396': 'Z', '\u0397': 'H', '\u0399': 'I', '\u039A': 'K', '\u039C': 'M', '\u039D': 'N', '\u039F': 'O', '\u03A1': 'P', '\u03A4': 'T', '\u03A5': 'Y', '\u03A7': 'X',
+                '\u03B1': 'a', '\u03B2': 'b', '\u03B5': 'e', '\u03B6': 'z', '\u03B7': 'h', '\u03B9': 'i', '\u03BA': 'k', '\u03BC': 'm', '\u03BD': 'n', '\u03BF': 'o', '\u03C1': 'p', '\u03C4': 't', '\u03C5': 'y', '\u03C7': 'x'
+            };
+            return name.toLowerCase().split('').map(char => greekToEnglish[char] || char).join('');
+        }
+;
+
+        // Save new collection to Firebase
+        async function saveNewCollection() {
+            const db = window.db || firebase.firestore();
+            const storage = window.storage || firebase.storage();
+            
+            if (!currentOwner || currentOwner === '' || currentOwner === 'ALL') {
+                alert('Error: Please select a specific owner first.');
+                return;
+            }
+            
+            const collectionName = document.getElementById('collectionNameInput').value.trim();
+            const description = document.getElementById('collectionDescriptionInput').value.trim();
+            const photoFile = document.getElementById('collectionPhotoInput').files[0];
+            const errorDiv = document.getElementById('addCollectionError');
+            
+            if (!collectionName) {
+                errorDiv.textContent = 'Collection name is required.';
+                errorDiv.style.display = 'block';
+                return;
+            }
+            
+            // Check if collection already exists for this owner (normalized comparison)
+            const userCollections = await db.collection('collections').where('owner', '==', currentOwner).get();
+            const normalizedNewName = normalizeCollectionName(collectionName);
+            const existingCollection = userCollections.docs.find(doc => {
+                const existingName = doc.data().collectionName;
+                if (!existingName) return false;
+                const normalizedExistingName = normalizeCollectionName(existingName);
+                return normalizedExistingName === normalizedNewName;
+            });
+            
+            if (existingCollection) {
+                errorDiv.textContent = 'A collection with this name already exists (including visually similar names with different character sets). Please choose a different name.';
+                errorDiv.style.display = 'block';
+                return;
+            }
+            
+            try {
+                errorDiv.style.display = 'none';
+                const saveBtn = document.getElementById('saveCollectionBtn');
+                saveBtn.disabled = true;
+                saveBtn.textContent = 'Saving...';
+                
+                let photoUrls = [];
+                
+                if (photoFile) {
+                    const loadingModal = new bootstrap.Modal(document.getElementById('photoUploadLoadingModal'));
+                    loadingModal.show();
+                    document.getElementById('photoUploadProgress').textContent = 'Processing image...';
+                    
+                    const compressedBlob = await compressImage(photoFile);
+                    if (!compressedBlob) {
+                        loadingModal.hide();
+                        errorDiv.textContent = 'Failed to compress image.';
+                        errorDiv.style.display = 'block';
+                        saveBtn.disabled = false;
+                        saveBtn.textContent = 'Save Collection';
+                        return;
+                    }
+                    
+                    document.getElementById('photoUploadProgress').textContent = 'Uploading to storage...';
+                    
+                    const fileName = `${collectionName}_photo1.jpg`;
+                    const photoRef = storage.ref('Collection%20Photo/' + fileName);
+                    const uploadTask = photoRef.put(compressedBlob);
+                    
+                    await new Promise((resolve, reject) => {
+                        uploadTask.on('state_changed',
+                            (snapshot) => {
+                                const progress = (snapshot.bytesTransferred / snapshot.totalBytes) * 100;
+                                document.getElementById('photoUploadProgress').textContent = `Uploading... ${Math.round(progress)}%`;
+                            },
+                            (error) => {
+                                loadingModal.hide();
+                                reject(error);
+                            },
+                            async () => {
+                                try {
+                                    const downloadURL = await uploadTask.snapshot.ref.getDownloadURL();
+                                    photoUrls = [downloadURL];
+                                    loadingModal.hide();
+                                    resolve();
+                                } catch (error) {
+                                    loadingModal.hide();
+                                    reject(error);
+                                }
+                            }
+                        );
+                    });
+                }
+                
+                const collectionData = {
+                    collectionName: collectionName,
+                    owner: currentOwner,
+                    createdAt: firebase.firestore.FieldValue.serverTimestamp(),
+                    photoUrls: photoUrls
+                };
+                
+                if (description) {
+                    collectionData.description = description;
+                }
+                
+                // Use collection name as document ID
+                await db.collection('collections').doc(collectionName).set(collectionData);
+                
+                window.newlyCreatedCollectionName = collectionName;
+                window.collectionSaveSuccess = true;
+                
+                const addModal = bootstrap.Modal.getInstance(document.getElementById('addCollectionModal'));
+                if (addModal) addModal.hide();
+                
+                alert('Collection created successfully!');
+                await showCollectionSelectionDialog();
+                
+            } catch (error) {
+                console.error('Error saving collection:', error);
+                errorDiv.textContent = 'Error saving collection: ' + error.message;
+                errorDiv.style.display = 'block';
+                const saveBtn = document.getElementById('saveCollectionBtn');
+                saveBtn.disabled = false;
+                saveBtn.textContent = 'Save Collection';
+            }
+        }
+
+        // Show Delete Collection Modal
+        async function showDeleteCollectionModal(collections = null) {
+            const db = window.db || firebase.firestore();
+            const modal = new bootstrap.Modal(document.getElementById('deleteCollectionModal'));
+            const selectDiv = document.getElementById('deleteCollectionSelectDiv');
+            const selectElement = document.getElementById('deleteCollectionSelect');
+            const warningDiv = document.getElementById('deleteCollectionWarning');
+            const alertDiv = document.getElementById('deleteCollectionAlert');
+            const optionsDiv = document.getElementById('deleteCollectionOptions');
+            const confirmBtn = document.getElementById('confirmDeleteCollectionBtn');
+            
+            // Reset form
+            document.getElementById('permanentDeleteCheckbox').checked = false;
+            document.getElementById('deleteCollectionError').style.display = 'none';
+            warningDiv.style.display = 'none';
+            alertDiv.style.display = 'none';
+            optionsDiv.style.display = 'none';
+            confirmBtn.disabled = true;
+            
+            // If collection name is already set (from viewing tools), use it
+            if (lastViewedCollectionName) {
+                selectDiv.style.display = 'none';
+                selectElement.value = lastViewedCollectionName;
+                document.getElementById('deleteCollectionName').textContent = lastViewedCollectionName;
+                warningDiv.style.display = 'block';
+                alertDiv.style.display = 'block';
+                optionsDiv.style.display = 'block';
+                confirmBtn.disabled = false;
+            } else {
+                // Show collection selection dropdown
+                selectDiv.style.display = 'block';
+                selectElement.innerHTML = '<option value="">-- Select a Collection --</option>';
+                
+                // Load collections if not provided
+                if (!collections) {
+                    try {
+                        let collectionsQuery;
+                        if (currentOwner === 'ALL') {
+                            collectionsQuery = await db.collection('collections').get();
+                        } else {
+                            collectionsQuery = await db.collection('collections')
+                                .where('owner', '==', currentOwner)
+                                .get();
+                        }
+                        collections = collectionsQuery.docs.map(doc => ({ id: doc.id, ...doc.data() }));
+                    } catch (error) {
+                        console.error('Error loading collections:', error);
+                        alert('Error loading collections. Please try again.');
+                        return;
+                    }
+                }
+                
+                // Populate dropdown
+                collections.forEach(collection => {
+                    const option = document.createElement('option');
+                    option.value = collection.collectionName || collection.id;
+                    option.textContent = collection.collectionName || collection.id;
+                    selectElement.appendChild(option);
+                });
+                
+                // Handle selection change
+                selectElement.onchange = function() {
+                    const selectedCollection = this.value;
+                    if (selectedCollection) {
+                        document.getElementById('deleteCollectionName').textContent = selectedCollection;
+                        warningDiv.style.display = 'block';
+                        alertDiv.style.display = 'block';
+                        optionsDiv.style.display = 'block';
+                        confirmBtn.disabled = false;
+                    } else {
+                        warningDiv.style.display = 'none';
+                        alertDiv.style.display = 'none';
+                        optionsDiv.style.display = 'none';
+                        confirmBtn.disabled = true;
+                    }
+                };
+            }
+            
+            modal.show();
+        }
+
+        // Delete Collection (with soft delete and permanent delete options)
+        async function deleteCollection() {
+            const db = window.db || firebase.firestore();
+            const storage = window.storage || firebase.storage();
+            
+            const selectElement = document.getElementById('deleteCollectionSelect');
+            const collectionName = lastViewedCollectionName || selectElement.value;
+            
+            if (!collectionName) {
+                alert('Please select a collection to delete.');
+                return;
+            }
+            
+            const permanentDelete = document.getElementById('permanentDeleteCheckbox').checked;
+            const errorDiv = document.getElementById('deleteCollectionError');
+            const confirmBtn = document.getElementById('confirmDeleteCollectionBtn');
+            
+            try {
+                errorDiv.style.display = 'none';
+                confirmBtn.disabled = true;
+                confirmBtn.textContent = 'Deleting...';
+                
+                // Get all tools in this collection
+                const toolsSnapshot = await db.collection('tools')
+                    .where('collectionCode', '==', collectionName)
+                    .get();
+                
+                if (toolsSnapshot.empty) {
+                    alert('No tools found in this collection.');
+                    confirmBtn.disabled = false;
+                    confirmBtn.textContent = 'Delete Collection';
+                    return;
+                }
+                
+                const loadingModal = new bootstrap.Modal(document.getElementById('photoUploadLoadingModal'));
+                loadingModal.show();
+                document.getElementById('photoUploadProgress').textContent = 'Deleting tools...';
+                
+                const deleteDate = new Date();
+                const permanentDeleteDate = new Date(deleteDate);
+                permanentDeleteDate.setDate(permanentDeleteDate.getDate() + 7);
+                
+                const batch = db.batch();
+                let deletedCount = 0;
+                
+                // Process each tool
+                for (const doc of toolsSnapshot.docs) {
+                    const toolData = doc.data();
+                    
+                    if (permanentDelete) {
+                        // Delete permanently immediately
+                        // Delete photos from storage
+                        if (toolData.photoUrls && Array.isArray(toolData.photoUrls)) {
+                            for (const photoUrl of toolData.photoUrls) {
+                                try {
+                                    const urlParts = photoUrl.split('/');
+                                    const encodedPath = urlParts[urlParts.length - 1].split('?')[0];
+                                    const decodedPath = decodeURIComponent(encodedPath);
+                                    const photoRef = storage.ref().child(decodedPath);
+                                    await photoRef.delete();
+                                } catch (storageError) {
+                                    console.warn('Could not delete photo from storage:', storageError);
+                                }
+                            }
+                        }
+                        // Delete the tool document
+                        batch.delete(doc.ref);
+                        deletedCount++;
+                    } else {
+                        // Soft delete - move to deletedTools collection
+                        // Preserve all original tool fields and add deletion metadata
+                        const deletedToolData = {
+                            ...toolData,  // All original fields from tools collection
+                            originalId: doc.id,
+                            // Preserve original collectionCode if it exists, otherwise use collectionName
+                            collectionCode: toolData.collectionCode || collectionName,
+                            deletedAt: firebase.firestore.FieldValue.serverTimestamp(),
+                            permanentDeleteDate: firebase.firestore.Timestamp.fromDate(permanentDeleteDate),
+                            deletedBy: currentOwner || 'Admin'
+                        };
+                        
+                        // Add to deletedTools collection
+                        batch.set(db.collection('deletedTools').doc(doc.id), deletedToolData);
+                        
+                        // Delete from tools collection
+                        batch.delete(doc.ref);
+                        deletedCount++;
+                    }
+                }
+                
+                // Commit the batch
+                await batch.commit();
+                
+                loadingModal.hide();
+                
+                if (permanentDelete) {
+                    alert(`✅ ${deletedCount} tool(s) permanently deleted from collection "${collectionName}".`);
+                } else {
+                    alert(`✅ ${deletedCount} tool(s) moved to deleted state. They will be permanently deleted after 7 days.`);
+                }
+                
+                // Close the delete modal
+                const deleteModal = bootstrap.Modal.getInstance(document.getElementById('deleteCollectionModal'));
+                if (deleteModal) deleteModal.hide();
+                
+                // Close collection selection modal if open
+                const collectionModal = bootstrap.Modal.getInstance(document.getElementById('collectionSelectModal'));
+                if (collectionModal) collectionModal.hide();
+                
+                // Return to owner selection
+                document.getElementById('toolsByOwnerScreen').style.display = 'block';
+                document.getElementById('myToolsByCollectionScreen').style.display = 'none';
+                lastViewedCollectionName = '';
+                
+                // Refresh collection selection dialog if needed
+                if (lastViewedCollectionName === collectionName) {
+                    lastViewedCollectionName = '';
+                }
+                
+            } catch (error) {
+                console.error('Error deleting collection:', error);
+                errorDiv.textContent = 'Error deleting collection: ' + error.message;
+                errorDiv.style.display = 'block';
+                confirmBtn.disabled = false;
+                confirmBtn.textContent = 'Delete Collection';
+                const loadingModal = bootstrap.Modal.getInstance(document.getElementById('photoUploadLoadingModal'));
+                if (loadingModal) loadingModal.hide();
+            }
+        }
+
+        // Show Restore Deleted Collection Modal
+        async function showRestoreCollectionModal() {
+            const db = window.db || firebase.firestore();
+            const modal = new bootstrap.Modal(document.getElementById('restoreCollectionModal'));
+            const selectElement = document.getElementById('restoreCollectionSelect');
+            const infoDiv = document.getElementById('restoreCollectionInfo');
+            const confirmBtn = document.getElementById('confirmRestoreCollectionBtn');
+            const errorDiv = document.getElementById('restoreCollectionError');
+            
+            // Reset form
+            selectElement.innerHTML = '<option value="">-- Select a Collection --</option>';
+            infoDiv.style.display = 'none';
+            confirmBtn.disabled = true;
+            errorDiv.style.display = 'none';
+            
+            try {
+                // Get all deleted collections for this owner
+                let deletedCollectionsQuery;
+                if (currentOwner === 'ALL') {
+                    deletedCollectionsQuery = await db.collection('deletedTools').get();
+                } else {
+                    deletedCollectionsQuery = await db.collection('deletedTools')
+                        .where('deletedBy', '==', currentOwner)
+                        .get();
+                }
+                
+                // Group by collectionCode and get unique collections
+                const collectionsMap = new Map();
+                deletedCollectionsQuery.forEach(doc => {
+                    const data = doc.data();
+                    const collectionCode = data.collectionCode;
+                    if (collectionCode && !collectionsMap.has(collectionCode)) {
+                        const deletedAt = data.deletedAt;
+                        const permanentDeleteDate = data.permanentDeleteDate;
+                        
+                        // Check if still within 7 days
+                        let canRestore = true;
+                        if (permanentDeleteDate) {
+                            const deleteDate = permanentDeleteDate.toDate ? permanentDeleteDate.toDate() : new Date(permanentDeleteDate.seconds * 1000);
+                            if (deleteDate < new Date()) {
+                                canRestore = false;
+                            }
+                        }
+                        
+                        if (canRestore) {
+                            collectionsMap.set(collectionCode, {
+                                collectionCode: collectionCode,
+                                deletedAt: deletedAt,
+                                permanentDeleteDate: permanentDeleteDate,
+                                toolCount: 0
+                            });
+                        }
+                    }
+                    
+                    // Count tools in this collection
+                    if (collectionsMap.has(collectionCode)) {
+                        collectionsMap.get(collectionCode).toolCount++;
+                    }
+                });
+                
+                const collections = Array.from(collectionsMap.values());
+                
+                if (collections.length === 0) {
+                    selectElement.innerHTML = '<option value="">No deleted collections available for restoration</option>';
+                    selectElement.disabled = true;
+                } else {
+                    // Populate dropdown
+                    collections.forEach(collection => {
+                        const option = document.createElement('option');
+                        option.value = collection.collectionCode;
+                        const deletedDate = collection.deletedAt ? 
+                            (collection.deletedAt.toDate ? collection.deletedAt.toDate() : new Date(collection.deletedAt.seconds * 1000)) : 
+                            new Date();
+                        option.textContent = `${collection.collectionCode} (${collection.toolCount} tools, deleted ${deletedDate.toLocaleDateString()})`;
+                        option.setAttribute('data-collection', JSON.stringify(collection));
+                        selectElement.appendChild(option);
+                    });
+                    
+                    // Handle selection change
+                    selectElement.onchange = function() {
+                        const selectedOption = this.options[this.selectedIndex];
+                        if (selectedOption.value) {
+                            const collection = JSON.parse(selectedOption.getAttribute('data-collection'));
+                            const deletedDate = collection.deletedAt ? 
+                                (collection.deletedAt.toDate ? collection.deletedAt.toDate() : new Date(collection.deletedAt.seconds * 1000)) : 
+                                new Date();
+                            const permanentDeleteDate = collection.permanentDeleteDate ? 
+                                (collection.permanentDeleteDate.toDate ? collection.permanentDeleteDate.toDate() : new Date(collection.permanentDeleteDate.seconds * 1000)) : 
+                                null;
+                            
+                            document.getElementById('restoreCollectionName').textContent = collection.collectionCode;
+                            document.getElementById('restoreDeletedDate').textContent = deletedDate.toLocaleString();
+                            document.getElementById('restoreToolsCount').textContent = collection.toolCount;
+                            infoDiv.style.display = 'block';
+                            confirmBtn.disabled = false;
+                        } else {
+                            infoDiv.style.display = 'none';
+                            confirmBtn.disabled = true;
+                        }
+                    };
+                }
+                
+                modal.show();
+            } catch (error) {
+                console.error('Error loading deleted collections:', error);
+                errorDiv.textContent = 'Error loading deleted collections: ' + error.message;
+                errorDiv.style.display = 'block';
+            }
+        }
+
+        // Restore Deleted Collection
+        async function restoreCollection() {
+            const db = window.db || firebase.firestore();
+            const selectElement = document.getElementById('restoreCollectionSelect');
+            const selectedOption = selectElement.options[selectElement.selectedIndex];
+            
+            if (!selectedOption || !selectedOption.value) {
+                alert('Please select a collection to restore.');
+                return;
+            }
+            
+            const collectionCode = selectedOption.value;
+            const errorDiv = document.getElementById('restoreCollectionError');
+            const confirmBtn = document.getElementById('confirmRestoreCollectionBtn');
+            
+            try {
+                errorDiv.style.display = 'none';
+                confirmBtn.disabled = true;
+                confirmBtn.textContent = 'Restoring...';
+                
+                // Get all deleted tools for this collection
+                let deletedToolsQuery;
+                if (currentOwner === 'ALL') {
+                    deletedToolsQuery = await db.collection('deletedTools')
+                        .where('collectionCode', '==', collectionCode)
+                        .get();
+                } else {
+                    deletedToolsQuery = await db.collection('deletedTools')
+                        .where('collectionCode', '==', collectionCode)
+                        .where('deletedBy', '==', currentOwner)
+                        .get();
+                }
+                
+                if (deletedToolsQuery.empty) {
+                    alert('No deleted tools found for this collection.');
+                    confirmBtn.disabled = false;
+                    confirmBtn.textContent = 'Restore Collection';
+                    return;
+                }
+                
+                const loadingModal = new bootstrap.Modal(document.getElementById('photoUploadLoadingModal'));
+                loadingModal.show();
+                document.getElementById('photoUploadProgress').textContent = 'Restoring tools...';
+                
+                const batch = db.batch();
+                let restoredCount = 0;
+                
+                // Restore each tool
+                for (const doc of deletedToolsQuery.docs) {
+                    const deletedToolData = doc.data();
+                    const originalId = deletedToolData.originalId || doc.id;
+                    
+                    // Remove deletion-related fields
+                    const restoredToolData = { ...deletedToolData };
+                    delete restoredToolData.deletedAt;
+                    delete restoredToolData.permanentDeleteDate;
+                    delete restoredToolData.deletedBy;
+                    delete restoredToolData.originalId;
+                    
+                    // Restore to tools collection
+                    batch.set(db.collection('tools').doc(originalId), restoredToolData);
+                    
+                    // Delete from deletedTools collection
+                    batch.delete(doc.ref);
+                    restoredCount++;
+                }
+                
+                // Commit the batch
+                await batch.commit();
+                
+                loadingModal.hide();
+                alert(`✅ ${restoredCount} tool(s) restored from collection "${collectionCode}".`);
+                
+                // Close the restore modal
+                const restoreModal = bootstrap.Modal.getInstance(document.getElementById('restoreCollectionModal'));
+                if (restoreModal) restoreModal.hide();
+                
+                // Refresh collection selection dialog
+                await showCollectionSelectionDialog();
+                
+            } catch (error) {
+                console.error('Error restoring collection:', error);
+                errorDiv.textContent = 'Error restoring collection: ' + error.message;
+                errorDiv.style.display = 'block';
+                confirmBtn.disabled = false;
+                confirmBtn.textContent = 'Restore Collection';
+                const loadingModal = bootstrap.Modal.getInstance(document.getElementById('photoUploadLoadingModal'));
+                if (loadingModal) loadingModal.hide();
+            }
+        }
+
+        // Set up event listeners
+        document.addEventListener('DOMContentLoaded', function() {
+            const saveBtn = document.getElementById('saveCollectionBtn');
+            if (saveBtn) {
+                saveBtn.addEventListener('click', saveNewCollection);
+            }
+            
+            const deleteBtn = document.getElementById('confirmDeleteCollectionBtn');
+            if (deleteBtn) {
+                deleteBtn.addEventListener('click', deleteCollection);
+            }
+            
+            const restoreBtn = document.getElementById('confirmRestoreCollectionBtn');
+            if (restoreBtn) {
+                restoreBtn.addEventListener('click', restoreCollection);
+            }
+        });
+
+        // Show My Tools by Collection (adapted from my-tools.html for selected owner)
+        async function showMyToolsByCollection(collectionName) {
+            const db = window.db || firebase.firestore();
+            lastViewedCollectionName = collectionName;
+            
+            // Hide owner selection screen, show My Tools by Collection screen
+            document.getElementById('toolsByOwnerScreen').style.display = 'none';
+            document.getElementById('myToolsByCollectionScreen').style.display = 'block';
+            
+            // Push history state for back button support
+            window.history.pushState({ screen: 'myToolsByCollection', collection: collectionName }, '', '');
+            
+            const title = document.getElementById('myToolsCollectionTitle');
+            const list = document.getElementById('myToolsByCollectionList');
+            title.textContent = `Collection: ${collectionName}`;
+            list.innerHTML = '<div class="text-center">Loading...</div>';
+            
+            try {
+                // Query tools where collectionCode matches the collectionName and owner matches selected owner
+                let query = db.collection('tools')
+                    .where('collectionCode', '==', collectionName);
+                
+                if (currentOwner !== 'ALL') {
+                    query = query.where('owner', '==', currentOwner);
+                }
+                
+                const snapshot = await query.get();
+                
+                if (snapshot.empty) {
+                    list.innerHTML = '<div class="text-center text-danger">No tools found in this collection.</div>';
+                    lastViewedCollectionTools = [];
+                    return;
+                }
+                
+                // Group tools by location
+                const tools = snapshot.docs.map(doc => ({ id: doc.id, ...doc.data() }));
+                lastViewedCollectionTools = tools;
+                const locations = [...new Set(tools.map(t => t.location || 'No Location'))];
+                locations.sort();
+                
+                // OUT tools first, then IN, then others
+                const getStatusOrder = status => {
+                    if (!status) return 2;
+                    const s = status.toUpperCase();
+                    if (s === 'OUT') return 0;
+                    if (s === 'IN') return 1;
+                    return 2;
+                };
+                
+                // Filtering state
+                let selectedLocation = 'All';
+                
+                // Render function
+                async function renderToolsByLocation(selectedLoc) {
+                    // Update the filter bar with new selected state
+                    let filterHtml = '<div id="locationFilterBar" style="display:flex;gap:8px;overflow-x:auto;position:sticky;top:0;z-index:10;background:#fff;padding:8px 0 8px 0;border-bottom:2px solid #FF9800;margin-bottom:10px;">';
+                    filterHtml += `<button class="btn btn-sm ${selectedLoc==='All'?'btn-orange':'btn-outline-secondary'}" data-location="All" style="${selectedLoc==='All'?'background-color:#FF9800;color:white;border-color:#FF9800;':'background-color:transparent;color:#6c757d;border-color:#6c757d;'}">All</button>`;
+                    locations.forEach(loc => {
+                        filterHtml += `<button class="btn btn-sm ${selectedLoc===loc?'btn-orange':'btn-outline-secondary'}" data-location="${loc}" style="${selectedLoc===loc?'background-color:#FF9800;color:white;border-color:#FF9800;':'background-color:transparent;color:#6c757d;border-color:#6c757d;'}">${loc}</button>`;
+                    });
+                    filterHtml += '</div>';
+                    
+                    let html = '';
+                    const locs = selectedLoc === 'All' ? locations : [selectedLoc];
+                    
+                    // Fetch photo counts for all locations
+                    const photoCountPromises = locs.map(loc => getLocationPhotoCount(collectionName, loc));
+                    const photoCounts = await Promise.all(photoCountPromises);
+                    
+                    locs.forEach((loc, locIndex) => {
+                        const toolsAtLoc = tools.filter(t => (t.location || 'No Location') === loc);
+                        if (!toolsAtLoc.length) return;
+                        
+                        const photoCount = photoCounts[locIndex];
+                        const photoText = getResponsiveButtonText(`Photos (${photoCount})`, `Pics (${photoCount})`);
+                        
+                        html += `<div style="background:#FF9800;color:white;font-weight:bold;font-size:1.1em;padding:4px 12px;border-radius:6px 6px 0 0;position:sticky;top:0;z-index:5;display:flex;align-items:center;justify-content:space-between;">
+                            <span>Location: ${loc} (Total: ${toolsAtLoc.length} tools)</span>
+                            <button class="location-photos-btn-3d ms-2" onclick="event.stopPropagation(); showLocationPhotosFromTitleBar('${collectionName}','${loc}')">
+                                <i class="fas fa-images"></i> ${photoText}
+                            </button>
+                        </div>`;
+                        
+                        // OUT first, then IN, then others
+                        const sorted = toolsAtLoc.slice().sort((a, b) => getStatusOrder(a.status) - getStatusOrder(b.status));
+                        sorted.forEach((tool, idx) => {
+                            const status = (tool.status || '').toUpperCase();
+                            let bg = '#E8F5E9';
+                            let statusColor = '#388E3C';
+                            if (status === 'OUT') { bg = '#FFEBEE'; statusColor = '#d32f2f'; }
+                            else if (status === 'BROKEN') { bg = '#FFF3E0'; statusColor = '#ff6f00'; }
+                            else if (status === 'LOST') { bg = '#FFE0B2'; statusColor = '#ff8f00'; }
+                            else if (status === 'CALIBRATION') { bg = '#E3F2FD'; statusColor = '#1976d2'; }
+                            
+                            html += `<div style="background:${bg};border-radius:0 0 6px 6px;margin-bottom:8px;padding:12px 12px 8px 12px;">
+                                <div style="cursor:pointer;" onclick="showToolDetailsFromMyTools(${JSON.stringify(tool).replace(/"/g, '&quot;')})">
+                                <div style="font-weight:bold;font-size:1.13rem;color:#1976d2;display:block !important;margin-bottom:4px;">${idx + 1}. ${tool.toolName || 'Unknown Tool'}</div>
+                                <div style="font-weight:bold;display:block !important;margin-bottom:4px;">TID: ${tool.id}</div>
+                                <span style="display:flex;align-items:center;justify-content:space-between;">
+                                    <span style="font-size:1.01rem;color:#444;">Part #: ${tool.partNumber || ''}</span>
+                                    <span style="font-size:1.01rem;font-weight:bold;color:#222;">WorkOn: <span style="color:#888;font-weight:bold;">${(typeof tool.WorkOn === 'string' && tool.WorkOn.trim()) ? tool.WorkOn : 'N/A'}</span></span>
+                                </span><br>
+                                <span style="font-weight:bold;color:${statusColor};">Status: ${tool.status || ''}</span><br>
+                                <span style="font-size:1.01rem;color:#222;">Location: ${tool.location || ''}</span><br>
+                                <span style="font-size:1.01rem;color:#1976d2;font-weight:bold;">Cal Due Date: ${tool.calDueDate ? (tool.calDueDate.toDate ? tool.calDueDate.toDate().toLocaleDateString('en-GB') : tool.calDueDate) : 'N/A'}</span>
+                                </div>
+                                <div style="margin-top:8px;display:flex;gap:8px;justify-content:flex-end;">
+                                    <button onclick="event.stopPropagation(); createPhotoUploadInput('${tool.id}', '${tool.partNumber || tool.id}')" 
+                                            class="mytools-add-photo-btn-3d">
+                                        <i class="fas fa-camera"></i> ${getResponsiveButtonText('Add Photo', 'Add')}
+                                    </button>
+                                    ${tool.photoUrls && tool.photoUrls.length > 0 ? 
+                                        `<button onclick="event.stopPropagation(); showToolPhotoGallery(this)" 
+                                                class="mytools-photos-btn-3d"
+                                                data-photo-urls='${JSON.stringify(tool.photoUrls)}'
+                                                data-tool-id='${tool.id}'
+                                                data-part-number='${tool.partNumber || tool.id}'>
+                                            <i class="fas fa-images"></i> ${getResponsiveButtonText('Photos', 'Pics')} (${tool.photoUrls.length})
+                                        </button>` : ''
+                                    }
+                                </div>
+                            </div>`;
+                        });
+                    });
+                    
+                    list.innerHTML = filterHtml + `<div style="height:calc(100vh - 300px);overflow-y:auto;padding-right:5px;">` + html + `</div>`;
+                    
+                    // Add event listeners for filter buttons
+                    list.querySelectorAll('button[data-location]').forEach(btn => {
+                        btn.onclick = async function() {
+                            selectedLocation = this.getAttribute('data-location');
+                            await renderToolsByLocation(selectedLocation);
+                        };
+                    });
+                }
+                
+                await renderToolsByLocation(selectedLocation);
+            } catch (e) {
+                title.textContent = `Collection: ${collectionName}`;
+                list.innerHTML = '<div class="text-center text-danger">Error loading tools.</div>';
+                lastViewedCollectionTools = [];
+            }
+        }
+
+
+
+        async function getLocationPhotoCount(collectionName, location) {
+            const db = window.db || firebase.firestore();
+            if (!collectionName || collectionName === 'N/A' || !location || location === 'N/A') return 0;
+            try {
+                const documentId = `${collectionName}_${location}`;
+                const docRef = db.collection('locationPhotos').doc(documentId);
+                const doc = await docRef.get();
+                
+                if (doc.exists) {
+                    const data = doc.data();
+                    return data.photoUrls ? data.photoUrls.length : 0;
+                }
+                return 0;
+            } catch (error) {
+                console.error('Error getting photo count:', error);
+                return 0;
+            }
+        }
+
+
+
+;
+
+        // Use multiple selected photos
+        async function useSelectedPhotos(toolId, partNumber, toolsWithSamePartDocs = [], addToAll = false) {
+            const db = window.db || firebase.firestore();
+            if (!window.selectedPhotos || window.selectedPhotos.length === 0) {
+                alert('Please select at least one photo.');
+                return;
+            }
+
+            // Hide the choice modal
+            const choiceModal = bootstrap.Modal.getInstance(document.getElementById('photoUploadChoiceModal'));
+            if (choiceModal) choiceModal.hide();
+
+            try {
+                if (addToAll) {
+                    const authorized = await verifyAdminCode('add the selected photos to ALL matching tools');
+                    if (!authorized) {
+                        return;
+                    }
+
+                    const updatePromises = toolsWithSamePartDocs.map(async (doc) => {
+                        const existingPhotoUrls = doc.data().photoUrls || [];
+                        const updatedPhotoUrls = [...existingPhotoUrls];
+
+                        window.selectedPhotos.forEach(photoUrl => {
+                            if (!updatedPhotoUrls.includes(photoUrl)) {
+                                updatedPhotoUrls.push(photoUrl);
+                            }
+                        });
+
+                        if (updatedPhotoUrls.length > existingPhotoUrls.length) {
+                            await doc.ref.update({
+                                photoUrls: updatedPhotoUrls
+                            });
+                            console.log('Added selected photos to tool', doc.id);
+                        }
+                    });
+
+                    await Promise.all(updatePromises);
+                    alert(`✅ ${window.selectedPhotos.length} photo(s) added to ALL ${toolsWithSamePartDocs.length} tool(s)!`);
+                } else {
+                    // Add photos only to current tool
+                    const toolDoc = await db.collection('tools').doc(toolId).get();
+                    if (toolDoc.exists) {
+                        const currentPhotoUrls = toolDoc.data().photoUrls || [];
+                        let newPhotoUrls = [...currentPhotoUrls];
+
+                        window.selectedPhotos.forEach(photoUrl => {
+                            if (!newPhotoUrls.includes(photoUrl)) {
+                                newPhotoUrls.push(photoUrl);
+                            }
+                        });
+
+                        if (newPhotoUrls.length > currentPhotoUrls.length) {
+                            await db.collection('tools').doc(toolId).update({
+                                photoUrls: newPhotoUrls
+                            });
+                            alert(`✅ ${newPhotoUrls.length - currentPhotoUrls.length} photo(s) added to YOUR tool!`);
+                        } else {
+                            alert('ℹ️ All selected photos are already in your tool.');
+                        }
+                    }
+                }
+
+                // Reset selection UI
+                window.selectedPhotos = [];
+                const selectedCountEl = document.getElementById('selectedCount');
+                if (selectedCountEl) selectedCountEl.textContent = '0';
+                const addSelectedMyBtn = document.getElementById('addSelectedPhotosMyToolBtn');
+                const addSelectedAllBtn = document.getElementById('addSelectedPhotosAllToolsBtn');
+                if (addSelectedMyBtn) addSelectedMyBtn.disabled = true;
+                if (addSelectedAllBtn) addSelectedAllBtn.disabled = true;
+
+                // Refresh the view
+                if (lastViewedCollectionName) {
+                    showMyToolsByCollection(lastViewedCollectionName);
+                }
+
+            } catch (error) {
+                console.error('Error using selected photos:', error);
+                alert('Error adding photos: ' + error.message);
+            }
+        }
+
+        // Verify admin code
+        async function verifyAdminCode(actionDescription = 'perform this action') {
+            const db = window.db || firebase.firestore();
+            try {
+                const settingsDoc = await db.collection('settings').doc('admin').get();
+                const adminCode = settingsDoc.exists ? settingsDoc.data().adminCode : null;
+
+                if (!adminCode) {
+                    alert('Admin code not configured. Please contact system administrator.');
+                    return false;
+                }
+
+                const enteredCode = prompt(`🔐 Enter admin code to ${actionDescription}:`);
+                if (enteredCode === null) {
+                    return false;
+                }
+
+                if (enteredCode !== adminCode) {
+                    alert('❌ Incorrect admin code.');
+                    return false;
+                }
+
+                return true;
+            } catch (error) {
+                console.error('Error verifying admin code:', error);
+                alert('Unable to verify admin code. Please try again.');
+                return false;
+            }
+        }
+
+
+;
+
+        // Upload tool photo (full implementation with sharing logic)
+        async function uploadToolPhoto(toolId, partNumber, file) {
+            const db = window.db || firebase.firestore();
+            const storage = window.storage || firebase.storage();
+            try {
+                const loadingModal = new bootstrap.Modal(document.getElementById('photoUploadLoadingModal'));
+                loadingModal.show();
+                document.getElementById('photoUploadProgress').textContent = 'Processing image...';
+
+                const compressedBlob = await compressImage(file);
+                if (!compressedBlob) {
+                    loadingModal.hide();
+                    alert('Failed to compress image');
+                    return;
+                }
+
+                document.getElementById('photoUploadProgress').textContent = 'Uploading to storage...';
+
+                const toolDoc = await db.collection('tools').doc(toolId).get();
+                const currentPhotoUrls = toolDoc.exists ? (toolDoc.data().photoUrls || []) : [];
+                const photoNumber = currentPhotoUrls.length + 1;
+
+                const fileName = `${partNumber}_photo${photoNumber}.jpg`;
+
+                const photoRef = storage.ref('Tool_Photos/' + fileName);
+                const uploadTask = photoRef.put(compressedBlob);
+
+                uploadTask.on('state_changed',
+                    (snapshot) => {
+                        const progress = (snapshot.bytesTransferred / snapshot.totalBytes) * 100;
+                        document.getElementById('photoUploadProgress').textContent = `Uploading... ${Math.round(progress)}%`;
+                    },
+                    (error) => {
+                        console.error('Upload error:', error);
+                        loadingModal.hide();
+                        alert('Upload failed: ' + error.message);
+                    },
+                    async () => {
+                        try {
+                            document.getElementById('photoUploadProgress').textContent = 'Updating database...';
+
+                            const downloadURL = await uploadTask.snapshot.ref.getDownloadURL();
+
+                            const newPhotoUrls = [...currentPhotoUrls, downloadURL];
+                            await db.collection('tools').doc(toolId).update({
+                                photoUrls: newPhotoUrls
+                            });
+
+                            // Share with other tools if user chose "Add to ALL Tools"
+                            const shouldAddToAll = photoUploadToAllTools && currentPhotoUploadToolId === toolId && currentPhotoUploadPartNumber === partNumber;
+                            
+                            if (shouldAddToAll) {
+                                // Find all tools with the same part number and add the same photo
+                                const toolsWithSamePart = await db.collection('tools')
+                                    .where('partNumber', '==', partNumber)
+                                    .get();
+                                
+                                const updatePromises = toolsWithSamePart.docs.map(async (doc) => {
+                                    if (doc.id !== toolId) {
+                                        const existingPhotoUrls = doc.data().photoUrls || [];
+                                        const updatedPhotoUrls = [...existingPhotoUrls, downloadURL];
+                                        await doc.ref.update({
+                                            photoUrls: updatedPhotoUrls
+                                        });
+                                        console.log('Updated tool', doc.id, 'with same photo');
+                                    }
+                                });
+                                
+                                await Promise.all(updatePromises);
+                                
+                                loadingModal.hide();
+                                alert('Photo uploaded successfully! Added to ' + (toolsWithSamePart.docs.length) + ' tools with the same part number.');
+                            } else if (photoUploadAutoShareTargets.length > 0) {
+                                const sharePromises = photoUploadAutoShareTargets.map(async (target) => {
+                                    const existingPhotoUrls = target.photoUrls || [];
+                                    if (!existingPhotoUrls.includes(downloadURL)) {
+                                        const updatedPhotoUrls = [...existingPhotoUrls, downloadURL];
+                                        await target.ref.update({
+                                            photoUrls: updatedPhotoUrls
+                                        });
+                                        console.log('Auto-shared photo with tool', target.id);
+                                    }
+                                });
+
+                                await Promise.all(sharePromises);
+
+                                loadingModal.hide();
+                                const reportLines = photoUploadAutoShareTargets.map(target => `${target.toolName} (${target.owner})`);
+                                alert(`✅ Photo uploaded successfully! Also shared with ${photoUploadAutoShareTargets.length} other tool(s) that previously had no photos:\n${reportLines.join('\n')}`);
+                            } else {
+                                loadingModal.hide();
+                                alert('✅ Photo uploaded successfully! Added to YOUR tool only.');
+                            }
+
+                            // Reset the global variables
+                            photoUploadToAllTools = false;
+                            currentPhotoUploadToolId = null;
+                            currentPhotoUploadPartNumber = null;
+                            photoUploadAutoShareTargets = [];
+
+                            // Refresh the current view
+                            if (lastViewedCollectionName) {
+                                showMyToolsByCollection(lastViewedCollectionName);
+                            }
+
+                        } catch (error) {
+                            console.error('Error updating tool:', error);
+                            loadingModal.hide();
+                            alert('Error updating tool: ' + error.message);
+                        }
+                    }
+                );
+
+            } catch (error) {
+                console.error('Photo upload failed:', error);
+                const loadingModal = bootstrap.Modal.getInstance(document.getElementById('photoUploadLoadingModal'));
+                if (loadingModal) loadingModal.hide();
+                alert('Upload failed: ' + error.message);
+            }
+        }
+
+        // Show tool photo gallery
+        function showToolPhotoGallery(el) {
+            const photoUrls = JSON.parse(el.getAttribute('data-photo-urls'));
+            const toolId = el.getAttribute('data-tool-id');
+            const partNumber = el.getAttribute('data-part-number');
+            if (!photoUrls || photoUrls.length === 0) return;
+            let currentPhotoIndex = 0;
+            const galleryContent = document.getElementById('toolPhotoGalleryContent');
+            const counter = document.getElementById('toolPhotoCounter');
+
+            function updatePhoto() {
+                galleryContent.innerHTML = `<img src="${photoUrls[currentPhotoIndex]}" class="img-fluid rounded shadow" style="max-height:80vh;max-width:100vw;object-fit:contain;">`;
+
+                const prevArrow = document.createElement('button');
+                prevArrow.type = 'button';
+                prevArrow.className = 'btn btn-light position-absolute';
+                prevArrow.id = 'toolPhotoPrevBtn';
+                prevArrow.style = 'left: 20px; top: 50%; transform: translateY(-50%); z-index: 1000; border-radius: 50%; width: 50px; height: 50px; display: flex; align-items: center; justify-content: center;';
+                prevArrow.innerHTML = '<i class="fas fa-chevron-left"></i>';
+                prevArrow.onclick = function() {
+                    if (currentPhotoIndex > 0) {
+                        currentPhotoIndex--;
+                        updatePhoto();
+                    }
+                };
+
+                const nextArrow = document.createElement('button');
+                nextArrow.type = 'button';
+                nextArrow.className = 'btn btn-light position-absolute';
+                nextArrow.id = 'toolPhotoNextBtn';
+                nextArrow.style = 'right: 20px; top: 50%; transform: translateY(-50%); z-index: 1000; border-radius: 50%; width: 50px; height: 50px; display: flex; align-items: center; justify-content: center;';
+                nextArrow.innerHTML = '<i class="fas fa-chevron-right"></i>';
+                nextArrow.onclick = function() {
+                    if (currentPhotoIndex < photoUrls.length - 1) {
+                        currentPhotoIndex++;
+                        updatePhoto();
+                    }
+                };
+
+                galleryContent.appendChild(prevArrow);
+                galleryContent.appendChild(nextArrow);
+
+                counter.textContent = `${currentPhotoIndex + 1} / ${photoUrls.length}`;
+
+                prevArrow.style.display = currentPhotoIndex === 0 ? 'none' : 'flex';
+                nextArrow.style.display = currentPhotoIndex === photoUrls.length - 1 ? 'none' : 'flex';
+
+                const deleteBtn = document.getElementById('toolPhotoDeleteBtn');
+                if (deleteBtn) {
+                    deleteBtn.onclick = function() {
+                        deletePhoto(toolId, partNumber, currentPhotoIndex, photoUrls[currentPhotoIndex]);
+                    };
+                }
+            }
+
+            updatePhoto();
+            const modal = new bootstrap.Modal(document.getElementById('toolPhotoGalleryModal'));
+            modal.show();
+            window.history.pushState({ modal: 'toolPhotoGallery' }, '', '');
+        }
+
+        // Delete photo function (full implementation with admin code verification)
+        async function deletePhoto(toolId, partNumber, photoIndex, photoUrl) {
+            const db = window.db || firebase.firestore();
+            const storage = window.storage || firebase.storage();
+            return new Promise(async (resolve, reject) => {
+                try {
+                    // Find all tools with the same part number to show owners
+                    const toolsWithSamePart = await db.collection('tools')
+                        .where('partNumber', '==', partNumber)
+                        .get();
+
+                    // Get unique owners
+                    const owners = [...new Set(toolsWithSamePart.docs.map(doc => doc.data().owner))].filter(Boolean);
+                    
+                    // Format owners as numbered vertical list
+                    let ownersListHTML = '';
+                    if (owners.length === 0) {
+                        ownersListHTML = '<div style="font-size: 1.15rem; font-weight: bold; color: #666;">Unknown</div>';
+                    } else {
+                        ownersListHTML = owners.map((owner, index) => 
+                            `<div style="font-size: 1.15rem; font-weight: bold; color: #333; margin-bottom: 6px;">${index + 1}. ${owner}</div>`
+                        ).join('');
+                    }
+                    
+                    // Show custom modal with owner information
+                    document.getElementById('photoDeleteOwnersList').innerHTML = ownersListHTML;
+                    const choiceModal = new bootstrap.Modal(document.getElementById('photoDeleteChoiceModal'));
+                    choiceModal.show();
+                    
+                    let deleteFromAll = false;
+                    
+                    // Handle "Delete from MY Tool Only" button
+                    document.getElementById('deleteMyToolOnlyBtn').onclick = function() {
+                        choiceModal.hide();
+                        
+                        if (!confirm('⚠️ Are you sure you want to delete this photo from YOUR tool?\n\nThis action cannot be undone.')) {
+                            return;
+                        }
+                        
+                        deleteFromAll = false;
+                        proceedWithDeletion();
+                    };
+                    
+                    // Handle "Delete from ALL Tools" button
+                    document.getElementById('deleteFromAllToolsBtn').onclick = async function() {
+                        const db = window.db || firebase.firestore();
+                        choiceModal.hide();
+                        
+                        const settingsDoc = await db.collection('settings').doc('admin').get();
+                        const adminCode = settingsDoc.exists ? settingsDoc.data().adminCode : null;
+                        
+                        if (!adminCode) {
+                            alert('Admin code not configured. Please contact system administrator.');
+                            return;
+                        }
+                        
+                        const enteredCode = prompt('🔐 Enter admin code to delete photo from ALL tools:');
+                        
+                        if (enteredCode === null) {
+                            return;
+                        }
+                        
+                        if (enteredCode !== adminCode) {
+                            alert('❌ Incorrect admin code. Photo deletion cancelled.');
+                            return;
+                        }
+                        
+                        if (!confirm(`⚠️ Are you sure you want to delete this photo from ALL ${toolsWithSamePart.docs.length} tools?\n\nThis will permanently remove the photo from:\n${owners.join('\n')}\n\nThis action CANNOT be undone!`)) {
+                            return;
+                        }
+                        
+                        deleteFromAll = true;
+                        proceedWithDeletion();
+                    };
+                    
+                    async function proceedWithDeletion() {
+                        const db = window.db || firebase.firestore();
+                        const storage = window.storage || firebase.storage();
+                        const loadingModal = new bootstrap.Modal(document.getElementById('photoUploadLoadingModal'));
+                        loadingModal.show();
+                        document.getElementById('photoUploadProgress').textContent = 'Deleting photo...';
+
+                        const toolDoc = await db.collection('tools').doc(toolId).get();
+                        const currentPhotoUrls = toolDoc.exists ? (toolDoc.data().photoUrls || []) : [];
+                        
+                        const updatedPhotoUrls = currentPhotoUrls.filter((url, index) => index !== photoIndex);
+                        
+                        await db.collection('tools').doc(toolId).update({
+                            photoUrls: updatedPhotoUrls
+                        });
+
+                        let affectedToolsCount = 1;
+
+                        if (deleteFromAll) {
+                            const updatePromises = toolsWithSamePart.docs.map(async (doc) => {
+                                if (doc.id !== toolId) {
+                                    const existingPhotoUrls = doc.data().photoUrls || [];
+                                    const updatedUrls = existingPhotoUrls.filter(url => url !== photoUrl);
+                                    await doc.ref.update({
+                                        photoUrls: updatedUrls
+                                    });
+                                    console.log('Updated tool', doc.id, 'removed same photo');
+                                }
+                            });
+
+                            await Promise.all(updatePromises);
+                            affectedToolsCount = toolsWithSamePart.docs.length;
+
+                            // Try to delete from Firebase Storage
+                            try {
+                                const urlParts = photoUrl.split('/');
+                                const encodedPath = urlParts[urlParts.length - 1].split('?')[0];
+                                const decodedPath = decodeURIComponent(encodedPath);
+                                const photoRef = storage.ref().child(decodedPath);
+                                await photoRef.delete();
+                            } catch (storageError) {
+                                console.warn('Could not delete from storage:', storageError);
+                            }
+                        } else {
+                            // Try to delete from Firebase Storage
+                            try {
+                                const urlParts = photoUrl.split('/');
+                                const encodedPath = urlParts[urlParts.length - 1].split('?')[0];
+                                const decodedPath = decodeURIComponent(encodedPath);
+                                const photoRef = storage.ref().child(decodedPath);
+                                await photoRef.delete();
+                            } catch (storageError) {
+                                console.warn('Could not delete from storage:', storageError);
+                            }
+                        }
+
+                        loadingModal.hide();
+                        alert(`Photo deleted successfully from ${affectedToolsCount} tool(s)!`);
+
+                        const galleryModal = bootstrap.Modal.getInstance(document.getElementById('toolPhotoGalleryModal'));
+                        if (galleryModal) galleryModal.hide();
+
+                        if (lastViewedCollectionName) {
+                            showMyToolsByCollection(lastViewedCollectionName);
+                        }
+
+                    }
+                } catch (error) {
+                    console.error('Photo delete failed:', error);
+                    alert('Delete failed: ' + error.message);
+                }
+            });
+        }
+
+        // Show location photos from title bar
+        async function showLocationPhotosFromTitleBar(collectionName, location) {
+            const db = window.db || firebase.firestore();
+            try {
+                const documentId = `${collectionName}_${location}`;
+                const docRef = db.collection('locationPhotos').doc(documentId);
+                const doc = await docRef.get();
+
+                if (!doc.exists) {
+                    alert('No photos found for this location.');
+                    return;
+                }
+
+                const data = doc.data();
+                const photoUrls = data.photoUrls || [];
+
+                if (photoUrls.length === 0) {
+                    alert('No photos found for this location.');
+                    return;
+                }
+
+                // Go directly to full-screen gallery starting from first photo
+                showLocationPhotoFullscreen(JSON.stringify(photoUrls), 0, collectionName, location);
+                
+            } catch (error) {
+                console.error('Error loading location photos:', error);
+                alert('Error loading photos. Please try again.');
+            }
+        }
+;
+
+        // Delete location photo
+        async function deleteLocationPhoto(collectionName, location, photoIndex, photoUrl) {
+            const db = window.db || firebase.firestore();
+            const storage = window.storage || firebase.storage();
+            if (!confirm('Are you sure you want to delete this location photo? This action cannot be undone.')) {
+                return;
+            }
+
+            try {
+                const loadingModal = new bootstrap.Modal(document.getElementById('photoUploadLoadingModal'));
+                loadingModal.show();
+                document.getElementById('photoUploadProgress').textContent = 'Deleting photo...';
+
+                const documentId = `${collectionName}_${location}`;
+                const docRef = db.collection('locationPhotos').doc(documentId);
+                const doc = await docRef.get();
+
+                if (!doc.exists) {
+                    throw new Error('Location document not found');
+                }
+
+                const currentPhotoUrls = doc.data().photoUrls || [];
+                const updatedPhotoUrls = currentPhotoUrls.filter((url, index) => index !== photoIndex);
+
+                await docRef.update({
+                    photoUrls: updatedPhotoUrls
+                });
+
+                try {
+                    const urlParts = photoUrl.split('/');
+                    const encodedPath = urlParts[urlParts.length - 1].split('?')[0];
+                    const decodedPath = decodeURIComponent(encodedPath);
+                    const photoRef = storage.ref().child(decodedPath);
+                    await photoRef.delete();
+                } catch (storageError) {
+                    console.warn('Could not delete from storage:', storageError);
+                }
+
+                loadingModal.hide();
+                alert('Location photo deleted successfully!');
+
+                const galleryModal = bootstrap.Modal.getInstance(document.getElementById('locationPhotoFullscreenModal'));
+                if (galleryModal) galleryModal.hide();
+
+                if (lastViewedCollectionName) {
+                    showMyToolsByCollection(lastViewedCollectionName);
+                }
+
+            } catch (error) {
+                console.error('Location photo delete failed:', error);
+                const loadingModal = bootstrap.Modal.getInstance(document.getElementById('photoUploadLoadingModal'));
+                if (loadingModal) loadingModal.hide();
+                alert('Delete failed: ' + error.message);
+            }
+        }
+
+
+;
+
+        // Upload collection photo
+        async function uploadCollectionPhoto(collectionName, file) {
+            const db = window.db || firebase.firestore();
+            const storage = window.storage || firebase.storage();
+            try {
+                const loadingModal = new bootstrap.Modal(document.getElementById('photoUploadLoadingModal'));
+                loadingModal.show();
+                document.getElementById('photoUploadProgress').textContent = 'Processing image...';
+
+                const compressedBlob = await compressImage(file);
+                if (!compressedBlob) {
+                    loadingModal.hide();
+                    alert('Failed to compress image');
+                    return;
+                }
+
+                document.getElementById('photoUploadProgress').textContent = 'Uploading to storage...';
+
+                const collectionQuery = await db.collection('collections').where('collectionName', '==', collectionName).get();
+                let currentPhotoUrls = [];
+                let collectionDocId = null;
+
+                if (!collectionQuery.empty) {
+                    const collectionDoc = collectionQuery.docs[0];
+                    collectionDocId = collectionDoc.id;
+                    currentPhotoUrls = collectionDoc.data().photoUrls || [];
+                }
+
+                const photoNumber = currentPhotoUrls.length + 1;
+                const fileName = `${collectionName}_photo${photoNumber}.jpg`;
+
+                const photoRef = storage.ref('Collection%20Photo/' + fileName);
+                const uploadTask = photoRef.put(compressedBlob);
+
+                uploadTask.on('state_changed',
+                    (snapshot) => {
+                        const progress = (snapshot.bytesTransferred / snapshot.totalBytes) * 100;
+                        document.getElementById('photoUploadProgress').textContent = `Uploading... ${Math.round(progress)}%`;
+                    },
+                    (error) => {
+                        console.error('Upload error:', error);
+                        loadingModal.hide();
+                        alert('Upload failed: ' + error.message);
+                    },
+                    async () => {
+                        try {
+                            document.getElementById('photoUploadProgress').textContent = 'Updating database...';
+
+                            const downloadURL = await uploadTask.snapshot.ref.getDownloadURL();
+                            const newPhotoUrls = [...currentPhotoUrls, downloadURL];
+
+                            if (collectionDocId) {
+                                await db.collection('collections').doc(collectionDocId).update({
+                                    photoUrls: newPhotoUrls
+                                });
+                            } else {
+                                await db.collection('collections').add({
+                                    collectionName: collectionName,
+                                    photoUrls: newPhotoUrls,
+                                    createdAt: firebase.firestore.FieldValue.serverTimestamp()
+                                });
+                            }
+
+                            loadingModal.hide();
+                            alert('Collection photo uploaded successfully!');
+
+                            if (lastViewedCollectionName) {
+                                showMyToolsByCollection(lastViewedCollectionName);
+                            }
+
+                        } catch (error) {
+                            console.error('Error updating collection:', error);
+                            loadingModal.hide();
+                            alert('Error updating collection: ' + error.message);
+                        }
+                    }
+                );
+
+            } catch (error) {
+                console.error('Collection photo upload failed:', error);
+                const loadingModal = bootstrap.Modal.getInstance(document.getElementById('photoUploadLoadingModal'));
+                if (loadingModal) loadingModal.hide();
+                alert('Upload failed: ' + error.message);
+            }
+        }
+
+        // Show collection photo gallery
+        async function showCollectionPhotoGallery(element) {
+            const db = window.db || firebase.firestore();
+            const collectionName = element.getAttribute('data-collection-name');
+
+            try {
+                const collectionQuery = await db.collection('collections').where('collectionName', '==', collectionName).get();
+                let photoUrls = [];
+
+                if (!collectionQuery.empty) {
+                    const collectionDoc = collectionQuery.docs[0];
+                    photoUrls = collectionDoc.data().photoUrls || [];
+                }
+
+                if (photoUrls.length === 0) {
+                    alert('No photos found for this collection.');
+                    return;
+                }
+
+                showCollectionPhotoFullscreen(photoUrls[0], 0, JSON.stringify(photoUrls));
+
+            } catch (error) {
+                console.error('Error loading collection photos:', error);
+                alert('Error loading collection photos: ' + error.message);
+            }
+        }
+;
+
+        // Delete collection photo
+        async function deleteCollectionPhoto(photoIndex, photoUrl) {
+            const db = window.db || firebase.firestore();
+            const storage = window.storage || firebase.storage();
+            if (!confirm('Are you sure you want to delete this photo? This action cannot be undone.')) {
+                return;
+            }
+
+            try {
+                const loadingModal = new bootstrap.Modal(document.getElementById('photoUploadLoadingModal'));
+                loadingModal.show();
+                document.getElementById('photoUploadProgress').textContent = 'Deleting photo...';
+
+                const collectionName = lastViewedCollectionName;
+                if (!collectionName) {
+                    throw new Error('Collection name not found');
+                }
+
+                const collectionDoc = await db.collection('collections').doc(collectionName).get();
+
+                if (!collectionDoc.exists) {
+                    throw new Error('Collection document not found');
+                }
+
+                const currentPhotoUrls = collectionDoc.data().photoUrls || [];
+                const updatedPhotoUrls = currentPhotoUrls.filter((url, index) => index !== photoIndex);
+
+                await db.collection('collections').doc(collectionName).update({
+                    photoUrls: updatedPhotoUrls
+                });
+
+                try {
+                    const urlParts = photoUrl.split('/');
+                    const encodedPath = urlParts[urlParts.length - 1].split('?')[0];
+                    const decodedPath = decodeURIComponent(encodedPath);
+                    const photoRef = storage.ref().child(decodedPath);
+                    await photoRef.delete();
+                } catch (storageError) {
+                    console.warn('Could not delete from storage:', storageError);
+                }
+
+                loadingModal.hide();
+                alert('Photo deleted successfully!');
+
+                const galleryModal = bootstrap.Modal.getInstance(document.getElementById('collectionPhotoFullscreenModal'));
+                if (galleryModal) galleryModal.hide();
+
+                if (lastViewedCollectionName) {
+                    showMyToolsByCollection(lastViewedCollectionName);
+                }
+
+            } catch (error) {
+                console.error('Collection photo delete failed:', error);
+                const loadingModal = bootstrap.Modal.getInstance(document.getElementById('photoUploadLoadingModal'));
+                if (loadingModal) loadingModal.hide();
+                alert('Delete failed: ' + error.message);
+            }
+        }
+
+        // Show location photo upload dialog
+        async function showLocationPhotoUploadDialog(collectionName, location) {
+            const db = window.db || firebase.firestore();
+            try {
+                const toolsSnapshot = await db.collection('tools')
+                    .where('collectionCode', '==', collectionName)
+                    .get();
+                
+                if (toolsSnapshot.empty) {
+                    alert('No tools found for this collection.');
+                    return;
+                }
+                
+                const locations = [...new Set(toolsSnapshot.docs.map(doc => doc.data().location).filter(Boolean))].sort();
+                
+                if (locations.length === 0) {
+                    alert('No locations found for this collection.');
+                    return;
+                }
+                
+                // Create location selection modal
+                const modalHtml = `
+                    <div class="modal fade" id="locationPhotoLocationSelectModal" tabindex="-1" aria-labelledby="locationPhotoLocationSelectModalLabel" aria-hidden="true">
+                        <div class="modal-dialog">
+                            <div class="modal-content">
+                                <div class="modal-header bg-success text-white">
+                                    <h5 class="modal-title" id="locationPhotoLocationSelectModalLabel">Select Location for Photo</h5>
+                                    <button type="button" class="btn-close" data-bs-dismiss="modal" aria-label="Close"></button>
+                                </div>
+                                <div class="modal-body">
+                                    <div class="mb-3">
+                                        <strong>Collection:</strong> ${collectionName}
+                                    </div>
+                                    <div class="mb-3">
+                                        <label class="form-label"><strong>Select Location:</strong></label>
+                                        <select id="locationPhotoLocationSelect" class="form-select">
+                                            <option value="">Choose a location...</option>
+                                        </select>
+                                    </div>
+                                </div>
+                                <div class="modal-footer">
+                                    <button type="button" class="btn btn-secondary" data-bs-dismiss="modal">Cancel</button>
+                                    <button type="button" class="btn btn-success" id="locationPhotoLocationConfirmBtn">Continue</button>
+                                </div>
+                            </div>
+                        </div>
+                    </div>
+                `;
+                
+                const existingModal = document.getElementById('locationPhotoLocationSelectModal');
+                if (existingModal) {
+                    existingModal.remove();
+                }
+                
+                document.body.insertAdjacentHTML('beforeend', modalHtml);
+                
+                const modal = document.getElementById('locationPhotoLocationSelectModal');
+                const locationSelect = modal.querySelector('#locationPhotoLocationSelect');
+                locationSelect.innerHTML = '<option value="">Choose a location...</option>';
+                locations.forEach(loc => {
+                    locationSelect.innerHTML += `<option value="${loc}">${loc}</option>`;
+                });
+                
+                const bsModal = new bootstrap.Modal(modal);
+                bsModal.show();
+                
+                document.getElementById('locationPhotoLocationConfirmBtn').onclick = function() {
+                    const selectedLocation = locationSelect.value;
+                    if (!selectedLocation) {
+                        alert('Please select a location.');
+                        return;
+                    }
+                    
+                    bsModal.hide();
+                    showLocationPhotoFileUploadDialog(collectionName, selectedLocation);
+                };
+                
+            } catch (error) {
+                console.error('Error loading locations:', error);
+                alert('Error loading locations. Please try again.');
+            }
+        }
+
+        // Show location photo file upload dialog
+        function showLocationPhotoFileUploadDialog(collectionName, selectedLocation) {
+            const modalHtml = `
+                <div class="modal fade" id="locationPhotoSourceModal" tabindex="-1" aria-labelledby="locationPhotoSourceModalLabel" aria-hidden="true">
+                    <div class="modal-dialog">
+                        <div class="modal-content">
+                            <div class="modal-header bg-success text-white">
+                                <h5 class="modal-title" id="locationPhotoSourceModalLabel">Choose Photo Source</h5>
+                                <button type="button" class="btn-close" data-bs-dismiss="modal" aria-label="Close"></button>
+                            </div>
+                            <div class="modal-body">
+                                <div class="mb-3">
+                                    <strong>Collection:</strong> ${collectionName}<br>
+                                    <strong>Location:</strong> ${selectedLocation}
+                                </div>
+                                <div class="d-grid gap-2">
+                                    <button id="locationPhotoCameraBtn" class="btn btn-primary">
+                                        <i class="fas fa-camera"></i> Take Photo with Camera
+                                    </button>
+                                    <button id="locationPhotoBrowseBtn" class="btn btn-secondary">
+                                        <i class="fas fa-folder-open"></i> Browse from Gallery
+                                    </button>
+                                </div>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+            `;
+            
+            const existingModal = document.getElementById('locationPhotoSourceModal');
+            if (existingModal) {
+                existingModal.remove();
+            }
+            
+            document.body.insertAdjacentHTML('beforeend', modalHtml);
+            
+            const modal = document.getElementById('locationPhotoSourceModal');
+            const bsModal = new bootstrap.Modal(modal);
+            bsModal.show();
+            
+            document.getElementById('locationPhotoCameraBtn').onclick = function() {
+                bsModal.hide();
+                showLocationPhotoCameraDialog(collectionName, selectedLocation);
+            };
+            
+            document.getElementById('locationPhotoBrowseBtn').onclick = function() {
+                bsModal.hide();
+                showLocationPhotoBrowseDialog(collectionName, selectedLocation);
+            };
+        }
+
+;
+
+        // Upload location photo
+        async function uploadLocationPhoto(collectionName, location, file) {
+            const db = window.db || firebase.firestore();
+            const storage = window.storage || firebase.storage();
+            try {
+                const loadingModal = new bootstrap.Modal(document.getElementById('photoUploadLoadingModal'));
+                loadingModal.show();
+                document.getElementById('photoUploadProgress').textContent = 'Processing image...';
+
+                const compressedBlob = await compressImage(file);
+                if (!compressedBlob) {
+                    loadingModal.hide();
+                    alert('Failed to compress image');
+                    return;
+                }
+
+                document.getElementById('photoUploadProgress').textContent = 'Uploading to storage...';
+
+                const documentId = `${collectionName}_${location}`;
+                const docRef = db.collection('locationPhotos').doc(documentId);
+                const doc = await docRef.get();
+
+                let currentPhotoUrls = [];
+                if (doc.exists) {
+                    currentPhotoUrls = doc.data().photoUrls || [];
+                }
+
+                const photoNumber = currentPhotoUrls.length + 1;
+                const fileName = `${collectionName}_${location}_photo${photoNumber}.jpg`;
+
+                const photoRef = storage.ref('Location_Photo/' + fileName);
+                const uploadTask = photoRef.put(compressedBlob);
+
+                uploadTask.on('state_changed',
+                    (snapshot) => {
+                        const progress = (snapshot.bytesTransferred / snapshot.totalBytes) * 100;
+                        document.getElementById('photoUploadProgress').textContent = `Uploading... ${Math.round(progress)}%`;
+                    },
+                    (error) => {
+                        console.error('Upload error:', error);
+                        loadingModal.hide();
+                        alert('Upload failed: ' + error.message);
+                    },
+                    async () => {
+                        try {
+                            document.getElementById('photoUploadProgress').textContent = 'Updating database...';
+
+                            const downloadURL = await uploadTask.snapshot.ref.getDownloadURL();
+                            const newPhotoUrls = [...currentPhotoUrls, downloadURL];
+
+                            await docRef.set({
+                                collectionName: collectionName,
+                                location: location,
+                                photoUrls: newPhotoUrls,
+                                lastUpdated: firebase.firestore.FieldValue.serverTimestamp()
+                            }, { merge: true });
+
+                            loadingModal.hide();
+                            alert('Location photo uploaded successfully!');
+
+                            if (lastViewedCollectionName) {
+                                showMyToolsByCollection(lastViewedCollectionName);
+                            }
+
+                        } catch (error) {
+                            console.error('Error updating location photo:', error);
+                            loadingModal.hide();
+                            alert('Error updating location photo: ' + error.message);
+                        }
+                    }
+                );
+
+            } catch (error) {
+                console.error('Location photo upload failed:', error);
+                const loadingModal = bootstrap.Modal.getInstance(document.getElementById('photoUploadLoadingModal'));
+                if (loadingModal) loadingModal.hide();
+                alert('Upload failed: ' + error.message);
+            }
+        }
+    
\ No newline at end of file
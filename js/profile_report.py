@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Read profiler dumps from bundles built with optimize_split.py --instrument.
+
+One dump prints the hottest functions; two dumps print what changed between
+the runs, biggest differences first:
+
+    python js/profile_report.py run.json
+    python js/profile_report.py before.json after.json --sort total
+"""
+
+import argparse
+import json
+import sys
+
+from instrument import DUMP_VERSION
+
+SORT_KEYS = {'self': 'self_ms', 'total': 'total_ms', 'calls': 'calls', 'max': 'max_ms'}
+
+
+def load_dump(path):
+    """{name: {'calls', 'total_ms', 'self_ms', 'max_ms'}} from a dump file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        dump = json.load(f)
+    if isinstance(dump, str):
+        # copy(__dsProf.dump()) in some consoles yields the JSON as a string
+        dump = json.loads(dump)
+    if dump.get('version') != DUMP_VERSION:
+        raise ValueError(f"{path}: unsupported profile version {dump.get('version')!r}")
+    return dump['functions']
+
+
+def print_hot(functions, key, limit):
+    """Print the `limit` functions with the largest `key`"""
+    rows = sorted(functions.items(), key=lambda item: item[1][key], reverse=True)[:limit]
+    total_self = sum(stat['self_ms'] for stat in functions.values()) or 1
+    print(f"{'function':40} {'calls':>9} {'self ms':>10} {'self %':>7} {'total ms':>10} "
+          f"{'max ms':>9} {'ms/call':>9}")
+    for name, stat in rows:
+        print(f"{name[:40]:40} {stat['calls']:>9} {stat['self_ms']:>10.1f} "
+              f"{100 * stat['self_ms'] / total_self:>6.1f}% {stat['total_ms']:>10.1f} "
+              f"{stat['max_ms']:>9.1f} {stat['total_ms'] / stat['calls']:>9.3f}")
+    print(f"{len(functions)} functions called, {total_self:.1f} ms of self time")
+
+
+def print_diff(before, after, key, limit):
+    """Print the `limit` functions whose `key` changed most between two runs"""
+    empty = {'calls': 0, 'total_ms': 0.0, 'self_ms': 0.0, 'max_ms': 0.0}
+    changes = []
+    for name in set(before) | set(after):
+        old = before.get(name, empty)
+        new = after.get(name, empty)
+        changes.append((new[key] - old[key], name, old, new))
+    changes.sort(key=lambda change: abs(change[0]), reverse=True)
+    print(f"{'function':40} {'calls':>15} {key:>21} {'change':>10}")
+    for delta, name, old, new in changes[:limit]:
+        if not delta:
+            break
+        ratio = f"{delta / old[key]:+.0%}" if old[key] else 'new'
+        print(f"{name[:40]:40} {old['calls']:>7}->{new['calls']:<7} "
+              f"{old[key]:>10.1f}->{new[key]:<10.1f} {ratio:>10}")
+    print(f"Sum of {key}: {sum(s[key] for s in before.values()):.1f} -> "
+          f"{sum(s[key] for s in after.values()):.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Hot-function tables from __dsProf dumps')
+    parser.add_argument('dumps', nargs='+', help='one dump, or a baseline and a new run')
+    parser.add_argument('--sort', choices=sorted(SORT_KEYS), default='self',
+                        help='counter to rank by (default: self)')
+    parser.add_argument('--limit', type=int, default=30, help='rows to print (default: 30)')
+    args = parser.parse_args()
+
+    if len(args.dumps) > 2:
+        parser.error('pass one dump, or two to compare')
+    try:
+        runs = [load_dump(path) for path in args.dumps]
+    except (OSError, ValueError) as error:
+        print(f"Error: {error}")
+        return 1
+    if len(runs) == 1:
+        print_hot(runs[0], SORT_KEYS[args.sort], args.limit)
+    else:
+        print_diff(runs[0], runs[1], SORT_KEYS[args.sort], args.limit)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
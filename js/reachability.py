@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Reachability pass over the duty-shifts bundles.
+
+Starting from everything the page can run on its own, it follows the call
+graph and reports the functions nothing can reach. The roots are:
+- inline event handlers in duty-shifts.html (onclick=, oninput=, ...)
+- inline <script> blocks of the page
+- top-level statements of the bundles, including window.x = ... exports
+  and variable initializers
+- every other local script loaded by the page (common.js, the AI assistant)
+- startDutyShiftsAppInit
+"""
+
+import argparse
+import os
+import sys
+
+from call_graph import build_call_graph, is_function
+from html_pages import inline_handlers, inline_scripts, local_script_paths, read_page
+from js_tokenizer import names_referenced_in
+
+ENTRY_POINTS = ('startDutyShiftsAppInit',)
+
+
+def page_roots(html_path, bundle_paths, index):
+    """Names the page references outside the given bundle files (scripts
+    in bundle_paths are being analyzed or regenerated, so they are skipped)"""
+    html = read_page(html_path)
+    roots = set(ENTRY_POINTS)
+    for code in inline_handlers(html) + inline_scripts(html):
+        roots |= names_referenced_in(code.encode('utf-8'))
+    bundles = {os.path.abspath(path) for path in bundle_paths}
+    for path in local_script_paths(html_path, html):
+        if path not in bundles and os.path.exists(path):
+            for _, refs in index.references(path):
+                roots.update(refs)
+    return roots
+
+
+def reachable_names(graph, roots):
+    """Every declaration reachable from the roots and the bundles' top-level code"""
+    pending = [name for name in roots if name in graph.nodes]
+    for refs in graph.top_level.values():
+        pending.extend(refs)
+    seen = set()
+    while pending:
+        name = pending.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        pending.extend(graph.edges.get(name, ()))
+    return seen
+
+
+def unreachable_functions(graph, roots):
+    """Sorted names of the functions nothing can reach"""
+    seen = reachable_names(graph, roots)
+    return sorted(name for name, decl in graph.nodes.items()
+                  if is_function(decl) and name not in seen)
+
+
+def analyze(html_path, bundle_paths, index, outputs=()):
+    """Return (graph, unreachable function names) for a page's bundles.
+
+    `outputs` are scripts of the page that will be regenerated from
+    bundle_paths; their current content is not treated as a root.
+    """
+    graph = build_call_graph(bundle_paths, index)
+    roots = page_roots(html_path, list(bundle_paths) + list(outputs), index)
+    return graph, unreachable_functions(graph, roots)
+
+
+def print_report(graph, unreachable):
+    """Print unreachable functions with the bytes they take in each file"""
+    total = 0
+    by_file = {}
+    for name in unreachable:
+        decl = graph.nodes[name]
+        size = decl.end - decl.lead
+        total += size
+        by_file.setdefault(graph.files[name], []).append((name, size))
+    for path, entries in by_file.items():
+        file_bytes = sum(size for _, size in entries)
+        print(f"{os.path.basename(path)}: {len(entries)} unreachable functions, {file_bytes} bytes")
+        for name, size in entries:
+            print(f"  {name} ({size} bytes)")
+    print(f"Total: {len(unreachable)} unreachable functions, {total} bytes")
+
+
+def main():
+    from optimize_split import open_index
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    default_html = os.path.join(os.path.dirname(script_dir), 'duty-shifts.html')
+    parser = argparse.ArgumentParser(description='Report functions the duty-shifts page cannot reach')
+    parser.add_argument('--html', default=default_html, help='page whose handlers and scripts are roots')
+    parser.add_argument('files', nargs='*',
+                        help='bundle files to analyze (default: the duty-shifts-*.js scripts of the page)')
+    args = parser.parse_args()
+
+    bundle_paths = args.files or [path for path in local_script_paths(args.html)
+                                  if os.path.basename(path).startswith('duty-shifts-')]
+    index = open_index()
+    graph, unreachable = analyze(args.html, bundle_paths, index)
+    index.save()
+    print_report(graph, unreachable)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,817 @@
+// ============================================
+// SHARED-PAGES.JS - Functions shared by several pages
+// Generated by js/extract_inline.py from: my-tools.html, register-tools.html, tools-by-owner.html
+// ============================================
+
+        // Show Add Collection Modal
+        function showAddCollectionModal() {
+            const modalElement = document.getElementById('addCollectionModal');
+            const modal = new bootstrap.Modal(modalElement);
+            document.getElementById('addCollectionForm').reset();
+            document.getElementById('addCollectionError').style.display = 'none';
+            document.getElementById('addCollectionError').textContent = '';
+            
+            window.collectionSaveSuccess = false;
+            
+            const handleModalClose = function() {
+                if (!window.collectionSaveSuccess) {
+                    setTimeout(() => {
+                        showCollectionSelectionDialog();
+                    }, 100);
+                }
+                window.collectionSaveSuccess = false;
+            };
+            
+            modalElement.removeEventListener('hidden.bs.modal', handleModalClose);
+            modalElement.addEventListener('hidden.bs.modal', handleModalClose);
+            
+            modal.show();
+        }
+
+        // Helper functions
+        function isMobileDevice() {
+            return /Android|webOS|iPhone|iPad|iPod|BlackBerry|IEMobile|Opera Mini/i.test(navigator.userAgent) || 
+                   window.innerWidth <= 768;
+        }
+
+        function getResponsiveButtonText(desktopText, mobileText) {
+            return isMobileDevice() ? mobileText : desktopText;
+        }
+
+        // Show tool details from My Tools (same as my-tools.html)
+        async function showToolDetailsFromMyTools(tool) {
+            const db = window.db || firebase.firestore();
+            const formatTimestamp = (timestamp) => {
+                if (!timestamp) return 'N/A';
+                if (timestamp.toDate) {
+                    return timestamp.toDate().toLocaleString('en-GB', {
+                        day: '2-digit', month: '2-digit', year: 'numeric',
+                        hour: '2-digit', minute: '2-digit', second: '2-digit', hour12: false
+                    });
+                }
+                if (timestamp.seconds) {
+                    return new Date(timestamp.seconds * 1000).toLocaleString('en-GB', {
+                        day: '2-digit', month: '2-digit', year: 'numeric',
+                        hour: '2-digit', minute: '2-digit', second: '2-digit', hour12: false
+                    });
+                }
+                return timestamp;
+            };
+
+            const modal = new bootstrap.Modal(document.getElementById('checkoutInfoModal'));
+            const modalTitle = document.getElementById('checkoutInfoModalTitle');
+            const modalBody = document.getElementById('checkoutInfoModalBody');
+
+            modalTitle.textContent = 'Loading...';
+            modalBody.innerHTML = '<div class="text-center">Loading checkout information...</div>';
+            modal.show();
+
+            try {
+                const status = tool.status || 'N/A';
+                let title = '';
+                let field1Label = '';
+                let field1Value = '';
+                let field2Label = '';
+                let field2Value = '';
+                let workOnValue = 'N/A';
+
+                // Get WorkOn value from tool data
+                const toolDoc = await db.collection('tools').doc(tool.id).get();
+                if (toolDoc.exists) {
+                    const toolData = toolDoc.data();
+                    workOnValue = (typeof toolData.WorkOn === 'string' && toolData.WorkOn.trim()) ? toolData.WorkOn : 'N/A';
+                } else {
+                    workOnValue = (typeof tool.WorkOn === 'string' && tool.WorkOn.trim()) ? tool.WorkOn : 'N/A';
+                }
+
+                if (status === 'OUT') {
+                    title = 'Tool Checkout Information';
+                    field1Label = 'Checked Out By:';
+                    field2Label = 'ChkOut Date:';
+
+                    if (toolDoc.exists) {
+                        const toolData = toolDoc.data();
+                        field1Value = toolData.technician || 'N/A';
+                        field2Value = formatTimestamp(toolData.timestamp);
+                    } else {
+                        field1Value = 'N/A';
+                        field2Value = 'N/A';
+                    }
+                } else if (status === 'IN') {
+                    title = 'Last Tool Movement Information';
+                    field1Label = 'Technician:';
+                    field2Label = 'Date:';
+                    try {
+                        const logSnapshot = await db.collection('logtoolmovements')
+                            .where('toolId', '==', tool.id)
+                            .orderBy('timestamp', 'desc')
+                            .limit(1)
+                            .get();
+                        if (!logSnapshot.empty) {
+                            const lastLogEntry = logSnapshot.docs[0].data();
+                            field1Value = lastLogEntry.technician || 'N/A';
+                            field2Value = formatTimestamp(lastLogEntry.timestamp);
+                        } else {
+                            field1Value = tool.technician || 'N/A';
+                            field2Value = formatTimestamp(tool.timestamp);
+                        }
+                    } catch (logError) {
+                        console.error('Error querying logtoolmovements:', logError);
+                        field1Value = tool.technician || 'N/A';
+                        field2Value = formatTimestamp(tool.timestamp);
+                    }
+                } else {
+                    title = 'Tool Information';
+                    field1Label = 'Status:';
+                    field1Value = tool.status || 'N/A';
+                    field2Label = 'Technician:';
+                    field2Value = tool.technician || 'N/A';
+                }
+
+                modalTitle.textContent = title;
+                modalBody.innerHTML = `
+                    <div class="mb-3">
+                        <strong style="color: #222; font-size: 1.1em;">${field1Label}</strong>
+                        <div style="color: #1976d2; font-size: 1.0em; margin-top: 4px;">${field1Value}</div>
+                    </div>
+                    <div class="mb-3">
+                        <strong style="color: #222; font-size: 1.1em;">${field2Label}</strong>
+                        <div style="color: #1976d2; font-size: 1.0em; margin-top: 4px;">${field2Value}</div>
+                    </div>
+                    <div class="mb-3">
+                        <strong style="color: #222; font-size: 1.1em;">Last WorkOn:</strong>
+                        <div style="color: #1976d2; font-size: 1.0em; margin-top: 4px;">${workOnValue}</div>
+                    </div>
+                `;
+
+                window.history.pushState({ modal: 'checkoutInfo' }, '', '');
+                modal.show();
+            } catch (error) {
+                console.error('Error fetching checkout information:', error);
+                modalTitle.textContent = 'Error';
+                modalBody.innerHTML = `
+                    <div class="text-center text-danger">
+                        Error loading checkout information. Please try again.<br>
+                        <small>Status: ${tool.status || 'N/A'}<br>
+                        Tool ID: ${tool.id || 'N/A'}</small>
+                    </div>
+                `;
+            }
+        }
+
+        // Image compression function
+        function compressImage(file) {
+            return new Promise((resolve) => {
+                const canvas = document.createElement('canvas');
+                const ctx = canvas.getContext('2d');
+                const img = new Image();
+
+                img.onload = function() {
+                    let newWidth = img.width;
+                    let newHeight = img.height;
+                    const maxSize = 1200;
+
+                    if (newWidth > maxSize || newHeight > maxSize) {
+                        if (newWidth > newHeight) {
+                            newHeight = (newHeight * maxSize) / newWidth;
+                            newWidth = maxSize;
+                        } else {
+                            newWidth = (newWidth * maxSize) / newHeight;
+                            newHeight = maxSize;
+                        }
+                    }
+
+                    canvas.width = newWidth;
+                    canvas.height = newHeight;
+
+                    ctx.drawImage(img, 0, 0, newWidth, newHeight);
+
+                    let quality = 0.95;
+
+                    function tryCompression() {
+                        canvas.toBlob((result) => {
+                            if (result.size <= 800 * 1024 || quality <= 0.1) {
+                                resolve(result);
+                            } else {
+                                quality -= 0.05;
+                                tryCompression();
+                            }
+                        }, 'image/jpeg', quality);
+                    }
+
+                    tryCompression();
+                };
+
+                img.onerror = function() {
+                    console.error('Failed to load image');
+                    resolve(null);
+                };
+
+                img.src = URL.createObjectURL(file);
+            });
+        }
+
+        // Create photo upload input (full implementation with photo sharing logic)
+        async function createPhotoUploadInput(toolId, partNumber) {
+            const db = window.db || firebase.firestore();
+            currentPhotoUploadToolId = toolId;
+            currentPhotoUploadPartNumber = partNumber;
+            photoUploadToAllTools = false;
+            photoUploadAutoShareTargets = [];
+
+            try {
+                // Get current tool's photo URLs
+                const toolDoc = await db.collection('tools').doc(toolId).get();
+                currentToolPhotoUrls = toolDoc.exists ? (toolDoc.data().photoUrls || []) : [];
+
+                // Check if there are other tools with the same part number that have photos
+                const toolsWithSamePart = await db.collection('tools')
+                    .where('partNumber', '==', partNumber)
+                    .get();
+
+                // Filter tools that have photos (excluding current tool)
+                const toolsWithPhotos = toolsWithSamePart.docs
+                    .filter(doc => doc.id !== toolId && doc.data().photoUrls && doc.data().photoUrls.length > 0)
+                    .map(doc => ({
+                        id: doc.id,
+                        toolName: doc.data().toolName || 'Unknown Tool',
+                        owner: doc.data().owner || 'Unknown',
+                        photoCount: (doc.data().photoUrls || []).length,
+                        photoUrls: doc.data().photoUrls || []
+                    }));
+
+                // If other tools with photos exist, show choice modal
+                if (toolsWithPhotos.length > 0) {
+                    // Format tools list
+                    let toolsListHTML = '';
+                    toolsListHTML = toolsWithPhotos.map((tool, index) => 
+                        `<div style="font-size: 1.15rem; font-weight: bold; color: #333; margin-bottom: 6px;">
+                            ${index + 1}. ${tool.toolName} (Owner: ${tool.owner}) - ${tool.photoCount} photo(s)
+                        </div>`
+                    ).join('');
+
+                    // Collect all unique photo URLs from all tools
+                    const allPhotoUrls = [];
+                    toolsWithPhotos.forEach(tool => {
+                        tool.photoUrls.forEach(url => {
+                            if (!allPhotoUrls.includes(url) && !currentToolPhotoUrls.includes(url)) {
+                                allPhotoUrls.push(url);
+                            }
+                        });
+                    });
+
+                    // Initialize selected photos array
+                    window.selectedPhotos = [];
+
+                    // Format photo thumbnails with selection handlers
+                    let thumbnailsHTML = '';
+                    if (allPhotoUrls.length > 0) {
+                        thumbnailsHTML = allPhotoUrls.map((url, index) => 
+                            `<div style="position: relative; display: inline-block;">
+                                <img src="${url}" 
+                                     data-photo-url="${url}"
+                                     data-photo-index="${index}"
+                                     class="photo-thumbnail-selectable"
+                                     style="width: 80px; height: 80px; object-fit: cover; border-radius: 8px; border: 2px solid #ddd; cursor: pointer; transition: all 0.2s;" 
+                                     onclick="togglePhotoSelection('${url}', ${index})"
+                                     onmouseover="this.style.transform='scale(1.05)';"
+                                     onmouseout="if(!this.classList.contains('selected')) { this.style.transform='scale(1)'; }"
+                                     title="Click to select/deselect">
+                                <div class="photo-selected-indicator" style="display: none; position: absolute; top: -5px; right: -5px; background: #4CAF50; color: white; border-radius: 50%; width: 24px; height: 24px; align-items: center; justify-content: center; font-weight: bold; font-size: 14px; box-shadow: 0 2px 4px rgba(0,0,0,0.2);">
+                                    <i class="fas fa-check"></i>
+                                </div>
+                            </div>`
+                        ).join('');
+                    } else {
+                        thumbnailsHTML = '<div style="color: #999; font-style: italic;">No new shared photos available (your tool already has all of them).</div>';
+                    }
+
+                    // Show choice modal
+                    document.getElementById('photoUploadToolsList').innerHTML = toolsListHTML;
+                    document.getElementById('photoUploadThumbnails').innerHTML = thumbnailsHTML;
+                    document.getElementById('selectedCount').textContent = '0';
+
+                    const addSelectedMyBtn = document.getElementById('addSelectedPhotosMyToolBtn');
+                    const addSelectedAllBtn = document.getElementById('addSelectedPhotosAllToolsBtn');
+                    if (addSelectedMyBtn) addSelectedMyBtn.disabled = true;
+                    if (addSelectedAllBtn) addSelectedAllBtn.disabled = true;
+
+                    const choiceModal = new bootstrap.Modal(document.getElementById('photoUploadChoiceModal'));
+                    choiceModal.show();
+
+                    // Store toolsWithSamePart for use in useSelectedPhotos function
+                    window.currentPhotoUploadData = {
+                        toolId: toolId,
+                        partNumber: partNumber,
+                        toolsWithSamePart: toolsWithSamePart,
+                        toolsWithPhotos: toolsWithPhotos,
+                        allPhotoUrls: allPhotoUrls,
+                        currentToolPhotoUrls: currentToolPhotoUrls
+                    };
+
+                    if (addSelectedMyBtn) {
+                        addSelectedMyBtn.onclick = function() {
+                            if (window.selectedPhotos.length > 0) {
+                                useSelectedPhotos(toolId, partNumber, toolsWithSamePart.docs, false);
+                            }
+                        };
+                    }
+
+                    if (addSelectedAllBtn) {
+                        addSelectedAllBtn.onclick = function() {
+                            if (window.selectedPhotos.length > 0) {
+                                useSelectedPhotos(toolId, partNumber, toolsWithSamePart.docs, true);
+                            }
+                        };
+                    }
+
+                    const addNewPhotoMyBtn = document.getElementById('addNewPhotoMyToolBtn');
+                    if (addNewPhotoMyBtn) {
+                        addNewPhotoMyBtn.onclick = function() {
+                            photoUploadToAllTools = false;
+                            photoUploadAutoShareTargets = [];
+                            window.selectedPhotos = [];
+                            choiceModal.hide();
+                            showPhotoSourceModal(toolId, partNumber);
+                        };
+                    }
+
+                    const addNewPhotoAllBtn = document.getElementById('addNewPhotoAllToolsBtn');
+                    if (addNewPhotoAllBtn) {
+                        addNewPhotoAllBtn.onclick = async function() {
+                            const authorized = await verifyAdminCode('add a new photo to ALL matching tools');
+                            if (!authorized) {
+                                return;
+                            }
+                            photoUploadToAllTools = true;
+                            photoUploadAutoShareTargets = [];
+                            window.selectedPhotos = [];
+                            choiceModal.hide();
+                            showPhotoSourceModal(toolId, partNumber);
+                        };
+                    }
+                } else {
+                    // No other tools with photos, proceed directly to source selection
+                    const toolsWithoutPhotos = toolsWithSamePart.docs
+                        .filter(doc => doc.id !== toolId && (!doc.data().photoUrls || doc.data().photoUrls.length === 0));
+
+                    photoUploadAutoShareTargets = toolsWithoutPhotos.map(doc => ({
+                        id: doc.id,
+                        ref: doc.ref,
+                        owner: doc.data().owner || 'Unknown',
+                        toolName: doc.data().toolName || 'Unknown Tool',
+                        photoUrls: doc.data().photoUrls || []
+                    }));
+
+                    photoUploadToAllTools = false;
+                    window.selectedPhotos = [];
+                    showPhotoSourceModal(toolId, partNumber);
+                }
+            } catch (error) {
+                console.error('Error checking tools with same part number:', error);
+                // On error, proceed with normal flow (add to my tool only)
+                photoUploadToAllTools = false;
+                showPhotoSourceModal(toolId, partNumber);
+            }
+        }
+
+        // Toggle photo selection
+        function togglePhotoSelection(photoUrl, index) {
+            const img = document.querySelector(`img[data-photo-index="${index}"]`);
+            const indicator = img ? img.nextElementSibling : null;
+            
+            if (!window.selectedPhotos) {
+                window.selectedPhotos = [];
+            }
+            
+            const isSelected = window.selectedPhotos.includes(photoUrl);
+            
+            if (isSelected) {
+                // Deselect
+                window.selectedPhotos = window.selectedPhotos.filter(url => url !== photoUrl);
+                if (img) {
+                    img.classList.remove('selected');
+                    img.style.border = '2px solid #ddd';
+                    img.style.opacity = '1';
+                }
+                if (indicator) indicator.style.display = 'none';
+            } else {
+                // Select
+                window.selectedPhotos.push(photoUrl);
+                if (img) {
+                    img.classList.add('selected');
+                    img.style.border = '3px solid #4CAF50';
+                    img.style.opacity = '0.9';
+                }
+                if (indicator) indicator.style.display = 'flex';
+            }
+            
+            // Update count and button states
+            const count = window.selectedPhotos.length;
+            const selectedCountEl = document.getElementById('selectedCount');
+            if (selectedCountEl) {
+                selectedCountEl.textContent = count;
+            }
+
+            const addSelectedMyBtn = document.getElementById('addSelectedPhotosMyToolBtn');
+            const addSelectedAllBtn = document.getElementById('addSelectedPhotosAllToolsBtn');
+            if (addSelectedMyBtn) {
+                addSelectedMyBtn.disabled = count === 0;
+            }
+            if (addSelectedAllBtn) {
+                addSelectedAllBtn.disabled = count === 0;
+            }
+        }
+
+        // Show photo source selection modal
+        function showPhotoSourceModal(toolId, partNumber) {
+            const modalHtml = `
+                <div class="modal fade" id="photoSourceModal" tabindex="-1" aria-labelledby="photoSourceModalLabel" aria-hidden="true">
+                    <div class="modal-dialog modal-sm">
+                        <div class="modal-content">
+                            <div class="modal-header bg-primary text-white">
+                                <h5 class="modal-title" id="photoSourceModalLabel">Add Photo</h5>
+                                <button type="button" class="btn-close" data-bs-dismiss="modal" aria-label="Close"></button>
+                            </div>
+                            <div class="modal-body text-center">
+                                <div class="d-grid gap-3">
+                                    <button type="button" class="btn btn-primary btn-lg" onclick="takePhotoWithCamera('${toolId}', '${partNumber}')">
+                                        <i class="fas fa-camera"></i> Take Photo
+                                    </button>
+                                    <button type="button" class="btn btn-secondary btn-lg" onclick="selectPhotoFromGallery('${toolId}', '${partNumber}')">
+                                        <i class="fas fa-images"></i> Choose from Gallery
+                                    </button>
+                                </div>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+            `;
+
+            const existingModal = document.getElementById('photoSourceModal');
+            if (existingModal) {
+                existingModal.remove();
+            }
+
+            document.body.insertAdjacentHTML('beforeend', modalHtml);
+
+            const modal = new bootstrap.Modal(document.getElementById('photoSourceModal'));
+            modal.show();
+
+            document.getElementById('photoSourceModal').addEventListener('hidden.bs.modal', function() {
+                this.remove();
+            });
+        }
+
+        // Take photo with camera
+        function takePhotoWithCamera(toolId, partNumber) {
+            const sourceModal = bootstrap.Modal.getInstance(document.getElementById('photoSourceModal'));
+            if (sourceModal) sourceModal.hide();
+
+            const input = document.createElement('input');
+            input.type = 'file';
+            input.accept = 'image/*';
+            input.capture = 'environment';
+            input.style.display = 'none';
+
+            input.onchange = function(event) {
+                const file = event.target.files[0];
+                if (file) {
+                    uploadToolPhoto(toolId, partNumber, file);
+                }
+                document.body.removeChild(input);
+            };
+
+            document.body.appendChild(input);
+            input.click();
+        }
+
+        // Select photo from gallery
+        function selectPhotoFromGallery(toolId, partNumber) {
+            const sourceModal = bootstrap.Modal.getInstance(document.getElementById('photoSourceModal'));
+            if (sourceModal) sourceModal.hide();
+
+            const input = document.createElement('input');
+            input.type = 'file';
+            input.accept = 'image/*';
+            input.style.display = 'none';
+
+            input.onchange = function(event) {
+                const file = event.target.files[0];
+                if (file) {
+                    uploadToolPhoto(toolId, partNumber, file);
+                }
+                document.body.removeChild(input);
+            };
+
+            document.body.appendChild(input);
+            input.click();
+        }
+
+        // Show location photo in fullscreen
+        function showLocationPhotoFullscreen(photoUrlsJson, photoIndex, collectionName, location) {
+            const photoUrls = JSON.parse(photoUrlsJson);
+            if (!photoUrls || photoUrls.length === 0) return;
+            
+            let currentPhotoIndex = photoIndex;
+            
+            let modal = document.getElementById('locationPhotoFullscreenModal');
+            if (!modal) {
+                modal = document.createElement('div');
+                modal.className = 'modal fade';
+                modal.id = 'locationPhotoFullscreenModal';
+                modal.tabIndex = -1;
+                modal.innerHTML = `
+                    <div class="modal-dialog modal-fullscreen">
+                        <div class="modal-content bg-dark text-white">
+                            <div class="modal-header border-0">
+                                <h5 class="modal-title">Location Photos: ${collectionName} / ${location}</h5>
+                                <button type="button" class="btn-close btn-close-white" data-bs-dismiss="modal" aria-label="Close"></button>
+                            </div>
+                            <div class="modal-body d-flex flex-column align-items-center justify-content-center position-relative" id="locationPhotoFullscreenContent">
+                            </div>
+                            <div class="modal-footer justify-content-center border-0 bg-dark">
+                                <span id="locationPhotoCounter" class="text-white"></span>
+                                <button type="button" class="btn btn-danger ms-3" id="locationPhotoDeleteBtn">
+                                    <i class="fas fa-trash"></i> Delete
+                                </button>
+                            </div>
+                        </div>
+                    </div>
+                `;
+                document.body.appendChild(modal);
+            }
+            
+            const contentElement = document.getElementById('locationPhotoFullscreenContent');
+            const counter = document.getElementById('locationPhotoCounter');
+            
+            function updatePhoto() {
+                contentElement.innerHTML = `<img src="${photoUrls[currentPhotoIndex]}" class="img-fluid rounded shadow" style="max-height:80vh;max-width:100vw;object-fit:contain;">`;
+
+                const prevArrow = document.createElement('button');
+                prevArrow.type = 'button';
+                prevArrow.className = 'btn btn-light position-absolute';
+                prevArrow.style = 'left: 20px; top: 50%; transform: translateY(-50%); z-index: 1000; border-radius: 50%; width: 50px; height: 50px; display: flex; align-items: center; justify-content: center;';
+                prevArrow.innerHTML = '<i class="fas fa-chevron-left"></i>';
+                prevArrow.onclick = function() {
+                    if (currentPhotoIndex > 0) {
+                        currentPhotoIndex--;
+                        updatePhoto();
+                    }
+                };
+
+                const nextArrow = document.createElement('button');
+                nextArrow.type = 'button';
+                nextArrow.className = 'btn btn-light position-absolute';
+                nextArrow.style = 'right: 20px; top: 50%; transform: translateY(-50%); z-index: 1000; border-radius: 50%; width: 50px; height: 50px; display: flex; align-items: center; justify-content: center;';
+                nextArrow.innerHTML = '<i class="fas fa-chevron-right"></i>';
+                nextArrow.onclick = function() {
+                    if (currentPhotoIndex < photoUrls.length - 1) {
+                        currentPhotoIndex++;
+                        updatePhoto();
+                    }
+                };
+
+                contentElement.appendChild(prevArrow);
+                contentElement.appendChild(nextArrow);
+
+                counter.textContent = `${currentPhotoIndex + 1} / ${photoUrls.length}`;
+
+                prevArrow.style.display = currentPhotoIndex === 0 ? 'none' : 'flex';
+                nextArrow.style.display = currentPhotoIndex === photoUrls.length - 1 ? 'none' : 'flex';
+
+                const deleteBtn = document.getElementById('locationPhotoDeleteBtn');
+                if (deleteBtn) {
+                    deleteBtn.onclick = function() {
+                        deleteLocationPhoto(collectionName, location, currentPhotoIndex, photoUrls[currentPhotoIndex]);
+                    };
+                }
+            }
+
+            updatePhoto();
+
+            const bsModal = new bootstrap.Modal(modal);
+            bsModal.show();
+        }
+
+        // Create collection photo upload input
+        function createCollectionPhotoUploadInput(collectionName) {
+            const modalHtml = `
+                <div class="modal fade" id="collectionPhotoSourceModal" tabindex="-1" aria-labelledby="collectionPhotoSourceModalLabel" aria-hidden="true">
+                    <div class="modal-dialog modal-sm">
+                        <div class="modal-content">
+                            <div class="modal-header bg-primary text-white">
+                                <h5 class="modal-title" id="collectionPhotoSourceModalLabel">Add Collection Photo</h5>
+                                <button type="button" class="btn-close" data-bs-dismiss="modal" aria-label="Close"></button>
+                            </div>
+                            <div class="modal-body text-center">
+                                <div class="d-grid gap-3">
+                                    <button type="button" class="btn btn-primary btn-lg" onclick="takeCollectionPhotoWithCamera('${collectionName}')">
+                                        <i class="fas fa-camera"></i> Take Photo
+                                    </button>
+                                    <button type="button" class="btn btn-secondary btn-lg" onclick="selectCollectionPhotoFromGallery('${collectionName}')">
+                                        <i class="fas fa-images"></i> Choose from Gallery
+                                    </button>
+                                </div>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+            `;
+
+            const existingModal = document.getElementById('collectionPhotoSourceModal');
+            if (existingModal) {
+                existingModal.remove();
+            }
+
+            document.body.insertAdjacentHTML('beforeend', modalHtml);
+
+            const modal = new bootstrap.Modal(document.getElementById('collectionPhotoSourceModal'));
+            modal.show();
+
+            document.getElementById('collectionPhotoSourceModal').addEventListener('hidden.bs.modal', function() {
+                this.remove();
+            });
+        }
+
+        // Take collection photo with camera
+        function takeCollectionPhotoWithCamera(collectionName) {
+            const sourceModal = bootstrap.Modal.getInstance(document.getElementById('collectionPhotoSourceModal'));
+            if (sourceModal) sourceModal.hide();
+
+            const input = document.createElement('input');
+            input.type = 'file';
+            input.accept = 'image/*';
+            input.capture = 'environment';
+            input.style.display = 'none';
+
+            input.onchange = function(event) {
+                const file = event.target.files[0];
+                if (file) {
+                    uploadCollectionPhoto(collectionName, file);
+                }
+                document.body.removeChild(input);
+            };
+
+            document.body.appendChild(input);
+            input.click();
+        }
+
+        // Select collection photo from gallery
+        function selectCollectionPhotoFromGallery(collectionName) {
+            const sourceModal = bootstrap.Modal.getInstance(document.getElementById('collectionPhotoSourceModal'));
+            if (sourceModal) sourceModal.hide();
+
+            const input = document.createElement('input');
+            input.type = 'file';
+            input.accept = 'image/*';
+            input.style.display = 'none';
+
+            input.onchange = function(event) {
+                const file = event.target.files[0];
+                if (file) {
+                    uploadCollectionPhoto(collectionName, file);
+                }
+                document.body.removeChild(input);
+            };
+
+            document.body.appendChild(input);
+            input.click();
+        }
+
+        // Show collection photo in fullscreen
+        function showCollectionPhotoFullscreen(photoUrl, photoIndex, allPhotoUrls) {
+            const photoUrls = JSON.parse(allPhotoUrls);
+            if (!photoUrls || photoUrls.length === 0) return;
+
+            let currentPhotoIndex = photoIndex;
+
+            let modal = document.getElementById('collectionPhotoFullscreenModal');
+            if (!modal) {
+                modal = document.createElement('div');
+                modal.className = 'modal fade';
+                modal.id = 'collectionPhotoFullscreenModal';
+                modal.tabIndex = -1;
+                modal.innerHTML = `
+                    <div class="modal-dialog modal-fullscreen">
+                        <div class="modal-content bg-dark text-white">
+                            <div class="modal-header border-0">
+                                <h5 class="modal-title">Collection Photos</h5>
+                                <button type="button" class="btn-close btn-close-white" data-bs-dismiss="modal" aria-label="Close"></button>
+                            </div>
+                            <div class="modal-body d-flex flex-column align-items-center justify-content-center position-relative" id="collectionPhotoFullscreenContent">
+                            </div>
+                            <div class="modal-footer justify-content-center border-0 bg-dark">
+                                <span id="collectionPhotoCounter" class="text-white"></span>
+                                <button type="button" class="btn btn-danger ms-3" id="collectionPhotoDeleteBtn">
+                                    <i class="fas fa-trash"></i> Delete
+                                </button>
+                        </div>
+                    </div>
+                </div>
+            `;
+                document.body.appendChild(modal);
+            }
+
+            const contentElement = document.getElementById('collectionPhotoFullscreenContent');
+            const counter = document.getElementById('collectionPhotoCounter');
+
+            function updatePhoto() {
+                contentElement.innerHTML = `<img src="${photoUrls[currentPhotoIndex]}" class="img-fluid rounded shadow" style="max-height:80vh;max-width:100vw;object-fit:contain;">`;
+
+                const prevArrow = document.createElement('button');
+                prevArrow.type = 'button';
+                prevArrow.className = 'btn btn-light position-absolute';
+                prevArrow.style = 'left: 20px; top: 50%; transform: translateY(-50%); z-index: 1000; border-radius: 50%; width: 50px; height: 50px; display: flex; align-items: center; justify-content: center;';
+                prevArrow.innerHTML = '<i class="fas fa-chevron-left"></i>';
+                prevArrow.onclick = function() {
+                    if (currentPhotoIndex > 0) {
+                        currentPhotoIndex--;
+                        updatePhoto();
+                    }
+                };
+
+                const nextArrow = document.createElement('button');
+                nextArrow.type = 'button';
+                nextArrow.className = 'btn btn-light position-absolute';
+                nextArrow.style = 'right: 20px; top: 50%; transform: translateY(-50%); z-index: 1000; border-radius: 50%; width: 50px; height: 50px; display: flex; align-items: center; justify-content: center;';
+                nextArrow.innerHTML = '<i class="fas fa-chevron-right"></i>';
+                nextArrow.onclick = function() {
+                    if (currentPhotoIndex < photoUrls.length - 1) {
+                        currentPhotoIndex++;
+                        updatePhoto();
+                    }
+                };
+
+                contentElement.appendChild(prevArrow);
+                contentElement.appendChild(nextArrow);
+
+                counter.textContent = `${currentPhotoIndex + 1} / ${photoUrls.length}`;
+
+                prevArrow.style.display = currentPhotoIndex === 0 ? 'none' : 'flex';
+                nextArrow.style.display = currentPhotoIndex === photoUrls.length - 1 ? 'none' : 'flex';
+
+                const deleteBtn = document.getElementById('collectionPhotoDeleteBtn');
+                if (deleteBtn) {
+                    deleteBtn.onclick = function() {
+                        deleteCollectionPhoto(currentPhotoIndex, photoUrls[currentPhotoIndex]);
+                    };
+                }
+            }
+
+            updatePhoto();
+
+            const bsModal = new bootstrap.Modal(modal);
+            bsModal.show();
+        }
+
+        // Show location photo camera dialog
+        function showLocationPhotoCameraDialog(collectionName, selectedLocation) {
+            const input = document.createElement('input');
+            input.type = 'file';
+            input.accept = 'image/*';
+            input.capture = 'environment';
+            input.style.display = 'none';
+
+            input.onchange = function(event) {
+                const file = event.target.files[0];
+                if (file) {
+                    uploadLocationPhoto(collectionName, selectedLocation, file);
+                }
+                document.body.removeChild(input);
+            };
+
+            document.body.appendChild(input);
+            input.click();
+        }
+
+        // Show location photo browse dialog
+        function showLocationPhotoBrowseDialog(collectionName, selectedLocation) {
+            const input = document.createElement('input');
+            input.type = 'file';
+            input.accept = 'image/*';
+            input.style.display = 'none';
+
+            input.onchange = function(event) {
+                const file = event.target.files[0];
+                if (file) {
+                    uploadLocationPhoto(collectionName, selectedLocation, file);
+                }
+                document.body.removeChild(input);
+            };
+
+            document.body.appendChild(input);
+            input.click();
+        }
+
+        // Helper to get status CSS class
+        function getStatusClass(status) {
+            const upperStatus = status ? status.toUpperCase() : 'IN';
+            switch (upperStatus) {
+                case 'OUT': return 'out';
+                case 'BROKEN': return 'broken';
+                case 'LOST': return 'lost';
+                case 'CALIBRATION': return 'calibration';
+                default: return 'in';
+            }
+        }
@@ -1,113 +1,39 @@
 #!/usr/bin/env python3
 """
-Script to split duty-shifts.js into 3 files:
+Report how the duty-shifts source splits into its three bundles:
 1. duty-shifts-data.js - Global variables, data loading/saving, Excel generation, utilities
 2. duty-shifts-logic.js - Calculation logic, rotation algorithms, swap logic
 3. duty-shifts-ui.js - UI rendering, modals, event handlers
+
+Declarations come from the token-driven declaration index and their seed
+category from optimize_split.py's name sets; optimize_split.py writes the
+bundles.
 """
 
-import re
+import os
+import sys
 
-def read_file(filename):
-    with open(filename, 'r', encoding='utf-8') as f:
-        return f.read()
+from optimize_split import find_source, open_index
 
-def write_file(filename, content):
-    with open(filename, 'w', encoding='utf-8') as f:
-        f.write(content)
 
 def split_file():
-    content = read_file('app/js/duty-shifts.js')
-    lines = content.split('\n')
-    
-    # Identify key function boundaries
-    # This is a simplified approach - we'll use function names to identify sections
-    
-    data_functions = [
-        'loadData', 'saveData', 'loadDataFromLocalStorage', 'saveDataToLocalStorage',
-        'sanitizeForFirestore', 'escapeHtml', 'mergeAndSaveMonthOrganizedAssignmentsDoc',
-        'formatDateKey', 'getDayType', 'getMonthNameFromDateKey', 'organizeAssignmentsByMonth',
-        'flattenAssignmentsByMonth', 'formatDate', 'getGreekDayName', 'getGreekMonthName',
-        'getDayTypeColor', 'showExcelPreview', 'generateExcelFilesForCurrentMonth',
-        'extractAllPersonNames', 'getAssignedPersonNameForGroupFromAssignment',
-        'getNextTwoRotationPeopleForCurrentMonth', 'getPersonColor', 'getDayPersonColors',
-        'getOrthodoxHolidayName', 'getOrthodoxHolidayNameAuto', 'isWeekend', 'isHoliday',
-        'isSpecialHoliday', 'isOrthodoxOrCyprusHoliday', 'calculateOrthodoxEaster',
-        'calculateOrthodoxHolidays', 'getGroupName', 'migrateGroupsFormat',
-        'getAssignmentsForDayType', 'getAssignmentForDate', 'setAssignmentForDate',
-        'deleteAssignmentForDate', 'getAllAssignments', 'parseAssignedPersonForGroupFromAssignment',
-        'extractGroupAssignmentsMap', 'getRotationBaselineAssignmentForType',
-        'getFinalAssignmentForType', 'findPersonBInGroupForTypeOnDate',
-        'getMonthKeyFromDate', 'rebuildRotationBaselineLastByType',
-        'formatGroupAssignmentsToStringMap', 'buildBaselineComputedCellHtml',
-        'greekUpperNoTones', 'dateToDateKey', 'dateKeyToInputValue', 'inputValueToDateKey',
-        'shiftDate', 'findPreviousDateKeyByDayType', 'findNthPreviousSpecialHolidayDateKey',
-        'getPreviousMonthKeyFromDate', 'isMonthKey', 'getLastRotationPersonForDate',
-        'setLastRotationPersonForMonth', 'getRotationBaselineAssignmentForDate',
-        'getCriticalAssignmentForDate', 'mapDayTypeToRotationType',
-        'getGreekDayNameUppercase', 'getGreekDayAccusativeArticle',
-        'rebuildCriticalAssignmentsFromLastDuties', 'clearDutyShiftsFirestoreDocs',
-        'applyCalendarCellHeight', 'restoreCalendarCellHeight'
-    ]
-    
-    logic_functions = [
-        'calculateDutiesForSelectedMonths', 'runSpecialHolidayLogic', 'runWeekendLogic',
-        'runSemiNormalLogic', 'runNormalLogic', 'runSemiNormalSwapLogic', 'runNormalSwapLogic',
-        'findNextEligiblePersonAfterMissing', 'isPersonMissingOnDate', 'isPersonDisabledForDuty',
-        'getRotationPosition', 'executeCalculation', 'renderStep1_SpecialHolidays',
-        'renderStep2_Weekends', 'renderStep3_SemiNormal', 'renderStep4_Normal',
-        'renderCurrentStep', 'goToNextStep', 'goToPreviousStep', 'cancelStepByStepCalculation',
-        'saveFinalNormalAssignments', 'showNormalSwapResults', 'showSemiNormalSwapResults',
-        'storeAssignmentReason', 'buildUnavailableReplacementReason',
-        'normalizeSkipReasonText', 'normalizeSwapReasonText', 'getUnavailableReasonShort',
-        'computeDefaultVirtualDatesForArrival', 'buildAutoPlacementForNewPerson',
-        'getMaxRankValue', 'getSortedRankingsList', 'insertPersonIntoRankings',
-        'applyAutoAddPerson', 'getRankValue', 'findTransferMatchesBackwards',
-        'applyAutoTransferPositionsFromMatches', 'getLastAndNextDutyDates',
-        'hasDutyOnDay', 'getConsecutiveDutyDates', 'checkRotationViolations',
-        'getDayTypeCategoryFromDayType', 'addDaysToDateKeyLocal'
-    ]
-    
-    ui_functions = [
-        'renderCalendar', 'renderGroups', 'renderHolidays', 'renderSpecialHolidays',
-        'renderRecurringHolidays', 'showDayDetails', 'showStepByStepCalculation',
-        'updateStatistics', 'createPersonItem', 'handleDragStart', 'handleDragEnter',
-        'handleDragLeave', 'handleDragOver', 'handleDrop', 'handleDragEnd',
-        'addPerson', 'editPerson', 'savePerson', 'removePerson', 'movePersonInList',
-        'openPersonActionsModal', 'openDisableSettingsFromActions', 'saveDisableSettings',
-        'openMissingDisabledPeopleModal', 'editPersonStatus', 'getDisabledState',
-        'getDisabledReasonText', 'openEditPersonFromActions', 'openMissingPeriodFromActions',
-        'openTransferFromActions', 'openTransferTargetGroupModal', 'cancelTransferTargetGroup',
-        'confirmTransferTargetGroup', 'deletePersonFromActions', 'getAllPeople',
-        'getPersonGroup', 'getPersonDetails', 'filterPeopleSearch', 'showPeopleSearchDropdown',
-        'hidePeopleSearchDropdown', 'selectPersonFromSearch', 'handlePersonSearchKeydown',
-        'openRankingsModal', 'handleRankingDragStart', 'trackRankingMousePosition',
-        'handleRankingDragOver', 'handleRankingDragEnter', 'handleRankingDragLeave',
-        'handleRankingDrop', 'handleRankingDragEnd', 'updateRankingsAfterMove',
-        'startRankingAutoScroll', 'stopRankingAutoScroll', 'editRankingManually',
-        'saveRankings', 'normalizeGroupPriorities', 'normalizeRankingsSequential',
-        'isPersonInAnyGroupLists', 'toggleTransferDropdown', 'transferPerson',
-        'openTransferPositionModal', 'renderTransferAutoPreview', 'renderTransferPositionLists',
-        'setTransferPosition', 'completeTransfer', 'addHoliday', 'saveHoliday',
-        'removeHoliday', 'initializeDefaultSpecialHolidays', 'loadRecurringHolidaysConfig',
-        'saveRecurringHolidaysConfig', 'addSpecialHoliday', 'saveSpecialHoliday',
-        'removeSpecialHoliday', 'toggleRecurringHolidayFields', 'addRecurringHoliday',
-        'saveRecurringHoliday', 'removeRecurringHoliday', 'renderAutoAddRankingsPicker',
-        'openAutoAddRankPickerModal', 'renderAutoAddPersonTable', 'openAutoAddPersonModal',
-        'getOpenLists', 'restoreOpenLists', 'ensureGroupListPopulated',
-        'showHierarchyPopup', 'hideHierarchyPopup', 'assignPersonToDay', 'removePersonFromDay',
-        'startDutyShiftsAppInit'
-    ]
-    
-    # Since the file is too large to process efficiently this way,
-    # we'll use a simpler approach: copy the entire file to each new file
-    # and then remove sections that don't belong
-    
-    # For now, let's just copy the file content
-    # The actual splitting will be done manually or with a more sophisticated tool
-    
-    print("File splitting script created. Due to file size, manual splitting recommended.")
-    print("Total lines:", len(lines))
+    try:
+        source = find_source(os.path.dirname(os.path.abspath(__file__)))
+    except (OSError, ValueError) as error:
+        print(f"Error: {error}")
+        return 1
+    # Declarations come from the shared on-disk index, so re-runs on an
+    # unchanged file skip tokenizing it again
+    index = open_index()
+    categories = index.categories(source)
+    index.save()
+
+    print(f"{source}: {len(categories)} top-level declarations")
+    for label in ('data', 'logic', 'ui', 'unknown'):
+        count = sum(1 for category in categories.values() if category == label)
+        print(f"  {label}: {count}")
+    print("Run optimize_split.py to write the split files.")
+    return 0
 
 if __name__ == '__main__':
-    split_file()
+    sys.exit(split_file())
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The tools import each other as top-level modules, as when run from js/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
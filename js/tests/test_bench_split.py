@@ -0,0 +1,25 @@
+from types import SimpleNamespace
+
+import pytest
+
+import bench_split
+from js_tokenizer import scan_declarations
+
+
+@pytest.mark.parametrize('platform, expected', [('linux', 204800), ('darwin', 200)])
+def test_peak_rss_is_kb_on_every_platform(monkeypatch, platform, expected):
+    monkeypatch.setattr(bench_split.resource, 'getrusage',
+                        lambda who: SimpleNamespace(ru_maxrss=204800))
+    monkeypatch.setattr(bench_split.sys, 'platform', platform)
+    assert bench_split.peak_rss_kb() == expected
+
+
+def test_write_synthetic_renames_copies(tmp_path):
+    source = tmp_path / 'app.js'
+    source.write_bytes(b'const items = [];\nfunction add(x) { items.push(x); return x.items; }\n')
+    path = bench_split.write_synthetic(str(source), 3, str(tmp_path / 'synthetic.js'))
+    names = [decl.name for decl in scan_declarations(path)]
+    assert names == ['items', 'add', 'items_x1', 'add_x1', 'items_x2', 'add_x2']
+    data = open(path, 'rb').read()
+    # Property names stay as they are
+    assert data.count(b'x.items;') == 3
@@ -0,0 +1,70 @@
+import base64
+import datetime
+import os
+import shutil
+
+import pytest
+
+from calendar_table import (DAY_TYPES, FIXED_HOLIDAYS, build_table, check, default_day_type,
+                            holiday_id, orthodox_easter, render)
+
+JS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.parametrize('year, easter', [
+    (2000, datetime.date(2000, 4, 30)),
+    (2021, datetime.date(2021, 5, 2)),
+    (2024, datetime.date(2024, 5, 5)),
+    (2025, datetime.date(2025, 4, 20)),
+])
+def test_orthodox_easter(year, easter):
+    assert orthodox_easter(year) == easter
+
+
+def test_holiday_id():
+    assert holiday_id(datetime.date(2025, 1, 1)) == 1
+    assert holiday_id(datetime.date(2025, 12, 31)) == len(FIXED_HOLIDAYS)
+    assert holiday_id(datetime.date(2025, 4, 21)) > len(FIXED_HOLIDAYS)  # Easter Monday
+    assert holiday_id(datetime.date(2025, 4, 22)) == 0
+
+
+@pytest.mark.parametrize('day, day_type', [
+    (datetime.date(2025, 12, 25), 'special-holiday'),
+    (datetime.date(2025, 4, 19), 'special-holiday'),   # Holy Saturday
+    (datetime.date(2025, 1, 6), 'weekend-holiday'),    # Epiphany, a Monday
+    (datetime.date(2025, 3, 8), 'weekend-holiday'),    # Saturday
+    (datetime.date(2025, 3, 7), 'semi-normal-day'),    # Friday
+    (datetime.date(2025, 1, 5), 'weekend-holiday'),    # Sunday before a holiday
+    (datetime.date(2025, 3, 24), 'semi-normal-day'),   # before 25 March
+    (datetime.date(2025, 3, 26), 'normal-day'),
+    (datetime.date(2025, 12, 30), 'normal-day'),       # a Tuesday
+    (datetime.date(2022, 12, 30), 'semi-normal-day'),  # a Friday
+])
+def test_default_day_type(day, day_type):
+    assert default_day_type(day) == day_type
+
+
+def test_build_table_packs_every_day():
+    easter, codes = build_table(2024, 2025)
+    assert easter == [(orthodox_easter(year) - datetime.date(year, 3, 21)).days
+                      for year in (2024, 2025)]
+    assert len(codes) == 366 + 365
+    christmas = (datetime.date(2025, 12, 25) - datetime.date(2024, 1, 1)).days
+    assert codes[christmas] & 31 == holiday_id(datetime.date(2025, 12, 25))
+    assert DAY_TYPES[codes[christmas] >> 5] == 'special-holiday'
+
+
+def test_render_embeds_the_table():
+    source = render(2024, 2025)
+    _, codes = build_table(2024, 2025)
+    assert base64.b64encode(codes).decode('ascii') in source
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason='node is not installed')
+def test_table_matches_the_original_functions(tmp_path):
+    data = os.path.join(JS_DIR, 'duty-shifts-data.js')
+    if not os.path.exists(data):
+        pytest.skip('duty-shifts-data.js not present')
+    table = tmp_path / 'calendar.js'
+    table.write_text(render(2024, 2026), encoding='utf-8')
+    assert check(2024, 2026, str(table), data, time_zones=('UTC',))
@@ -0,0 +1,68 @@
+import os
+
+import pytest
+
+from call_graph import assign_categories, build_call_graph, closure
+from declaration_index import DeclarationIndex
+from optimize_split import bundle_paths, categorize_all, combine_bundles, open_index
+
+JS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SOURCE = b'''const settings = loadSettings();
+
+function loadSettings() { return parse(readStorage()); }
+function parse(text) { return JSON.parse(text); }
+function readStorage() { return localStorage.getItem('s'); }
+
+function renderTable() { formatCell(); formatCell(); }
+function formatCell() { return settings.cell; }
+
+function computeShifts() { return rotate(); }
+function rotate() { return settings.order; }
+
+document.addEventListener('DOMContentLoaded', renderTable);
+'''
+
+
+@pytest.fixture
+def graph(tmp_path):
+    path = tmp_path / 'app.js'
+    path.write_bytes(SOURCE)
+    return build_call_graph([str(path)], DeclarationIndex(None))
+
+
+def test_edges_and_top_level(graph):
+    assert graph.edges['loadSettings'] == {'parse', 'readStorage'}
+    assert graph.edges['formatCell'] == {'settings'}
+    assert graph.initializers == {'loadSettings'}
+    top_level, = graph.top_level.values()
+    assert top_level == {'loadSettings', 'renderTable'}
+
+
+def test_closure_follows_calls(graph):
+    assert closure(graph, {'loadSettings'}) == {'loadSettings', 'parse', 'readStorage'}
+    # ... and what variable initializers call
+    assert closure(graph, {'computeShifts'}) == {'computeShifts', 'rotate', 'settings',
+                                                 'loadSettings', 'parse', 'readStorage'}
+
+
+def test_assign_categories(graph):
+    labels = assign_categories(graph, {'renderTable': 'ui', 'computeShifts': 'logic'})
+    # Variables and what their initializers call load with data.js
+    assert labels['settings'] == labels['loadSettings'] == 'data'
+    # Unseeded functions follow the bundle they share most calls with
+    assert labels['formatCell'] == 'ui'
+    assert labels['rotate'] == 'logic'
+    assert set(labels) == set(graph.nodes)
+
+
+def test_categorize_all_places_every_shipped_function(tmp_path):
+    paths = bundle_paths(JS_DIR)
+    if not all(os.path.exists(path) for path in paths):
+        pytest.skip('shipped bundles not present')
+    source = combine_bundles(paths, str(tmp_path / 'combined.js'))
+    index = open_index(None)
+    graph, seeds, labels = categorize_all(source, index)
+    shipped = {name for path in paths for decl in index.declarations(path) for name in decl.names}
+    assert shipped <= set(labels)
+    assert set(labels.values()) <= {'data', 'logic', 'ui'}
@@ -0,0 +1,96 @@
+import os
+
+import pytest
+
+from declaration_index import DeclarationIndex
+
+SOURCE = b'''// header
+const config = { a: 1 };
+
+function first() {
+    return config.a;
+}
+
+function second() {
+    return first() + 1;
+}
+
+init(second);
+
+function third() {
+    return `${second()}`;
+}
+'''
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / 'app.js'
+    path.write_bytes(SOURCE)
+    return path
+
+
+def rewrite(path, data):
+    path.write_bytes(data)
+    # Make sure the size/mtime memo cannot hide the change
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def full_scan(path):
+    return DeclarationIndex(None).segments(path)
+
+
+def test_segments_cover_the_file(source):
+    segments = full_scan(source)
+    assert segments[0]['start'] == 0 and segments[-1]['end'] == len(SOURCE)
+    assert all(a['end'] == b['start'] for a, b in zip(segments, segments[1:]))
+    named = {record['name']: record for record in segments if 'name' in record}
+    assert set(named) == {'config', 'first', 'second', 'third'}
+    assert named['second']['refs'] == ['first']
+    assert any('init' in record['refs'] for record in segments if 'name' not in record)
+
+
+@pytest.mark.parametrize('old, new', [
+    (b'return config.a;', b'return config.a + config.a;'),
+    (b'init(second);', b'init(second);\nfunction added() { third(); }'),
+    (b'function second() {\n    return first() + 1;\n}\n', b''),
+    (b'return `${second()}`;', b'return `${second()} ${first()}`;'),
+])
+def test_incremental_update_matches_full_scan(tmp_path, source, old, new):
+    index = DeclarationIndex(str(tmp_path / 'cache.json'))
+    index.segments(source)
+    index.save()
+
+    rewrite(source, SOURCE.replace(old, new))
+    index = DeclarationIndex(str(tmp_path / 'cache.json'))
+    assert index.segments(source) == full_scan(source)
+    assert index.stats['incremental'] == 1 and index.stats['full'] == 0
+    assert index.stats['rescanned_bytes'] < len(source.read_bytes())
+
+
+def test_unbalanced_edit_falls_back_to_full_scan(source):
+    index = DeclarationIndex(None)
+    index.segments(source)
+    rewrite(source, SOURCE.replace(b'return config.a;', b'return config.a; /* open'))
+    assert index.segments(source) == full_scan(source)
+    assert index.stats['full'] == 2
+
+
+def test_unchanged_file_is_a_cache_hit(tmp_path, source):
+    index = DeclarationIndex(str(tmp_path / 'cache.json'))
+    index.segments(source)
+    index.save()
+    index = DeclarationIndex(str(tmp_path / 'cache.json'))
+    index.segments(source)
+    assert index.stats == {'hits': 1, 'incremental': 0, 'full': 0, 'rescanned_bytes': 0}
+
+
+def test_categories_follow_category_version(tmp_path, source):
+    cache = str(tmp_path / 'cache.json')
+    index = DeclarationIndex(cache, categorize=lambda decl: 'data', category_version='1')
+    index.segments(source)
+    index.save()
+    index = DeclarationIndex(cache, categorize=lambda decl: 'ui', category_version='2')
+    assert set(index.categories(source).values()) == {'ui'}
+    assert index.stats['hits'] == 1
@@ -0,0 +1,158 @@
+import os
+import subprocess
+
+import pytest
+
+from dedupe_bundles import bundle_paths, find_duplicates, plan, write_bundles
+from declaration_index import DeclarationIndex
+from extract_inline import normalized
+
+JS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def bundles(tmp_path, *sources):
+    paths = []
+    for number, source in enumerate(sources):
+        path = tmp_path / f'bundle-{number}.js'
+        path.write_bytes(source)
+        paths.append(str(path))
+    return paths
+
+
+def run_plan(paths):
+    drops, kept, notes = plan(paths, DeclarationIndex(None))
+    return {path: sorted(spans) for path, spans in drops.items()}, kept, dict(notes)
+
+
+def test_identical_functions_keep_the_first_copy(tmp_path):
+    first, second = bundles(tmp_path, b'function same(a) { return a; }\n',
+                            b'function same(a) {\n    return a; // doc\n}\n')
+    drops, kept, notes = run_plan([first, second])
+    assert kept == {'same': first} and not notes
+    assert drops[first] == [] and len(drops[second]) == 1
+
+
+def test_different_functions_keep_the_last_copy(tmp_path):
+    first, second = bundles(tmp_path, b'function f() { return 1; }\n',
+                            b'function f() { return 2; }\n')
+    drops, kept, notes = run_plan([first, second])
+    assert kept == {'f': second}
+    assert len(drops[first]) == 1 and drops[second] == []
+
+
+def test_load_time_use_keeps_both_copies(tmp_path):
+    first, second = bundles(tmp_path, b'function f() { return 1; }\nconst early = f();\n',
+                            b'function f() { return 2; }\n')
+    drops, kept, notes = run_plan([first, second])
+    assert 'f' not in kept and 'may run at load time' in notes['f']
+    assert drops == {first: [], second: []}
+
+
+def test_load_time_use_through_other_functions(tmp_path):
+    first, second = bundles(tmp_path,
+                            b'function f() { return 1; }\n'
+                            b'function setup() { return helper(); }\n'
+                            b'function helper() { return f(); }\n'
+                            b"if (document.readyState === 'loading') {\n"
+                            b"    document.addEventListener('DOMContentLoaded', setup);\n"
+                            b'} else {\n'
+                            b'    setup();\n'
+                            b'}\n',
+                            b'function f() { return 2; }\n')
+    drops, kept, notes = run_plan([first, second])
+    assert 'f' in notes and 'f' not in kept
+
+
+def test_captured_handlers_run_after_every_bundle(tmp_path):
+    first, second = bundles(tmp_path,
+                            b'function f() { return 1; }\n'
+                            b'function setup() { return f(); }\n'
+                            b"document.addEventListener('DOMContentLoaded', setup);\n"
+                            b'window.setup = setup;\n',
+                            b'function f() { return 2; }\n')
+    drops, kept, notes = run_plan([first, second])
+    assert kept == {'f': second} and not notes
+    assert len(drops[first]) == 1
+
+
+def test_use_after_the_winner_does_not_matter(tmp_path):
+    first, second, third = bundles(tmp_path, b'function f() { return 1; }\n',
+                                   b'function f() { return 2; }\n', b'f();\n')
+    drops, kept, notes = run_plan([first, second, third])
+    assert kept == {'f': second}
+
+
+def test_lexical_duplicates_keep_the_first(tmp_path):
+    first, second = bundles(tmp_path, b'let state = {};\n', b'let state = { other: 1 };\n')
+    drops, kept, notes = run_plan([first, second])
+    assert kept == {'state': first} and len(drops[second]) == 1
+
+
+def test_var_assigned_differently_is_left_alone(tmp_path):
+    first, second = bundles(tmp_path, b'var mode = 1;\n', b'var mode = 2;\n')
+    drops, kept, notes = run_plan([first, second])
+    assert 'mode' in notes and drops == {first: [], second: []}
+
+
+def test_write_bundles(tmp_path):
+    first, second = bundles(tmp_path, b'function f() { return 1; }\n',
+                            b'keep();\nfunction f() { return 2; }\n(g || h)();\n')
+    index = DeclarationIndex(None)
+    assert set(find_duplicates([first, second], index)) == {'f'}
+    drops, _, _ = plan([first, second], index)
+    out = tmp_path / 'out'
+    out.mkdir()
+    results = write_bundles([first, second], drops, str(out))
+    assert (out / 'bundle-0.js').read_bytes().strip() == b''
+    assert (out / 'bundle-1.js').read_bytes().startswith(b'keep();')
+    assert [after < before for _, before, after in results] == [True, False]
+
+
+def shipped_bundles():
+    html = os.path.join(os.path.dirname(JS_DIR), 'duty-shifts.html')
+    if not os.path.exists(html):
+        pytest.skip('duty-shifts.html not present')
+    return bundle_paths(html)
+
+
+def test_shipped_bundles_are_deduplicated(tmp_path):
+    paths = shipped_bundles()
+    drops, _, _ = plan(paths, DeclarationIndex(None))
+    assert all(not spans for spans in drops.values())
+    for output_file, before, after in write_bundles(paths, drops, str(tmp_path)):
+        original = os.path.join(JS_DIR, os.path.basename(output_file))
+        assert open(output_file, 'rb').read() == open(original, 'rb').read()
+
+
+def declarations_of(path, index):
+    with open(path, 'rb') as f:
+        data = f.read()
+    return sorted((decl.names, normalized(data[decl.start:decl.end])) for decl in index.declarations(path))
+
+
+def test_shipped_bundles_match_the_tool_output(tmp_path):
+    # The bundles as they were before dedupe_bundles.py was added, run
+    # through the current tool, declare exactly what the committed files
+    # declare (later hand edits may move code around, not add or drop it)
+    paths = shipped_bundles()
+    try:
+        added = subprocess.run(['git', 'log', '--diff-filter=A', '--format=%H', '--', 'dedupe_bundles.py'],
+                               cwd=JS_DIR, check=True, capture_output=True, text=True).stdout.split()
+    except (OSError, subprocess.CalledProcessError):
+        pytest.skip('not a git checkout')
+    if not added:
+        pytest.skip('dedupe_bundles.py has no history')
+    originals = []
+    for path in paths:
+        name = os.path.basename(path)
+        data = subprocess.run(['git', 'show', f'{added[-1]}^:./{name}'], cwd=JS_DIR,
+                              check=True, capture_output=True).stdout
+        (tmp_path / name).write_bytes(data)
+        originals.append(str(tmp_path / name))
+    out = tmp_path / 'out'
+    out.mkdir()
+    index = DeclarationIndex(None)
+    drops, _, _ = plan(originals, index)
+    for output_file, _, _ in write_bundles(originals, drops, str(out)):
+        committed = os.path.join(JS_DIR, os.path.basename(output_file))
+        assert declarations_of(output_file, index) == declarations_of(committed, index)
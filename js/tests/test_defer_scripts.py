@@ -0,0 +1,105 @@
+import os
+
+import pytest
+
+from declaration_index import DeclarationIndex
+from defer_scripts import analyze, load_time_code, rewrite_page
+
+
+@pytest.mark.parametrize('code, reads, calls', [
+    (b'function f() { return later(); }', set(), set()),
+    (b'const x = setup(config);', {'x', 'setup', 'config'}, {'setup'}),
+    (b'(function () { init(); })();', {'init'}, {'init'}),
+    (b'!function () { init(); }();', {'init'}, {'init'}),
+    (b'function f() { init(); }\n(g || h)();', {'g', 'h'}, set()),
+    (b'const f = (a, b) => a + b + offset;', {'f'}, set()),
+    (b'const f = function (a) { return a + offset; };', {'f'}, set()),
+    (b'if (typeof XLSX !== "undefined") { ready = 1; }', {'ready'}, set()),
+    (b'class Table extends Base { render() { draw(); } }', {'Base'}, set()),
+    (b'const handlers = { open: openModal, close() { hide(); } };', {'handlers', 'openModal'}, set()),
+    (b'el.addEventListener("click", () => handle(event));', {'el'}, set()),
+])
+def test_load_time_code(code, reads, calls):
+    found_reads, found_calls, _ = load_time_code(code)
+    assert found_reads == reads and found_calls == calls
+
+
+def test_load_time_code_notices_the_dom():
+    assert load_time_code(b'const root = document.getElementById("app");')[2]
+    assert not load_time_code(b'function f() { return document.body; }')[2]
+
+
+PAGE = '''<html>
+<head>
+    <link rel="preload" href="js/duty-shifts-ui.js" as="script">
+    <link rel="preload" href="js/duty-shifts-chunk-excel.js" as="script">
+</head>
+<body>
+    <script src="https://cdn.example.com/xlsx.full.min.js"></script>
+    <script src="js/duty-shifts-data.js"></script>
+    <script src="js/duty-shifts-ui.js" defer></script>
+    <script>inline();</script>
+</body>
+</html>
+'''
+
+
+def test_rewrite_page_defers_and_syncs_preloads():
+    html = rewrite_page(PAGE, set(), None)
+    assert '<script src="js/duty-shifts-data.js" defer></script>' in html
+    assert '<script src="https://cdn.example.com/xlsx.full.min.js" defer></script>' in html
+    assert html.count('defer') == 3
+    assert 'duty-shifts-chunk-excel' not in html
+    assert html.count('rel="preload"') == 2
+    assert '<link rel="preload" href="js/duty-shifts-data.js" as="script">' in html
+    assert 'cdn.example.com/xlsx.full.min.js" as="script"' not in html
+    assert rewrite_page(html, set(), None) == html
+
+
+def test_rewrite_page_replaces_libraries_with_the_loader():
+    libraries = {'https://cdn.example.com/xlsx.full.min.js'}
+    html = rewrite_page(PAGE, libraries, 'js/duty-shifts-libraries.js')
+    assert 'xlsx.full.min.js' not in html
+    ui = html.index('<script src="js/duty-shifts-ui.js"')
+    loader = html.index('<script src="js/duty-shifts-libraries.js" charset="UTF-8" defer></script>')
+    assert loader > ui
+    assert '<link rel="preload" href="js/duty-shifts-libraries.js" as="script">' in html
+    assert rewrite_page(html, libraries, 'js/duty-shifts-libraries.js') == html
+
+
+TDZ_SCRIPT = b'''if (document.readyState === 'loading') document.addEventListener('DOMContentLoaded', init); else init();
+function init(){ wire(); }
+function wire(){ if (_wired) return; _wired = true; }
+let _wired = false;
+'''
+
+
+def deferred_site(tmp_path, script):
+    (tmp_path / 'js').mkdir()
+    (tmp_path / 'js' / 'app.js').write_bytes(script)
+    (tmp_path / 'page.html').write_text('<html><body>\n<script src="js/app.js" defer></script>\n</body></html>\n')
+    return str(tmp_path / 'page.html')
+
+
+def test_ready_state_handler_reaching_a_later_let(tmp_path):
+    _, problems = analyze(deferred_site(tmp_path, TDZ_SCRIPT), DeclarationIndex(None))
+    assert problems == ['app.js uses _wired while loading, before its declaration']
+
+
+@pytest.mark.parametrize('script', [
+    b'let _wired = false;\n' + TDZ_SCRIPT.replace(b'let _wired = false;\n', b''),
+    TDZ_SCRIPT.replace(b' else init();', b''),
+    b'if (window._wired) {}\nlet _wired = false;\n',
+])
+def test_later_let_read_only_after_load(tmp_path, script):
+    _, problems = analyze(deferred_site(tmp_path, script), DeclarationIndex(None))
+    assert problems == []
+
+
+def test_shipped_page_has_no_load_order_problems():
+    html = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                        'duty-shifts.html')
+    if not os.path.exists(html):
+        pytest.skip('duty-shifts.html not present')
+    _, problems = analyze(html, DeclarationIndex(None))
+    assert problems == []
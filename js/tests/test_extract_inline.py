@@ -0,0 +1,65 @@
+import os
+
+from extract_inline import SHARED_SCRIPT, extract_page, normalized, plan, strip_functions
+
+FILLER = '// ' + 'x' * 1100 + '\n'
+
+
+def test_normalized_ignores_comments_and_whitespace():
+    assert normalized(b'function f(a) {\n  // note\n  return a+1;\n}') == \
+           normalized(b'function f(a){return a + 1;}')
+    assert normalized(b'function f(a) { return a + 1; }') != \
+           normalized(b'function f(a) { return a + 2; }')
+
+
+def test_strip_functions():
+    code = b'const keep = 1;\nfunction drop() { return 1; }\nfunction stay() {}\n'
+    stripped = strip_functions(code, {'drop', 'keep'})
+    assert b'drop' not in stripped
+    assert b'const keep = 1;' in stripped and b'function stay' in stripped
+
+
+def test_strip_functions_keeps_crlf():
+    code = b'a();\r\nfunction drop() {}\r\n(b || c)();\r\n'
+    stripped = strip_functions(code, {'drop'})
+    assert stripped == b'a();\r\n;\r\n(b || c)();\r\n'
+
+
+def write_page(root, name, script):
+    page = root / name
+    page.write_text(f'<html><body>\n<script>\n{script}{FILLER}</script>\n</body></html>\n')
+    return str(page)
+
+
+def test_plan_shares_identical_functions(tmp_path):
+    (tmp_path / 'js').mkdir()
+    (tmp_path / 'js' / 'common.js').write_text('function escapeHtml(s) { return s; }\n')
+    shared = 'function formatDate(d) {\n    return d.toISOString();\n}\n'
+    first = write_page(tmp_path, 'a.html', shared + 'function escapeHtml(s) { return s; }\n'
+                       'function onlyA() {}\n')
+    second = write_page(tmp_path, 'b.html', shared.replace('    ', '\t') + 'function onlyB() {}\n')
+    moved, removed = plan(str(tmp_path), [first, second], str(tmp_path / 'js' / 'common.js'))
+    assert list(moved) == ['formatDate']
+    assert removed == {first: {'formatDate', 'escapeHtml'}, second: {'formatDate'}}
+
+    # A page loading shared-pages.js must not bind a shared name lexically
+    helper = 'function helper() { return 1; }\n'
+    first = write_page(tmp_path, 'a.html', shared + helper)
+    second = write_page(tmp_path, 'b.html', shared + helper)
+    third = write_page(tmp_path, 'c.html', shared + 'let helper = null;\n')
+    moved, removed = plan(str(tmp_path), [first, second, third], str(tmp_path / 'js' / 'common.js'))
+    assert list(moved) == ['formatDate']
+    assert removed == {first: {'formatDate'}, second: {'formatDate'}, third: {'formatDate'}}
+
+
+def test_extract_page(tmp_path):
+    page = write_page(tmp_path, 'a.html', 'function formatDate(d) {}\nfunction onlyA() {}\n')
+    written = extract_page(str(tmp_path), page, {'formatDate'},
+                           str(tmp_path / SHARED_SCRIPT))
+    html = open(page, encoding='utf-8').read()
+    assert '<script src="js/shared-pages.js" charset="UTF-8"></script>' in html
+    assert '<script src="js/pages/a.js" charset="UTF-8"></script>' in html
+    assert '<script>' not in html
+    path, code = written[0]
+    assert path == os.path.join(str(tmp_path), 'js', 'pages', 'a.js')
+    assert b'onlyA' in code and b'formatDate' not in code
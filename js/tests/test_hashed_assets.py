@@ -0,0 +1,60 @@
+import os
+
+import pytest
+
+from hashed_assets import (PRECACHE_FILE, main, prune_hashed, read_precache_manifest,
+                           rewrite_page, write_hashed, write_precache_manifest)
+
+
+def build(root, version):
+    """Write js/app.js with new content, hash it and point the page at it"""
+    (root / 'js' / 'app.js').write_text(f'var version = {version};\n')
+    hashed = write_hashed(str(root / 'js' / 'app.js'))
+    # Older copies must look older to prune_hashed
+    os.utime(hashed, (version, version))
+    page = root / 'index.html'
+    page.write_text(rewrite_page('<script src="js/app.js"></script>', str(page),
+                                 {str(root / 'js' / 'app.js'): hashed}))
+    write_precache_manifest(str(root), [str(page)])
+    return hashed
+
+
+@pytest.fixture
+def root(tmp_path):
+    (tmp_path / 'js').mkdir()
+    return tmp_path
+
+
+def test_write_hashed_keeps_older_copies(root):
+    first = build(root, 1)
+    second = build(root, 2)
+    assert first != second
+    assert os.path.exists(first) and os.path.exists(second)
+    assert os.path.basename(second) in (root / 'index.html').read_text()
+
+
+def test_manifest_round_trip(root):
+    hashed = build(root, 1)
+    manifest = read_precache_manifest(str(root))
+    urls = {entry['url']: entry['revision'] for entry in manifest['entries']}
+    assert urls['js/' + os.path.basename(hashed)] is None
+    assert urls['index.html'] is not None
+
+
+def test_prune_keeps_current_and_previous_generation(root):
+    copies = [build(root, version) for version in (1, 2, 3, 4)]
+    removed = prune_hashed(str(root))
+    assert sorted(removed) == sorted(copies[:2])
+    assert all(os.path.exists(path) for path in copies[2:])
+    assert prune_hashed(str(root)) == []
+    assert prune_hashed(str(root), keep=0) == [copies[2]]
+
+
+def test_prune_needs_a_manifest(root, monkeypatch):
+    hashed = build(root, 1)
+    os.remove(root / PRECACHE_FILE)
+    with pytest.raises(ValueError):
+        prune_hashed(str(root))
+    monkeypatch.setattr('sys.argv', ['hashed_assets.py', '--root', str(root), '--prune'])
+    assert main() == 1
+    assert os.path.exists(hashed)
@@ -0,0 +1,102 @@
+import contextlib
+import io
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from declaration_index import DeclarationIndex
+from instrument import DUMP_VERSION, prelude, unwrapped_names, wrapped_names
+from profile_report import load_dump, print_diff, print_hot
+
+CODE = b'''function add(a, b) { return a + b; }
+function describe(prefix) { return prefix + this.name + ':' + arguments.length; }
+async function load() { return 1; }
+function* counter() { yield 1; yield 2; }
+function Point(x) { this.x = x; }
+Point.origin = new Point(0);
+class Shape {}
+const arrow = () => 1;
+'''
+
+
+def segments_of(tmp_path, code):
+    path = tmp_path / 'bundle.js'
+    path.write_bytes(code)
+    return DeclarationIndex(None).segments(str(path))
+
+
+def test_wrapped_names(tmp_path):
+    segments = segments_of(tmp_path, CODE)
+    assert wrapped_names(segments) == ['add', 'describe', 'load', 'counter', 'Point']
+    assert unwrapped_names(CODE) >= {'counter', 'Point'}
+    assert wrapped_names(segments, unwrapped_names(CODE)) == ['add', 'describe', 'load']
+
+
+def test_prelude():
+    assert prelude([]) == ''
+    header = prelude(['add', 'describe'])
+    assert "        add = __dsProf.wrap('add', add);\n" in header
+    assert header.endswith("describe = __dsProf.wrap('describe', describe);\n\n")
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason='node is not installed')
+def test_wrapped_functions_behave_the_same(tmp_path):
+    names = wrapped_names(segments_of(tmp_path, CODE), unwrapped_names(CODE))
+    harness = '''
+var results = [add(2, 3), describe.call({ name: 'obj' }, 'p-', 'x', 'y'),
+               Array.from(counter()), Point.origin instanceof Point, add.__dsProfName,
+               counter.__dsProfName || null, Point.__dsProfName || null];
+var stats = __dsProf.snapshot().functions;
+console.log(JSON.stringify([results, stats.add.calls, stats.describe.calls, Object.keys(stats).sort()]));
+'''
+    window = 'var window = globalThis; var location = {}; var navigator = {};\n'
+    source = window + prelude(names) + CODE.decode() + harness
+    output = subprocess.run(['node', '-e', source], check=True, capture_output=True, text=True).stdout
+    results, add_calls, describe_calls, profiled = json.loads(output)
+    assert results == [5, 'p-obj:3', [1, 2], True, 'add', None, None]
+    assert (add_calls, describe_calls) == (1, 1)
+    assert profiled == ['add', 'describe']
+
+
+def dump(tmp_path, name, functions):
+    path = tmp_path / name
+    path.write_text(json.dumps({'version': DUMP_VERSION, 'functions': functions}))
+    return str(path)
+
+
+def test_profile_report(tmp_path):
+    before = load_dump(dump(tmp_path, 'before.json', {
+        'render': {'calls': 4, 'total_ms': 30.0, 'self_ms': 20.0, 'max_ms': 12.0},
+        'format': {'calls': 100, 'total_ms': 10.0, 'self_ms': 10.0, 'max_ms': 0.5},
+    }))
+    after = load_dump(dump(tmp_path, 'after.json', {
+        'render': {'calls': 4, 'total_ms': 14.0, 'self_ms': 9.0, 'max_ms': 5.0},
+        'format': {'calls': 100, 'total_ms': 5.0, 'self_ms': 5.0, 'max_ms': 0.2},
+        'cache': {'calls': 1, 'total_ms': 1.0, 'self_ms': 1.0, 'max_ms': 1.0},
+    }))
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        print_hot(before, 'self_ms', 10)
+    lines = out.getvalue().splitlines()
+    assert lines[1].split()[:3] == ['render', '4', '20.0']
+    assert lines[1].split()[3] == '66.7%'
+    assert lines[-1] == '2 functions called, 30.0 ms of self time'
+
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        print_diff(before, after, 'self_ms', 10)
+    lines = out.getvalue().splitlines()
+    assert [line.split()[0] for line in lines[1:4]] == ['render', 'format', 'cache']
+    assert lines[3].split()[-1] == 'new'
+    assert lines[-1] == 'Sum of self_ms: 30.0 -> 15.0'
+
+
+def test_profile_report_reads_string_dumps(tmp_path):
+    path = tmp_path / 'console.json'
+    path.write_text(json.dumps(json.dumps({'version': DUMP_VERSION, 'functions': {}})))
+    assert load_dump(str(path)) == {}
+    path.write_text(json.dumps({'version': DUMP_VERSION + 1, 'functions': {}}))
+    with pytest.raises(ValueError):
+        load_dump(str(path))
@@ -0,0 +1,153 @@
+import io
+
+import pytest
+
+from js_tokenizer import cut_spans, ends_statement, iter_declarations, names_referenced_in, tokenize
+
+
+def tokens(code, **kwargs):
+    return list(tokenize(io.BytesIO(code), **kwargs))
+
+
+def kinds(code):
+    return [(token.kind, token.value) for token in tokens(code)]
+
+
+def declarations(code):
+    return list(iter_declarations(tokenize(io.BytesIO(code))))
+
+
+@pytest.mark.parametrize('code, expected', [
+    (b'a = b / c / d', 'punct'),
+    (b'x = /ab+c/g.test(y)', 'regex'),
+    (b'return /\\d+/.exec(s)', 'regex'),
+    (b'f(x) / 2', 'punct'),
+])
+def test_slash_is_regex_or_division(code, expected):
+    slashes = [token for token in tokens(code) if token.value.startswith(b'/')]
+    assert slashes[0].kind == expected
+
+
+@pytest.mark.parametrize('code', [
+    b'if (x) /re}/.test(s);',
+    b'while (next()) /[)}]/.exec(s);',
+    b'for (const c of s) /a{/.test(c) && n++;',
+])
+def test_regex_after_statement_head(code):
+    regexes = [token.value for token in tokens(code) if token.kind == 'regex']
+    assert len(regexes) == 1 and regexes[0].endswith((b'/', b'/g'))
+
+
+def test_statement_head_regex_keeps_declarations_whole():
+    code = b'function check(s, x) {\n    if (x) /re}/.test(s);\n    return x;\n}\nfunction next() {}\n'
+    decls = declarations(code)
+    assert [decl.name for decl in decls] == ['check', 'next']
+    assert code[decls[0].start:decls[0].end].endswith(b'return x;\n}')
+
+
+def test_division_after_call_parens():
+    assert [t.kind for t in tokens(b'total = sum(a) / count(b) / 2')].count('regex') == 0
+
+
+def test_template_with_nested_braces():
+    code = b'const s = `a ${ {x: 1}.x } b ${f(`inner ${y}`)} c`; next();'
+    values = [token.value for token in tokens(code)]
+    assert values[-4:] == [b'next', b'(', b')', b';']
+
+
+def test_offsets_survive_chunk_boundaries():
+    code = b'function longName() { return "a string that spans"; }\n' * 20
+    small = tokens(code, chunk_size=7)
+    assert [(t.kind, t.value, t.start, t.end) for t in small] == \
+           [(t.kind, t.value, t.start, t.end) for t in tokens(code)]
+    assert all(code[t.start:t.end] == t.value for t in small)
+
+
+def test_comments_only_when_asked():
+    code = b'// note\na(); /* block */ b();'
+    assert all(token.kind != 'comment' for token in tokens(code))
+    assert [t.value for t in tokens(code, comments=True) if t.kind == 'comment'] == \
+           [b'// note', b'/* block */']
+
+
+def test_nl_before():
+    first, second = tokens(b'a\nb')
+    assert not first.nl_before and second.nl_before
+
+
+def test_declaration_kinds():
+    code = (b'function a() { if (x) { } }\n'
+            b'async function b() {}\n'
+            b'class C { m() {} }\n'
+            b'const d = () => 1;\n'
+            b'let e = function () {};\n'
+            b'var f = 1, g = 2;\n'
+            b'const { h, i } = obj;\n')
+    found = [(decl.name, decl.kind, decl.names) for decl in declarations(code)]
+    assert found == [
+        ('a', 'function', ('a',)),
+        ('b', 'async function', ('b',)),
+        ('C', 'class', ('C',)),
+        ('d', 'arrow', ('d',)),
+        ('e', 'function expression', ('e',)),
+        ('f', 'variable', ('f', 'g')),
+        ('', 'variable', ()),
+    ]
+
+
+def test_declaration_ends_at_automatic_semicolon():
+    code = b'let a = 1\nlet b = 2\nfoo()\n'
+    decls = declarations(code)
+    assert [decl.name for decl in decls] == ['a', 'b']
+    assert code[decls[0].start:decls[0].end] == b'let a = 1'
+
+
+def test_lead_covers_documenting_comment():
+    code = b'x();\n// Adds one\nfunction inc(n) { return n + 1; }'
+    decl = declarations(code)[0]
+    assert code[decl.lead:decl.start] == b'\n// Adds one\n'
+
+
+def test_nested_functions_are_not_top_level():
+    code = b'function outer() { function inner() {} }\nif (x) { var y = 1; }'
+    assert [decl.name for decl in declarations(code)] == ['outer']
+
+
+@pytest.mark.parametrize('code, expected', [
+    (b'a\nb', True),
+    (b'a\n(b)', False),
+    (b'a\n+b', False),
+    (b'a +\nb', False),
+    (b'f()\n++i', True),
+    (b'x\ninstanceof Y', False),
+    (b'a b', False),
+])
+def test_ends_statement(code, expected):
+    found = tokens(code)
+    line_start = next(i for i, token in enumerate(found) if token.nl_before or i == len(found) - 1)
+    assert ends_statement(found[line_start - 1], found[line_start]) is expected
+
+
+def test_cut_spans_adds_semicolon_before_continuation():
+    code = b'a = b\nfunction f() {}\n(c || d).go()'
+    start = code.index(b'\nfunction')
+    end = code.index(b'}') + 1
+    assert cut_spans(code, [(start, end)]) == b'a = b\n;\n(c || d).go()'
+
+
+def test_cut_spans_keeps_crlf():
+    code = b'one();\r\nfunction f() {}\r\ntwo();\r\n'
+    start = code.index(b'\r\nfunction')
+    end = code.index(b'}') + 1
+    cut = cut_spans(code, [(start, end)])
+    assert cut == b'one();\r\n\r\ntwo();\r\n'
+    assert b'\n' not in cut.replace(b'\r\n', b'')
+
+
+def test_names_referenced_in():
+    code = (b'renderAll(data.items, window.helper);\n'
+            b'el.innerHTML = \'<button onclick="openModal(1)">\';\n'
+            b'lookup("bareName"); obj.prop;')
+    names = names_referenced_in(code)
+    assert {'renderAll', 'data', 'window', 'helper', 'openModal', 'bareName', 'obj'} <= names
+    assert 'items' not in names and 'prop' not in names and 'innerHTML' not in names
@@ -0,0 +1,91 @@
+import pytest
+
+from call_graph import build_call_graph
+from declaration_index import DeclarationIndex
+from lazy_chunks import drop_script_tags, loader_source, manifest, plan_chunks, sync_value_uses
+
+
+def uses(tmp_path, code, name='openRankingsModal'):
+    path = tmp_path / 'app.js'
+    path.write_bytes(code)
+    return sync_value_uses(str(path), [(0, len(code))], name)
+
+
+@pytest.mark.parametrize('code, expected', [
+    (b'openRankingsModal();', 0),
+    (b'foo()\nopenRankingsModal();', 0),
+    (b'if (x) openRankingsModal();', 0),
+    (b'await openRankingsModal();', 0),
+    (b'el.openRankingsModal();', 0),
+    (b'const html = openRankingsModal();', 1),
+    (b'const html =\n    openRankingsModal();', 1),
+    (b'return openRankingsModal();', 1),
+    (b'render(\n    openRankingsModal());', 1),
+    (b'const ok = a &&\n    openRankingsModal();', 1),
+    (b'switch (step) { case 1: openRankingsModal(); break; }', 0),
+    (b'switch (step) { case a ? 1 : 2: openRankingsModal(); }', 0),
+    (b'switch (step) { default: openRankingsModal(); }', 0),
+    (b'const html = ready ? cached : openRankingsModal();', 1),
+    (b'render({ body: openRankingsModal() });', 1),
+])
+def test_sync_value_uses(tmp_path, code, expected):
+    assert uses(tmp_path, code) == expected
+
+
+SOURCE = b'''function showStep(step) {
+    switch (step) {
+        case 1:
+            renderStep();
+            break;
+    }
+}
+function renderStep() { return stepHelper(); }
+function stepHelper() { return 1; }
+function openReport() { document.body.innerHTML = reportHtml(); }
+function reportHtml() { return reportRow(); }
+function reportRow() { return '<tr>'; }
+'''
+
+CHUNKS = {
+    'step': {'entries': ['renderStep']},
+    'report': {'entries': ['reportHtml']},
+}
+
+
+def test_plan_chunks_skips_chunks_without_movable_entries(tmp_path):
+    path = tmp_path / 'app.js'
+    path.write_bytes(SOURCE)
+    index = DeclarationIndex(None)
+    graph = build_call_graph([str(path)], index)
+    labels = {}
+    plan = plan_chunks(str(path), graph, set(), labels, index, str(tmp_path), CHUNKS)
+    # reportHtml's result is used synchronously, so its chunk would be empty
+    assert list(plan) == ['step']
+    assert plan['step']['members'] == {'renderStep', 'stepHelper'}
+    assert plan['step']['exports'] == ['renderStep']
+    assert labels == {'renderStep': 'chunk:step', 'stepHelper': 'chunk:step'}
+    assert list(manifest(plan, 'js/')) == ['step']
+    assert 'report' not in loader_source(plan, 'js/')
+
+
+PAGE = '''<html>
+<head>
+    <link rel="preload" href="js/duty-shifts-ui.js" as="script">
+    <link rel="preload" href="js/duty-shifts-debug.0123456789.js" as="script">
+    <link rel="stylesheet" href="css/app.css">
+</head>
+<body>
+    <script src="js/duty-shifts-ui.js" defer></script>
+    <script src="js/duty-shifts-debug.0123456789.js?v=2" defer></script>
+</body>
+</html>
+'''
+
+
+def test_drop_script_tags_removes_tags_and_preloads(tmp_path):
+    html_path = tmp_path / 'page.html'
+    dropped = drop_script_tags(PAGE, [str(tmp_path / 'js' / 'duty-shifts-debug.js')], str(html_path))
+    assert 'duty-shifts-debug' not in dropped
+    assert dropped.count('duty-shifts-ui.js') == 2
+    assert 'css/app.css' in dropped
+    assert '\n\n' not in dropped
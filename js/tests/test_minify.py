@@ -0,0 +1,104 @@
+import io
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from js_tokenizer import tokenize
+from minify import drop_console_calls, free_names, mangle_names, minify, scope_names, source_map
+
+FUNCTION = b'''function layout(items, options) {
+    const width = innerWidth - (options.margin || 0);
+    let total = 0;
+    for (let index = 0; index < items.length; index++) {
+        total += measure(items[index], width);
+    }
+    try {
+        scrollTo(0, total);
+    } catch (error) {
+        report(error, getSelection());
+    }
+    const named = function inner(depth) { return depth ? inner(depth - 1) : total; };
+    return { total, named: named(2) };
+}
+'''
+
+
+def tokens(code):
+    return list(tokenize(io.BytesIO(code)))
+
+
+def test_scope_names():
+    local, free = scope_names(tokens(FUNCTION))
+    assert {b'items', b'options', b'width', b'total', b'index', b'error', b'named',
+            b'inner', b'depth'} <= local
+    assert free == {b'layout', b'innerWidth', b'measure', b'scrollTo', b'report', b'getSelection'}
+
+
+def test_block_scoped_names_are_free_outside_their_block():
+    code = b'function f() { { let a = 1; } return a + b; }'
+    assert free_names(tokens(code)) == {b'f', b'a', b'b'}
+
+
+def test_var_is_function_scoped():
+    code = b'function f() { if (x) { var a = 1; } return a; }'
+    assert free_names(tokens(code)) == {b'f', b'x'}
+
+
+def test_mangle_never_renames_globals():
+    renames = mangle_names(tokens(FUNCTION), reserved=set())
+    assert renames and not set(renames) & free_names(tokens(FUNCTION))
+    assert not set(renames.values()) & free_names(tokens(FUNCTION))
+    assert b'options' in renames
+
+
+def test_mangle_respects_reserved_names():
+    renames = mangle_names(tokens(FUNCTION), reserved={b'options'})
+    assert b'options' not in renames
+    assert b'options' not in renames.values()
+
+
+def test_mangle_skips_eval():
+    assert mangle_names(tokens(b'function f(longName) { eval("longName"); }'), set()) == {}
+
+
+def test_drop_console_calls():
+    code = (b'function f(x) { console.log("a", x); g(console.debug(x)); '
+            b'console.log(x++); console.error(x); }')
+    out = b' '.join(token.value for token in drop_console_calls(tokens(code)))
+    assert b'console . log ( "a"' not in out
+    assert b'g ( void 0 )' in out
+    assert b'console . log ( x ++ )' in out
+    assert b'console . error' in out
+
+
+def test_source_map_points_at_the_original():
+    code, writer = minify([(FUNCTION, 0, True)], FUNCTION, mangle=True)
+    assert len(code) < len(FUNCTION)
+    sourcemap = source_map(writer, '/out/app.js', '/src/app.js')
+    assert sourcemap['sources'] == ['../src/app.js']
+    assert sourcemap['mappings'] and 'options' in sourcemap['names']
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason='node is not installed')
+def test_minified_code_behaves_the_same():
+    harness = b'''
+var innerWidth = 100, calls = [];
+function measure(item, width) { return item * width; }
+function scrollTo(x, y) { calls.push(['scroll', x, y]); }
+function report(error, selection) { calls.push(['report', String(error), selection]); }
+function getSelection() { return 'sel'; }
+console.log(JSON.stringify([layout([1, 2, 3], {margin: 10}), calls]));
+scrollTo = function () { throw new Error('boom'); };
+calls = [];
+console.log(JSON.stringify([layout([4], {}), calls]));
+'''
+    code, _ = minify([(FUNCTION, 0, True)], FUNCTION, mangle=True)
+
+    def run(source):
+        return subprocess.run(['node', '-e', (source + harness).decode()], check=True,
+                              capture_output=True, text=True).stdout
+
+    assert run(code) == run(FUNCTION)
+    assert json.loads(run(FUNCTION).splitlines()[0])[0]['total'] == 540
@@ -0,0 +1,122 @@
+import contextlib
+import io
+import os
+
+import pytest
+
+import optimize_split
+from declaration_index import DeclarationIndex
+from minify import write_minified
+from optimize_split import (BUNDLE_FILES, bundle_paths, categorize_all, combine_bundles, emit_files,
+                            find_source, is_build_output, lost_declarations, open_index, strip_banner,
+                            write_bundle)
+
+JS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BANNER = (b'        // ============================================================================\n'
+          b'        // DUTY-SHIFTS-UI.JS - UI functions\n'
+          b'        // ============================================================================\n')
+
+
+def test_strip_banner():
+    code = b'// Renders the table\nfunction render() {}\n'
+    assert strip_banner(BANNER + code) == code
+    assert strip_banner(code) == code
+
+
+def test_is_build_output():
+    assert is_build_output(b'function a(){}\n//# sourceMappingURL=app.js.map\n')
+    assert not is_build_output(b'function a() {}\n')
+
+
+def test_combine_bundles_joins_without_banners(tmp_path):
+    first, second = tmp_path / 'a.js', tmp_path / 'b.js'
+    first.write_bytes(BANNER + b'const a = 1;\n\n\n')
+    second.write_bytes(BANNER + b'function b() {}')
+    out = combine_bundles([str(first), str(second)], str(tmp_path / 'cache' / 'combined.js'))
+    assert open(out, 'rb').read() == b'const a = 1;\n\nfunction b() {}\n'
+
+
+def test_find_source_refuses_build_output(tmp_path):
+    for name in ('duty-shifts-data.js', 'duty-shifts-logic.js', 'duty-shifts-ui.js'):
+        (tmp_path / name).write_bytes(b'function f() {}\n')
+    (tmp_path / 'duty-shifts-ui.js').write_bytes(b'function f(){}\n//# sourceMappingURL=x.map\n')
+    with pytest.raises(ValueError):
+        find_source(str(tmp_path))
+    (tmp_path / 'duty-shifts-ui.js').unlink()
+    with pytest.raises(FileNotFoundError):
+        find_source(str(tmp_path))
+
+
+def test_lost_declarations(tmp_path):
+    source = tmp_path / 'source.js'
+    source.write_bytes(b'function kept() {}\n')
+    bundle = tmp_path / 'bundle.js'
+    bundle.write_bytes(b'function kept() {}\nfunction onlyInBundle() {}\nconst alsoLost = 1;\n')
+    index = DeclarationIndex(None)
+    assert lost_declarations(str(source), [str(bundle), str(tmp_path / 'missing.js')], index) == \
+           ['alsoLost', 'onlyInBundle']
+
+
+@pytest.fixture(scope='module')
+def split_input(tmp_path_factory):
+    paths = bundle_paths(JS_DIR)
+    if not all(os.path.exists(path) for path in paths):
+        pytest.skip('shipped bundles not present')
+    source = combine_bundles(paths, str(tmp_path_factory.mktemp('source') / 'combined.js'))
+    index = open_index(None)
+    _, _, labels = categorize_all(source, index)
+    return source, index, labels
+
+
+def emit(split_input, out_dir, workers, minify_options=None):
+    source, index, labels = split_input
+    jobs = [(str(out_dir / filename), category, header) for filename, category, header in BUNDLE_FILES]
+    with contextlib.redirect_stdout(io.StringIO()):
+        emit_files(source, jobs, index, labels, workers, minify_options)
+    return {path.name: path.read_bytes() for path in sorted(out_dir.iterdir())}
+
+
+@pytest.mark.parametrize('minify_options', [None, {'drop_console': True, 'mangle': True}])
+def test_jobs_do_not_change_the_output(split_input, tmp_path, minify_options):
+    (tmp_path / 'serial').mkdir()
+    (tmp_path / 'parallel').mkdir()
+    serial = emit(split_input, tmp_path / 'serial', 1, minify_options)
+    parallel = emit(split_input, tmp_path / 'parallel', 3, minify_options)
+    assert len(serial) == (6 if minify_options else 3)
+    assert serial == parallel
+
+
+def test_failed_write_keeps_the_old_bundle(tmp_path, monkeypatch):
+    source = tmp_path / 'source.js'
+    source.write_bytes(b'function a() {}\n')
+    bundle = tmp_path / 'bundle.js'
+    bundle.write_bytes(b'// previous build\n')
+
+    def fail(src, dst):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(optimize_split.os, 'replace', fail)
+    with pytest.raises(OSError):
+        write_bundle(str(source), str(bundle), '', [(0, 15)])
+    assert bundle.read_bytes() == b'// previous build\n'
+    assert sorted(os.listdir(tmp_path)) == ['bundle.js', 'source.js']
+
+
+def test_failed_minified_write_keeps_the_old_bundle(tmp_path, monkeypatch):
+    source = tmp_path / 'source.js'
+    source.write_bytes(b'function a(longName) { return longName; }\n')
+    bundle = tmp_path / 'bundle.js'
+    bundle.write_bytes(b'// previous build\n')
+    real_replace = os.replace
+
+    def fail_on_bundle(src, dst):
+        if dst == str(bundle):
+            raise OSError('disk full')
+        real_replace(src, dst)
+
+    monkeypatch.setattr('minify.os.replace', fail_on_bundle)
+    with pytest.raises(OSError):
+        write_minified(str(source), str(bundle), '', [(0, 43, True)])
+    assert bundle.read_bytes() == b'// previous build\n'
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
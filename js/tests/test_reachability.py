@@ -0,0 +1,104 @@
+import contextlib
+import io
+
+import pytest
+
+from declaration_index import DeclarationIndex
+from optimize_split import emit_files
+from reachability import analyze, page_roots, reachable_names
+
+BUNDLE = b'''function startDutyShiftsAppInit() { renderCalendar(); }
+function renderCalendar() { formatCell(); }
+function formatCell() { return 1; }
+
+function openRankingsModal() { sortRankings(); }
+function sortRankings() {}
+
+function exportedViaWindow() {}
+window.exportedViaWindow = exportedViaWindow;
+
+function builtByName() {}
+function calledFromCommon() {}
+function calledFromInlineScript() {}
+function buildsHandlers() {
+    return '<button onclick="builtByName()">';
+}
+
+const settings = loadDefaults();
+function loadDefaults() { return {}; }
+
+function deadHelper() { return deadLeaf(); }
+function deadLeaf() {}
+'''
+
+PAGE = '''<html><body>
+<button onclick="openRankingsModal()">Rankings</button>
+<select onchange="if (ready) { buildsHandlers(); }"></select>
+<script src="js/common.js"></script>
+<script src="js/bundle.js"></script>
+<script>calledFromInlineScript();</script>
+</body></html>
+'''
+
+
+@pytest.fixture
+def site(tmp_path):
+    (tmp_path / 'js').mkdir()
+    (tmp_path / 'js' / 'bundle.js').write_bytes(BUNDLE)
+    (tmp_path / 'js' / 'common.js').write_bytes(b'function commonInit() { calledFromCommon(); }\n')
+    (tmp_path / 'page.html').write_text(PAGE)
+    return tmp_path
+
+
+def test_page_roots(site):
+    roots = page_roots(str(site / 'page.html'), [str(site / 'js' / 'bundle.js')], DeclarationIndex(None))
+    assert {'startDutyShiftsAppInit', 'openRankingsModal', 'buildsHandlers', 'ready',
+            'calledFromInlineScript', 'calledFromCommon'} <= roots
+    # Bundles being analyzed are not roots of themselves
+    assert 'deadHelper' not in roots
+
+
+def test_analyze(site):
+    graph, unreachable = analyze(str(site / 'page.html'), [str(site / 'js' / 'bundle.js')],
+                                 DeclarationIndex(None))
+    assert unreachable == ['deadHelper', 'deadLeaf']
+    reached = reachable_names(graph, set())
+    # window.x = x exports and variable initializers are top-level code
+    assert {'exportedViaWindow', 'loadDefaults'} <= reached
+
+
+def test_names_built_in_strings_are_reachable(site):
+    _, unreachable = analyze(str(site / 'page.html'), [str(site / 'js' / 'bundle.js')],
+                             DeclarationIndex(None))
+    assert 'builtByName' not in unreachable
+
+
+def test_outputs_are_not_roots(site):
+    # The current output still calls deadHelper, but it is about to be rewritten
+    (site / 'js' / 'old-output.js').write_bytes(b'deadHelper();\n')
+    html = PAGE.replace('<script src="js/bundle.js"></script>',
+                        '<script src="js/old-output.js"></script>')
+    (site / 'page.html').write_text(html)
+    bundle = str(site / 'js' / 'bundle.js')
+    index = DeclarationIndex(None)
+    _, kept = analyze(str(site / 'page.html'), [bundle], index)
+    assert 'deadHelper' not in kept
+    _, pruned = analyze(str(site / 'page.html'), [bundle], index, [str(site / 'js' / 'old-output.js')])
+    assert pruned == ['deadHelper', 'deadLeaf']
+
+
+def test_pruned_functions_leave_the_output(site):
+    bundle = str(site / 'js' / 'bundle.js')
+    index = DeclarationIndex(None)
+    graph, unreachable = analyze(str(site / 'page.html'), [bundle], index)
+    labels = {name: 'data' for name in graph.nodes}
+    labels.update((name, 'pruned') for name in unreachable)
+    out = site / 'out.js'
+    with contextlib.redirect_stdout(io.StringIO()):
+        emit_files(bundle, [(str(out), 'data', '')], index, labels)
+    code = out.read_bytes()
+    assert b'deadHelper' not in code and b'deadLeaf' not in code
+    for name in graph.nodes:
+        if name not in unreachable:
+            assert f'function {name}('.encode() in code or f'const {name} '.encode() in code
+    assert b'window.exportedViaWindow = exportedViaWindow;' in code
@@ -1,7 +1,106 @@
-self.addEventListener('install', event => {
-  self.skipWaiting();
-});
-
-self.addEventListener('activate', event => {
-  self.clients.claim();
-}); 
\ No newline at end of file
+// Cache-first service worker.
+//
+// precache-manifest.js (generated by js/hashed_assets.py) lists the pages and
+// every asset they load. Each manifest version gets its own cache; activating
+// a new version deletes the caches of older ones. Assets with a content hash
+// in their name never change, so they are served from the cache without
+// touching the network.
+
+const CACHE_PREFIX = 'ams-';
+const HASHED_ASSET = /\.[0-9a-f]{10}\.(js|css)$/;
+
+try {
+  importScripts('precache-manifest.js');
+} catch (error) {
+  // No manifest yet (assets not built): fall back to runtime caching only
+  self.__precacheManifest = null;
+}
+
+const manifest = self.__precacheManifest || { version: 'runtime', entries: [] };
+const PRECACHE = `${CACHE_PREFIX}precache-${manifest.version}`;
+const RUNTIME = `${CACHE_PREFIX}runtime-${manifest.version}`;
+const precacheUrls = new Set(manifest.entries.map(entry => new URL(entry.url, self.location).href));
+
+async function precache() {
+  const cache = await caches.open(PRECACHE);
+  await Promise.all(manifest.entries.map(async entry => {
+    const url = new URL(entry.url, self.location).href;
+    if (entry.revision === null) {
+      // Hashed names are immutable: reuse a copy an older version cached
+      const cached = await caches.match(url);
+      if (cached) {
+        await cache.put(url, cached);
+        return;
+      }
+    }
+    const response = await fetch(url, { cache: 'reload' });
+    if (!response.ok) {
+      throw new Error(`Precache failed for ${url}: ${response.status}`);
+    }
+    await cache.put(url, response);
+  }));
+}
+
+self.addEventListener('install', event => {
+  event.waitUntil(precache().then(() => self.skipWaiting()));
+});
+
+self.addEventListener('activate', event => {
+  event.waitUntil((async () => {
+    const names = await caches.keys();
+    await Promise.all(names
+      .filter(name => name.startsWith(CACHE_PREFIX) && name !== PRECACHE && name !== RUNTIME)
+      .map(name => caches.delete(name)));
+    await self.clients.claim();
+  })());
+});
+
+async function cacheFirst(request, cacheName) {
+  const cache = await caches.open(cacheName);
+  const cached = await cache.match(request, { ignoreSearch: request.mode === 'navigate' });
+  if (cached) {
+    return cached;
+  }
+  const response = await fetch(request);
+  if (response.ok) {
+    cache.put(request, response.clone());
+  }
+  return response;
+}
+
+async function networkFirst(request) {
+  const cache = await caches.open(RUNTIME);
+  try {
+    const response = await fetch(request);
+    if (response.ok) {
+      cache.put(request, response.clone());
+    }
+    return response;
+  } catch (error) {
+    const cached = await caches.match(request, { ignoreSearch: request.mode === 'navigate' });
+    if (cached) {
+      return cached;
+    }
+    throw error;
+  }
+}
+
+self.addEventListener('fetch', event => {
+  const request = event.request;
+  if (request.method !== 'GET') {
+    return;
+  }
+  const url = new URL(request.url);
+  // Firebase, CDNs and other origins handle their own caching
+  if (url.origin !== self.location.origin) {
+    return;
+  }
+  const key = url.origin + url.pathname;
+  if (precacheUrls.has(key)) {
+    event.respondWith(cacheFirst(new Request(key), PRECACHE));
+  } else if (HASHED_ASSET.test(url.pathname)) {
+    event.respondWith(cacheFirst(request, RUNTIME));
+  } else {
+    event.respondWith(networkFirst(request));
+  }
+});